@@ -0,0 +1,47 @@
+"""
+python script to backfill "LiteLLM_SpendRollups" from "LiteLLM_SpendLogs"
+
+Usage:
+    DATABASE_URL=... python backfill_spend_rollups.py --start_date 2024-01-01 --end_date 2024-06-30
+
+After backfilling, set `general_settings::use_spend_rollups: true` on the proxy.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from prisma import Prisma
+
+sys.path.insert(0, "..")
+
+from litellm.proxy.spend_tracking.spend_rollups import backfill_spend_rollups
+
+db = Prisma(
+    http={
+        "timeout": 60000,
+    },
+)
+
+
+async def main(start_date: str, end_date: str):
+    await db.connect()
+    try:
+        rows_written = await backfill_spend_rollups(
+            prisma_client=SimpleNamespace(db=db),
+            start_date=datetime.strptime(start_date, "%Y-%m-%d"),
+            end_date=datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1),
+        )
+        print(f"Backfilled spend rollups. Rows written: {rows_written}")  # noqa
+    finally:
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--start_date", required=True, help="YYYY-MM-DD")
+    parser.add_argument("--end_date", required=True, help="YYYY-MM-DD, inclusive")
+    args = parser.parse_args()
+    asyncio.run(main(start_date=args.start_date, end_date=args.end_date))
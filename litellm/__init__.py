@@ -3,9 +3,21 @@ import warnings
 
 warnings.filterwarnings("ignore", message=".*conflict with protected namespace.*")
 ### INIT VARIABLES ########
+import importlib
 import threading
 import os
-from typing import Callable, List, Optional, Dict, Union, Any, Literal, get_args
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    List,
+    Optional,
+    Dict,
+    Tuple,
+    Union,
+    Any,
+    Literal,
+    get_args,
+)
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.caching.caching import Cache, DualCache, RedisCache, InMemoryCache
 from litellm.types.llms.bedrock import COHERE_EMBEDDING_INPUT_TYPES
@@ -107,6 +119,9 @@ _custom_logger_compatible_callbacks_literal = Literal[
     "gcs_pubsub",
 ]
 logged_real_time_event_types: Optional[Union[List[str], Literal["*"]]] = None
+realtime_partial_logging_interval_seconds: Optional[float] = (
+    None  # defaults to REALTIME_PARTIAL_LOGGING_INTERVAL_SECONDS, 0 disables partial logging
+)
 _known_custom_logger_compatible_callbacks: List = list(
     get_args(_custom_logger_compatible_callbacks_literal)
 )
@@ -116,6 +131,7 @@ callbacks: List[
 langfuse_default_tags: Optional[List[str]] = None
 langsmith_batch_size: Optional[int] = None
 prometheus_initialize_budget_metrics: Optional[bool] = False
+prometheus_async_metrics_aggregation: Optional[bool] = False
 argilla_batch_size: Optional[int] = None
 datadog_use_v1: Optional[bool] = False  # if you want to use v1 datadog logged payload
 argilla_transformation_object: Optional[Dict[str, Any]] = None
@@ -139,6 +155,9 @@ add_user_information_to_llm_headers: Optional[bool] = (
     None  # adds user_id, team_id, token hash (params from StandardLoggingMetadata) to request headers
 )
 store_audit_logs = False  # Enterprise feature, allow users to see audit logs
+callback_delivery_log_dir: Optional[str] = os.getenv(
+    "LITELLM_CALLBACK_DELIVERY_LOG_DIR"
+)  # batch logging callbacks (datadog, opik) write events to an on-disk delivery log here, and deliver them from it - events survive destination outages + restarts
 ### end of callbacks #############
 
 email: Optional[str] = (
@@ -765,6 +784,7 @@ from .utils import (
     check_valid_key,
     register_model,
     encode,
+    encode_batch,
     decode,
     _calculate_retry_after,
     _should_retry,
@@ -790,194 +810,567 @@ ALL_LITELLM_RESPONSE_TYPES = [
 ]
 
 from .llms.custom_llm import CustomLLM
-from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
-from .llms.openai_like.chat.handler import OpenAILikeChatConfig
-from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
-from .llms.galadriel.chat.transformation import GaladrielChatConfig
-from .llms.github.chat.transformation import GithubChatConfig
-from .llms.empower.chat.transformation import EmpowerChatConfig
-from .llms.huggingface.chat.transformation import (
-    HuggingfaceChatConfig as HuggingfaceConfig,
-)
-from .llms.oobabooga.chat.transformation import OobaboogaConfig
-from .llms.maritalk import MaritalkConfig
-from .llms.openrouter.chat.transformation import OpenrouterConfig
-from .llms.anthropic.chat.transformation import AnthropicConfig
-from .llms.anthropic.experimental_pass_through.transformation import (
-    AnthropicExperimentalPassThroughConfig,
-)
-from .llms.groq.stt.transformation import GroqSTTConfig
-from .llms.anthropic.completion.transformation import AnthropicTextConfig
-from .llms.triton.completion.transformation import TritonConfig
-from .llms.triton.completion.transformation import TritonGenerateConfig
-from .llms.triton.completion.transformation import TritonInferConfig
-from .llms.triton.embedding.transformation import TritonEmbeddingConfig
-from .llms.databricks.chat.transformation import DatabricksConfig
-from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
-from .llms.predibase.chat.transformation import PredibaseConfig
-from .llms.replicate.chat.transformation import ReplicateConfig
-from .llms.cohere.completion.transformation import CohereTextConfig as CohereConfig
-from .llms.cohere.rerank.transformation import CohereRerankConfig
-from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
-from .llms.infinity.rerank.transformation import InfinityRerankConfig
-from .llms.clarifai.chat.transformation import ClarifaiConfig
-from .llms.ai21.chat.transformation import AI21ChatConfig, AI21ChatConfig as AI21Config
-from .llms.together_ai.chat import TogetherAIConfig
-from .llms.together_ai.completion.transformation import TogetherAITextCompletionConfig
-from .llms.cloudflare.chat.transformation import CloudflareChatConfig
-from .llms.deprecated_providers.palm import (
-    PalmConfig,
-)  # here to prevent breaking changes
-from .llms.nlp_cloud.chat.handler import NLPCloudConfig
-from .llms.petals.completion.transformation import PetalsConfig
-from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
-from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
-    VertexGeminiConfig,
-    VertexGeminiConfig as VertexAIConfig,
-)
-from .llms.gemini.chat.transformation import (
-    GoogleAIStudioGeminiConfig,
-    GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
-)
 
+### PROVIDER CONFIGS ###
+# Provider configs (and a few heavy subsystems) are only imported on first access - e.g. `litellm.AnthropicConfig`.
+# This keeps `import litellm` fast for CLI tools / serverless functions that only use one provider.
+# To add a new provider config, register it in `_lazy_imports` + the `TYPE_CHECKING` block below.
+if TYPE_CHECKING:
+    from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
+    from .llms.openai_like.chat.handler import OpenAILikeChatConfig
+    from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
+    from .llms.galadriel.chat.transformation import GaladrielChatConfig
+    from .llms.github.chat.transformation import GithubChatConfig
+    from .llms.empower.chat.transformation import EmpowerChatConfig
+    from .llms.huggingface.chat.transformation import (
+        HuggingfaceChatConfig as HuggingfaceConfig,
+    )
+    from .llms.oobabooga.chat.transformation import OobaboogaConfig
+    from .llms.maritalk import MaritalkConfig
+    from .llms.openrouter.chat.transformation import OpenrouterConfig
+    from .llms.anthropic.chat.transformation import AnthropicConfig
+    from .llms.anthropic.experimental_pass_through.transformation import (
+        AnthropicExperimentalPassThroughConfig,
+    )
+    from .llms.groq.stt.transformation import GroqSTTConfig
+    from .llms.anthropic.completion.transformation import AnthropicTextConfig
+    from .llms.triton.completion.transformation import TritonConfig
+    from .llms.triton.completion.transformation import TritonGenerateConfig
+    from .llms.triton.completion.transformation import TritonInferConfig
+    from .llms.triton.embedding.transformation import TritonEmbeddingConfig
+    from .llms.databricks.chat.transformation import DatabricksConfig
+    from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
+    from .llms.predibase.chat.transformation import PredibaseConfig
+    from .llms.replicate.chat.transformation import ReplicateConfig
+    from .llms.cohere.completion.transformation import CohereTextConfig as CohereConfig
+    from .llms.cohere.rerank.transformation import CohereRerankConfig
+    from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
+    from .llms.infinity.rerank.transformation import InfinityRerankConfig
+    from .llms.clarifai.chat.transformation import ClarifaiConfig
+    from .llms.ai21.chat.transformation import (
+        AI21ChatConfig,
+        AI21ChatConfig as AI21Config,
+    )
+    from .llms.together_ai.chat import TogetherAIConfig
+    from .llms.together_ai.completion.transformation import (
+        TogetherAITextCompletionConfig,
+    )
+    from .llms.cloudflare.chat.transformation import CloudflareChatConfig
+    from .llms.deprecated_providers.palm import (
+        PalmConfig,
+    )  # here to prevent breaking changes
+    from .llms.nlp_cloud.chat.handler import NLPCloudConfig
+    from .llms.petals.completion.transformation import PetalsConfig
+    from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
+    from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
+        VertexGeminiConfig,
+        VertexGeminiConfig as VertexAIConfig,
+    )
+    from .llms.gemini.chat.transformation import (
+        GoogleAIStudioGeminiConfig,
+        GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
+    )
+    from .llms.vertex_ai.vertex_embeddings.transformation import (
+        VertexAITextEmbeddingConfig,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
+        VertexAIAnthropicConfig,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
+        VertexAILlama3Config,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
+        VertexAIAi21Config,
+    )
+    from .llms.ollama.completion.transformation import OllamaConfig
+    from .llms.sagemaker.completion.transformation import SagemakerConfig
+    from .llms.sagemaker.chat.transformation import SagemakerChatConfig
+    from .llms.ollama_chat import OllamaChatConfig
+    from .llms.bedrock.chat.invoke_handler import (
+        AmazonCohereChatConfig,
+        bedrock_tool_name_mappings,
+    )
+    from .llms.bedrock.common_utils import (
+        AmazonBedrockGlobalConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
+        AmazonAI21Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
+        AmazonInvokeNovaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
+        AmazonAnthropicConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
+        AmazonAnthropicClaude3Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
+        AmazonCohereConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
+        AmazonLlamaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
+        AmazonMistralConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
+        AmazonTitanConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
+        AmazonInvokeConfig,
+    )
+    from .llms.bedrock.image.amazon_stability1_transformation import (
+        AmazonStabilityConfig,
+    )
+    from .llms.bedrock.image.amazon_stability3_transformation import (
+        AmazonStability3Config,
+    )
+    from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
+    from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
+        AmazonTitanMultimodalEmbeddingG1Config,
+    )
+    from .llms.bedrock.embed.amazon_titan_v2_transformation import (
+        AmazonTitanV2Config,
+    )
+    from .llms.cohere.chat.transformation import CohereChatConfig
+    from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
+    from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
+    from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
+    from .llms.deepinfra.chat.transformation import DeepInfraConfig
+    from .llms.deepgram.audio_transcription.transformation import (
+        DeepgramAudioTranscriptionConfig,
+    )
+    from .llms.topaz.common_utils import TopazModelInfo
+    from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
+    from .llms.openai.completion.transformation import OpenAITextCompletionConfig
+    from .llms.groq.chat.transformation import GroqChatConfig
+    from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
+    from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
+    from .llms.mistral.mistral_chat_transformation import MistralConfig
+    from .llms.openai.chat.o_series_transformation import (
+        OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
+        OpenAIOSeriesConfig,
+    )
+    from .llms.openai.chat.gpt_transformation import (
+        OpenAIGPTConfig,
+    )
+    from .llms.openai.chat.gpt_audio_transformation import (
+        OpenAIGPTAudioConfig,
+    )
+    from .llms.nvidia_nim.chat import NvidiaNimConfig
+    from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
+    from .llms.cerebras.chat import CerebrasConfig
+    from .llms.sambanova.chat import SambanovaConfig
+    from .llms.ai21.chat.transformation import AI21ChatConfig
+    from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
+    from .llms.fireworks_ai.completion.transformation import (
+        FireworksAITextCompletionConfig,
+    )
+    from .llms.fireworks_ai.audio_transcription.transformation import (
+        FireworksAIAudioTranscriptionConfig,
+    )
+    from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
+        FireworksAIEmbeddingConfig,
+    )
+    from .llms.friendliai.chat.transformation import FriendliaiChatConfig
+    from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
+    from .llms.xai.chat.transformation import XAIChatConfig
+    from .llms.volcengine import VolcEngineConfig
+    from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
+    from .llms.azure.azure import (
+        AzureOpenAIError,
+        AzureOpenAIAssistantsAPIConfig,
+    )
+    from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
+    from .llms.azure.completion.transformation import AzureOpenAITextConfig
+    from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
+    from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
+    from .llms.vllm.completion.transformation import VLLMConfig
+    from .llms.deepseek.chat.transformation import DeepSeekChatConfig
+    from .llms.lm_studio.chat.transformation import LMStudioChatConfig
+    from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
+    from .llms.perplexity.chat.transformation import PerplexityChatConfig
+    from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
+    from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
+    from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
+    from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
+
+    vertexAITextEmbeddingConfig: VertexAITextEmbeddingConfig
+    openaiOSeriesConfig: OpenAIOSeriesConfig
+    openAIGPTConfig: OpenAIGPTConfig
+    openAIGPTAudioConfig: OpenAIGPTAudioConfig
+    nvidiaNimConfig: NvidiaNimConfig
+    nvidiaNimEmbeddingConfig: NvidiaNimEmbeddingConfig
+    from .budget_manager import BudgetManager
+    from .proxy.proxy_cli import run_server
+    from .router import Router
+
+# attribute name -> (module, attribute in module)
+_lazy_imports: Dict[str, Tuple[str, str]] = {
+    "AmazonConverseConfig": (
+        ".llms.bedrock.chat.converse_transformation",
+        "AmazonConverseConfig",
+    ),
+    "OpenAILikeChatConfig": (".llms.openai_like.chat.handler", "OpenAILikeChatConfig"),
+    "AiohttpOpenAIChatConfig": (
+        ".llms.aiohttp_openai.chat.transformation",
+        "AiohttpOpenAIChatConfig",
+    ),
+    "GaladrielChatConfig": (
+        ".llms.galadriel.chat.transformation",
+        "GaladrielChatConfig",
+    ),
+    "GithubChatConfig": (".llms.github.chat.transformation", "GithubChatConfig"),
+    "EmpowerChatConfig": (".llms.empower.chat.transformation", "EmpowerChatConfig"),
+    "HuggingfaceConfig": (
+        ".llms.huggingface.chat.transformation",
+        "HuggingfaceChatConfig",
+    ),
+    "OobaboogaConfig": (".llms.oobabooga.chat.transformation", "OobaboogaConfig"),
+    "MaritalkConfig": (".llms.maritalk", "MaritalkConfig"),
+    "OpenrouterConfig": (".llms.openrouter.chat.transformation", "OpenrouterConfig"),
+    "AnthropicConfig": (".llms.anthropic.chat.transformation", "AnthropicConfig"),
+    "AnthropicExperimentalPassThroughConfig": (
+        ".llms.anthropic.experimental_pass_through.transformation",
+        "AnthropicExperimentalPassThroughConfig",
+    ),
+    "GroqSTTConfig": (".llms.groq.stt.transformation", "GroqSTTConfig"),
+    "AnthropicTextConfig": (
+        ".llms.anthropic.completion.transformation",
+        "AnthropicTextConfig",
+    ),
+    "TritonConfig": (".llms.triton.completion.transformation", "TritonConfig"),
+    "TritonGenerateConfig": (
+        ".llms.triton.completion.transformation",
+        "TritonGenerateConfig",
+    ),
+    "TritonInferConfig": (
+        ".llms.triton.completion.transformation",
+        "TritonInferConfig",
+    ),
+    "TritonEmbeddingConfig": (
+        ".llms.triton.embedding.transformation",
+        "TritonEmbeddingConfig",
+    ),
+    "DatabricksConfig": (".llms.databricks.chat.transformation", "DatabricksConfig"),
+    "DatabricksEmbeddingConfig": (
+        ".llms.databricks.embed.transformation",
+        "DatabricksEmbeddingConfig",
+    ),
+    "PredibaseConfig": (".llms.predibase.chat.transformation", "PredibaseConfig"),
+    "ReplicateConfig": (".llms.replicate.chat.transformation", "ReplicateConfig"),
+    "CohereConfig": (".llms.cohere.completion.transformation", "CohereTextConfig"),
+    "CohereRerankConfig": (".llms.cohere.rerank.transformation", "CohereRerankConfig"),
+    "AzureAIRerankConfig": (
+        ".llms.azure_ai.rerank.transformation",
+        "AzureAIRerankConfig",
+    ),
+    "InfinityRerankConfig": (
+        ".llms.infinity.rerank.transformation",
+        "InfinityRerankConfig",
+    ),
+    "ClarifaiConfig": (".llms.clarifai.chat.transformation", "ClarifaiConfig"),
+    "AI21ChatConfig": (".llms.ai21.chat.transformation", "AI21ChatConfig"),
+    "AI21Config": (".llms.ai21.chat.transformation", "AI21ChatConfig"),
+    "TogetherAIConfig": (".llms.together_ai.chat", "TogetherAIConfig"),
+    "TogetherAITextCompletionConfig": (
+        ".llms.together_ai.completion.transformation",
+        "TogetherAITextCompletionConfig",
+    ),
+    "CloudflareChatConfig": (
+        ".llms.cloudflare.chat.transformation",
+        "CloudflareChatConfig",
+    ),
+    "PalmConfig": (".llms.deprecated_providers.palm", "PalmConfig"),
+    "NLPCloudConfig": (".llms.nlp_cloud.chat.handler", "NLPCloudConfig"),
+    "PetalsConfig": (".llms.petals.completion.transformation", "PetalsConfig"),
+    "AlephAlphaConfig": (".llms.deprecated_providers.aleph_alpha", "AlephAlphaConfig"),
+    "VertexGeminiConfig": (
+        ".llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini",
+        "VertexGeminiConfig",
+    ),
+    "VertexAIConfig": (
+        ".llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini",
+        "VertexGeminiConfig",
+    ),
+    "GoogleAIStudioGeminiConfig": (
+        ".llms.gemini.chat.transformation",
+        "GoogleAIStudioGeminiConfig",
+    ),
+    "GeminiConfig": (".llms.gemini.chat.transformation", "GoogleAIStudioGeminiConfig"),
+    "VertexAITextEmbeddingConfig": (
+        ".llms.vertex_ai.vertex_embeddings.transformation",
+        "VertexAITextEmbeddingConfig",
+    ),
+    "VertexAIAnthropicConfig": (
+        ".llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation",
+        "VertexAIAnthropicConfig",
+    ),
+    "VertexAILlama3Config": (
+        ".llms.vertex_ai.vertex_ai_partner_models.llama3.transformation",
+        "VertexAILlama3Config",
+    ),
+    "VertexAIAi21Config": (
+        ".llms.vertex_ai.vertex_ai_partner_models.ai21.transformation",
+        "VertexAIAi21Config",
+    ),
+    "OllamaConfig": (".llms.ollama.completion.transformation", "OllamaConfig"),
+    "SagemakerConfig": (".llms.sagemaker.completion.transformation", "SagemakerConfig"),
+    "SagemakerChatConfig": (
+        ".llms.sagemaker.chat.transformation",
+        "SagemakerChatConfig",
+    ),
+    "OllamaChatConfig": (".llms.ollama_chat", "OllamaChatConfig"),
+    "AmazonCohereChatConfig": (
+        ".llms.bedrock.chat.invoke_handler",
+        "AmazonCohereChatConfig",
+    ),
+    "bedrock_tool_name_mappings": (
+        ".llms.bedrock.chat.invoke_handler",
+        "bedrock_tool_name_mappings",
+    ),
+    "AmazonBedrockGlobalConfig": (
+        ".llms.bedrock.common_utils",
+        "AmazonBedrockGlobalConfig",
+    ),
+    "AmazonAI21Config": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation",
+        "AmazonAI21Config",
+    ),
+    "AmazonInvokeNovaConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_nova_transformation",
+        "AmazonInvokeNovaConfig",
+    ),
+    "AmazonAnthropicConfig": (
+        ".llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation",
+        "AmazonAnthropicConfig",
+    ),
+    "AmazonAnthropicClaude3Config": (
+        ".llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation",
+        "AmazonAnthropicClaude3Config",
+    ),
+    "AmazonCohereConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation",
+        "AmazonCohereConfig",
+    ),
+    "AmazonLlamaConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_llama_transformation",
+        "AmazonLlamaConfig",
+    ),
+    "AmazonMistralConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation",
+        "AmazonMistralConfig",
+    ),
+    "AmazonTitanConfig": (
+        ".llms.bedrock.chat.invoke_transformations.amazon_titan_transformation",
+        "AmazonTitanConfig",
+    ),
+    "AmazonInvokeConfig": (
+        ".llms.bedrock.chat.invoke_transformations.base_invoke_transformation",
+        "AmazonInvokeConfig",
+    ),
+    "AmazonStabilityConfig": (
+        ".llms.bedrock.image.amazon_stability1_transformation",
+        "AmazonStabilityConfig",
+    ),
+    "AmazonStability3Config": (
+        ".llms.bedrock.image.amazon_stability3_transformation",
+        "AmazonStability3Config",
+    ),
+    "AmazonTitanG1Config": (
+        ".llms.bedrock.embed.amazon_titan_g1_transformation",
+        "AmazonTitanG1Config",
+    ),
+    "AmazonTitanMultimodalEmbeddingG1Config": (
+        ".llms.bedrock.embed.amazon_titan_multimodal_transformation",
+        "AmazonTitanMultimodalEmbeddingG1Config",
+    ),
+    "AmazonTitanV2Config": (
+        ".llms.bedrock.embed.amazon_titan_v2_transformation",
+        "AmazonTitanV2Config",
+    ),
+    "CohereChatConfig": (".llms.cohere.chat.transformation", "CohereChatConfig"),
+    "BedrockCohereEmbeddingConfig": (
+        ".llms.bedrock.embed.cohere_transformation",
+        "BedrockCohereEmbeddingConfig",
+    ),
+    "OpenAIConfig": (".llms.openai.openai", "OpenAIConfig"),
+    "MistralEmbeddingConfig": (".llms.openai.openai", "MistralEmbeddingConfig"),
+    "OpenAIImageVariationConfig": (
+        ".llms.openai.image_variations.transformation",
+        "OpenAIImageVariationConfig",
+    ),
+    "DeepInfraConfig": (".llms.deepinfra.chat.transformation", "DeepInfraConfig"),
+    "DeepgramAudioTranscriptionConfig": (
+        ".llms.deepgram.audio_transcription.transformation",
+        "DeepgramAudioTranscriptionConfig",
+    ),
+    "TopazModelInfo": (".llms.topaz.common_utils", "TopazModelInfo"),
+    "TopazImageVariationConfig": (
+        ".llms.topaz.image_variations.transformation",
+        "TopazImageVariationConfig",
+    ),
+    "OpenAITextCompletionConfig": (
+        ".llms.openai.completion.transformation",
+        "OpenAITextCompletionConfig",
+    ),
+    "GroqChatConfig": (".llms.groq.chat.transformation", "GroqChatConfig"),
+    "VoyageEmbeddingConfig": (
+        ".llms.voyage.embedding.transformation",
+        "VoyageEmbeddingConfig",
+    ),
+    "AzureAIStudioConfig": (
+        ".llms.azure_ai.chat.transformation",
+        "AzureAIStudioConfig",
+    ),
+    "MistralConfig": (".llms.mistral.mistral_chat_transformation", "MistralConfig"),
+    "OpenAIO1Config": (
+        ".llms.openai.chat.o_series_transformation",
+        "OpenAIOSeriesConfig",
+    ),
+    "OpenAIOSeriesConfig": (
+        ".llms.openai.chat.o_series_transformation",
+        "OpenAIOSeriesConfig",
+    ),
+    "OpenAIGPTConfig": (".llms.openai.chat.gpt_transformation", "OpenAIGPTConfig"),
+    "OpenAIGPTAudioConfig": (
+        ".llms.openai.chat.gpt_audio_transformation",
+        "OpenAIGPTAudioConfig",
+    ),
+    "NvidiaNimConfig": (".llms.nvidia_nim.chat", "NvidiaNimConfig"),
+    "NvidiaNimEmbeddingConfig": (".llms.nvidia_nim.embed", "NvidiaNimEmbeddingConfig"),
+    "CerebrasConfig": (".llms.cerebras.chat", "CerebrasConfig"),
+    "SambanovaConfig": (".llms.sambanova.chat", "SambanovaConfig"),
+    "FireworksAIConfig": (
+        ".llms.fireworks_ai.chat.transformation",
+        "FireworksAIConfig",
+    ),
+    "FireworksAITextCompletionConfig": (
+        ".llms.fireworks_ai.completion.transformation",
+        "FireworksAITextCompletionConfig",
+    ),
+    "FireworksAIAudioTranscriptionConfig": (
+        ".llms.fireworks_ai.audio_transcription.transformation",
+        "FireworksAIAudioTranscriptionConfig",
+    ),
+    "FireworksAIEmbeddingConfig": (
+        ".llms.fireworks_ai.embed.fireworks_ai_transformation",
+        "FireworksAIEmbeddingConfig",
+    ),
+    "FriendliaiChatConfig": (
+        ".llms.friendliai.chat.transformation",
+        "FriendliaiChatConfig",
+    ),
+    "JinaAIEmbeddingConfig": (
+        ".llms.jina_ai.embedding.transformation",
+        "JinaAIEmbeddingConfig",
+    ),
+    "XAIChatConfig": (".llms.xai.chat.transformation", "XAIChatConfig"),
+    "VolcEngineConfig": (".llms.volcengine", "VolcEngineConfig"),
+    "CodestralTextCompletionConfig": (
+        ".llms.codestral.completion.transformation",
+        "CodestralTextCompletionConfig",
+    ),
+    "AzureOpenAIError": (".llms.azure.azure", "AzureOpenAIError"),
+    "AzureOpenAIAssistantsAPIConfig": (
+        ".llms.azure.azure",
+        "AzureOpenAIAssistantsAPIConfig",
+    ),
+    "AzureOpenAIConfig": (".llms.azure.chat.gpt_transformation", "AzureOpenAIConfig"),
+    "AzureOpenAITextConfig": (
+        ".llms.azure.completion.transformation",
+        "AzureOpenAITextConfig",
+    ),
+    "HostedVLLMChatConfig": (
+        ".llms.hosted_vllm.chat.transformation",
+        "HostedVLLMChatConfig",
+    ),
+    "LiteLLMProxyChatConfig": (
+        ".llms.litellm_proxy.chat.transformation",
+        "LiteLLMProxyChatConfig",
+    ),
+    "VLLMConfig": (".llms.vllm.completion.transformation", "VLLMConfig"),
+    "DeepSeekChatConfig": (".llms.deepseek.chat.transformation", "DeepSeekChatConfig"),
+    "LMStudioChatConfig": (".llms.lm_studio.chat.transformation", "LMStudioChatConfig"),
+    "LmStudioEmbeddingConfig": (
+        ".llms.lm_studio.embed.transformation",
+        "LmStudioEmbeddingConfig",
+    ),
+    "PerplexityChatConfig": (
+        ".llms.perplexity.chat.transformation",
+        "PerplexityChatConfig",
+    ),
+    "AzureOpenAIO1Config": (
+        ".llms.azure.chat.o_series_transformation",
+        "AzureOpenAIO1Config",
+    ),
+    "IBMWatsonXAIConfig": (
+        ".llms.watsonx.completion.transformation",
+        "IBMWatsonXAIConfig",
+    ),
+    "IBMWatsonXChatConfig": (
+        ".llms.watsonx.chat.transformation",
+        "IBMWatsonXChatConfig",
+    ),
+    "IBMWatsonXEmbeddingConfig": (
+        ".llms.watsonx.embed.transformation",
+        "IBMWatsonXEmbeddingConfig",
+    ),
+    # subsystems
+    "BudgetManager": (".budget_manager", "BudgetManager"),
+    "run_server": (".proxy.proxy_cli", "run_server"),
+    "Router": (".router", "Router"),
+}
 
-from .llms.vertex_ai.vertex_embeddings.transformation import (
-    VertexAITextEmbeddingConfig,
-)
+# singleton config instances - attribute name -> config class name in `_lazy_imports`
+_lazy_config_instances: Dict[str, str] = {
+    "vertexAITextEmbeddingConfig": "VertexAITextEmbeddingConfig",
+    "openaiOSeriesConfig": "OpenAIOSeriesConfig",
+    "openAIGPTConfig": "OpenAIGPTConfig",
+    "openAIGPTAudioConfig": "OpenAIGPTAudioConfig",
+    "nvidiaNimConfig": "NvidiaNimConfig",
+    "nvidiaNimEmbeddingConfig": "NvidiaNimEmbeddingConfig",
+}
 
-vertexAITextEmbeddingConfig = VertexAITextEmbeddingConfig()
+_lazy_config_instances_lock = threading.Lock()
 
-from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
-    VertexAIAnthropicConfig,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
-    VertexAILlama3Config,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
-    VertexAIAi21Config,
-)
 
-from .llms.ollama.completion.transformation import OllamaConfig
-from .llms.sagemaker.completion.transformation import SagemakerConfig
-from .llms.sagemaker.chat.transformation import SagemakerChatConfig
-from .llms.ollama_chat import OllamaChatConfig
-from .llms.bedrock.chat.invoke_handler import (
-    AmazonCohereChatConfig,
-    bedrock_tool_name_mappings,
-)
+def _lazy_import(name: str) -> Any:
+    # no lock needed - the import system is thread-safe, and re-resolving returns the same object
+    module_name, attribute_name = _lazy_imports[name]
+    module = importlib.import_module(module_name, package=__name__)
+    value = getattr(module, attribute_name)
+    globals()[name] = value
+    return value
 
-from .llms.bedrock.common_utils import (
-    AmazonBedrockGlobalConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
-    AmazonAI21Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
-    AmazonInvokeNovaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
-    AmazonAnthropicConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
-    AmazonAnthropicClaude3Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
-    AmazonCohereConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
-    AmazonLlamaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
-    AmazonMistralConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
-    AmazonTitanConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
-    AmazonInvokeConfig,
-)
-
-from .llms.bedrock.image.amazon_stability1_transformation import AmazonStabilityConfig
-from .llms.bedrock.image.amazon_stability3_transformation import AmazonStability3Config
-from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
-from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
-    AmazonTitanMultimodalEmbeddingG1Config,
-)
-from .llms.bedrock.embed.amazon_titan_v2_transformation import (
-    AmazonTitanV2Config,
-)
-from .llms.cohere.chat.transformation import CohereChatConfig
-from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
-from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
-from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
-from .llms.deepinfra.chat.transformation import DeepInfraConfig
-from .llms.deepgram.audio_transcription.transformation import (
-    DeepgramAudioTranscriptionConfig,
-)
-from .llms.topaz.common_utils import TopazModelInfo
-from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
-from litellm.llms.openai.completion.transformation import OpenAITextCompletionConfig
-from .llms.groq.chat.transformation import GroqChatConfig
-from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
-from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
-from .llms.mistral.mistral_chat_transformation import MistralConfig
-from .llms.openai.chat.o_series_transformation import (
-    OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
-    OpenAIOSeriesConfig,
-)
 
-openaiOSeriesConfig = OpenAIOSeriesConfig()
-from .llms.openai.chat.gpt_transformation import (
-    OpenAIGPTConfig,
-)
+def __getattr__(name: str) -> Any:
+    """Resolve lazily registered provider configs / subsystems on first access."""
+    if name in _lazy_imports:
+        return _lazy_import(name)
+    if name in _lazy_config_instances:
+        config_class = _lazy_import(_lazy_config_instances[name])
+        with _lazy_config_instances_lock:
+            if name not in globals():
+                globals()[name] = config_class()
+        return globals()[name]
+    if not name.startswith("__"):
+        # submodules not imported yet, e.g. `litellm.router` - no longer imported eagerly by `litellm.Router`
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-openAIGPTConfig = OpenAIGPTConfig()
-from .llms.openai.chat.gpt_audio_transformation import (
-    OpenAIGPTAudioConfig,
-)
 
-openAIGPTAudioConfig = OpenAIGPTAudioConfig()
+def __dir__() -> List[str]:
+    return sorted(
+        set(globals().keys()) | set(_lazy_imports) | set(_lazy_config_instances)
+    )
 
-from .llms.nvidia_nim.chat import NvidiaNimConfig
-from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
 
-nvidiaNimConfig = NvidiaNimConfig()
-nvidiaNimEmbeddingConfig = NvidiaNimEmbeddingConfig()
-
-from .llms.cerebras.chat import CerebrasConfig
-from .llms.sambanova.chat import SambanovaConfig
-from .llms.ai21.chat.transformation import AI21ChatConfig
-from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
-from .llms.fireworks_ai.completion.transformation import FireworksAITextCompletionConfig
-from .llms.fireworks_ai.audio_transcription.transformation import (
-    FireworksAIAudioTranscriptionConfig,
-)
-from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
-    FireworksAIEmbeddingConfig,
-)
-from .llms.friendliai.chat.transformation import FriendliaiChatConfig
-from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
-from .llms.xai.chat.transformation import XAIChatConfig
-from .llms.volcengine import VolcEngineConfig
-from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
-from .llms.azure.azure import (
-    AzureOpenAIError,
-    AzureOpenAIAssistantsAPIConfig,
-)
-
-from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
-from .llms.azure.completion.transformation import AzureOpenAITextConfig
-from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
-from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
-from .llms.vllm.completion.transformation import VLLMConfig
-from .llms.deepseek.chat.transformation import DeepSeekChatConfig
-from .llms.lm_studio.chat.transformation import LMStudioChatConfig
-from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
-from .llms.perplexity.chat.transformation import PerplexityChatConfig
-from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
-from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
-from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
-from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
 from .main import *  # type: ignore
 from .integrations import *
 from .exceptions import (
@@ -1002,9 +1395,6 @@ from .exceptions import (
     LITELLM_EXCEPTION_TYPES,
     MockException,
 )
-from .budget_manager import BudgetManager
-from .proxy.proxy_cli import run_server
-from .router import Router
 from .assistants.main import *
 from .batches.main import *
 from .batch_completion.main import *  # type: ignore
@@ -1014,6 +1404,10 @@ from .fine_tuning.main import *
 from .files.main import *
 from .scheduler import *
 from .cost_calculator import response_cost_calculator, cost_per_token
+from .litellm_core_utils.llm_cost_calc.batch_cost_calculator import (
+    batch_cost_per_token,
+    batch_cost_per_token_from_standard_logging_payloads,
+)
 
 ### ADAPTERS ###
 from .types.adapter import AdapterItem
@@ -1031,4 +1425,17 @@ _custom_providers: List[str] = (
 disable_hf_tokenizer_download: Optional[bool] = (
     None  # disable huggingface tokenizer download. Defaults to openai clk100
 )
+tokenizer_cache_dir: Optional[str] = os.getenv(
+    "LITELLM_TOKENIZER_CACHE_DIR"
+)  # local dir of huggingface tokenizers - read before downloading a tokenizer, downloaded tokenizers are saved there
+preload_tokenizers: Optional[List[str]] = (
+    None  # models whose tokenizers are loaded on proxy startup, instead of on the first request
+)
 global_disable_no_log_param: bool = False
+
+# `from litellm import *` - public module attributes + the lazily resolved names
+__all__ = sorted(
+    {name for name in globals() if not name.startswith("_")}
+    | set(_lazy_imports)
+    | set(_lazy_config_instances)
+)
@@ -3,6 +3,9 @@ import logging
 import os
 from datetime import datetime
 from logging import Formatter
+from typing import Any, Callable, Optional
+
+import litellm
 
 set_verbose = False
 
@@ -96,6 +99,73 @@ def _enable_debugging():
     verbose_proxy_logger.disabled = False
 
 
+class LazyArg:
+    """
+    A log argument computed only if the message is emitted - e.g. `LazyArg(json.dumps, data, indent=4)`
+    """
+
+    __slots__ = ("func", "args", "kwargs", "value")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.value: Optional[str] = None
+
+    def __str__(self) -> str:
+        # computed once - each handler formats the message
+        if self.value is None:
+            self.value = str(self.func(*self.args, **self.kwargs))
+        return self.value
+
+    __repr__ = __str__
+
+
+class LazyLogger:
+    """
+    Logging facade for hot paths - code running per request or per streamed chunk.
+
+    `verbose_logger.debug(f"chunk: {chunk}")` builds the repr of `chunk` even when debug logging is off. `lazy_verbose_logger.debug("chunk: %s", chunk)`:
+    - checks the level first - `Logger.isEnabledFor` is a dict lookup, the logging module caches the check per level and clears the cache when a level is configured
+    - formats the arguments (+ computes `LazyArg`s) only if the message is emitted
+
+    Hot paths are listed in `tests/code_coverage_tests/enforce_lazy_debug_logging.py`.
+    """
+
+    __slots__ = ("logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    def is_debug_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def debug(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, stacklevel=2)
+
+    def info(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(msg, *args, stacklevel=2)
+
+    def print_verbose(self, msg: str, *args: Any) -> None:
+        """
+        Lazy `litellm.utils.print_verbose` - debug log, + print if `litellm.set_verbose` is on
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, stacklevel=2)
+        if litellm.set_verbose is True:
+            try:
+                print(msg % args if args else msg)  # noqa
+            except Exception:
+                pass
+
+
+lazy_verbose_proxy_logger = LazyLogger(verbose_proxy_logger)
+lazy_verbose_router_logger = LazyLogger(verbose_router_logger)
+lazy_verbose_logger = LazyLogger(verbose_logger)
+
+
 def print_verbose(print_statement):
     try:
         if set_verbose:
@@ -1,8 +1,17 @@
+import asyncio
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from typing import List, Optional
+from functools import partial
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 
 import litellm
-from litellm._logging import print_verbose
+from litellm._logging import print_verbose, verbose_logger
+from litellm.constants import (
+    BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES,
+    DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL,
+    DEFAULT_ADAPTIVE_CONCURRENCY_MAX,
+)
+from litellm.router_utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from litellm.types.utils import ModelResponse
 from litellm.utils import get_optional_params
 
 from ..llms.vllm.completion import handler as vllm_handler
@@ -251,3 +260,190 @@ def batch_completion_models_all_responses(*args, **kwargs):
                 responses.append(future.result())
 
     return responses
+
+
+async def abatch_completion_iter(
+    model: str,
+    messages: List[List],
+    ordered: bool = False,
+    initial_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL,
+    max_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_MAX,
+    max_rate_limit_retries: int = BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES,
+    **kwargs,
+) -> AsyncIterator[Tuple[int, Union[ModelResponse, Exception]]]:
+    """
+    Async batch litellm.acompletion for a given model - yields `(index, response)` as requests complete.
+
+    - requests run on the event loop (no thread per request), and share litellm's cached async client for the provider
+    - concurrency adapts to rate limits (AIMD) - it grows while requests succeed, shrinks on a 429, and follows the provider's `retry-after` / `x-ratelimit-*` headers
+    - a failed request yields its exception (after `max_rate_limit_retries` retries for rate limit errors), other requests are not affected
+
+    Args:
+        model (str): The model to use for generating completions.
+        messages (List[List]): List of message lists - each is sent as 1 request.
+        ordered (bool, optional): Yield results in the order of `messages`, instead of as they complete. Defaults to False.
+        initial_concurrency (int, optional): Number of concurrent requests to start with.
+        max_concurrency (int, optional): Upper bound on the number of concurrent requests.
+        max_rate_limit_retries (int, optional): Number of retries for a request that got rate limited.
+        **kwargs: Passed to `litellm.acompletion`.
+    """
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_concurrency=initial_concurrency, max_concurrency=max_concurrency
+    )
+    results: asyncio.Queue = asyncio.Queue()
+    tasks: Set[asyncio.Task] = set()
+
+    async def _run(index: int, message_list: List):
+        try:
+            response = await limiter.call(
+                partial(
+                    litellm.acompletion, model=model, messages=message_list, **kwargs
+                ),
+                max_rate_limit_retries=max_rate_limit_retries,
+            )
+            results.put_nowait((index, response))
+        except Exception as e:
+            results.put_nowait((index, e))
+        finally:
+            await limiter.release()
+
+    async def _dispatch():
+        for index, message_list in enumerate(messages):
+            # only start a task once it has a slot, so memory doesn't grow with len(messages)
+            await limiter.acquire()
+            task = asyncio.create_task(_run(index, message_list))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    dispatcher = asyncio.create_task(_dispatch())
+    try:
+        next_index = 0
+        completed: Dict[int, Union[ModelResponse, Exception]] = {}
+        for _ in range(len(messages)):
+            index, result = await results.get()
+            if not ordered:
+                yield index, result
+                continue
+            completed[index] = result
+            while next_index in completed:
+                yield next_index, completed.pop(next_index)
+                next_index += 1
+    finally:
+        # the caller stopped iterating early - don't leave requests running
+        dispatcher.cancel()
+        for task in list(tasks):
+            task.cancel()
+
+
+async def abatch_completion(
+    model: str,
+    messages: List[List],
+    initial_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL,
+    max_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_MAX,
+    max_rate_limit_retries: int = BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES,
+    **kwargs,
+) -> List[Union[ModelResponse, Exception]]:
+    """
+    Async batch litellm.acompletion for a given model. See `abatch_completion_iter` for how requests are run.
+
+    Returns:
+        list: The completion results, in the order of `messages`. Failed requests are returned as their exception.
+    """
+    responses: List[Union[ModelResponse, Exception]] = [None] * len(messages)  # type: ignore
+    num_failed = 0
+    async for index, result in abatch_completion_iter(
+        model=model,
+        messages=messages,
+        initial_concurrency=initial_concurrency,
+        max_concurrency=max_concurrency,
+        max_rate_limit_retries=max_rate_limit_retries,
+        **kwargs,
+    ):
+        responses[index] = result
+        if isinstance(result, Exception):
+            num_failed += 1
+    if num_failed > 0:
+        verbose_logger.warning(
+            "abatch_completion: %s/%s requests failed", num_failed, len(messages)
+        )
+    return responses
+
+
+def _get_batch_completion_models_kwargs(args: tuple, kwargs: dict) -> List[dict]:
+    """
+    Returns the `litellm.acompletion` kwargs for every model / deployment to send the request to
+    """
+    kwargs = dict(kwargs)
+    kwargs.pop("model", None)
+    if "models" in kwargs:
+        models = kwargs.pop("models")
+        if isinstance(models, str):
+            models = [models]
+        if args:
+            kwargs["messages"] = args[0]
+        return [{**kwargs, "model": model} for model in models]
+    elif "deployments" in kwargs:
+        deployments = kwargs.pop("deployments")
+        kwargs.pop("model_list", None)
+        nested_kwargs = kwargs.pop("kwargs", {})
+        # don't override deployment values e.g. model name, api base, etc.
+        return [{**kwargs, **deployment, **nested_kwargs} for deployment in deployments]
+    raise ValueError("'models' or 'deployments' param not in kwargs")
+
+
+async def abatch_completion_models(*args, **kwargs) -> Optional[ModelResponse]:
+    """
+    Async: send a request to multiple language models concurrently and return the first successful response.
+
+    The requests to the other models are cancelled once a model responds. Returns None if all models fail.
+    """
+    tasks = [
+        asyncio.create_task(litellm.acompletion(**completion_kwargs))
+        for completion_kwargs in _get_batch_completion_models_kwargs(args, kwargs)
+    ]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                # if model 1 fails, continue with response from model 2, model3
+                verbose_logger.debug(
+                    "abatch_completion_models: a model failed - %s", task.exception()
+                )
+    finally:
+        for task in pending:
+            task.cancel()
+    return None  # If no response is received from any model
+
+
+async def abatch_completion_models_all_responses(
+    *args, **kwargs
+) -> List[ModelResponse]:
+    """
+    Async: send a request to multiple language models concurrently and return the responses of all models that respond.
+
+    Models that fail are left out of the result (and logged).
+    """
+    completion_kwargs_list = _get_batch_completion_models_kwargs(args, kwargs)
+    results = await asyncio.gather(
+        *[
+            litellm.acompletion(**completion_kwargs)
+            for completion_kwargs in completion_kwargs_list
+        ],
+        return_exceptions=True,
+    )
+    responses: List[ModelResponse] = []
+    for completion_kwargs, result in zip(completion_kwargs_list, results):
+        if isinstance(result, Exception):
+            verbose_logger.warning(
+                "abatch_completion_models_all_responses: model=%s failed - %s",
+                completion_kwargs.get("model"),
+                result,
+            )
+        elif result is not None:
+            responses.append(result)  # type: ignore
+    return responses
@@ -2,15 +2,26 @@ import asyncio
 import datetime
 import json
 import threading
-from typing import Any, List, Literal, Optional
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
 import litellm
 from litellm._logging import verbose_logger
 from litellm.constants import (
+    BATCH_OUTPUT_FILE_STREAM_CHUNK_SIZE_BYTES,
     BATCH_STATUS_POLL_INTERVAL_SECONDS,
     BATCH_STATUS_POLL_MAX_ATTEMPTS,
 )
-from litellm.files.main import afile_content
+from litellm.cost_calculator import _get_model_cost_lookup_key
+from litellm.files.main import afile_content_stream
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.types.llms.openai import Batch
 from litellm.types.utils import StandardLoggingPayload, Usage
@@ -72,19 +83,9 @@ async def _handle_completed_batch(
     **kwargs,
 ) -> None:
     """Helper function to process a completed batch and handle logging"""
-    # Get batch results
-    file_content_dictionary = await _get_batch_output_file_content_as_dictionary(
-        batch, custom_llm_provider
-    )
-
-    # Calculate costs and usage
-    batch_cost = await _batch_cost_calculator(
-        custom_llm_provider=custom_llm_provider,
-        file_content_dictionary=file_content_dictionary,
-    )
-    batch_usage = _get_batch_job_total_usage_from_file_content(
-        file_content_dictionary=file_content_dictionary,
-        custom_llm_provider=custom_llm_provider,
+    # Calculate costs and usage - streams the batch output file, line by line
+    batch_cost, batch_usage = await _get_batch_output_file_cost_and_usage(
+        batch=batch, custom_llm_provider=custom_llm_provider
     )
 
     # Handle logging
@@ -135,118 +136,156 @@ async def _log_completed_batch(
     ).start()
 
 
-async def _batch_cost_calculator(
-    file_content_dictionary: List[dict],
-    custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
-) -> float:
+class BatchOutputUsageAggregator:
     """
-    Calculate the cost of a batch based on the output file id
+    Incrementally computes the cost + usage of a batch job, one output file line at a time - memory use doesn't depend on the size of the output file.
+
+    Requests are priced with the batch pricing of the model (`input_cost_per_token_batches` / `output_cost_per_token_batches` in the model cost map).
+    Falls back to `litellm.completion_cost()` for models without batch pricing.
     """
-    if custom_llm_provider == "vertex_ai":
-        raise ValueError("Vertex AI does not support file content retrieval")
-    total_cost = _get_batch_job_cost_from_file_content(
-        file_content_dictionary=file_content_dictionary,
-        custom_llm_provider=custom_llm_provider,
-    )
-    verbose_logger.debug("total_cost=%s", total_cost)
-    return total_cost
 
+    def __init__(
+        self,
+        custom_llm_provider: Literal[
+            "openai", "azure", "vertex_ai", "local"
+        ] = "openai",
+    ):
+        self.custom_llm_provider = custom_llm_provider
+        self.cost: float = 0.0
+        self.prompt_tokens: int = 0
+        self.completion_tokens: int = 0
+        self.total_tokens: int = 0
+        self._batch_pricing: Dict[str, Optional[Tuple[float, float]]] = {}
+
+    @property
+    def usage(self) -> Usage:
+        return Usage(
+            total_tokens=self.total_tokens,
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+        )
 
-async def _get_batch_output_file_content_as_dictionary(
-    batch: Batch,
-    custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
-) -> List[dict]:
-    """
-    Get the batch output file content as a list of dictionaries
-    """
-    if custom_llm_provider == "vertex_ai":
-        raise ValueError("Vertex AI does not support file content retrieval")
+    def add_line(self, line: bytes) -> None:
+        line = line.strip()
+        if not line:  # Skip empty lines
+            return
+        try:
+            batch_job_output_file_item = json.loads(line)
+        except ValueError as e:
+            # e.g. a truncated last line - the rest of the file is still priced
+            verbose_logger.warning(
+                "Skipping malformed batch output file line - %s", str(e)
+            )
+            return
+        if not isinstance(batch_job_output_file_item, dict):
+            verbose_logger.warning(
+                "Skipping batch output file line that is not a JSON object"
+            )
+            return
+        self.add_item(batch_job_output_file_item)
+
+    def add_item(self, batch_job_output_file_item: dict) -> None:
+        if not _batch_response_was_successful(batch_job_output_file_item):
+            return
+        _response_body = _get_response_from_batch_job_output_file(
+            batch_job_output_file_item
+        )
+        _usage = _response_body.get("usage", None) or {}
+        prompt_tokens = _usage.get("prompt_tokens", None) or 0
+        completion_tokens = _usage.get("completion_tokens", None) or 0
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.total_tokens += (
+            _usage.get("total_tokens", None) or prompt_tokens + completion_tokens
+        )
 
-    if batch.output_file_id is None:
-        raise ValueError("Output file id is None cannot retrieve file content")
+        batch_pricing = self._get_batch_pricing(_response_body.get("model", None))
+        if batch_pricing is not None:
+            input_cost_per_token, output_cost_per_token = batch_pricing
+            self.cost += (
+                prompt_tokens * input_cost_per_token
+                + completion_tokens * output_cost_per_token
+            )
+        else:
+            self.cost += litellm.completion_cost(
+                completion_response=_response_body,
+                custom_llm_provider=self.custom_llm_provider,
+            )
 
-    _file_content = await afile_content(
-        file_id=batch.output_file_id,
-        custom_llm_provider=custom_llm_provider,
-    )
-    return _get_file_content_as_dictionary(_file_content.content)
+    def _get_batch_pricing(self, model: Optional[str]) -> Optional[Tuple[float, float]]:
+        """
+        Returns (input_cost_per_token_batches, output_cost_per_token_batches) for `model`, None if the model has no batch pricing
+        """
+        if model is None:
+            return None
+        if model not in self._batch_pricing:
+            lookup_key, _, _ = _get_model_cost_lookup_key(
+                model=model, custom_llm_provider=self.custom_llm_provider
+            )
+            model_info = litellm.model_cost.get(lookup_key, None) or {}
+            input_cost_per_token = model_info.get("input_cost_per_token_batches", None)
+            output_cost_per_token = model_info.get(
+                "output_cost_per_token_batches", None
+            )
+            self._batch_pricing[model] = (
+                (float(input_cost_per_token), float(output_cost_per_token))
+                if input_cost_per_token is not None
+                and output_cost_per_token is not None
+                else None
+            )
+        return self._batch_pricing[model]
 
 
-def _get_file_content_as_dictionary(file_content: bytes) -> List[dict]:
-    """
-    Get the file content as a list of dictionaries from JSON Lines format
+async def _aiter_jsonl_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
     """
-    try:
-        _file_content_str = file_content.decode("utf-8")
-        # Split by newlines and parse each line as a separate JSON object
-        json_objects = []
-        for line in _file_content_str.strip().split("\n"):
-            if line:  # Skip empty lines
-                json_objects.append(json.loads(line))
-        verbose_logger.debug("json_objects=%s", json.dumps(json_objects, indent=4))
-        return json_objects
-    except Exception as e:
-        raise e
-
-
-def _get_batch_job_cost_from_file_content(
-    file_content_dictionary: List[dict],
-    custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
-) -> float:
-    """
-    Get the cost of a batch job from the file content
+    Split a stream of byte chunks into JSON Lines - only the current line is held in memory
     """
-    try:
-        total_cost: float = 0.0
-        # parse the file content as json
-        verbose_logger.debug(
-            "file_content_dictionary=%s", json.dumps(file_content_dictionary, indent=4)
-        )
-        for _item in file_content_dictionary:
-            if _batch_response_was_successful(_item):
-                _response_body = _get_response_from_batch_job_output_file(_item)
-                total_cost += litellm.completion_cost(
-                    completion_response=_response_body,
-                    custom_llm_provider=custom_llm_provider,
-                )
-                verbose_logger.debug("total_cost=%s", total_cost)
-        return total_cost
-    except Exception as e:
-        verbose_logger.error("error in _get_batch_job_cost_from_file_content", e)
-        raise e
+    parts: List[bytes] = []
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                if start < len(chunk):
+                    parts.append(chunk[start:])
+                break
+            parts.append(chunk[start:end])
+            yield b"".join(parts)
+            parts = []
+            start = end + 1
+    if parts:
+        yield b"".join(parts)
 
 
-def _get_batch_job_total_usage_from_file_content(
-    file_content_dictionary: List[dict],
-    custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
-) -> Usage:
+async def _get_batch_output_file_cost_and_usage(
+    batch: Batch,
+    custom_llm_provider: Literal["openai", "azure", "vertex_ai", "local"] = "openai",
+) -> Tuple[float, Usage]:
     """
-    Get the tokens of a batch job from the file content
+    Get the cost + usage of a completed batch by streaming its output file
     """
-    total_tokens: int = 0
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    for _item in file_content_dictionary:
-        if _batch_response_was_successful(_item):
-            _response_body = _get_response_from_batch_job_output_file(_item)
-            usage: Usage = _get_batch_job_usage_from_response_body(_response_body)
-            total_tokens += usage.total_tokens
-            prompt_tokens += usage.prompt_tokens
-            completion_tokens += usage.completion_tokens
-    return Usage(
-        total_tokens=total_tokens,
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-    )
+    if custom_llm_provider == "vertex_ai":
+        raise ValueError("Vertex AI does not support file content retrieval")
 
+    if batch.output_file_id is None:
+        raise ValueError("Output file id is None cannot retrieve file content")
 
-def _get_batch_job_usage_from_response_body(response_body: dict) -> Usage:
-    """
-    Get the tokens of a batch job from the response body
-    """
-    _usage_dict = response_body.get("usage", None) or {}
-    usage: Usage = Usage(**_usage_dict)
-    return usage
+    aggregator = BatchOutputUsageAggregator(custom_llm_provider=custom_llm_provider)
+    async for line in _aiter_jsonl_lines(
+        afile_content_stream(
+            file_id=batch.output_file_id,
+            custom_llm_provider=custom_llm_provider,  # type: ignore
+            chunk_size=BATCH_OUTPUT_FILE_STREAM_CHUNK_SIZE_BYTES,
+        )
+    ):
+        aggregator.add_line(line)
+    verbose_logger.debug(
+        "batch %s - total_cost=%s, usage=%s",
+        batch.id,
+        aggregator.cost,
+        aggregator.usage,
+    )
+    return aggregator.cost, aggregator.usage
 
 
 def _get_response_from_batch_job_output_file(batch_job_output_file: dict) -> Any:
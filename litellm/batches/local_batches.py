@@ -0,0 +1,966 @@
+"""
+Local batch execution - emulates the OpenAI Files + Batches API for providers without a native batch api.
+
+- used with `custom_llm_provider="local"`, and by the router for deployments whose provider has no batch api
+- files + batch state are stored in `LITELLM_LOCAL_BATCH_DIR` (default: `<tmp dir>/litellm_local_batches`). Set it to a persistent dir, for batches to survive restarts.
+- every line of the input file is run through `Router.acompletion` / `aembedding` / `atext_completion` (or `litellm.*` if no router is given), with AIMD concurrency that backs off on rate limit errors
+- a line's `body` can only set the params in `LOCAL_BATCH_ENDPOINT_TO_BODY_PARAMS` - e.g. not `api_base` / `api_key`
+- results are appended to the output / error file as they complete. These files are the checkpoint - a resumed batch skips the `custom_id`s already in them.
+- a running batch holds a lock file, so it is run by 1 process - every proxy worker resumes interrupted batches on startup
+- file reads / writes of async paths are done in a thread, not on the event loop
+"""
+
+import asyncio
+import functools
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from os import PathLike
+from typing import (
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+import httpx
+from openai.types.batch import Errors
+from openai.types.batch_error import BatchError
+from openai.types.batch_request_counts import BatchRequestCounts
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL,
+    DEFAULT_ADAPTIVE_CONCURRENCY_MAX,
+    LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES,
+    LOCAL_BATCH_PROGRESS_SAVE_INTERVAL_SECONDS,
+)
+from litellm.router_utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from litellm.types.llms.openai import (
+    Batch,
+    CreateBatchRequest,
+    CreateFileRequest,
+    FileContentRequest,
+    FileObject,
+    FileTypes,
+    HttpxBinaryResponseContent,
+)
+
+try:
+    import fcntl
+except (
+    ImportError
+):  # not available on windows - batches are not locked across processes
+    fcntl = None  # type: ignore
+
+NATIVE_BATCH_API_PROVIDERS = ["openai", "azure", "vertex_ai"]
+LOCAL_BATCH_ENDPOINT_TO_ROUTE = {
+    "/v1/chat/completions": "acompletion",
+    "/v1/embeddings": "aembedding",
+    "/v1/completions": "atext_completion",
+}
+# body params a batch request line can set, per endpoint. Anything else (e.g. `api_base`, `api_key`) is rejected.
+LOCAL_BATCH_ENDPOINT_TO_BODY_PARAMS: Dict[str, Set[str]] = {
+    "/v1/chat/completions": {
+        "model",
+        "messages",
+        "audio",
+        "frequency_penalty",
+        "function_call",
+        "functions",
+        "logit_bias",
+        "logprobs",
+        "max_completion_tokens",
+        "max_tokens",
+        "metadata",
+        "mock_response",
+        "modalities",
+        "n",
+        "parallel_tool_calls",
+        "prediction",
+        "presence_penalty",
+        "reasoning_effort",
+        "response_format",
+        "seed",
+        "service_tier",
+        "stop",
+        "store",
+        "temperature",
+        "tool_choice",
+        "tools",
+        "top_logprobs",
+        "top_p",
+        "user",
+    },
+    "/v1/embeddings": {
+        "model",
+        "input",
+        "dimensions",
+        "encoding_format",
+        "metadata",
+        "mock_response",
+        "user",
+    },
+    "/v1/completions": {
+        "model",
+        "prompt",
+        "best_of",
+        "echo",
+        "frequency_penalty",
+        "logit_bias",
+        "logprobs",
+        "max_tokens",
+        "metadata",
+        "mock_response",
+        "n",
+        "presence_penalty",
+        "seed",
+        "stop",
+        "suffix",
+        "temperature",
+        "top_p",
+        "user",
+    },
+}
+LOCAL_FILE_ID_PREFIX = "file-local-"
+_ACTIVE_BATCH_STATUSES = ("validating", "in_progress", "finalizing", "cancelling")
+_ID_PATTERN = re.compile(r"^[A-Za-z0-9_\-]+$")
+_INPUT_FILE_READ_SIZE_BYTES = (
+    1024 * 1024
+)  # input file lines are read in chunks of ~this size
+
+
+def is_native_batch_api_provider(custom_llm_provider: Optional[str]) -> bool:
+    return custom_llm_provider in NATIVE_BATCH_API_PROVIDERS
+
+
+def is_local_file_id(file_id: Optional[str]) -> bool:
+    return file_id is not None and file_id.startswith(LOCAL_FILE_ID_PREFIX)
+
+
+def validate_local_batch_request_body(endpoint: str, body: Any) -> dict:
+    """
+    Raises BadRequestError if a batch request line's `body` sets a param not allowed for `endpoint`
+    """
+    if not isinstance(body, dict):
+        raise litellm.exceptions.BadRequestError(
+            message=f"Invalid batch request body - expected a JSON object, got {type(body).__name__}",
+            model="n/a",
+            llm_provider="local",
+        )
+    disallowed_params = body.keys() - LOCAL_BATCH_ENDPOINT_TO_BODY_PARAMS[endpoint]
+    if disallowed_params:
+        raise litellm.exceptions.BadRequestError(
+            message=f"Invalid batch request body - params={sorted(disallowed_params)} are not allowed for endpoint={endpoint}",
+            model=str(body.get("model") or "n/a"),
+            llm_provider="local",
+        )
+    return body
+
+
+def _get_completion_window_seconds(completion_window: str) -> int:
+    if completion_window.endswith("h") and completion_window[:-1].isdigit():
+        return int(completion_window[:-1]) * 3600
+    raise litellm.exceptions.BadRequestError(
+        message=f"Invalid completion_window={completion_window}. Expected a window in hours, e.g. '24h'",
+        model="n/a",
+        llm_provider="local",
+    )
+
+
+async def _run_in_thread(fn, *args, **kwargs) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(fn, *args, **kwargs)
+    )
+
+
+def _truncate_partial_last_line(file_path: str):
+    """
+    Drop a partially written last line (e.g. the process died mid-write), so the file can be appended to
+    """
+    if not os.path.exists(file_path):
+        return
+    with open(file_path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            newline_index = f.read(end - start).rfind(b"\n")
+            if newline_index != -1:
+                f.truncate(start + newline_index + 1)
+                return
+            end = start
+        f.truncate(0)
+
+
+class LocalBatchStore:
+    """
+    Files + batch state on local disk.
+
+    - files/<file_id>.jsonl - file content
+    - files/<file_id>.json - FileObject
+    - batches/<batch_id>.json - Batch + the litellm metadata the batch requests are made with
+    - batches/<batch_id>.lock - locked by the process running the batch
+    """
+
+    def __init__(self, base_dir: Optional[str] = None):
+        self._base_dir = base_dir
+        self._warned_default_base_dir = False
+
+    @property
+    def base_dir(self) -> str:
+        return (
+            self._base_dir
+            or os.getenv("LITELLM_LOCAL_BATCH_DIR")
+            or os.path.join(tempfile.gettempdir(), "litellm_local_batches")
+        )
+
+    def warn_if_default_base_dir(self):
+        if self._warned_default_base_dir:
+            return
+        if self._base_dir is None and os.getenv("LITELLM_LOCAL_BATCH_DIR") is None:
+            verbose_logger.warning(
+                "litellm.batches.local_batches - local batches are stored in %s. Set `LITELLM_LOCAL_BATCH_DIR` to a persistent dir, to resume batches after a restart.",
+                self.base_dir,
+            )
+        self._warned_default_base_dir = True
+
+    def _get_path(self, directory: str, object_id: str, suffix: str) -> str:
+        if not _ID_PATTERN.match(object_id):
+            raise litellm.exceptions.BadRequestError(
+                message=f"Invalid id={object_id}",
+                model="n/a",
+                llm_provider="local",
+            )
+        directory_path = os.path.join(self.base_dir, directory)
+        os.makedirs(directory_path, exist_ok=True)
+        return os.path.join(directory_path, object_id + suffix)
+
+    @staticmethod
+    def _write_json(file_path: str, obj: Any):
+        # write to a temp file + rename, so concurrent readers never see a partial file
+        tmp_file_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file_path, "w") as f:
+            json.dump(obj, f, default=str)
+        os.replace(tmp_file_path, file_path)
+
+    @staticmethod
+    def _read_json(file_path: str, object_type: str, object_id: str) -> Any:
+        try:
+            with open(file_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise litellm.exceptions.NotFoundError(
+                message=f"No local {object_type} found with id={object_id}",
+                model="n/a",
+                llm_provider="local",
+            )
+
+    ## FILES ##
+
+    def get_file_content_path(self, file_id: str) -> str:
+        return self._get_path("files", file_id, ".jsonl")
+
+    def create_file(self, file: FileTypes, purpose: str) -> FileObject:
+        file_id = f"{LOCAL_FILE_ID_PREFIX}{uuid.uuid4().hex}"
+        filename = "file.jsonl"
+        content: Any = file
+        if isinstance(file, tuple):
+            filename = file[0] or filename
+            content = file[1]
+
+        file_path = self.get_file_content_path(file_id)
+        with open(file_path, "wb") as f:
+            if isinstance(content, bytes):
+                f.write(content)
+            elif isinstance(content, str):
+                f.write(content.encode("utf-8"))
+            elif isinstance(content, PathLike):
+                with open(content, "rb") as source_file:
+                    shutil.copyfileobj(source_file, f)
+            elif hasattr(content, "read"):
+                for chunk in iter(lambda: content.read(65536), content.read(0)):
+                    f.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            else:
+                raise litellm.exceptions.BadRequestError(
+                    message=f"Unsupported file content type - {type(content)}",
+                    model="n/a",
+                    llm_provider="local",
+                )
+        return self.save_file_object(
+            file_id=file_id, filename=filename, purpose=purpose
+        )
+
+    def save_file_object(self, file_id: str, filename: str, purpose: str) -> FileObject:
+        file_object = FileObject(
+            id=file_id,
+            bytes=os.path.getsize(self.get_file_content_path(file_id)),
+            created_at=int(time.time()),
+            filename=filename,
+            object="file",
+            purpose=purpose,  # type: ignore
+            status="processed",
+        )
+        self._write_json(
+            self._get_path("files", file_id, ".json"), file_object.model_dump()
+        )
+        return file_object
+
+    def get_file(self, file_id: str) -> FileObject:
+        return FileObject(
+            **self._read_json(
+                self._get_path("files", file_id, ".json"), "file", file_id
+            )
+        )
+
+    def get_file_content(self, file_id: str) -> bytes:
+        self.get_file(file_id)
+        with open(self.get_file_content_path(file_id), "rb") as f:
+            return f.read()
+
+    def iter_file_lines(self, file_id: str) -> Iterator[bytes]:
+        self.get_file(file_id)
+        with open(self.get_file_content_path(file_id), "rb") as f:
+            yield from f
+
+    ## BATCHES ##
+
+    def save_batch(self, batch: Batch, litellm_metadata: Optional[dict] = None):
+        self._write_json(
+            self._get_path("batches", batch.id, ".json"),
+            {"batch": batch.model_dump(), "litellm_metadata": litellm_metadata},
+        )
+
+    def update_batch(self, batch: Batch):
+        """
+        Save `batch`, keeping the litellm metadata it was created with
+        """
+        self.save_batch(
+            batch, litellm_metadata=self.get_batch_litellm_metadata(batch.id)
+        )
+
+    def _get_batch_state(self, batch_id: str) -> dict:
+        return self._read_json(
+            self._get_path("batches", batch_id, ".json"), "batch", batch_id
+        )
+
+    def get_batch(self, batch_id: str) -> Batch:
+        return Batch(**self._get_batch_state(batch_id)["batch"])
+
+    def get_batch_litellm_metadata(self, batch_id: str) -> Optional[dict]:
+        return self._get_batch_state(batch_id).get("litellm_metadata")
+
+    def try_lock_batch(self, batch_id: str) -> Optional[int]:
+        """
+        Non-blocking exclusive lock on a batch, held while the batch runs.
+
+        Returns the lock fd, None if the batch is locked by another run (e.g. in another proxy worker).
+        """
+        lock_fd = os.open(
+            self._get_path("batches", batch_id, ".lock"), os.O_RDWR | os.O_CREAT
+        )
+        if fcntl is None:
+            return lock_fd
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(lock_fd)
+            return None
+        return lock_fd
+
+    @staticmethod
+    def unlock_batch(lock_fd: int):
+        os.close(lock_fd)  # releases the lock
+
+    def list_batches(self) -> List[Batch]:
+        batches_dir = os.path.join(self.base_dir, "batches")
+        if not os.path.isdir(batches_dir):
+            return []
+        batches = []
+        for file_name in os.listdir(batches_dir):
+            if file_name.endswith(".json"):
+                batches.append(self.get_batch(file_name[: -len(".json")]))
+        return sorted(batches, key=lambda batch: batch.created_at, reverse=True)
+
+
+class LocalBatchRun:
+    """
+    Executes 1 batch - dispatches the input file lines, writes the output / error files, keeps the batch state up to date
+    """
+
+    def __init__(
+        self,
+        batch: Batch,
+        store: LocalBatchStore,
+        limiter: AdaptiveConcurrencyLimiter,
+        llm_router: Optional[Any] = None,
+        litellm_metadata: Optional[dict] = None,
+        max_rate_limit_retries: int = LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES,
+    ):
+        self.batch = batch
+        self.store = store
+        self.limiter = limiter
+        self.llm_router = llm_router
+        self.litellm_metadata = litellm_metadata
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.output_file_id = f"file-{batch.id}-output"
+        self.error_file_id = f"file-{batch.id}-errors"
+        self.cancelled = False
+        self.expired = False
+        self._pending: Set[asyncio.Task] = set()
+        self._last_progress_save_time = 0.0
+
+    @property
+    def request_counts(self) -> BatchRequestCounts:
+        return self.batch.request_counts  # type: ignore
+
+    async def run(self) -> Batch:
+        batch = self.batch
+        try:
+            done_custom_ids, done_line_numbers = await _run_in_thread(
+                self._load_checkpoint
+            )
+            if batch.status == "cancelling":
+                self.cancelled = True
+            else:
+                batch.status = "in_progress"
+            batch.in_progress_at = batch.in_progress_at or int(time.time())
+            await _run_in_thread(self.store.update_batch, batch)
+
+            self._output_file = await _run_in_thread(
+                open, self.store.get_file_content_path(self.output_file_id), "ab"
+            )
+            try:
+                self._error_file = await _run_in_thread(
+                    open, self.store.get_file_content_path(self.error_file_id), "ab"
+                )
+                try:
+                    await self._dispatch(done_custom_ids, done_line_numbers)
+                    if self._pending:
+                        await asyncio.gather(*self._pending)
+                finally:
+                    await asyncio.shield(_run_in_thread(self._error_file.close))
+            finally:
+                await asyncio.shield(_run_in_thread(self._output_file.close))
+
+            await _run_in_thread(self._finalize)
+        except asyncio.CancelledError:
+            for task in self._pending:
+                task.cancel()
+            batch.status = "cancelled"
+            batch.cancelled_at = int(time.time())
+            # shielded - the state is saved even though this task is being cancelled
+            await asyncio.shield(_run_in_thread(self.store.update_batch, batch))
+            raise
+        except Exception as e:
+            verbose_logger.exception(
+                "litellm.batches.local_batches - batch_id=%s failed - %s",
+                batch.id,
+                str(e),
+            )
+            batch.status = "failed"
+            batch.failed_at = int(time.time())
+            batch.errors = Errors(
+                object="list",
+                data=[BatchError(code="local_batch_error", message=str(e))],
+            )
+            await _run_in_thread(self.store.update_batch, batch)
+        return batch
+
+    def _load_checkpoint(self):
+        """
+        Returns the custom_ids (and line numbers of invalid lines) already in the output / error files
+        """
+        done_custom_ids: Set[str] = set()
+        done_line_numbers: Set[int] = set()
+        num_lines = {}
+        for file_id in (self.output_file_id, self.error_file_id):
+            file_path = self.store.get_file_content_path(file_id)
+            _truncate_partial_last_line(file_path)
+            num_lines[file_id] = 0
+            if not os.path.exists(file_path):
+                continue
+            with open(file_path, "rb") as f:
+                for line_number, line in enumerate(f, start=1):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:  # invalid json / utf-8
+                        # not counted as done - its request is re-run
+                        verbose_logger.warning(
+                            "litellm.batches.local_batches - skipping corrupt line %s of %s",
+                            line_number,
+                            file_path,
+                        )
+                        continue
+                    num_lines[file_id] += 1
+                    if record.get("custom_id") is not None:
+                        done_custom_ids.add(record["custom_id"])
+                    elif (record.get("error") or {}).get("line") is not None:
+                        done_line_numbers.add(record["error"]["line"])
+        self.request_counts.completed = num_lines[self.output_file_id]
+        self.request_counts.failed = num_lines[self.error_file_id]
+        return done_custom_ids, done_line_numbers
+
+    @staticmethod
+    async def _aiter_lines(file: Any) -> AsyncIterator[bytes]:
+        while True:
+            lines = await _run_in_thread(file.readlines, _INPUT_FILE_READ_SIZE_BYTES)
+            if not lines:
+                return
+            for line in lines:
+                yield line
+
+    async def _dispatch(self, done_custom_ids: Set[str], done_line_numbers: Set[int]):
+        total = 0
+        line_number = 0
+        input_file = await _run_in_thread(
+            open, self.store.get_file_content_path(self.batch.input_file_id), "rb"
+        )
+        try:
+            async for line in self._aiter_lines(input_file):
+                line_number += 1
+                if not line.strip():
+                    continue
+                total += 1
+                self.request_counts.total = max(self.request_counts.total, total)
+                if line_number in done_line_numbers:
+                    continue
+                try:
+                    request = json.loads(line)
+                    custom_id = request["custom_id"]
+                    body = request["body"]
+                except Exception as e:
+                    await self._write_invalid_line_error(
+                        line_number=line_number, error=e
+                    )
+                    continue
+                if custom_id in done_custom_ids:
+                    continue
+
+                await self.limiter.acquire()
+                if self._should_stop():
+                    await self.limiter.release()
+                    break
+                task = asyncio.create_task(self._run_request(custom_id, body))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+                await self._maybe_save_progress()
+        finally:
+            await asyncio.shield(_run_in_thread(input_file.close))
+
+    def _should_stop(self) -> bool:
+        if self.batch.expires_at is not None and time.time() > self.batch.expires_at:
+            self.expired = True
+        return self.cancelled or self.expired
+
+    async def _run_request(self, custom_id: str, body: dict):
+        try:
+            response = await self.limiter.call(
+                functools.partial(self._call, body),
+                max_rate_limit_retries=self.max_rate_limit_retries,
+            )
+            await self._write_output(custom_id=custom_id, response=response)
+        except Exception as e:
+            await self._write_error(custom_id=custom_id, error=e)
+        finally:
+            await self.limiter.release()
+            await self._maybe_save_progress()
+
+    async def _call(self, body: dict) -> Any:
+        kwargs = dict(validate_local_batch_request_body(self.batch.endpoint, body))
+        if self.litellm_metadata:
+            # e.g. the proxy's user_api_key_* metadata - so spend is tracked per request
+            kwargs["metadata"] = {
+                **(kwargs.get("metadata") or {}),
+                **self.litellm_metadata,
+            }
+        route = LOCAL_BATCH_ENDPOINT_TO_ROUTE[self.batch.endpoint]
+        target = self.llm_router if self.llm_router is not None else litellm
+        return await getattr(target, route)(**kwargs)
+
+    ## OUTPUT ##
+
+    @staticmethod
+    def _write_line(file: Any, record: dict):
+        file.write(json.dumps(record, default=str).encode("utf-8") + b"\n")
+        file.flush()
+
+    async def _write_output(self, custom_id: str, response: Any):
+        await _run_in_thread(
+            self._write_line,
+            self._output_file,
+            {
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": custom_id,
+                "response": {
+                    "status_code": 200,
+                    "request_id": getattr(response, "id", None) or "",
+                    "body": response.model_dump(),
+                },
+                "error": None,
+            },
+        )
+        self.request_counts.completed += 1
+
+    async def _write_error(self, custom_id: str, error: Exception):
+        await _run_in_thread(
+            self._write_line,
+            self._error_file,
+            {
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": custom_id,
+                "response": {
+                    "status_code": getattr(error, "status_code", 500),
+                    "request_id": "",
+                    "body": {
+                        "error": {
+                            "message": str(error),
+                            "type": type(error).__name__,
+                            "code": getattr(error, "code", None),
+                        }
+                    },
+                },
+                "error": None,
+            },
+        )
+        self.request_counts.failed += 1
+
+    async def _write_invalid_line_error(self, line_number: int, error: Exception):
+        await _run_in_thread(
+            self._write_line,
+            self._error_file,
+            {
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": None,
+                "response": None,
+                "error": {
+                    "code": "invalid_request",
+                    "message": f"Invalid batch request line - {str(error)}",
+                    "line": line_number,
+                },
+            },
+        )
+        self.request_counts.failed += 1
+
+    ## STATE ##
+
+    async def _maybe_save_progress(self):
+        now = time.monotonic()
+        if (
+            now - self._last_progress_save_time
+            < LOCAL_BATCH_PROGRESS_SAVE_INTERVAL_SECONDS
+        ):
+            return
+        self._last_progress_save_time = now
+        # the batch may have been cancelled by another worker
+        stored_batch = await _run_in_thread(self.store.get_batch, self.batch.id)
+        if stored_batch.status == "cancelling":
+            self.cancelled = True
+            self.batch.status = "cancelling"
+        await _run_in_thread(self.store.update_batch, self.batch)
+
+    def _finalize(self):
+        batch = self.batch
+        now = int(time.time())
+        if self.cancelled:
+            batch.status = "cancelled"
+            batch.cancelled_at = now
+        elif self.expired:
+            batch.status = "expired"
+            batch.expired_at = now
+        else:
+            batch.status = "completed"
+            batch.finalizing_at = now
+            batch.completed_at = now
+        if self.request_counts.completed > 0:
+            batch.output_file_id = self.store.save_file_object(
+                file_id=self.output_file_id,
+                filename="batch_output.jsonl",
+                purpose="batch_output",
+            ).id
+        if self.request_counts.failed > 0:
+            batch.error_file_id = self.store.save_file_object(
+                file_id=self.error_file_id,
+                filename="batch_errors.jsonl",
+                purpose="batch_output",
+            ).id
+        self.store.update_batch(batch)
+
+
+class LocalBatchExecutor:
+    def __init__(
+        self,
+        store: Optional[LocalBatchStore] = None,
+        initial_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL,
+        max_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_MAX,
+        max_rate_limit_retries: int = LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES,
+    ):
+        self.store = store or LocalBatchStore()
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self._runs: Dict[str, LocalBatchRun] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def _create_batch_object(self, create_batch_data: CreateBatchRequest) -> Batch:
+        endpoint = create_batch_data["endpoint"]
+        if endpoint not in LOCAL_BATCH_ENDPOINT_TO_ROUTE:
+            raise litellm.exceptions.BadRequestError(
+                message=f"Unsupported endpoint={endpoint} for local batches. Supported endpoints - {list(LOCAL_BATCH_ENDPOINT_TO_ROUTE.keys())}",
+                model="n/a",
+                llm_provider="local",
+            )
+        self.store.get_file(create_batch_data["input_file_id"])
+        self.store.warn_if_default_base_dir()
+        completion_window = create_batch_data.get("completion_window") or "24h"
+        # batch metadata is str -> str. Drop anything else (e.g. ints / lists the router adds to `metadata`)
+        metadata = {
+            key: value
+            for key, value in (create_batch_data.get("metadata") or {}).items()
+            if isinstance(value, str)
+        }
+        now = int(time.time())
+        return Batch(
+            id=f"batch_local_{uuid.uuid4().hex}",
+            object="batch",
+            endpoint=endpoint,
+            input_file_id=create_batch_data["input_file_id"],
+            completion_window=completion_window,
+            status="validating",
+            created_at=now,
+            expires_at=now + _get_completion_window_seconds(completion_window),
+            metadata=metadata or None,
+            request_counts=BatchRequestCounts(total=0, completed=0, failed=0),
+        )
+
+    def _get_run(
+        self, batch_id: str, llm_router: Optional[Any] = None
+    ) -> LocalBatchRun:
+        run = LocalBatchRun(
+            batch=self.store.get_batch(batch_id),
+            store=self.store,
+            limiter=AdaptiveConcurrencyLimiter(
+                initial_concurrency=self.initial_concurrency,
+                max_concurrency=self.max_concurrency,
+            ),
+            llm_router=llm_router,
+            litellm_metadata=self.store.get_batch_litellm_metadata(batch_id),
+            max_rate_limit_retries=self.max_rate_limit_retries,
+        )
+        self._runs[batch_id] = run
+        return run
+
+    async def arun_batch(
+        self,
+        batch_id: str,
+        llm_router: Optional[Any] = None,
+        lock_fd: Optional[int] = None,
+    ) -> Batch:
+        """
+        Run (or resume) a batch until it is completed / cancelled / expired
+
+        If the batch is already running in another process, returns its current state.
+        """
+        if lock_fd is None:
+            lock_fd = await _run_in_thread(self.store.try_lock_batch, batch_id)
+            if lock_fd is None:
+                return await _run_in_thread(self.store.get_batch, batch_id)
+        try:
+            run = await _run_in_thread(
+                self._get_run, batch_id=batch_id, llm_router=llm_router
+            )
+            return await run.run()
+        finally:
+            self._runs.pop(batch_id, None)
+            self.store.unlock_batch(lock_fd)
+
+    def start_batch(
+        self,
+        batch_id: str,
+        llm_router: Optional[Any] = None,
+        lock_fd: Optional[int] = None,
+    ) -> asyncio.Task:
+        task = asyncio.create_task(
+            self.arun_batch(batch_id, llm_router=llm_router, lock_fd=lock_fd)
+        )
+        self._tasks[batch_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(batch_id, None))
+        return task
+
+    async def acreate_batch(
+        self,
+        create_batch_data: CreateBatchRequest,
+        llm_router: Optional[Any] = None,
+        litellm_metadata: Optional[dict] = None,
+    ) -> Batch:
+        batch = await _run_in_thread(self._create_batch_object, create_batch_data)
+        await _run_in_thread(
+            self.store.save_batch, batch, litellm_metadata=litellm_metadata
+        )
+        self.start_batch(batch.id, llm_router=llm_router)
+        return batch
+
+    def create_batch(
+        self,
+        create_batch_data: CreateBatchRequest,
+        llm_router: Optional[Any] = None,
+        litellm_metadata: Optional[dict] = None,
+    ) -> Batch:
+        """
+        Sync - runs the batch on a background thread, with its own event loop
+        """
+        batch = self._create_batch_object(create_batch_data)
+        self.store.save_batch(batch, litellm_metadata=litellm_metadata)
+        threading.Thread(
+            target=asyncio.run,
+            args=(self.arun_batch(batch.id, llm_router=llm_router),),
+            daemon=True,
+        ).start()
+        return batch
+
+    def cancel_batch(self, batch_id: str) -> Batch:
+        """
+        Stops dispatching new requests. In-flight requests finish, then the batch is `cancelled`.
+        """
+        batch = self.store.get_batch(batch_id)
+        if batch.status not in _ACTIVE_BATCH_STATUSES:
+            return batch
+        run = self._runs.get(batch_id)
+        if run is not None:
+            run.cancelled = True
+            batch = run.batch
+        batch.status = "cancelling"
+        batch.cancelling_at = int(time.time())
+        self.store.update_batch(batch)
+        return batch
+
+    async def resume_batches(self, llm_router: Optional[Any] = None) -> List[str]:
+        """
+        Resume batches that were interrupted (e.g. by a restart). Returns the resumed batch ids.
+
+        Called on proxy startup by every worker - a batch is resumed by the 1st worker that locks it.
+        """
+        resumed_batch_ids = []
+        for batch in await _run_in_thread(self.store.list_batches):
+            if batch.status not in _ACTIVE_BATCH_STATUSES or batch.id in self._runs:
+                continue
+            lock_fd = await _run_in_thread(self.store.try_lock_batch, batch.id)
+            if lock_fd is None:
+                continue  # running in another process
+            self.start_batch(batch.id, llm_router=llm_router, lock_fd=lock_fd)
+            resumed_batch_ids.append(batch.id)
+        return resumed_batch_ids
+
+
+class LocalBatchesAPI:
+    """
+    Files + Batches API handler for `custom_llm_provider="local"`
+    """
+
+    def __init__(self, executor: Optional[LocalBatchExecutor] = None):
+        self.executor = executor or LocalBatchExecutor()
+
+    @property
+    def store(self) -> LocalBatchStore:
+        return self.executor.store
+
+    def create_file(self, create_file_data: CreateFileRequest) -> FileObject:
+        return self.store.create_file(
+            file=create_file_data["file"], purpose=create_file_data["purpose"]
+        )
+
+    def retrieve_file(self, file_id: str) -> FileObject:
+        return self.store.get_file(file_id)
+
+    def file_content(
+        self, file_content_request: FileContentRequest
+    ) -> HttpxBinaryResponseContent:
+        file_id = file_content_request["file_id"]
+        return HttpxBinaryResponseContent(
+            response=httpx.Response(
+                status_code=200,
+                content=self.store.get_file_content(file_id),
+                request=httpx.Request(method="GET", url=f"local://files/{file_id}"),
+            )
+        )
+
+    async def afile_content_stream(
+        self, file_content_request: FileContentRequest, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        file_id = file_content_request["file_id"]
+        await _run_in_thread(self.store.get_file, file_id)
+        f = await _run_in_thread(open, self.store.get_file_content_path(file_id), "rb")
+        try:
+            while True:
+                chunk = await _run_in_thread(
+                    f.read, chunk_size or io.DEFAULT_BUFFER_SIZE
+                )
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            await asyncio.shield(_run_in_thread(f.close))
+
+    def create_batch(
+        self,
+        _is_async: bool,
+        create_batch_data: CreateBatchRequest,
+        llm_router: Optional[Any] = None,
+        litellm_metadata: Optional[dict] = None,
+    ) -> Union[Batch, Coroutine[Any, Any, Batch]]:
+        if _is_async is True:
+            # the batch task has to be started on the caller's event loop
+            return self.executor.acreate_batch(
+                create_batch_data=create_batch_data,
+                llm_router=llm_router,
+                litellm_metadata=litellm_metadata,
+            )
+        return self.executor.create_batch(
+            create_batch_data=create_batch_data,
+            llm_router=llm_router,
+            litellm_metadata=litellm_metadata,
+        )
+
+    def retrieve_batch(self, batch_id: str) -> Batch:
+        return self.store.get_batch(batch_id)
+
+    def cancel_batch(self, batch_id: str) -> Batch:
+        return self.executor.cancel_batch(batch_id)
+
+    def list_batches(self, after: Optional[str] = None, limit: Optional[int] = None):
+        batches = self.store.list_batches()
+        if after is not None:
+            batch_ids = [batch.id for batch in batches]
+            batches = (
+                batches[batch_ids.index(after) + 1 :] if after in batch_ids else []
+            )
+        limit = limit or 20
+        data = batches[:limit]
+        return {
+            "object": "list",
+            "data": data,
+            "first_id": data[0].id if data else None,
+            "last_id": data[-1].id if data else None,
+            "has_more": len(batches) > limit,
+        }
+
+
+local_batch_executor = LocalBatchExecutor()
+local_batches_instance = LocalBatchesAPI(executor=local_batch_executor)
@@ -1,6 +1,8 @@
 """
 Dual Cache implementation - Class to update both Redis and an in-memory cache simultaneously.
 
+With a shared-memory cache (multi-worker proxy), it's checked between the in-memory cache and Redis - values are shared by all workers on the host. The in-memory copy of a shared value expires after `SHARED_MEMORY_CACHE_IN_MEMORY_TTL_SECONDS`, so a worker reads a value updated by another worker with at most that much staleness.
+
 Has 4 primary methods:
     - set_cache
     - get_cache
@@ -9,17 +11,26 @@ Has 4 primary methods:
 """
 
 import asyncio
+import itertools
 import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
+from litellm.constants import (
+    DEFAULT_SHARED_MEMORY_CACHE_SLOT_SIZE,
+    SHARED_MEMORY_CACHE_IN_MEMORY_TTL_SECONDS,
+)
 
 from .base_cache import BaseCache
 from .in_memory_cache import InMemoryCache
 from .redis_cache import RedisCache
+from .shared_memory_cache import SharedMemoryCache
+
+_PLAIN_VALUE_MAX_DEPTH = 32
+_PLAIN_VALUE_MAX_ITEMS = DEFAULT_SHARED_MEMORY_CACHE_SLOT_SIZE
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -43,6 +54,34 @@ class LimitedSizeOrderedDict(OrderedDict):
         super().__setitem__(key, value)
 
 
+def _is_plain_value(value: Any) -> bool:
+    """
+    True if the value is plain data (str / number / bool / None, or containers of them) - not a process object like a client or a semaphore
+
+    Walks the value with an explicit stack. Values nested deeper than `_PLAIN_VALUE_MAX_DEPTH`, or with more than `_PLAIN_VALUE_MAX_ITEMS` items, are not plain - they don't fit a shared-memory slot anyway.
+    """
+    num_items = 0
+    stack: List[Tuple[Any, int]] = [(value, 0)]
+    while stack:
+        item, depth = stack.pop()
+        if item is None or isinstance(item, (str, bytes, int, float, bool)):
+            continue
+        if depth >= _PLAIN_VALUE_MAX_DEPTH:
+            return False
+        children: Iterable[Any]
+        if isinstance(item, dict):
+            children = itertools.chain(item.keys(), item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            children = item
+        else:
+            return False
+        num_items += len(item)
+        if num_items > _PLAIN_VALUE_MAX_ITEMS:
+            return False
+        stack.extend((child, depth + 1) for child in children)
+    return True
+
+
 class DualCache(BaseCache):
     """
     DualCache is a cache implementation that updates both Redis and an in-memory cache simultaneously.
@@ -58,10 +97,13 @@ class DualCache(BaseCache):
         default_redis_ttl: Optional[float] = None,
         default_redis_batch_cache_expiry: Optional[float] = None,
         default_max_redis_batch_cache_size: int = 100,
+        shared_memory_cache: Optional[SharedMemoryCache] = None,
     ) -> None:
         super().__init__()
         # If in_memory_cache is not provided, use the default InMemoryCache
         self.in_memory_cache = in_memory_cache or InMemoryCache()
+        # shared by the workers of the proxy on 1 host - checked before redis
+        self.shared_memory_cache = shared_memory_cache
         # If redis_cache is not provided, use the default RedisCache
         self.redis_cache = redis_cache
         self.last_redis_batch_access_time = LimitedSizeOrderedDict(
@@ -86,6 +128,46 @@ class DualCache(BaseCache):
         if default_redis_ttl is not None:
             self.default_redis_ttl = default_redis_ttl
 
+    def _should_set_shared_memory_cache(self, value: Any, local_only: bool) -> bool:
+        """
+        `local_only` values are only shared with the other workers if they are plain data - process objects (clients, semaphores) stay in the worker
+        """
+        return local_only is False or _is_plain_value(value)
+
+    @staticmethod
+    def _get_in_memory_kwargs_for_shared_value(kwargs: dict) -> dict:
+        """
+        kwargs for the in-memory copy of a value that is also in the shared-memory cache.
+
+        The in-memory cache is read first - the copy expires after at most `SHARED_MEMORY_CACHE_IN_MEMORY_TTL_SECONDS`, so a set / increment by another worker is seen after that long.
+        """
+        ttl = kwargs.get("ttl")
+        return {
+            **kwargs,
+            "ttl": (
+                SHARED_MEMORY_CACHE_IN_MEMORY_TTL_SECONDS
+                if ttl is None
+                else min(ttl, SHARED_MEMORY_CACHE_IN_MEMORY_TTL_SECONDS)
+            ),
+        }
+
+    def _get_shared_memory_cache(self, key, **kwargs):
+        """
+        Get a value from the shared-memory cache, and copy it to the in-memory cache with its remaining ttl
+        """
+        if self.shared_memory_cache is None:
+            return None
+        result, expires_at = self.shared_memory_cache.get_cache_with_expires_at(key)
+        if result is not None and expires_at is not None:
+            ttl = expires_at - time.time()
+            if ttl <= 0:
+                return None
+            kwargs["ttl"] = ttl
+            self.in_memory_cache.set_cache(
+                key, result, **self._get_in_memory_kwargs_for_shared_value(kwargs)
+            )
+        return result
+
     def set_cache(self, key, value, local_only: bool = False, **kwargs):
         # Update both Redis and in-memory cache
         try:
@@ -93,6 +175,15 @@ class DualCache(BaseCache):
                 if "ttl" not in kwargs and self.default_in_memory_ttl is not None:
                     kwargs["ttl"] = self.default_in_memory_ttl
 
+            if (
+                self.shared_memory_cache is not None
+                and self._should_set_shared_memory_cache(value, local_only)
+            ):
+                self.in_memory_cache.set_cache(
+                    key, value, **self._get_in_memory_kwargs_for_shared_value(kwargs)
+                )
+                self.shared_memory_cache.set_cache(key, value, **kwargs)
+            elif self.in_memory_cache is not None:
                 self.in_memory_cache.set_cache(key, value, **kwargs)
 
             if self.redis_cache is not None and local_only is False:
@@ -112,7 +203,13 @@ class DualCache(BaseCache):
         """
         try:
             result: int = value
-            if self.in_memory_cache is not None:
+            if self.shared_memory_cache is not None:
+                # incremented by all workers - the in-memory cache holds the total
+                result = self.shared_memory_cache.increment_cache(key, value, **kwargs)
+                self.in_memory_cache.set_cache(
+                    key, result, **self._get_in_memory_kwargs_for_shared_value(kwargs)
+                )
+            elif self.in_memory_cache is not None:
                 result = self.in_memory_cache.increment_cache(key, value, **kwargs)
 
             if self.redis_cache is not None and local_only is False:
@@ -139,6 +236,9 @@ class DualCache(BaseCache):
                 if in_memory_result is not None:
                     result = in_memory_result
 
+            if result is None and self.shared_memory_cache is not None:
+                result = self._get_shared_memory_cache(key, **kwargs)
+
             if result is None and self.redis_cache is not None and local_only is False:
                 # If not found in in-memory cache, try fetching from Redis
                 redis_result = self.redis_cache.get_cache(
@@ -147,7 +247,15 @@ class DualCache(BaseCache):
 
                 if redis_result is not None:
                     # Update in-memory cache with the value from Redis
-                    self.in_memory_cache.set_cache(key, redis_result, **kwargs)
+                    if self.shared_memory_cache is not None:
+                        self.in_memory_cache.set_cache(
+                            key,
+                            redis_result,
+                            **self._get_in_memory_kwargs_for_shared_value(kwargs),
+                        )
+                        self.shared_memory_cache.set_cache(key, redis_result, **kwargs)
+                    else:
+                        self.in_memory_cache.set_cache(key, redis_result, **kwargs)
 
                 result = redis_result
 
@@ -213,6 +321,9 @@ class DualCache(BaseCache):
                 if in_memory_result is not None:
                     result = in_memory_result
 
+            if result is None and self.shared_memory_cache is not None:
+                result = self._get_shared_memory_cache(key, **kwargs)
+
             if result is None and self.redis_cache is not None and local_only is False:
                 # If not found in in-memory cache, try fetching from Redis
                 redis_result = await self.redis_cache.async_get_cache(
@@ -221,9 +332,19 @@ class DualCache(BaseCache):
 
                 if redis_result is not None:
                     # Update in-memory cache with the value from Redis
-                    await self.in_memory_cache.async_set_cache(
-                        key, redis_result, **kwargs
-                    )
+                    if self.shared_memory_cache is not None:
+                        await self.in_memory_cache.async_set_cache(
+                            key,
+                            redis_result,
+                            **self._get_in_memory_kwargs_for_shared_value(kwargs),
+                        )
+                        await self.shared_memory_cache.async_set_cache(
+                            key, redis_result, **kwargs
+                        )
+                    else:
+                        await self.in_memory_cache.async_set_cache(
+                            key, redis_result, **kwargs
+                        )
 
                 result = redis_result
 
@@ -266,6 +387,12 @@ class DualCache(BaseCache):
                 if in_memory_result is not None:
                     result = in_memory_result
 
+            if None in result and self.shared_memory_cache is not None:
+                for index, key in enumerate(keys):
+                    if result[index] is not None:
+                        continue
+                    result[index] = self._get_shared_memory_cache(key, **kwargs)
+
             if None in result and self.redis_cache is not None and local_only is False:
                 """
                 - for the none values in the result
@@ -285,9 +412,21 @@ class DualCache(BaseCache):
                         # Update in-memory cache with the value from Redis
                         for key, value in redis_result.items():
                             if value is not None:
-                                await self.in_memory_cache.async_set_cache(
-                                    key, redis_result[key], **kwargs
-                                )
+                                if self.shared_memory_cache is not None:
+                                    await self.in_memory_cache.async_set_cache(
+                                        key,
+                                        value,
+                                        **self._get_in_memory_kwargs_for_shared_value(
+                                            kwargs
+                                        ),
+                                    )
+                                    await self.shared_memory_cache.async_set_cache(
+                                        key, value, **kwargs
+                                    )
+                                else:
+                                    await self.in_memory_cache.async_set_cache(
+                                        key, value, **kwargs
+                                    )
                             # Update the last access time for each key fetched from Redis
                             self.last_redis_batch_access_time[key] = current_time
 
@@ -304,7 +443,15 @@ class DualCache(BaseCache):
             f"async set cache: cache key: {key}; local_only: {local_only}; value: {value}"
         )
         try:
-            if self.in_memory_cache is not None:
+            if (
+                self.shared_memory_cache is not None
+                and self._should_set_shared_memory_cache(value, local_only)
+            ):
+                await self.in_memory_cache.async_set_cache(
+                    key, value, **self._get_in_memory_kwargs_for_shared_value(kwargs)
+                )
+                await self.shared_memory_cache.async_set_cache(key, value, **kwargs)
+            elif self.in_memory_cache is not None:
                 await self.in_memory_cache.async_set_cache(key, value, **kwargs)
 
             if self.redis_cache is not None and local_only is False:
@@ -325,7 +472,25 @@ class DualCache(BaseCache):
             f"async batch set cache: cache keys: {cache_list}; local_only: {local_only}"
         )
         try:
-            if self.in_memory_cache is not None:
+            if self.shared_memory_cache is not None:
+                shared_cache_list = []
+                local_cache_list = []
+                for cache_key, cache_value in cache_list:
+                    if self._should_set_shared_memory_cache(cache_value, local_only):
+                        shared_cache_list.append((cache_key, cache_value))
+                    else:
+                        local_cache_list.append((cache_key, cache_value))
+                await self.in_memory_cache.async_set_cache_pipeline(
+                    cache_list=shared_cache_list,
+                    **self._get_in_memory_kwargs_for_shared_value(kwargs),
+                )
+                await self.in_memory_cache.async_set_cache_pipeline(
+                    cache_list=local_cache_list, **kwargs
+                )
+                await self.shared_memory_cache.async_set_cache_pipeline(
+                    cache_list=shared_cache_list, **kwargs
+                )
+            elif self.in_memory_cache is not None:
                 await self.in_memory_cache.async_set_cache_pipeline(
                     cache_list=cache_list, **kwargs
                 )
@@ -356,7 +521,15 @@ class DualCache(BaseCache):
         """
         try:
             result: float = value
-            if self.in_memory_cache is not None:
+            if self.shared_memory_cache is not None:
+                # incremented by all workers - the in-memory cache holds the total
+                result = await self.shared_memory_cache.async_increment(
+                    key, value, **kwargs
+                )
+                await self.in_memory_cache.async_set_cache(
+                    key, result, **self._get_in_memory_kwargs_for_shared_value(kwargs)
+                )
+            elif self.in_memory_cache is not None:
                 result = await self.in_memory_cache.async_increment(
                     key, value, **kwargs
                 )
@@ -386,7 +559,16 @@ class DualCache(BaseCache):
         Returns - None
         """
         try:
-            if self.in_memory_cache is not None:
+            if (
+                self.shared_memory_cache is not None
+                and self._should_set_shared_memory_cache(value, local_only)
+            ):
+                _ = await self.shared_memory_cache.async_set_cache_sadd(
+                    key, value, ttl=kwargs.get("ttl", None)
+                )
+                # the next read copies the set, with the values added by all workers, from shared memory
+                self.in_memory_cache.delete_cache(key)
+            elif self.in_memory_cache is not None:
                 _ = await self.in_memory_cache.async_set_cache_sadd(
                     key, value, ttl=kwargs.get("ttl", None)
                 )
@@ -403,6 +585,8 @@ class DualCache(BaseCache):
     def flush_cache(self):
         if self.in_memory_cache is not None:
             self.in_memory_cache.flush_cache()
+        if self.shared_memory_cache is not None:
+            self.shared_memory_cache.flush_cache()
         if self.redis_cache is not None:
             self.redis_cache.flush_cache()
 
@@ -412,6 +596,8 @@ class DualCache(BaseCache):
         """
         if self.in_memory_cache is not None:
             self.in_memory_cache.delete_cache(key)
+        if self.shared_memory_cache is not None:
+            self.shared_memory_cache.delete_cache(key)
         if self.redis_cache is not None:
             self.redis_cache.delete_cache(key)
 
@@ -421,14 +607,18 @@ class DualCache(BaseCache):
         """
         if self.in_memory_cache is not None:
             self.in_memory_cache.delete_cache(key)
+        if self.shared_memory_cache is not None:
+            self.shared_memory_cache.delete_cache(key)
         if self.redis_cache is not None:
             await self.redis_cache.async_delete_cache(key)
 
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
-        Get the remaining TTL of a key in in-memory cache or redis
+        Get the remaining TTL of a key in in-memory cache, shared-memory cache or redis
         """
         ttl = await self.in_memory_cache.async_get_ttl(key)
+        if ttl is None and self.shared_memory_cache is not None:
+            ttl = await self.shared_memory_cache.async_get_ttl(key)
         if ttl is None and self.redis_cache is not None:
             ttl = await self.redis_cache.async_get_ttl(key)
         return ttl
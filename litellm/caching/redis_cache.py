@@ -882,6 +882,28 @@ class RedisCache(BaseCache):
         async with _redis_client as redis_client:
             await redis_client.delete(*keys)
 
+    def publish(self, channel: str, message: Any) -> None:
+        channel = self.check_and_fix_namespace(key=channel)
+        self.redis_client.publish(channel, json.dumps(message))  # type: ignore
+
+    async def async_publish(self, channel: str, message: Any) -> None:
+        # typed as Any, redis python lib has incomplete type stubs for RedisCluster and does not include `publish`
+        _redis_client: Any = self.init_async_client()
+        channel = self.check_and_fix_namespace(key=channel)
+        async with _redis_client as redis_client:
+            await redis_client.publish(channel, json.dumps(message))
+
+    def init_async_pubsub(self) -> Optional[Any]:
+        """
+        Returns a `redis.asyncio` PubSub object, or None if the client doesn't support pub/sub (e.g. redis cluster).
+
+        Use it as an async context manager, so its connection is released. Channels passed to it are not namespaced - use `check_and_fix_namespace()`.
+        """
+        _redis_client: Any = self.init_async_client()
+        if not hasattr(_redis_client, "pubsub"):
+            return None
+        return _redis_client.pubsub()
+
     def client_list(self) -> List:
         client_list: List = self.redis_client.client_list()  # type: ignore
         return client_list
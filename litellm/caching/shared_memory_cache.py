@@ -0,0 +1,557 @@
+"""
+Shared-Memory Cache implementation - a hash table in a memory-mapped file, shared by all workers of the proxy on 1 host.
+
+Used as a tier of `DualCache` between the in-memory cache and redis, when the proxy runs with `--num_workers > 1`. A value cached by 1 worker (key / team objects, rate limit counters, router cooldowns) is visible to every worker on the host, without a redis round trip.
+
+- fixed number of fixed-size slots, open addressing with linear probing over `MAX_PROBES` slots. If all probed slots are in use, the entry expiring first is evicted
+- values are pickled. Values larger than a slot, or that can't be pickled, are not cached in shared memory
+- writes are serialized across workers with `flock`. Reads take no lock - every slot has a version counter which is odd while the slot is written, a read is retried if the version changed
+- the proxy CLI creates the file before the workers start, and passes it to them in `LITELLM_SHARED_MEMORY_CACHE_PATH`
+"""
+
+import atexit
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_SHARED_MEMORY_CACHE_NUM_SLOTS,
+    DEFAULT_SHARED_MEMORY_CACHE_SLOT_SIZE,
+)
+
+from .base_cache import BaseCache
+
+try:
+    import fcntl
+except ImportError:  # not available on windows - the shared-memory cache is not used
+    fcntl = None  # type: ignore
+
+SHARED_MEMORY_CACHE_PATH_ENV = "LITELLM_SHARED_MEMORY_CACHE_PATH"
+DISABLE_SHARED_MEMORY_CACHE_ENV = "LITELLM_DISABLE_SHARED_MEMORY_CACHE"
+
+MAX_PROBES = 8
+_MAX_READ_RETRIES = 16
+
+_MAGIC = b"LLMSHMC1"
+_FILE_HEADER = struct.Struct("<8sII")  # magic, num slots, slot size
+_FILE_HEADER_SIZE = 64
+# version, state, key hash, expires at, key length, value length
+_SLOT_HEADER = struct.Struct("<IBIdHI")
+_SLOT_VERSION = struct.Struct("<I")
+_SLOT_EMPTY = 0
+_SLOT_USED = 1
+_SLOT_DELETED = 2
+
+
+class _SharedMemoryTable:
+    """
+    Hash table of key bytes -> value bytes in 1 memory-mapped file
+    """
+
+    def __init__(self, path: str, num_slots: int, slot_size: int) -> None:
+        self.path = path
+        self.num_slots = num_slots
+        self.slot_size = slot_size
+        self._fd: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._pid: Optional[int] = None
+        # flock is held per open file - threads of 1 worker are serialized with a thread lock
+        self._thread_lock = threading.Lock()
+
+    def _open(self) -> mmap.mmap:
+        if fcntl is None:
+            raise ImportError("The shared-memory cache requires `fcntl`")
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < _FILE_HEADER_SIZE:
+                    # 1st worker to open the file sizes it - pages are only allocated once written
+                    os.ftruncate(
+                        fd, _FILE_HEADER_SIZE + self.num_slots * self.slot_size
+                    )
+                    os.pwrite(
+                        fd,
+                        _FILE_HEADER.pack(_MAGIC, self.num_slots, self.slot_size),
+                        0,
+                    )
+                else:
+                    magic, num_slots, slot_size = _FILE_HEADER.unpack(
+                        os.pread(fd, _FILE_HEADER.size, 0)
+                    )
+                    if magic != _MAGIC:
+                        raise ValueError(
+                            f"{self.path} is not a litellm shared-memory cache file"
+                        )
+                    self.num_slots = num_slots
+                    self.slot_size = slot_size
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            shared_mmap = mmap.mmap(
+                fd, _FILE_HEADER_SIZE + self.num_slots * self.slot_size
+            )
+        except Exception:
+            os.close(fd)
+            raise
+        self._fd = fd
+        self._mmap = shared_mmap
+        self._pid = os.getpid()
+        return shared_mmap
+
+    def get_mmap(self) -> mmap.mmap:
+        if self._mmap is not None and self._pid == os.getpid():
+            return self._mmap
+        # 1st use, or forked worker - every worker needs its own open file for flock
+        self.close()
+        return self._open()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[mmap.mmap]:
+        shared_mmap = self.get_mmap()
+        with self._thread_lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)  # type: ignore
+            try:
+                yield shared_mmap
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)  # type: ignore
+
+    def _get_offset(self, index: int) -> int:
+        return _FILE_HEADER_SIZE + index * self.slot_size
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        start = key_hash % self.num_slots
+        for i in range(min(MAX_PROBES, self.num_slots)):
+            yield (start + i) % self.num_slots
+
+    def _read_slot(
+        self, shared_mmap: mmap.mmap, index: int, key_bytes: bytes, key_hash: int
+    ) -> Optional[Tuple[int, float, Optional[bytes]]]:
+        """
+        Returns (state, expires at, value - if the slot holds `key_bytes`). None if the slot kept changing while it was read.
+        """
+        offset = self._get_offset(index)
+        data_start = offset + _SLOT_HEADER.size
+        for _ in range(_MAX_READ_RETRIES):
+            version, state, slot_key_hash, expires_at, key_len, value_len = (
+                _SLOT_HEADER.unpack_from(shared_mmap, offset)
+            )
+            if version & 1:
+                continue
+            value: Optional[bytes] = None
+            if (
+                state == _SLOT_USED
+                and slot_key_hash == key_hash
+                and shared_mmap[data_start : data_start + key_len] == key_bytes
+            ):
+                value_start = data_start + key_len
+                value = shared_mmap[value_start : value_start + value_len]
+            if _SLOT_VERSION.unpack_from(shared_mmap, offset)[0] == version:
+                return state, expires_at, value
+        return None
+
+    def _write_slot(
+        self,
+        shared_mmap: mmap.mmap,
+        index: int,
+        state: int,
+        key_hash: int,
+        expires_at: float,
+        key_bytes: bytes,
+        value: bytes,
+    ) -> None:
+        offset = self._get_offset(index)
+        version = _SLOT_VERSION.unpack_from(shared_mmap, offset)[0]
+        # odd version - readers retry until the write is done
+        _SLOT_VERSION.pack_into(shared_mmap, offset, (version + 1) & 0xFFFFFFFF)
+        data_start = offset + _SLOT_HEADER.size
+        shared_mmap[data_start : data_start + len(key_bytes)] = key_bytes
+        value_start = data_start + len(key_bytes)
+        shared_mmap[value_start : value_start + len(value)] = value
+        _SLOT_HEADER.pack_into(
+            shared_mmap,
+            offset,
+            (version + 2) & 0xFFFFFFFF,
+            state,
+            key_hash,
+            expires_at,
+            len(key_bytes),
+            len(value),
+        )
+
+    def _find_slot(
+        self, shared_mmap: mmap.mmap, key_bytes: bytes, key_hash: int
+    ) -> Tuple[Optional[int], int]:
+        """
+        Called with the write lock held.
+
+        Returns (slot holding the key, slot to write the key to - a free slot, or the slot expiring first)
+        """
+        now = time.time()
+        free_index: Optional[int] = None
+        evict_index: Optional[int] = None
+        evict_expires_at = float("inf")
+        for index in self._probe(key_hash):
+            slot = self._read_slot(shared_mmap, index, key_bytes, key_hash)
+            if slot is None:
+                continue
+            state, expires_at, value = slot
+            if value is not None:
+                return index, index
+            if state != _SLOT_USED or expires_at <= now:
+                if free_index is None:
+                    free_index = index
+                if state == _SLOT_EMPTY:
+                    # keys are never stored past an empty slot
+                    break
+            elif expires_at < evict_expires_at:
+                evict_index = index
+                evict_expires_at = expires_at
+        if free_index is not None:
+            return None, free_index
+        return None, (
+            evict_index if evict_index is not None else key_hash % self.num_slots
+        )
+
+    def _fits(self, key_bytes: bytes, value: bytes) -> bool:
+        return (
+            len(key_bytes) <= 0xFFFF
+            and _SLOT_HEADER.size + len(key_bytes) + len(value) <= self.slot_size
+        )
+
+    def get(self, key: str) -> Tuple[Optional[bytes], float]:
+        """
+        Returns (value, expires at) - (None, 0) if the key is not in the table
+        """
+        shared_mmap = self.get_mmap()
+        key_bytes = key.encode("utf-8")
+        key_hash = zlib.crc32(key_bytes)
+        for index in self._probe(key_hash):
+            slot = self._read_slot(shared_mmap, index, key_bytes, key_hash)
+            if slot is None:
+                continue
+            state, expires_at, value = slot
+            if value is not None:
+                if expires_at <= time.time():
+                    return None, 0
+                return value, expires_at
+            if state == _SLOT_EMPTY:
+                break
+        return None, 0
+
+    def set(self, key: str, value: Optional[bytes], expires_at: float) -> bool:
+        """
+        Stores the value of a key. Returns False if the value does not fit in a slot - the key is removed, so no stale value is read.
+        """
+        return self.update(key=key, update_fn=lambda _: value, expires_at=expires_at)
+
+    def update(
+        self,
+        key: str,
+        update_fn: Callable[[Optional[bytes]], Optional[bytes]],
+        expires_at: float,
+    ) -> bool:
+        """
+        Read-modify-write of a key, atomic across workers - `update_fn` gets the current value (None if not set) and returns the new value
+        """
+        key_bytes = key.encode("utf-8")
+        key_hash = zlib.crc32(key_bytes)
+        with self._write_lock() as shared_mmap:
+            key_index, write_index = self._find_slot(shared_mmap, key_bytes, key_hash)
+            current_value: Optional[bytes] = None
+            if key_index is not None:
+                current_value, _ = self.get(key)
+            value = update_fn(current_value)
+            if value is None or not self._fits(key_bytes, value):
+                if key_index is not None:
+                    self._write_slot(
+                        shared_mmap, key_index, _SLOT_DELETED, 0, 0, b"", b""
+                    )
+                return False
+            self._write_slot(
+                shared_mmap,
+                write_index,
+                _SLOT_USED,
+                key_hash,
+                expires_at,
+                key_bytes,
+                value,
+            )
+        return True
+
+    def delete(self, key: str) -> None:
+        key_bytes = key.encode("utf-8")
+        key_hash = zlib.crc32(key_bytes)
+        with self._write_lock() as shared_mmap:
+            key_index, _ = self._find_slot(shared_mmap, key_bytes, key_hash)
+            if key_index is not None:
+                self._write_slot(shared_mmap, key_index, _SLOT_DELETED, 0, 0, b"", b"")
+
+    def delete_prefix(self, prefix: str) -> None:
+        prefix_bytes = prefix.encode("utf-8")
+        with self._write_lock() as shared_mmap:
+            for index in range(self.num_slots):
+                offset = self._get_offset(index)
+                _, state, _, _, key_len, _ = _SLOT_HEADER.unpack_from(
+                    shared_mmap, offset
+                )
+                if state != _SLOT_USED:
+                    continue
+                data_start = offset + _SLOT_HEADER.size
+                if shared_mmap[data_start : data_start + key_len].startswith(
+                    prefix_bytes
+                ):
+                    self._write_slot(shared_mmap, index, _SLOT_DELETED, 0, 0, b"", b"")
+
+
+# 1 table per file and process - shared by the caches of all namespaces
+_shared_memory_tables: Dict[str, _SharedMemoryTable] = {}
+_shared_memory_tables_lock = threading.Lock()
+
+
+def _get_shared_memory_table(
+    path: str, num_slots: int, slot_size: int
+) -> _SharedMemoryTable:
+    with _shared_memory_tables_lock:
+        table = _shared_memory_tables.get(path)
+        if table is None:
+            table = _SharedMemoryTable(
+                path=path, num_slots=num_slots, slot_size=slot_size
+            )
+            _shared_memory_tables[path] = table
+        return table
+
+
+class SharedMemoryCache(BaseCache):
+    def __init__(
+        self,
+        path: str,
+        namespace: str = "",
+        default_ttl: Optional[int] = 600,
+        num_slots: int = DEFAULT_SHARED_MEMORY_CACHE_NUM_SLOTS,
+        slot_size: int = DEFAULT_SHARED_MEMORY_CACHE_SLOT_SIZE,
+    ):
+        """
+        path [str]: file shared by all workers - created if it does not exist. `num_slots` and `slot_size` of an existing file are kept
+        namespace [str]: prefix of all keys - caches of different namespaces share 1 file, without key collisions
+        default_ttl [int]: ttl of values set without a ttl, same default as the in-memory cache
+        """
+        super().__init__(default_ttl=default_ttl or 600)
+        self.path = path
+        self.namespace = namespace
+        self._key_prefix = f"{namespace}:" if namespace else ""
+        self._table = _get_shared_memory_table(
+            path=path, num_slots=num_slots, slot_size=slot_size
+        )
+
+    def _get_key(self, key) -> str:
+        return f"{self._key_prefix}{key}"
+
+    def _get_expires_at(self, ttl: Optional[float]) -> float:
+        return time.time() + (ttl if ttl is not None else self.default_ttl)
+
+    def set_cache(self, key, value, **kwargs):
+        try:
+            value_bytes: Optional[bytes] = pickle.dumps(
+                value, protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "SharedMemoryCache: unable to pickle the value of key=%s: %s",
+                key,
+                str(e),
+            )
+            value_bytes = None
+        self._table.set(
+            key=self._get_key(key),
+            value=value_bytes,
+            expires_at=self._get_expires_at(kwargs.get("ttl")),
+        )
+
+    async def async_set_cache(self, key, value, **kwargs):
+        self.set_cache(key=key, value=value, **kwargs)
+
+    async def async_set_cache_pipeline(self, cache_list, ttl=None, **kwargs):
+        for cache_key, cache_value in cache_list:
+            self.set_cache(key=cache_key, value=cache_value, ttl=ttl)
+
+    def get_cache_with_expires_at(self, key) -> Tuple[Any, Optional[float]]:
+        """
+        Returns (value, expires at) - (None, None) if the key is not cached
+        """
+        value_bytes, expires_at = self._table.get(self._get_key(key))
+        if value_bytes is None:
+            return None, None
+        try:
+            return pickle.loads(value_bytes), expires_at
+        except Exception as e:
+            verbose_logger.debug(
+                "SharedMemoryCache: unable to unpickle the value of key=%s: %s",
+                key,
+                str(e),
+            )
+            return None, None
+
+    def get_cache(self, key, **kwargs):
+        value, _ = self.get_cache_with_expires_at(key)
+        return value
+
+    async def async_get_cache(self, key, **kwargs):
+        return self.get_cache(key=key, **kwargs)
+
+    def batch_get_cache(self, keys: list, **kwargs):
+        return [self.get_cache(key=k, **kwargs) for k in keys]
+
+    async def async_batch_get_cache(self, keys: list, **kwargs):
+        return self.batch_get_cache(keys=keys, **kwargs)
+
+    def _update(
+        self, key, update_value: Callable[[Any], Any], ttl: Optional[float]
+    ) -> Any:
+        """
+        Read-modify-write of the value of a key, atomic across workers. Returns the new value.
+        """
+        new_value: Any = None
+
+        def _update_fn(current_value_bytes: Optional[bytes]) -> Optional[bytes]:
+            nonlocal new_value
+            current_value = None
+            if current_value_bytes is not None:
+                try:
+                    current_value = pickle.loads(current_value_bytes)
+                except Exception:
+                    current_value = None
+            new_value = update_value(current_value)
+            return pickle.dumps(new_value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._table.update(
+            key=self._get_key(key),
+            update_fn=_update_fn,
+            expires_at=self._get_expires_at(ttl),
+        )
+        return new_value
+
+    def increment_cache(self, key, value: int, **kwargs) -> int:
+        return self._update(
+            key=key,
+            update_value=lambda current_value: (current_value or 0) + value,
+            ttl=kwargs.get("ttl"),
+        )
+
+    async def async_increment(self, key, value: float, **kwargs) -> float:
+        return self._update(
+            key=key,
+            update_value=lambda current_value: (current_value or 0) + value,
+            ttl=kwargs.get("ttl"),
+        )
+
+    async def async_set_cache_sadd(self, key, value: List, ttl: Optional[float]):
+        """
+        Add value to set
+        """
+
+        def _add_to_set(current_value):
+            init_value = current_value or set()
+            for val in value:
+                init_value.add(val)
+            return init_value
+
+        self._update(key=key, update_value=_add_to_set, ttl=ttl)
+        return value
+
+    def flush_cache(self):
+        self._table.delete_prefix(self._key_prefix)
+
+    async def disconnect(self):
+        pass
+
+    def delete_cache(self, key):
+        self._table.delete(self._get_key(key))
+
+    async def async_get_ttl(self, key: str) -> Optional[int]:
+        """
+        Get the remaining TTL of a key in the shared-memory cache
+        """
+        value_bytes, expires_at = self._table.get(self._get_key(key))
+        if value_bytes is None:
+            return None
+        return int(expires_at - time.time())
+
+
+def _is_shared_memory_cache_disabled() -> bool:
+    return os.getenv(DISABLE_SHARED_MEMORY_CACHE_ENV, "false").lower() == "true"
+
+
+def _remove_shared_memory_cache_file(path: str, owner_pid: int) -> None:
+    # forked workers inherit the atexit hook - only the proxy process removes the file
+    if os.getpid() != owner_pid:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def setup_shared_memory_cache_path(num_workers: Optional[int]) -> Optional[str]:
+    """
+    Called by the proxy CLI before any worker starts.
+
+    If the proxy runs more than 1 worker and `LITELLM_SHARED_MEMORY_CACHE_PATH` is not set, a new file in `/dev/shm` is used, and removed when the proxy exits.
+
+    Returns the shared-memory cache file, None if the shared-memory cache is not used.
+    """
+    if fcntl is None or _is_shared_memory_cache_disabled():
+        return None
+    path = os.getenv(SHARED_MEMORY_CACHE_PATH_ENV)
+    if path:
+        return path
+
+    if num_workers is None or num_workers <= 1:
+        return None
+
+    fd, path = tempfile.mkstemp(
+        prefix="litellm_shared_cache_",
+        dir="/dev/shm" if os.path.isdir("/dev/shm") else None,
+    )
+    os.close(fd)
+    atexit.register(_remove_shared_memory_cache_file, path, os.getpid())
+    os.environ[SHARED_MEMORY_CACHE_PATH_ENV] = path
+    verbose_logger.debug(
+        "Running %s workers, shared-memory cache: %s", num_workers, path
+    )
+    return path
+
+
+def get_shared_memory_cache(namespace: str) -> Optional[SharedMemoryCache]:
+    """
+    Returns the shared-memory cache of a namespace, None if the workers don't share a cache (`LITELLM_SHARED_MEMORY_CACHE_PATH` not set)
+    """
+    path = os.getenv(SHARED_MEMORY_CACHE_PATH_ENV)
+    if not path or fcntl is None or _is_shared_memory_cache_disabled():
+        return None
+    try:
+        shared_memory_cache = SharedMemoryCache(path=path, namespace=namespace)
+        shared_memory_cache._table.get_mmap()
+        return shared_memory_cache
+    except Exception as e:
+        verbose_logger.warning(
+            "Unable to open the shared-memory cache at %s, workers will not share a cache: %s",
+            path,
+            str(e),
+        )
+        return None
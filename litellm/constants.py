@@ -8,11 +8,35 @@ DEFAULT_FAILURE_THRESHOLD_PERCENT = (
     0.5  # default cooldown a deployment if 50% of requests fail in a given minute
 )
 DEFAULT_COOLDOWN_TIME_SECONDS = 5
+COOLDOWN_EVENTS_RESUBSCRIBE_DELAY_SECONDS = 1  # wait before re-subscribing to router cooldown events (redis pub/sub), after the subscription dropped
+PROMETHEUS_METRICS_BUFFER_FLUSH_INTERVAL_SECONDS = 1  # how often buffered prometheus metric updates are aggregated into the prometheus registry
 DEFAULT_REPLICATE_POLLING_RETRIES = 5
 DEFAULT_REPLICATE_POLLING_DELAY_SECONDS = 1
 DEFAULT_IMAGE_TOKEN_COUNT = 250
 DEFAULT_IMAGE_WIDTH = 300
 DEFAULT_IMAGE_HEIGHT = 300
+MAX_COMPILED_CHAT_TEMPLATES = 100  # compiled huggingface chat templates kept in memory
+#### MEDIA FETCHING (image / pdf urls in messages) ####
+# max size of a single fetched image / pdf
+MAX_MEDIA_FETCH_SIZE_BYTES = 50 * 1024 * 1024
+MEDIA_FETCH_CACHE_MAX_SIZE_IN_MEMORY_BYTES = 100 * 1024 * 1024
+# only used if LITELLM_MEDIA_CACHE_DIR is set
+MEDIA_FETCH_CACHE_MAX_SIZE_ON_DISK_BYTES = 1024 * 1024 * 1024
+MEDIA_FETCH_CACHE_TTL_SECONDS = 3600  # after this, a cached url is revalidated (conditional GET if the response had an ETag)
+#### BATCH FILES ####
+# rewritten batch .jsonl files larger than this are spooled to disk
+BATCH_FILE_SPOOL_MAX_SIZE_BYTES = 10 * 1024 * 1024
+# chunk size when streaming batch output files to compute batch cost / usage
+BATCH_OUTPUT_FILE_STREAM_CHUNK_SIZE_BYTES = 64 * 1024
+#### ADAPTIVE CONCURRENCY (AIMD) - used for fanning out batches of requests ####
+DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL = 10
+DEFAULT_ADAPTIVE_CONCURRENCY_MAX = 100
+# concurrency is multiplied by this on a rate limit error
+DEFAULT_ADAPTIVE_CONCURRENCY_DECREASE_FACTOR = 0.5
+LOCAL_BATCH_MAX_RATE_LIMIT_RETRIES = 10  # a batch request that keeps getting rate limited is written to the error file after this many retries
+# how often the request counts of a running local batch are persisted
+LOCAL_BATCH_PROGRESS_SAVE_INTERVAL_SECONDS = 1
+BATCH_COMPLETION_MAX_RATE_LIMIT_RETRIES = 5  # abatch_completion() returns the rate limit error for a request after this many retries
 SINGLE_DEPLOYMENT_TRAFFIC_FAILURE_THRESHOLD = 1000  # Minimum number of requests to consider "reasonable traffic". Used for single-deployment cooldown logic.
 #### RELIABILITY ####
 REPEATED_STREAMING_CHUNK_LIMIT = 100  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
@@ -423,5 +447,27 @@ BATCH_STATUS_POLL_INTERVAL_SECONDS = 3600  # 1 hour
 BATCH_STATUS_POLL_MAX_ATTEMPTS = 24  # for 24 hours
 
 HEALTH_CHECK_TIMEOUT_SECONDS = 60  # 60 seconds
+# max number of deployments health checked at the same time
+HEALTH_CHECK_MAX_CONCURRENCY = 10
+HEALTH_CHECK_JITTER = 0.1  # background health checks run every health_check_interval +/- this fraction of it
+HEALTH_CHECK_SCHEDULER_MIN_SLEEP_SECONDS = 1
+
+TRIM_MESSAGES_PLACEHOLDER = "[{num_messages} earlier messages were removed to fit the context window]"  # trim_messages(trim_strategy="placeholder")
+# coalesced SSE events are flushed once this many bytes are buffered
+DEFAULT_STREAM_COALESCING_MAX_BYTES = 8192
+REALTIME_PARTIAL_LOGGING_INTERVAL_SECONDS = 900  # realtime sessions are logged in parts, every 15 minutes - long voice sessions are not held in memory until they end
+DEFAULT_SPEND_FLUSH_SIZE_THRESHOLD = 10000  # spend of an entity type is written to the db early, once this many entities are waiting for the next batch write
+REDIS_SPEND_ACCUMULATOR_KEY_PREFIX = "litellm:spend_accumulator"  # spend of all proxy pods is summed in redis hashes under this prefix, with `use_redis_spend_aggregation`
+# segment files of the callback delivery log are rotated at this size
+CALLBACK_DELIVERY_LOG_MAX_SEGMENT_BYTES = 16 * 1024 * 1024
+# oldest undelivered segments are dropped once the delivery log of a logger grows past this size - dead letters are bounded by it too
+CALLBACK_DELIVERY_LOG_MAX_BYTES = 1024 * 1024 * 1024
+# retry delay of a failed batch - doubled per attempt
+CALLBACK_DELIVERY_LOG_BACKOFF_BASE_SECONDS = 1
+CALLBACK_DELIVERY_LOG_BACKOFF_MAX_SECONDS = 60
+DEFAULT_SHARED_MEMORY_CACHE_NUM_SLOTS = 16384  # entries of the cache shared by the workers of a multi-worker proxy - 64MB with the default slot size
+# bytes - values larger than a slot are not cached in shared memory
+DEFAULT_SHARED_MEMORY_CACHE_SLOT_SIZE = 4096
+SHARED_MEMORY_CACHE_IN_MEMORY_TTL_SECONDS = 1  # max ttl of a worker's in-memory copy of a shared-memory cache value - bounds how long an update by another worker is not seen
 
 UI_SESSION_TOKEN_TEAM_ID = "litellm-dashboard"
@@ -9,12 +9,13 @@ import asyncio
 import contextvars
 import os
 from functools import partial
-from typing import Any, Coroutine, Dict, Literal, Optional, Union, cast
+from typing import Any, AsyncIterator, Coroutine, Dict, Literal, Optional, Union, cast
 
 import httpx
 
 import litellm
 from litellm import get_secret_str
+from litellm.batches.local_batches import local_batches_instance
 from litellm.llms.azure.files.handler import AzureOpenAIFilesAPI
 from litellm.llms.openai.openai import FileDeleted, FileObject, OpenAIFilesAPI
 from litellm.llms.vertex_ai.files.handler import VertexAIFilesHandler
@@ -36,7 +37,7 @@ vertex_ai_files_instance = VertexAIFilesHandler()
 
 async def afile_retrieve(
     file_id: str,
-    custom_llm_provider: Literal["openai", "azure"] = "openai",
+    custom_llm_provider: Literal["openai", "azure", "local"] = "openai",
     extra_headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, str]] = None,
     **kwargs,
@@ -76,7 +77,7 @@ async def afile_retrieve(
 
 def file_retrieve(
     file_id: str,
-    custom_llm_provider: Literal["openai", "azure"] = "openai",
+    custom_llm_provider: Literal["openai", "azure", "local"] = "openai",
     extra_headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, str]] = None,
     **kwargs,
@@ -168,6 +169,8 @@ def file_retrieve(
                 max_retries=optional_params.max_retries,
                 file_id=file_id,
             )
+        elif custom_llm_provider == "local":
+            response = local_batches_instance.retrieve_file(file_id=file_id)
         else:
             raise litellm.exceptions.BadRequestError(
                 message="LiteLLM doesn't support {} for 'file_retrieve'. Only 'openai' and 'azure' are supported.".format(
@@ -491,7 +494,7 @@ def file_list(
 async def acreate_file(
     file: FileTypes,
     purpose: Literal["assistants", "batch", "fine-tune"],
-    custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
+    custom_llm_provider: Literal["openai", "azure", "vertex_ai", "local"] = "openai",
     extra_headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, str]] = None,
     **kwargs,
@@ -533,7 +536,7 @@ async def acreate_file(
 def create_file(
     file: FileTypes,
     purpose: Literal["assistants", "batch", "fine-tune"],
-    custom_llm_provider: Literal["openai", "azure", "vertex_ai"] = "openai",
+    custom_llm_provider: Literal["openai", "azure", "vertex_ai", "local"] = "openai",
     extra_headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, str]] = None,
     **kwargs,
@@ -657,6 +660,10 @@ def create_file(
                 max_retries=optional_params.max_retries,
                 create_file_data=_create_file_request,
             )
+        elif custom_llm_provider == "local":
+            response = local_batches_instance.create_file(
+                create_file_data=_create_file_request
+            )
         else:
             raise litellm.exceptions.BadRequestError(
                 message="LiteLLM doesn't support {} for 'create_batch'. Only 'openai' is supported.".format(
@@ -675,9 +682,141 @@ def create_file(
         raise e
 
 
+def _get_file_content_timeout(
+    optional_params: GenericLiteLLMParams, custom_llm_provider: str, **kwargs
+) -> Union[float, httpx.Timeout]:
+    ### TIMEOUT LOGIC ###
+    timeout = optional_params.timeout or kwargs.get("request_timeout", 600) or 600
+    # set timeout for 10 minutes by default
+
+    if (
+        timeout is not None
+        and isinstance(timeout, httpx.Timeout)
+        and supports_httpx_timeout(custom_llm_provider) is False
+    ):
+        read_timeout = timeout.read or 600
+        timeout = read_timeout  # default 10 min timeout
+    elif timeout is not None and not isinstance(timeout, httpx.Timeout):
+        timeout = float(timeout)  # type: ignore
+    elif timeout is None:
+        timeout = 600.0
+    return timeout
+
+
+def _get_openai_file_content_credentials(
+    optional_params: GenericLiteLLMParams,
+) -> Dict[str, Optional[str]]:
+    # for deepinfra/perplexity/anyscale/groq we check in get_llm_provider and pass in the api base from there
+    api_base = (
+        optional_params.api_base
+        or litellm.api_base
+        or os.getenv("OPENAI_API_BASE")
+        or "https://api.openai.com/v1"
+    )
+    organization = (
+        optional_params.organization
+        or litellm.organization
+        or os.getenv("OPENAI_ORGANIZATION", None)
+        or None  # default - https://github.com/openai/openai-python/blob/284c1799070c723c6a553337134148a7ab088dd8/openai/util.py#L105
+    )
+    # set API KEY
+    api_key = (
+        optional_params.api_key
+        or litellm.api_key  # for deepinfra/perplexity/anyscale we check in get_llm_provider and pass in the api key from there
+        or litellm.openai_key
+        or os.getenv("OPENAI_API_KEY")
+    )
+    return {"api_base": api_base, "api_key": api_key, "organization": organization}
+
+
+def _get_azure_file_content_credentials(
+    optional_params: GenericLiteLLMParams,
+) -> Dict[str, Optional[str]]:
+    api_base = optional_params.api_base or litellm.api_base or get_secret_str("AZURE_API_BASE")  # type: ignore
+    api_version = (
+        optional_params.api_version
+        or litellm.api_version
+        or get_secret_str("AZURE_API_VERSION")
+    )  # type: ignore
+
+    api_key = (
+        optional_params.api_key
+        or litellm.api_key
+        or litellm.azure_key
+        or get_secret_str("AZURE_OPENAI_API_KEY")
+        or get_secret_str("AZURE_API_KEY")
+    )  # type: ignore
+    return {"api_base": api_base, "api_key": api_key, "api_version": api_version}
+
+
+async def afile_content_stream(
+    file_id: str,
+    custom_llm_provider: Literal["openai", "azure", "local"] = "openai",
+    chunk_size: Optional[int] = None,
+    extra_headers: Optional[Dict[str, str]] = None,
+    extra_body: Optional[Dict[str, str]] = None,
+    **kwargs,
+) -> AsyncIterator[bytes]:
+    """
+    Async: Get file contents as a stream of byte chunks - for large files (e.g. batch output files) that shouldn't be read into memory at once
+
+    ```python
+    async for chunk in litellm.afile_content_stream(file_id="file-abc123"):
+        ...
+    ```
+    """
+    optional_params = GenericLiteLLMParams(**kwargs)
+    timeout = _get_file_content_timeout(
+        optional_params=optional_params,
+        custom_llm_provider=custom_llm_provider,
+        **kwargs,
+    )
+    _file_content_request = FileContentRequest(
+        file_id=file_id,
+        extra_headers=extra_headers,
+        extra_body=extra_body,
+    )
+    stream: AsyncIterator[bytes]
+    if custom_llm_provider == "openai":
+        stream = openai_files_instance.afile_content_stream(
+            file_content_request=_file_content_request,
+            timeout=timeout,
+            max_retries=optional_params.max_retries,
+            chunk_size=chunk_size,
+            **_get_openai_file_content_credentials(optional_params),  # type: ignore
+        )
+    elif custom_llm_provider == "azure":
+        stream = azure_files_instance.afile_content_stream(
+            file_content_request=_file_content_request,
+            timeout=timeout,
+            max_retries=optional_params.max_retries,
+            chunk_size=chunk_size,
+            **_get_azure_file_content_credentials(optional_params),
+        )
+    elif custom_llm_provider == "local":
+        stream = local_batches_instance.afile_content_stream(
+            file_content_request=_file_content_request, chunk_size=chunk_size
+        )
+    else:
+        raise litellm.exceptions.BadRequestError(
+            message="LiteLLM doesn't support {} for 'afile_content_stream'. Only 'openai', 'azure' and 'local' are supported.".format(
+                custom_llm_provider
+            ),
+            model="n/a",
+            llm_provider=custom_llm_provider,
+            response=httpx.Response(
+                status_code=400,
+                content="Unsupported provider",
+                request=httpx.Request(method="afile_content_stream", url="https://github.com/BerriAI/litellm"),  # type: ignore
+            ),
+        )
+    async for chunk in stream:
+        yield chunk
+
+
 async def afile_content(
     file_id: str,
-    custom_llm_provider: Literal["openai", "azure"] = "openai",
+    custom_llm_provider: Literal["openai", "azure", "local"] = "openai",
     extra_headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, str]] = None,
     **kwargs,
@@ -717,7 +856,7 @@ async def afile_content(
 
 def file_content(
     file_id: str,
-    custom_llm_provider: Literal["openai", "azure"] = "openai",
+    custom_llm_provider: Literal["openai", "azure", "local"] = "openai",
     extra_headers: Optional[Dict[str, str]] = None,
     extra_body: Optional[Dict[str, str]] = None,
     **kwargs,
@@ -729,21 +868,11 @@ def file_content(
     """
     try:
         optional_params = GenericLiteLLMParams(**kwargs)
-        ### TIMEOUT LOGIC ###
-        timeout = optional_params.timeout or kwargs.get("request_timeout", 600) or 600
-        # set timeout for 10 minutes by default
-
-        if (
-            timeout is not None
-            and isinstance(timeout, httpx.Timeout)
-            and supports_httpx_timeout(custom_llm_provider) is False
-        ):
-            read_timeout = timeout.read or 600
-            timeout = read_timeout  # default 10 min timeout
-        elif timeout is not None and not isinstance(timeout, httpx.Timeout):
-            timeout = float(timeout)  # type: ignore
-        elif timeout is None:
-            timeout = 600.0
+        timeout = _get_file_content_timeout(
+            optional_params=optional_params,
+            custom_llm_provider=custom_llm_provider,
+            **kwargs,
+        )
 
         _file_content_request = FileContentRequest(
             file_id=file_id,
@@ -753,52 +882,14 @@ def file_content(
 
         _is_async = kwargs.pop("afile_content", False) is True
         if custom_llm_provider == "openai":
-            # for deepinfra/perplexity/anyscale/groq we check in get_llm_provider and pass in the api base from there
-            api_base = (
-                optional_params.api_base
-                or litellm.api_base
-                or os.getenv("OPENAI_API_BASE")
-                or "https://api.openai.com/v1"
-            )
-            organization = (
-                optional_params.organization
-                or litellm.organization
-                or os.getenv("OPENAI_ORGANIZATION", None)
-                or None  # default - https://github.com/openai/openai-python/blob/284c1799070c723c6a553337134148a7ab088dd8/openai/util.py#L105
-            )
-            # set API KEY
-            api_key = (
-                optional_params.api_key
-                or litellm.api_key  # for deepinfra/perplexity/anyscale we check in get_llm_provider and pass in the api key from there
-                or litellm.openai_key
-                or os.getenv("OPENAI_API_KEY")
-            )
-
             response = openai_files_instance.file_content(
                 _is_async=_is_async,
                 file_content_request=_file_content_request,
-                api_base=api_base,
-                api_key=api_key,
                 timeout=timeout,
                 max_retries=optional_params.max_retries,
-                organization=organization,
+                **_get_openai_file_content_credentials(optional_params),  # type: ignore
             )
         elif custom_llm_provider == "azure":
-            api_base = optional_params.api_base or litellm.api_base or get_secret_str("AZURE_API_BASE")  # type: ignore
-            api_version = (
-                optional_params.api_version
-                or litellm.api_version
-                or get_secret_str("AZURE_API_VERSION")
-            )  # type: ignore
-
-            api_key = (
-                optional_params.api_key
-                or litellm.api_key
-                or litellm.azure_key
-                or get_secret_str("AZURE_OPENAI_API_KEY")
-                or get_secret_str("AZURE_API_KEY")
-            )  # type: ignore
-
             extra_body = optional_params.get("extra_body", {})
             if extra_body is not None:
                 extra_body.pop("azure_ad_token", None)
@@ -807,12 +898,14 @@ def file_content(
 
             response = azure_files_instance.file_content(
                 _is_async=_is_async,
-                api_base=api_base,
-                api_key=api_key,
-                api_version=api_version,
                 timeout=timeout,
                 max_retries=optional_params.max_retries,
                 file_content_request=_file_content_request,
+                **_get_azure_file_content_credentials(optional_params),
+            )
+        elif custom_llm_provider == "local":
+            response = local_batches_instance.file_content(
+                file_content_request=_file_content_request
             )
         else:
             raise litellm.exceptions.BadRequestError(
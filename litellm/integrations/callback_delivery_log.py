@@ -0,0 +1,384 @@
+"""
+On-disk delivery log for batch logging integrations (`CustomBatchLogger`).
+
+Enabled with `litellm.callback_delivery_log_dir` (env: `LITELLM_CALLBACK_DELIVERY_LOG_DIR`), for integrations with `supports_delivery_log = True` (datadog, opik).
+
+- producers append: `flush_queue` appends the in-memory batch to the delivery log - no network call on the logging path, a slow destination never blocks `flush_queue`
+- segment files: `<dir>/<logger>/<slot>/segment-<n>.jsonl` (1 event per line), rotated at `CALLBACK_DELIVERY_LOG_MAX_SEGMENT_BYTES`. Delivered segments are deleted, the oldest undelivered segments are dropped past `CALLBACK_DELIVERY_LOG_MAX_BYTES`.
+- per-destination cursor: `cursor.json` - segment + byte offset of the 1st undelivered event, moved after every delivered batch. Events not delivered before a restart are replayed from the cursor.
+- delivery runs in a background task, reading `batch_size` events at a time - memory is bounded by 1 batch
+- a failed batch is retried with exponential backoff (capped at `CALLBACK_DELIVERY_LOG_BACKOFF_MAX_SECONDS`) until it's delivered - the cursor stays on it, so an outage only delays delivery. A batch rejected with a 4xx error, other than 408 / 429, is appended to `dead_letter.jsonl` instead, and delivery moves on.
+- dead letters are requeued once on startup (e.g. after fixing the destination config), or with `requeue_dead_letters()`. `dead_letter.jsonl` is bounded by `CALLBACK_DELIVERY_LOG_MAX_BYTES` - past it, older dead letters are dropped.
+
+Each process locks its own slot dir (`<slot>` = 0, 1, ...), so gunicorn workers sharing `callback_delivery_log_dir` don't read each other's log - a restarted worker picks up a free slot, and replays it.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import IO, Any, Awaitable, Callable, List, Optional, Tuple
+
+import httpx
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    CALLBACK_DELIVERY_LOG_BACKOFF_BASE_SECONDS,
+    CALLBACK_DELIVERY_LOG_BACKOFF_MAX_SECONDS,
+    CALLBACK_DELIVERY_LOG_MAX_BYTES,
+    CALLBACK_DELIVERY_LOG_MAX_SEGMENT_BYTES,
+)
+
+try:
+    import fcntl
+except ImportError:  # windows - 1 slot dir per logger
+    fcntl = None  # type: ignore
+
+MAX_DELIVERY_LOG_SLOTS = 256
+SEGMENT_FILE_PREFIX = "segment-"
+SEGMENT_FILE_SUFFIX = ".jsonl"
+CURSOR_FILE_NAME = "cursor.json"
+DEAD_LETTER_FILE_NAME = "dead_letter.jsonl"
+LOCK_FILE_NAME = "lock"
+
+# (segment number, byte offset)
+DeliveryLogCursor = Tuple[int, int]
+
+
+def _acquire_slot_dir(directory: str) -> Tuple[str, Optional[IO]]:
+    """
+    Returns the 1st slot dir under `directory` not locked by another process, and its lock file (kept open while the process runs)
+    """
+    for slot in range(MAX_DELIVERY_LOG_SLOTS):
+        slot_dir = os.path.join(directory, str(slot))
+        os.makedirs(slot_dir, exist_ok=True)
+        if fcntl is None:
+            return slot_dir, None
+        lock_file = open(os.path.join(slot_dir, LOCK_FILE_NAME), "a")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return slot_dir, lock_file
+        except OSError:
+            lock_file.close()
+    raise ValueError(
+        f"All {MAX_DELIVERY_LOG_SLOTS} callback delivery log slots in {directory} are locked"
+    )
+
+
+def _is_retryable_delivery_error(e: Exception) -> bool:
+    if isinstance(e, httpx.HTTPStatusError):
+        status_code = e.response.status_code
+        if 400 <= status_code < 500 and status_code not in (408, 429):
+            # the destination rejected the batch - sending it again won't help
+            return False
+    return True
+
+
+class CallbackDeliveryLog:
+    def __init__(
+        self,
+        directory: str,
+        send_events: Callable[[List[Any]], Awaitable[Any]],
+        batch_size: int,
+        max_segment_bytes: int = CALLBACK_DELIVERY_LOG_MAX_SEGMENT_BYTES,
+        max_bytes: int = CALLBACK_DELIVERY_LOG_MAX_BYTES,
+        backoff_base_seconds: float = CALLBACK_DELIVERY_LOG_BACKOFF_BASE_SECONDS,
+        backoff_max_seconds: float = CALLBACK_DELIVERY_LOG_BACKOFF_MAX_SECONDS,
+    ) -> None:
+        """
+        Args:
+            directory: delivery log dir of 1 destination (e.g. `<callback_delivery_log_dir>/DataDogLogger`)
+            send_events: sends a batch of events to the destination - raises if the batch was not accepted
+            batch_size: max number of events per `send_events` call
+        """
+        self.directory, self._lock_file = _acquire_slot_dir(directory)
+        self.send_events = send_events
+        self.batch_size = batch_size
+        self.max_segment_bytes = max_segment_bytes
+        self.max_bytes = max_bytes
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+        self.num_delivered = 0
+        self.num_dead_lettered = 0
+
+        self._cursor: DeliveryLogCursor = self._read_cursor()
+        # a new segment per process - never append to a segment cut off mid-event by a crash
+        segments = self._list_segments()
+        self._write_segment = (
+            max(segments[-1] + 1, self._cursor[0]) if segments else self._cursor[0]
+        )
+        self._write_file: Optional[IO[bytes]] = None
+        self._new_events: Optional[asyncio.Event] = None
+        self._delivery_task: Optional[asyncio.Task] = None
+        self.requeue_dead_letters()
+
+    ### PRODUCER ###
+
+    def append(self, events: List[Any]) -> None:
+        """
+        Append events to the log - they're delivered by the background delivery task
+        """
+        if not events:
+            return
+        data = b"".join(
+            json.dumps(event, default=str).encode("utf-8") + b"\n" for event in events
+        )
+        write_file = self._get_write_file()
+        write_file.write(data)
+        write_file.flush()
+        if write_file.tell() >= self.max_segment_bytes:
+            self._rotate()
+        if self._new_events is not None:
+            self._new_events.set()
+
+    def start(self) -> None:
+        """
+        Start the background delivery task, if it's not running. No-op outside of an event loop.
+        """
+        if self._delivery_task is not None and not self._delivery_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._new_events = asyncio.Event()
+        self._delivery_task = loop.create_task(self._run_delivery())
+
+    def has_pending_events(self) -> bool:
+        segment, offset = self._cursor
+        if segment < self._write_segment:
+            return True
+        path = self._get_segment_path(segment)
+        return os.path.exists(path) and os.path.getsize(path) > offset
+
+    def requeue_dead_letters(self) -> int:
+        """
+        Append dead-lettered events back to the log - e.g. after fixing the destination config. Called on startup. Returns the number of events requeued.
+        """
+        dead_letter_path = os.path.join(self.directory, DEAD_LETTER_FILE_NAME)
+        if not os.path.exists(dead_letter_path):
+            return 0
+        events: List[Any] = []
+        with open(dead_letter_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    events.append(json.loads(line)["event"])
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    verbose_logger.warning(
+                        "Callback delivery log - skipping corrupt dead letter in %s",
+                        dead_letter_path,
+                    )
+        self.append(events)
+        os.remove(dead_letter_path)
+        return len(events)
+
+    def close(self) -> None:
+        """
+        Stop delivery, and release the slot dir - undelivered events are replayed by the next process using it
+        """
+        if self._delivery_task is not None:
+            self._delivery_task.cancel()
+            self._delivery_task = None
+        if self._write_file is not None:
+            self._write_file.close()
+            self._write_file = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    ### DELIVERY ###
+
+    async def _run_delivery(self) -> None:
+        while True:
+            try:
+                await self.deliver_pending()
+                if self._new_events is not None:
+                    self._new_events.clear()
+                    if not self.has_pending_events():
+                        await self._new_events.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                verbose_logger.exception(
+                    "Callback delivery log - delivery failed: %s", str(e)
+                )
+                await asyncio.sleep(self.backoff_base_seconds)
+
+    async def deliver_pending(self) -> int:
+        """
+        Deliver all events after the cursor. Returns the number of events processed (delivered + dead-lettered).
+        """
+        num_processed = 0
+        while True:
+            events, next_cursor = self._read_batch()
+            if not events:
+                self._set_cursor(next_cursor)
+                return num_processed
+            await self._deliver_batch(events)
+            self._set_cursor(next_cursor)
+            num_processed += len(events)
+
+    async def _deliver_batch(self, events: List[Any]) -> None:
+        """
+        Deliver 1 batch - retryable errors are retried until the batch is delivered, batches rejected by the destination are dead-lettered
+        """
+        attempt = 0
+        while True:
+            try:
+                await self.send_events(events)
+                self.num_delivered += len(events)
+                return
+            except Exception as e:
+                if not _is_retryable_delivery_error(e):
+                    self._dead_letter(events=events, error=e)
+                    return
+                delay = min(
+                    self.backoff_base_seconds * (2 ** min(attempt, 32)),
+                    self.backoff_max_seconds,
+                )
+                attempt += 1
+                verbose_logger.warning(
+                    "Callback delivery log - delivery of %s events in %s failed (attempt %s), retrying in %ss: %s",
+                    len(events),
+                    self.directory,
+                    attempt,
+                    delay,
+                    str(e),
+                )
+                await asyncio.sleep(delay)
+
+    def _dead_letter(self, events: List[Any], error: Exception) -> None:
+        verbose_logger.error(
+            "Callback delivery log - dead-lettering %s events in %s: %s",
+            len(events),
+            self.directory,
+            str(error),
+        )
+        failed_at = time.time()
+        data = b"".join(
+            json.dumps(
+                {"failed_at": failed_at, "error": str(error), "event": event},
+                default=str,
+            ).encode("utf-8")
+            + b"\n"
+            for event in events
+        )
+        dead_letter_path = os.path.join(self.directory, DEAD_LETTER_FILE_NAME)
+        if (
+            os.path.exists(dead_letter_path)
+            and os.path.getsize(dead_letter_path) + len(data) > self.max_bytes
+        ):
+            verbose_logger.warning(
+                "Callback delivery log - %s is over %s bytes, dropping %s bytes of older dead letters",
+                dead_letter_path,
+                self.max_bytes,
+                os.path.getsize(dead_letter_path),
+            )
+            os.remove(dead_letter_path)
+        with open(dead_letter_path, "ab") as f:
+            f.write(data)
+        self.num_dead_lettered += len(events)
+
+    def _read_batch(self) -> Tuple[List[Any], DeliveryLogCursor]:
+        """
+        Read up to `batch_size` events after the cursor. Returns the events, and the cursor after them.
+        """
+        segment, offset = self._cursor
+        while True:
+            events: List[Any] = []
+            path = self._get_segment_path(segment)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    f.seek(offset)
+                    for line in f:
+                        if not line.endswith(b"\n"):  # partially written event
+                            break
+                        offset += len(line)
+                        try:
+                            events.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            verbose_logger.warning(
+                                "Callback delivery log - skipping corrupt event in %s",
+                                path,
+                            )
+                        if len(events) >= self.batch_size:
+                            break
+            if events or segment >= self._write_segment:
+                return events, (segment, offset)
+            # segment read to the end - continue with the next one
+            segment, offset = segment + 1, 0
+
+    ### FILES ###
+
+    def _get_segment_path(self, segment: int) -> str:
+        return os.path.join(
+            self.directory, f"{SEGMENT_FILE_PREFIX}{segment:08d}{SEGMENT_FILE_SUFFIX}"
+        )
+
+    def _list_segments(self) -> List[int]:
+        segments = []
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith(SEGMENT_FILE_PREFIX) and file_name.endswith(
+                SEGMENT_FILE_SUFFIX
+            ):
+                segments.append(
+                    int(file_name[len(SEGMENT_FILE_PREFIX) : -len(SEGMENT_FILE_SUFFIX)])
+                )
+        return sorted(segments)
+
+    def _get_write_file(self) -> IO[bytes]:
+        if self._write_file is None:
+            self._write_file = open(self._get_segment_path(self._write_segment), "ab")
+        return self._write_file
+
+    def _rotate(self) -> None:
+        if self._write_file is not None:
+            self._write_file.close()
+            self._write_file = None
+        self._write_segment += 1
+        self._drop_oldest_segments()
+
+    def _drop_oldest_segments(self) -> None:
+        segments = [s for s in self._list_segments() if s >= self._cursor[0]]
+        sizes = {s: os.path.getsize(self._get_segment_path(s)) for s in segments}
+        total_bytes = sum(sizes.values())
+        for segment in segments:
+            if total_bytes <= self.max_bytes or segment >= self._write_segment:
+                break
+            verbose_logger.warning(
+                "Callback delivery log - %s is over %s bytes, dropping %s undelivered bytes",
+                self.directory,
+                self.max_bytes,
+                sizes[segment],
+            )
+            os.remove(self._get_segment_path(segment))
+            total_bytes -= sizes[segment]
+            self._set_cursor((segment + 1, 0))
+
+    def _read_cursor(self) -> DeliveryLogCursor:
+        try:
+            with open(os.path.join(self.directory, CURSOR_FILE_NAME), "r") as f:
+                cursor = json.load(f)
+            return int(cursor["segment"]), int(cursor["offset"])
+        except (FileNotFoundError, ValueError, KeyError):
+            segments = self._list_segments()
+            return (segments[0] if segments else 0), 0
+
+    def _set_cursor(self, cursor: DeliveryLogCursor) -> None:
+        if cursor <= self._cursor:
+            return
+        cursor_path = os.path.join(self.directory, CURSOR_FILE_NAME)
+        tmp_path = f"{cursor_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"segment": cursor[0], "offset": cursor[1]}, f)
+        os.replace(tmp_path, cursor_path)
+        # delivered segments
+        for segment in range(self._cursor[0], cursor[0]):
+            try:
+                os.remove(self._get_segment_path(segment))
+            except FileNotFoundError:
+                pass
+        self._cursor = cursor
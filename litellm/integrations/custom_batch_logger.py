@@ -2,35 +2,54 @@
 Custom Logger that handles batching logic 
 
 Use this if you want your logs to be stored in memory and flushed periodically.
+
+With `litellm.callback_delivery_log_dir` set, loggers with `supports_delivery_log = True` (+ `async_send_events`) flush their batches to an on-disk delivery log instead, and deliver them from it in the background - see `callback_delivery_log.py`
 """
 
 import asyncio
+import os
 import time
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.integrations.callback_delivery_log import CallbackDeliveryLog
 from litellm.integrations.custom_logger import CustomLogger
 
 
 class CustomBatchLogger(CustomLogger):
+    # set to True by loggers implementing `async_send_events`
+    supports_delivery_log: bool = False
 
     def __init__(
         self,
         flush_lock: Optional[asyncio.Lock] = None,
         batch_size: Optional[int] = None,
         flush_interval: Optional[int] = None,
+        delivery_log_dir: Optional[str] = None,
         **kwargs,
     ) -> None:
         """
         Args:
             flush_lock (Optional[asyncio.Lock], optional): Lock to use when flushing the queue. Defaults to None. Only used for custom loggers that do batching
+            delivery_log_dir (Optional[str], optional): Dir of the on-disk delivery log. Defaults to `litellm.callback_delivery_log_dir`. Only used for loggers with `supports_delivery_log = True`
         """
         self.log_queue: List = []
         self.flush_interval = flush_interval or litellm.DEFAULT_FLUSH_INTERVAL_SECONDS
         self.batch_size: int = batch_size or litellm.DEFAULT_BATCH_SIZE
         self.last_flush_time = time.time()
         self.flush_lock = flush_lock
+        self.delivery_log: Optional[CallbackDeliveryLog] = None
+
+        delivery_log_dir = delivery_log_dir or litellm.callback_delivery_log_dir
+        if delivery_log_dir is not None and self.supports_delivery_log is True:
+            self.delivery_log = CallbackDeliveryLog(
+                directory=os.path.join(delivery_log_dir, type(self).__name__),
+                send_events=self.async_send_events,
+                batch_size=self.batch_size,
+            )
+            # replay events not delivered before a restart
+            self.delivery_log.start()
 
         super().__init__(**kwargs)
 
@@ -51,9 +70,22 @@ class CustomBatchLogger(CustomLogger):
                 verbose_logger.debug(
                     "CustomLogger: Flushing batch of %s events", len(self.log_queue)
                 )
-                await self.async_send_batch()
+                if self.delivery_log is not None:
+                    self.delivery_log.append(self.log_queue)
+                else:
+                    await self.async_send_batch()
                 self.log_queue.clear()
                 self.last_flush_time = time.time()
+            if self.delivery_log is not None:
+                self.delivery_log.start()
 
     async def async_send_batch(self, *args, **kwargs):
         pass
+
+    async def async_send_events(self, events: List[Any]) -> None:
+        """
+        Send a batch of events read from the delivery log - raise if the batch was not accepted, so it's retried
+
+        Implement this + set `supports_delivery_log = True` to support `litellm.callback_delivery_log_dir`
+        """
+        raise NotImplementedError
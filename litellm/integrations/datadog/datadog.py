@@ -7,6 +7,7 @@ DD Reference API: https://docs.datadoghq.com/api/latest/logs
 `log_success_event` - sync version of logging to DataDog, only used on litellm Python SDK, if user opts in to using sync functions
 
 async_log_success_event:  will store batch of DD_MAX_BATCH_SIZE in memory and flush to Datadog once it reaches DD_MAX_BATCH_SIZE or every 5 seconds
+With `litellm.callback_delivery_log_dir` set, batches are flushed to an on-disk delivery log, and sent to Datadog from it (`async_send_events`)
 
 async_service_failure_hook: Logs failures from Redis, Postgres (Adjacent systems), as 'WARNING' on DataDog
 
@@ -47,6 +48,8 @@ class DataDogLogger(
     CustomBatchLogger,
     AdditionalLoggingUtils,
 ):
+    supports_delivery_log = True
+
     # Class variables or attributes
     def __init__(
         self,
@@ -176,6 +179,20 @@ class DataDogLogger(
                 f"Datadog Error sending batch API - {str(e)}\n{traceback.format_exc()}"
             )
 
+    async def async_send_events(self, events: List[DatadogPayload]) -> None:
+        """
+        Sends a batch of logs read from the callback delivery log to datadog api
+
+        Raises:
+            httpx.HTTPStatusError / Exception if datadog did not accept the batch - the delivery log retries it
+        """
+        response = await self.async_send_compressed_data(events)
+        response.raise_for_status()
+        if response.status_code != 202:
+            raise Exception(
+                f"Response from datadog API status_code: {response.status_code}, text: {response.text}"
+            )
+
     def log_success_event(self, kwargs, response_obj, start_time, end_time):
         """
         Sync Log success events to Datadog
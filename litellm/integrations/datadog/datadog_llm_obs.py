@@ -26,6 +26,9 @@ from litellm.types.utils import StandardLoggingPayload
 
 
 class DataDogLLMObsLogger(DataDogLogger, CustomBatchLogger):
+    # llm obs spans are sent by `async_send_batch`, not `DataDogLogger.async_send_events`
+    supports_delivery_log = False
+
     def __init__(self, **kwargs):
         try:
             verbose_logger.debug("DataDogLLMObs: Initializing logger")
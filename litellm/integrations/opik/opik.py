@@ -5,7 +5,7 @@ Opik Logger that logs LLM events to an Opik server
 import asyncio
 import json
 import traceback
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from litellm._logging import verbose_logger
 from litellm.integrations.custom_batch_logger import CustomBatchLogger
@@ -28,6 +28,8 @@ class OpikLogger(CustomBatchLogger):
     Opik Logger for logging events to an Opik Server
     """
 
+    supports_delivery_log = True
+
     def __init__(self, **kwargs):
         self.async_httpx_client = get_async_httpx_client(
             llm_provider=httpxSpecialProvider.LoggingCallback
@@ -64,6 +66,8 @@ class OpikLogger(CustomBatchLogger):
 
         self.opik_workspace = opik_workspace
         self.opik_api_key = opik_api_key
+        # ids of the traces of the batch being delivered that opik already accepted - not sent again when the batch is retried
+        self._delivered_trace_ids: Set[str] = set()
         try:
             asyncio.create_task(self.periodic_flush())
             self.flush_lock = asyncio.Lock()
@@ -153,6 +157,33 @@ class OpikLogger(CustomBatchLogger):
         except Exception as e:
             verbose_logger.exception(f"OpikLogger failed to send batch - {str(e)}")
 
+    async def async_send_events(self, events: List[Dict]) -> None:
+        """
+        Sends a batch of events read from the callback delivery log to the Opik server - raises if a trace / span batch was not accepted
+
+        Traces + spans are sent in 2 requests - if the spans fail, the traces already accepted are skipped when the batch is retried
+        """
+        traces, spans = get_traces_and_spans_from_payload(events)
+        traces = [
+            trace
+            for trace in traces
+            if trace.get("id") is None or trace["id"] not in self._delivered_trace_ids
+        ]
+        if len(traces) > 0:
+            response = await self.async_httpx_client.post(
+                url=self.trace_url, headers=self.headers, json={"traces": traces}  # type: ignore
+            )
+            response.raise_for_status()
+            self._delivered_trace_ids.update(
+                trace["id"] for trace in traces if trace.get("id") is not None
+            )
+        if len(spans) > 0:
+            response = await self.async_httpx_client.post(
+                url=self.span_url, headers=self.headers, json={"spans": spans}  # type: ignore
+            )
+            response.raise_for_status()
+        self._delivered_trace_ids.clear()
+
     def _create_opik_headers(self):
         headers = {}
         if self.opik_workspace:
@@ -9,6 +9,9 @@ from typing import Any, Awaitable, Callable, List, Literal, Optional, Tuple, cas
 import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.integrations.prometheus_helpers.metrics_buffer import (
+    PrometheusMetricsBuffer,
+)
 from litellm.proxy._types import LiteLLM_TeamTable, UserAPIKeyAuth
 from litellm.types.integrations.prometheus import *
 from litellm.types.utils import StandardLoggingPayload
@@ -26,6 +29,8 @@ class PrometheusLogger(CustomLogger):
 
             from litellm.proxy.proxy_server import CommonProxyErrors, premium_user
 
+            self.metrics_buffer: Optional[PrometheusMetricsBuffer] = None
+
             if premium_user is not True:
                 verbose_logger.warning(
                     f"🚨🚨🚨 Prometheus Metrics is on LiteLLM Enterprise\n🚨 {CommonProxyErrors.not_premium_user.value}"
@@ -134,6 +139,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_remaining_team_budget_metric = Gauge(
                 "litellm_remaining_team_budget_metric",
                 "Remaining budget for team",
+                multiprocess_mode="mostrecent",
                 labelnames=PrometheusMetricLabels.get_labels(
                     label_name="litellm_remaining_team_budget_metric"
                 ),
@@ -143,6 +149,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_team_max_budget_metric = Gauge(
                 "litellm_team_max_budget_metric",
                 "Maximum budget set for team",
+                multiprocess_mode="mostrecent",
                 labelnames=PrometheusMetricLabels.get_labels(
                     label_name="litellm_team_max_budget_metric"
                 ),
@@ -152,6 +159,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_team_budget_remaining_hours_metric = Gauge(
                 "litellm_team_budget_remaining_hours_metric",
                 "Remaining days for team budget to be reset",
+                multiprocess_mode="mostrecent",
                 labelnames=PrometheusMetricLabels.get_labels(
                     label_name="litellm_team_budget_remaining_hours_metric"
                 ),
@@ -161,6 +169,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_remaining_api_key_budget_metric = Gauge(
                 "litellm_remaining_api_key_budget_metric",
                 "Remaining budget for api key",
+                multiprocess_mode="mostrecent",
                 labelnames=PrometheusMetricLabels.get_labels(
                     label_name="litellm_remaining_api_key_budget_metric"
                 ),
@@ -170,6 +179,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_api_key_max_budget_metric = Gauge(
                 "litellm_api_key_max_budget_metric",
                 "Maximum budget set for api key",
+                multiprocess_mode="mostrecent",
                 labelnames=PrometheusMetricLabels.get_labels(
                     label_name="litellm_api_key_max_budget_metric"
                 ),
@@ -178,6 +188,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_api_key_budget_remaining_hours_metric = Gauge(
                 "litellm_api_key_budget_remaining_hours_metric",
                 "Remaining hours for api key budget to be reset",
+                multiprocess_mode="mostrecent",
                 labelnames=PrometheusMetricLabels.get_labels(
                     label_name="litellm_api_key_budget_remaining_hours_metric"
                 ),
@@ -190,6 +201,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_remaining_api_key_requests_for_model = Gauge(
                 "litellm_remaining_api_key_requests_for_model",
                 "Remaining Requests API Key can make for model (model based rpm limit on key)",
+                multiprocess_mode="mostrecent",
                 labelnames=["hashed_api_key", "api_key_alias", "model"],
             )
 
@@ -197,6 +209,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_remaining_api_key_tokens_for_model = Gauge(
                 "litellm_remaining_api_key_tokens_for_model",
                 "Remaining Tokens API Key can make for model (model based tpm limit on key)",
+                multiprocess_mode="mostrecent",
                 labelnames=["hashed_api_key", "api_key_alias", "model"],
             )
 
@@ -208,6 +221,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_remaining_requests_metric = Gauge(
                 "litellm_remaining_requests",
                 "LLM Deployment Analytics - remaining requests for model, returned from LLM API Provider",
+                multiprocess_mode="mostrecent",
                 labelnames=[
                     "model_group",
                     "api_provider",
@@ -221,6 +235,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_remaining_tokens_metric = Gauge(
                 "litellm_remaining_tokens",
                 "remaining tokens for model, returned from LLM API Provider",
+                multiprocess_mode="mostrecent",
                 labelnames=[
                     "model_group",
                     "api_provider",
@@ -248,6 +263,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_provider_remaining_budget_metric = Gauge(
                 "litellm_provider_remaining_budget_metric",
                 "Remaining budget for provider - used when you set provider budget limits",
+                multiprocess_mode="mostrecent",
                 labelnames=["api_provider"],
             )
 
@@ -269,6 +285,7 @@ class PrometheusLogger(CustomLogger):
             self.litellm_deployment_state = Gauge(
                 "litellm_deployment_state",
                 "LLM Deployment Analytics - The state of the deployment: 0 = healthy, 1 = partial outage, 2 = complete outage",
+                multiprocess_mode="mostrecent",
                 labelnames=_logged_llm_labels,
             )
 
@@ -359,12 +376,29 @@ class PrometheusLogger(CustomLogger):
                     label_name="litellm_requests_metric"
                 ),
             )
+            if litellm.prometheus_async_metrics_aggregation is True:
+                self._enable_metrics_buffer()
             self._initialize_prometheus_startup_metrics()
 
         except Exception as e:
             print_verbose(f"Got exception on init prometheus client {str(e)}")
             raise e
 
+    def _enable_metrics_buffer(self):
+        """
+        Wrap all labelled metrics, so metric updates in the request path are buffered and aggregated by a background task.
+
+        See litellm/integrations/prometheus_helpers/metrics_buffer.py
+        """
+        from prometheus_client.metrics import MetricWrapperBase
+
+        self.metrics_buffer = PrometheusMetricsBuffer()
+        for attribute_name, attribute_value in list(vars(self).items()):
+            if isinstance(attribute_value, MetricWrapperBase) and len(
+                attribute_value._labelnames
+            ):
+                setattr(self, attribute_name, self.metrics_buffer.wrap(attribute_value))
+
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         # Define prometheus client
         from litellm.types.utils import StandardLoggingPayload
@@ -0,0 +1,201 @@
+"""
+Buffered prometheus metric updates
+
+`prometheus_client` takes a lock on every `.labels(...)` lookup and on every value update. At high RPS this is a measurable per-request cost in the prometheus logging hooks.
+
+When `litellm.prometheus_async_metrics_aggregation = True`, PrometheusLogger wraps its metrics in `BufferedMetric`:
+- `.labels(...).inc() / .set() / .observe()` only appends a raw event to a per-worker deque (deque.append is thread-safe, no lock is taken)
+- a background task drains the deque every PROMETHEUS_METRICS_BUFFER_FLUSH_INTERVAL_SECONDS, sums counter increments per label set and applies them to pre-bound label children (`metric.labels(...)` runs once per label set)
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.constants import PROMETHEUS_METRICS_BUFFER_FLUSH_INTERVAL_SECONDS
+
+# (metric index, positional label values, keyword label values, operation, value)
+# only holds the metric index (not the metric), so buffered events are not tracked by the garbage collector
+MetricEvent = Tuple[int, Tuple[Any, ...], Optional[Dict[str, Any]], str, float]
+
+
+class BufferedLabelChild:
+    """
+    Returned by `BufferedMetric.labels(...)` - records metric updates in the buffer instead of applying them.
+
+    Label values are stored as passed, they are only converted to the label child key when the buffer is flushed.
+    """
+
+    __slots__ = ("_append", "_metric_index", "_labelvalues", "_labelkwargs")
+
+    def __init__(
+        self,
+        append: Callable[[MetricEvent], None],
+        metric_index: int,
+        labelvalues: Tuple[Any, ...],
+        labelkwargs: Optional[Dict[str, Any]],
+    ):
+        self._append = append
+        self._metric_index = metric_index
+        self._labelvalues = labelvalues
+        self._labelkwargs = labelkwargs
+
+    def inc(self, amount: float = 1) -> None:
+        self._append(
+            (self._metric_index, self._labelvalues, self._labelkwargs, "inc", amount)
+        )
+
+    def dec(self, amount: float = 1) -> None:
+        self._append(
+            (self._metric_index, self._labelvalues, self._labelkwargs, "dec", amount)
+        )
+
+    def set(self, value: float) -> None:
+        self._append(
+            (self._metric_index, self._labelvalues, self._labelkwargs, "set", value)
+        )
+
+    def observe(self, amount: float) -> None:
+        self._append(
+            (
+                self._metric_index,
+                self._labelvalues,
+                self._labelkwargs,
+                "observe",
+                amount,
+            )
+        )
+
+
+class BufferedMetric:
+    """
+    Wraps a prometheus Counter / Gauge / Histogram. Any other attribute is read from the wrapped metric.
+    """
+
+    def __init__(self, metric: Any, buffer: "PrometheusMetricsBuffer"):
+        self.metric = metric
+        self.buffer = buffer
+        self._labelnames: Tuple[str, ...] = tuple(metric._labelnames)
+        self._labelnames_set = set(self._labelnames)
+        self._label_children: Dict[Tuple[str, ...], Any] = {}
+        self._append = buffer.events.append
+        self._metric_index = len(buffer.metrics)
+        buffer.metrics.append(self)
+
+    def labels(self, *labelvalues: Any, **labelkwargs: Any) -> BufferedLabelChild:
+        """
+        Invalid label names / counts still raise at the call site, same as `prometheus_client`
+        """
+        if self.buffer._flush_task is None:
+            self.buffer._start_periodic_flush()
+        if labelkwargs:
+            if (
+                labelvalues
+                or len(labelkwargs) != len(self._labelnames)
+                or not self._labelnames_set.issuperset(labelkwargs)
+            ):
+                raise ValueError("Incorrect label names")
+            return BufferedLabelChild(
+                self._append, self._metric_index, labelvalues, labelkwargs
+            )
+        if len(labelvalues) != len(self._labelnames):
+            raise ValueError("Incorrect label count")
+        return BufferedLabelChild(self._append, self._metric_index, labelvalues, None)
+
+    def get_label_values(
+        self, labelvalues: Tuple[Any, ...], labelkwargs: Optional[Dict[str, Any]]
+    ) -> Tuple[str, ...]:
+        if labelkwargs is not None:
+            return tuple([str(labelkwargs[name]) for name in self._labelnames])
+        return tuple([str(value) for value in labelvalues])
+
+    def get_label_child(self, label_values: Tuple[str, ...]) -> Any:
+        """
+        Returns the pre-bound prometheus label child for `label_values`
+        """
+        label_child = self._label_children.get(label_values)
+        if label_child is None:
+            label_child = self.metric.labels(*label_values)
+            self._label_children[label_values] = label_child
+        return label_child
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.metric, name)
+
+
+class PrometheusMetricsBuffer:
+    def __init__(
+        self, flush_interval: float = PROMETHEUS_METRICS_BUFFER_FLUSH_INTERVAL_SECONDS
+    ):
+        self.flush_interval = flush_interval
+        self.events: Deque[MetricEvent] = deque()
+        self.metrics: List[BufferedMetric] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def wrap(self, metric: Any) -> BufferedMetric:
+        return BufferedMetric(metric=metric, buffer=self)
+
+    def _start_periodic_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no running event loop (sync caller) - task is started on the next async record
+            return
+        self._flush_task = loop.create_task(self.periodic_flush())
+
+    async def periodic_flush(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                verbose_logger.exception(
+                    "prometheus metrics buffer: error flushing metrics - %s", str(e)
+                )
+
+    def flush(self) -> int:
+        """
+        Drain buffered events into the prometheus metrics.
+
+        Counter / gauge increments are summed per label set. Other operations (set, observe, dec) are applied in order.
+
+        Returns the number of events drained.
+        """
+        pending_increments: Dict[Tuple[BufferedMetric, Tuple[str, ...]], float] = {}
+        num_events = len(self.events)
+        for _ in range(num_events):
+            metric_index, labelvalues, labelkwargs, operation, value = (
+                self.events.popleft()
+            )
+            metric = self.metrics[metric_index]
+            label_values = metric.get_label_values(labelvalues, labelkwargs)
+            key = (metric, label_values)
+            if operation == "inc":
+                pending_increments[key] = pending_increments.get(key, 0.0) + value
+                continue
+            # keep ordering with increments on the same label set, e.g. gauge .inc() then .set()
+            if key in pending_increments:
+                self._apply(metric, label_values, "inc", pending_increments.pop(key))
+            self._apply(metric, label_values, operation, value)
+
+        for (metric, label_values), value in pending_increments.items():
+            self._apply(metric, label_values, "inc", value)
+        return num_events
+
+    def _apply(
+        self,
+        metric: BufferedMetric,
+        label_values: Tuple[str, ...],
+        operation: str,
+        value: float,
+    ) -> None:
+        try:
+            getattr(metric.get_label_child(label_values), operation)(value)
+        except Exception as e:
+            verbose_logger.exception(
+                "prometheus metrics buffer: error applying %s to %s - %s",
+                operation,
+                metric._name,
+                str(e),
+            )
@@ -0,0 +1,130 @@
+"""
+Multiprocess mode for prometheus metrics
+
+Used when the proxy runs with `--num_workers > 1` - every worker writes its metrics to `PROMETHEUS_MULTIPROC_DIR`, and `/metrics` aggregates them across all workers.
+
+prometheus_client reads `PROMETHEUS_MULTIPROC_DIR` when it is imported, so it needs to be set before the workers import prometheus_client.
+See https://prometheus.github.io/client_python/multiprocess/
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+from typing import Any, Optional
+
+from litellm._logging import verbose_logger
+
+
+def is_prometheus_multiprocess_mode() -> bool:
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def _clear_prometheus_multiprocess_dir(multiprocess_dir: str) -> None:
+    # metric files of a previous run would be summed into /metrics
+    for file_name in os.listdir(multiprocess_dir):
+        if file_name.endswith(".db"):
+            try:
+                os.remove(os.path.join(multiprocess_dir, file_name))
+            except OSError:
+                pass
+
+
+def _remove_prometheus_multiprocess_dir(multiprocess_dir: str, owner_pid: int) -> None:
+    # forked workers inherit the atexit hook - only the proxy process removes the dir
+    if os.getpid() != owner_pid:
+        return
+    shutil.rmtree(multiprocess_dir, ignore_errors=True)
+
+
+def setup_prometheus_multiprocess_dir(num_workers: Optional[int]) -> Optional[str]:
+    """
+    Called by the proxy CLI before any worker starts.
+
+    If `PROMETHEUS_MULTIPROC_DIR` is set, metric files left in it by a previous run are removed.
+    Else if the proxy runs more than 1 worker, a new temp dir is used, and removed when the proxy exits.
+
+    Returns the multiprocess dir, None if multiprocess mode is not used.
+    """
+    multiprocess_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiprocess_dir:
+        os.makedirs(multiprocess_dir, exist_ok=True)
+        _clear_prometheus_multiprocess_dir(multiprocess_dir)
+        return multiprocess_dir
+
+    if num_workers is None or num_workers <= 1:
+        return None
+
+    multiprocess_dir = tempfile.mkdtemp(prefix="litellm_prometheus_")
+    atexit.register(_remove_prometheus_multiprocess_dir, multiprocess_dir, os.getpid())
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = multiprocess_dir
+    verbose_logger.debug(
+        "Running %s workers, prometheus multiprocess dir: %s",
+        num_workers,
+        multiprocess_dir,
+    )
+    return multiprocess_dir
+
+
+def get_prometheus_metrics_asgi_app() -> Any:
+    """
+    ASGI app for `/metrics`. Aggregates metrics across all workers in multiprocess mode.
+    """
+    from prometheus_client import CollectorRegistry, make_asgi_app, multiprocess
+
+    if not is_prometheus_multiprocess_mode():
+        return make_asgi_app()
+
+    mark_exited_prometheus_workers_dead()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return make_asgi_app(registry=registry)
+
+
+def mark_prometheus_worker_dead(server: Any, worker: Any) -> None:
+    """
+    gunicorn `child_exit` hook - removes the metrics of live gauges for a dead worker
+    """
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # e.g. EPERM - the process exists
+        return True
+    return True
+
+
+def mark_exited_prometheus_workers_dead() -> None:
+    """
+    Removes the live gauge files of workers that exited - uvicorn restarts workers without a `child_exit` hook.
+
+    Called when a worker mounts `/metrics`.
+    """
+    from prometheus_client import multiprocess
+
+    multiprocess_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if not multiprocess_dir or not os.path.isdir(multiprocess_dir):
+        return
+
+    # live gauge files are named `gauge_live{mode}_{pid}.db`
+    dead_pids = set()
+    for file_name in os.listdir(multiprocess_dir):
+        if not file_name.startswith("gauge_live") or not file_name.endswith(".db"):
+            continue
+        try:
+            pid = int(file_name[: -len(".db")].rsplit("_", 1)[1])
+        except (IndexError, ValueError):
+            continue
+        if not _is_process_alive(pid):
+            dead_pids.add(pid)
+
+    for pid in dead_pids:
+        verbose_logger.debug("Marking exited prometheus worker %s dead", pid)
+        multiprocess.mark_process_dead(pid, path=multiprocess_dir)
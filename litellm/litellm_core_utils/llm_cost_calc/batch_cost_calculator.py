@@ -0,0 +1,469 @@
+"""
+Batch cost calculation - price many requests at once.
+
+`cost_per_token()` prices 1 request per call (model name normalization + model info lookup + arithmetic every time).
+For backfills, spend recomputation after a price change, analytics exports, etc. use `batch_cost_per_token()`:
+- pricing is resolved once per distinct (model, custom_llm_provider)
+- costs are computed with NumPy over the token columns. NumPy is optional - without it, every row is priced with `cost_per_token()`.
+
+Results match `cost_per_token(..., call_type="completion")` for every row.
+
+Providers with pricing that is not linear in the token columns (e.g. vertex ai character based pricing, databricks DBU pricing) are priced row by row with `cost_per_token()`.
+"""
+
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from litellm._logging import verbose_logger
+from litellm.cost_calculator import _get_model_cost_lookup_key, cost_per_token
+from litellm.types.utils import (
+    CompletionTokensDetailsWrapper,
+    PromptTokensDetailsWrapper,
+    StandardLoggingPayload,
+    Usage,
+)
+from litellm.utils import _cached_get_model_info_helper
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# providers using `generic_cost_per_token()` in `cost_per_token()`
+GENERIC_COST_PROVIDERS = {"anthropic", "gemini", "deepseek"}
+# providers priced row by row with `cost_per_token()`
+SCALAR_COST_PROVIDERS = {"vertex_ai", "databricks", "fireworks_ai"}
+
+# pricing kinds - which branch of `cost_per_token()` the model is priced with
+_PRICING_UNMAPPED = 0
+_PRICING_DEFAULT = 1
+_PRICING_GENERIC = 2
+_PRICING_OPENAI = 3
+_PRICING_AZURE = 4
+_PRICING_SCALAR = 5
+
+# columns of the per-model pricing table
+_PRICING_FIELDS = (
+    "input_cost_per_token",
+    "output_cost_per_token",
+    "input_cost_per_token_above_128k_tokens",
+    "output_cost_per_token_above_128k_tokens",
+    "cache_read_input_token_cost",
+    "cache_creation_input_token_cost",
+    "input_cost_per_audio_token",
+    "output_cost_per_audio_token",
+    "input_cost_per_second",
+    "output_cost_per_second",
+)
+
+
+def _get_pricing_row(
+    model: str, custom_llm_provider: Optional[str]
+) -> Tuple[int, List[float], List[bool]]:
+    """
+    Resolve pricing for a distinct (model, custom_llm_provider) - same lookup as `cost_per_token()`.
+
+    Returns the pricing kind, pricing values (0.0 if not set) and whether each value is set.
+    """
+    model, custom_llm_provider, _ = _get_model_cost_lookup_key(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+    if custom_llm_provider in SCALAR_COST_PROVIDERS:
+        return (
+            _PRICING_SCALAR,
+            [0.0] * len(_PRICING_FIELDS),
+            [False] * len(_PRICING_FIELDS),
+        )
+
+    model_info = _cached_get_model_info_helper(
+        model=model, custom_llm_provider=custom_llm_provider
+    )
+    values: List[float] = []
+    is_set: List[bool] = []
+    for field in _PRICING_FIELDS:
+        value = model_info.get(field)
+        is_set.append(value is not None)
+        values.append(float(value) if value is not None else 0.0)
+    # required for token pricing, `cost_per_token()` raises if these are missing
+    float(model_info["input_cost_per_token"])
+    float(model_info["output_cost_per_token"])
+
+    if custom_llm_provider in GENERIC_COST_PROVIDERS:
+        pricing_kind = _PRICING_GENERIC
+    elif custom_llm_provider == "openai":
+        pricing_kind = _PRICING_OPENAI
+    elif custom_llm_provider == "azure":
+        pricing_kind = _PRICING_AZURE
+    else:
+        pricing_kind = _PRICING_DEFAULT
+    return pricing_kind, values, is_set
+
+
+def _as_column(np_module: Any, values: Optional[Sequence], num_rows: int, dtype: Any):
+    if values is None:
+        return np_module.zeros(num_rows, dtype=dtype)
+    column = np_module.asarray(values, dtype=dtype)
+    if column.shape != (num_rows,):
+        raise ValueError(
+            "batch_cost_per_token: all columns must have the same length. Expected {} rows, got shape {}".format(
+                num_rows, column.shape
+            )
+        )
+    return column
+
+
+def _scalar_batch_cost_per_token(
+    models: Sequence[str],
+    columns: Dict[str, Optional[Sequence]],
+    custom_llm_providers: Optional[Sequence[Optional[str]]],
+) -> Tuple[List[float], List[float]]:
+    """
+    `batch_cost_per_token()` without NumPy - every row is priced with `cost_per_token()`.
+    """
+    num_rows = len(models)
+    for name, values in columns.items():
+        if values is not None and len(values) != num_rows:
+            raise ValueError(
+                "batch_cost_per_token: all columns must have the same length. Expected {} rows, got {} {}".format(
+                    num_rows, len(values), name
+                )
+            )
+
+    def _get_value(name: str, row_index: int) -> Any:
+        values = columns[name]
+        return values[row_index] if values is not None else 0
+
+    prompt_costs: List[float] = []
+    completion_costs: List[float] = []
+    for row_index, model in enumerate(models):
+        custom_llm_provider = (
+            custom_llm_providers[row_index]
+            if custom_llm_providers is not None
+            else None
+        )
+        prompt_tokens = int(_get_value("prompt_tokens", row_index))
+        completion_tokens = int(_get_value("completion_tokens", row_index))
+        cache_read_input_tokens = int(_get_value("cache_read_input_tokens", row_index))
+        cache_creation_input_tokens = int(
+            _get_value("cache_creation_input_tokens", row_index)
+        )
+        try:
+            prompt_cost, completion_cost = cost_per_token(
+                model=model,
+                custom_llm_provider=custom_llm_provider,
+                response_time_ms=float(_get_value("response_time_ms", row_index)),
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cache_read_input_tokens=cache_read_input_tokens,
+                cache_creation_input_tokens=cache_creation_input_tokens,
+                usage_object=Usage(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens,
+                    cache_read_input_tokens=cache_read_input_tokens,
+                    cache_creation_input_tokens=cache_creation_input_tokens,
+                    prompt_tokens_details=PromptTokensDetailsWrapper(
+                        cached_tokens=cache_read_input_tokens,
+                        audio_tokens=int(_get_value("prompt_audio_tokens", row_index)),
+                    ),
+                    completion_tokens_details=CompletionTokensDetailsWrapper(
+                        audio_tokens=int(
+                            _get_value("completion_audio_tokens", row_index)
+                        ),
+                    ),
+                ),
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "batch_cost_per_token: unable to calculate cost for model=%s - %s",
+                model,
+                str(e),
+            )
+            prompt_cost, completion_cost = math.nan, math.nan
+        prompt_costs.append(prompt_cost)
+        completion_costs.append(completion_cost)
+    return prompt_costs, completion_costs
+
+
+def batch_cost_per_token(  # noqa: PLR0915
+    models: Sequence[str],
+    prompt_tokens: Sequence[int],
+    completion_tokens: Sequence[int],
+    custom_llm_providers: Optional[Sequence[Optional[str]]] = None,
+    cache_read_input_tokens: Optional[Sequence[int]] = None,
+    cache_creation_input_tokens: Optional[Sequence[int]] = None,
+    prompt_audio_tokens: Optional[Sequence[int]] = None,
+    completion_audio_tokens: Optional[Sequence[int]] = None,
+    response_time_ms: Optional[Sequence[float]] = None,
+) -> Union[Tuple["np.ndarray", "np.ndarray"], Tuple[List[float], List[float]]]:
+    """
+    Calculates the prompt + completion cost for many requests at once.
+
+    Parameters:
+        models: model name per row, e.g. "gpt-4o" or "anthropic/claude-3-5-sonnet-20240620"
+        prompt_tokens: prompt tokens per row (incl. cached tokens)
+        completion_tokens: completion tokens per row
+        custom_llm_providers: provider per row. If None (or None for a row), the provider is inferred from the model name.
+        cache_read_input_tokens: cached prompt tokens per row
+        cache_creation_input_tokens: prompt tokens written to the cache per row (anthropic prompt caching)
+        prompt_audio_tokens: audio prompt tokens per row (openai audio models)
+        completion_audio_tokens: audio completion tokens per row (openai audio models)
+        response_time_ms: response time per row, only used for per-second pricing
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray] - prompt_cost_in_usd, completion_cost_in_usd per row.
+        - rows with a model that is not mapped in `litellm.model_cost` are `nan`.
+        - lists of floats if NumPy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return _scalar_batch_cost_per_token(
+            models=models,
+            columns={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "cache_read_input_tokens": cache_read_input_tokens,
+                "cache_creation_input_tokens": cache_creation_input_tokens,
+                "prompt_audio_tokens": prompt_audio_tokens,
+                "completion_audio_tokens": completion_audio_tokens,
+                "response_time_ms": response_time_ms,
+            },
+            custom_llm_providers=custom_llm_providers,
+        )
+
+    num_rows = len(models)
+    prompt_tokens_column = _as_column(np, prompt_tokens, num_rows, np.int64)
+    completion_tokens_column = _as_column(np, completion_tokens, num_rows, np.int64)
+    cached_tokens_column = _as_column(np, cache_read_input_tokens, num_rows, np.int64)
+    cache_creation_tokens_column = _as_column(
+        np, cache_creation_input_tokens, num_rows, np.int64
+    )
+    prompt_audio_tokens_column = _as_column(np, prompt_audio_tokens, num_rows, np.int64)
+    completion_audio_tokens_column = _as_column(
+        np, completion_audio_tokens, num_rows, np.int64
+    )
+    response_time_ms_column = _as_column(np, response_time_ms, num_rows, np.float64)
+    if custom_llm_providers is not None and len(custom_llm_providers) != num_rows:
+        raise ValueError(
+            "batch_cost_per_token: all columns must have the same length. Expected {} rows, got {} custom_llm_providers".format(
+                num_rows, len(custom_llm_providers)
+            )
+        )
+
+    ## GROUP ROWS BY DISTINCT (model, custom_llm_provider)
+    group_keys: Dict[Tuple[str, Optional[str]], int] = {}
+    providers: Sequence[Optional[str]] = (
+        custom_llm_providers if custom_llm_providers is not None else [None] * num_rows
+    )
+    group_codes = np.fromiter(
+        (group_keys.setdefault(key, len(group_keys)) for key in zip(models, providers)),
+        dtype=np.int64,
+        count=num_rows,
+    )
+
+    ## RESOLVE PRICING ONCE PER GROUP
+    num_groups = len(group_keys)
+    pricing_kinds = np.full(num_groups, _PRICING_UNMAPPED, dtype=np.int64)
+    pricing_values = np.zeros((num_groups, len(_PRICING_FIELDS)), dtype=np.float64)
+    pricing_is_set = np.zeros((num_groups, len(_PRICING_FIELDS)), dtype=bool)
+    scalar_groups: Dict[int, Tuple[str, Optional[str]]] = {}
+    for (model, custom_llm_provider), group_code in group_keys.items():
+        try:
+            pricing_kind, values, is_set = _get_pricing_row(
+                model=model, custom_llm_provider=custom_llm_provider
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "batch_cost_per_token: unable to resolve pricing for model=%s, custom_llm_provider=%s - %s",
+                model,
+                custom_llm_provider,
+                str(e),
+            )
+            continue
+        pricing_kinds[group_code] = pricing_kind
+        pricing_values[group_code] = values
+        pricing_is_set[group_code] = is_set
+        if pricing_kind == _PRICING_SCALAR:
+            scalar_groups[group_code] = (model, custom_llm_provider)
+
+    ## EXPAND PRICING TO ROWS
+    row_kinds = pricing_kinds[group_codes]
+    row_values = pricing_values[group_codes]
+    row_is_set = pricing_is_set[group_codes]
+    (
+        input_cost_per_token,
+        output_cost_per_token,
+        input_cost_per_token_above_128k_tokens,
+        output_cost_per_token_above_128k_tokens,
+        cache_read_input_token_cost,
+        cache_creation_input_token_cost,
+        input_cost_per_audio_token,
+        output_cost_per_audio_token,
+        input_cost_per_second,
+        output_cost_per_second,
+    ) = row_values.T
+    input_cost_per_second_is_set = row_is_set[
+        :, _PRICING_FIELDS.index("input_cost_per_second")
+    ]
+    output_cost_per_second_is_set = row_is_set[
+        :, _PRICING_FIELDS.index("output_cost_per_second")
+    ]
+
+    non_cached_tokens = prompt_tokens_column - cached_tokens_column
+    prompt_costs = np.full(num_rows, np.nan, dtype=np.float64)
+    completion_costs = np.full(num_rows, np.nan, dtype=np.float64)
+
+    ## GENERIC - anthropic, gemini, deepseek (see `generic_cost_per_token()`)
+    mask = row_kinds == _PRICING_GENERIC
+    if mask.any():
+        prompt_base_cost = np.where(
+            (prompt_tokens_column[mask] > 128000)
+            & (input_cost_per_token_above_128k_tokens[mask] != 0),
+            input_cost_per_token_above_128k_tokens[mask],
+            input_cost_per_token[mask],
+        )
+        completion_base_cost = np.where(
+            (completion_tokens_column[mask] > 128000)
+            & (output_cost_per_token_above_128k_tokens[mask] != 0),
+            output_cost_per_token_above_128k_tokens[mask],
+            output_cost_per_token[mask],
+        )
+        prompt_costs[mask] = (
+            non_cached_tokens[mask] * prompt_base_cost
+            + cached_tokens_column[mask] * cache_read_input_token_cost[mask]
+            + cache_creation_tokens_column[mask] * cache_creation_input_token_cost[mask]
+        )
+        completion_costs[mask] = completion_tokens_column[mask] * completion_base_cost
+
+    ## OPENAI - cached + audio tokens
+    mask = row_kinds == _PRICING_OPENAI
+    if mask.any():
+        prompt_costs[mask] = (
+            non_cached_tokens[mask] * input_cost_per_token[mask]
+            + cached_tokens_column[mask] * cache_read_input_token_cost[mask]
+            + prompt_audio_tokens_column[mask] * input_cost_per_audio_token[mask]
+        )
+        completion_costs[mask] = (
+            completion_tokens_column[mask] * output_cost_per_token[mask]
+            + completion_audio_tokens_column[mask] * output_cost_per_audio_token[mask]
+        )
+
+    ## AZURE - cached tokens, per-second pricing overrides the completion cost
+    mask = row_kinds == _PRICING_AZURE
+    if mask.any():
+        prompt_costs[mask] = (
+            non_cached_tokens[mask] * input_cost_per_token[mask]
+            + cached_tokens_column[mask] * cache_read_input_token_cost[mask]
+        )
+        completion_costs[mask] = np.where(
+            output_cost_per_second_is_set[mask],
+            output_cost_per_second[mask] * response_time_ms_column[mask] / 1000,
+            completion_tokens_column[mask] * output_cost_per_token[mask],
+        )
+
+    ## DEFAULT - cost per token, else cost per second
+    mask = row_kinds == _PRICING_DEFAULT
+    if mask.any():
+        prompt_costs[mask] = np.where(
+            input_cost_per_token[mask] > 0,
+            input_cost_per_token[mask] * prompt_tokens_column[mask],
+            np.where(
+                input_cost_per_second_is_set[mask],
+                input_cost_per_second[mask] * response_time_ms_column[mask] / 1000,
+                0.0,
+            ),
+        )
+        completion_costs[mask] = np.where(
+            output_cost_per_token[mask] > 0,
+            output_cost_per_token[mask] * completion_tokens_column[mask],
+            np.where(
+                output_cost_per_second_is_set[mask],
+                output_cost_per_second[mask] * response_time_ms_column[mask] / 1000,
+                0.0,
+            ),
+        )
+
+    ## SCALAR - row by row
+    if scalar_groups:
+        for row_index in np.flatnonzero(row_kinds == _PRICING_SCALAR):
+            model, custom_llm_provider = scalar_groups[int(group_codes[row_index])]
+            try:
+                prompt_costs[row_index], completion_costs[row_index] = cost_per_token(
+                    model=model,
+                    custom_llm_provider=custom_llm_provider,
+                    response_time_ms=float(response_time_ms_column[row_index]),
+                    prompt_tokens=int(prompt_tokens_column[row_index]),
+                    completion_tokens=int(completion_tokens_column[row_index]),
+                    cache_read_input_tokens=int(cached_tokens_column[row_index]),
+                    cache_creation_input_tokens=int(
+                        cache_creation_tokens_column[row_index]
+                    ),
+                )
+            except Exception as e:
+                verbose_logger.debug(
+                    "batch_cost_per_token: unable to calculate cost for model=%s - %s",
+                    model,
+                    str(e),
+                )
+
+    return prompt_costs, completion_costs
+
+
+def _get_usage_token_count(usage: dict, details_key: str, key: str) -> int:
+    details = usage.get(details_key)
+    if isinstance(details, dict):
+        return details.get(key) or 0
+    return 0
+
+
+def batch_cost_per_token_from_standard_logging_payloads(
+    payloads: Sequence[StandardLoggingPayload],
+) -> Union[Tuple["np.ndarray", "np.ndarray"], Tuple[List[float], List[float]]]:
+    """
+    `batch_cost_per_token()` over logged requests, e.g. to recompute `response_cost` after a price change.
+
+    Cached / cache creation / audio tokens are read from the logged response usage, if present.
+    """
+    models: List[str] = []
+    custom_llm_providers: List[Optional[str]] = []
+    prompt_tokens: List[int] = []
+    completion_tokens: List[int] = []
+    cache_read_input_tokens: List[int] = []
+    cache_creation_input_tokens: List[int] = []
+    prompt_audio_tokens: List[int] = []
+    completion_audio_tokens: List[int] = []
+    response_time_ms: List[float] = []
+    for payload in payloads:
+        models.append(payload["model"])
+        custom_llm_providers.append(payload.get("custom_llm_provider"))
+        prompt_tokens.append(payload.get("prompt_tokens") or 0)
+        completion_tokens.append(payload.get("completion_tokens") or 0)
+        response_time_ms.append((payload.get("response_time") or 0.0) * 1000)
+
+        response = payload.get("response")
+        usage = response.get("usage") if isinstance(response, dict) else None
+        if not isinstance(usage, dict):
+            usage = {}
+        cache_read_input_tokens.append(
+            _get_usage_token_count(usage, "prompt_tokens_details", "cached_tokens")
+        )
+        cache_creation_input_tokens.append(
+            usage.get("cache_creation_input_tokens") or 0
+        )
+        prompt_audio_tokens.append(
+            _get_usage_token_count(usage, "prompt_tokens_details", "audio_tokens")
+        )
+        completion_audio_tokens.append(
+            _get_usage_token_count(usage, "completion_tokens_details", "audio_tokens")
+        )
+
+    return batch_cost_per_token(
+        models=models,
+        custom_llm_providers=custom_llm_providers,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cache_read_input_tokens=cache_read_input_tokens,
+        cache_creation_input_tokens=cache_creation_input_tokens,
+        prompt_audio_tokens=prompt_audio_tokens,
+        completion_audio_tokens=completion_audio_tokens,
+        response_time_ms=response_time_ms,
+    )
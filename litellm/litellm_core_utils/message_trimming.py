@@ -0,0 +1,182 @@
+"""
+Token budget based message trimming - used by `litellm.utils.trim_messages()`
+
+Every message is tokenized once:
+- the messages to keep are picked with prefix sums of the per-message token counts + a binary search
+- a message that only partially fits is cut in the middle by slicing its tokens + decoding them (no re-counting a shrinking string)
+
+Trim strategies:
+- "keep_system_and_tail": keep the system message(s) + the most recent messages that fit
+- "placeholder": same as "keep_system_and_tail", but the removed messages are replaced by 1 placeholder message - so the model knows part of the conversation is missing
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Literal, Optional, Tuple
+
+import litellm
+from litellm.constants import TRIM_MESSAGES_PLACEHOLDER
+
+TrimStrategy = Literal["keep_system_and_tail", "placeholder"]
+
+_TRUNCATION_MARKER = ".."
+
+
+class MessageTrimmer:
+    def __init__(
+        self,
+        model: Optional[str],
+        trim_strategy: TrimStrategy = "keep_system_and_tail",
+    ):
+        self.model = model
+        self.trim_strategy = trim_strategy
+        # per-request tokens, counted once (e.g. the reply priming tokens for openai models)
+        self.base_tokens = self._count_tokens(messages=[])
+
+    def _count_tokens(self, messages: List) -> int:
+        return litellm.utils.token_counter(model=self.model, messages=messages)
+
+    def _encode(self, text: str) -> List[int]:
+        enc = litellm.utils.encode(model=self.model or "", text=text)
+        return enc.ids if hasattr(enc, "ids") else enc  # huggingface tokenizer
+
+    def _decode(self, tokens: List[int]) -> str:
+        return litellm.utils.decode(model=self.model or "", tokens=tokens)
+
+    def get_message_tokens(self, message) -> int:
+        """
+        Tokens the message adds to a request
+        """
+        return self._count_tokens(messages=[message]) - self.base_tokens
+
+    def truncate_message(
+        self, message: dict, max_tokens: int, message_tokens: Optional[int] = None
+    ) -> Optional[dict]:
+        """
+        Return a copy of the message, with the middle of its content cut out so the message uses <= `max_tokens`.
+
+        Returns None if the message can't be truncated (non-text content, function / tool calls) or doesn't fit at all.
+        """
+        content = message.get("content")
+        if (
+            not isinstance(content, str)
+            or message.get("function_call")
+            or message.get("tool_calls")
+        ):
+            return None
+        if message_tokens is None:
+            message_tokens = self.get_message_tokens(message)
+        if message_tokens <= max_tokens:
+            return message
+        content_tokens = self._encode(content)
+        # role, name, per-message formatting tokens
+        overhead_tokens = message_tokens - len(content_tokens)
+        tokens_to_keep = (
+            max_tokens - overhead_tokens - len(self._encode(_TRUNCATION_MARKER))
+        )
+        if tokens_to_keep <= 0:
+            return None
+        tail_length = tokens_to_keep // 2
+        head_length = tokens_to_keep - tail_length
+        truncated_content = (
+            self._decode(content_tokens[:head_length])
+            + _TRUNCATION_MARKER
+            + self._decode(content_tokens[len(content_tokens) - tail_length :])
+        )
+        return {**message, "content": truncated_content}
+
+    def _get_placeholder_message(self, num_removed_messages: int) -> dict:
+        return {
+            "role": "user",
+            "content": TRIM_MESSAGES_PLACEHOLDER.format(
+                num_messages=num_removed_messages
+            ),
+        }
+
+    def _select_messages(
+        self,
+        messages: List,
+        messages_tokens: List[int],
+        max_tokens: int,
+    ) -> List:
+        """
+        Keep the most recent messages that fit `max_tokens`. The most recent message that doesn't fit is truncated, if possible.
+        """
+        # tail_tokens[i] = tokens of the i + 1 most recent messages
+        tail_tokens = list(accumulate(reversed(messages_tokens)))
+        num_kept = bisect_right(tail_tokens, max_tokens)
+        if num_kept == len(messages):
+            return list(messages)
+
+        add_placeholder = False
+        if self.trim_strategy == "placeholder":
+            # reserve room for the placeholder - counted with the largest possible number of removed messages
+            placeholder_tokens = self.get_message_tokens(
+                self._get_placeholder_message(len(messages))
+            )
+            if placeholder_tokens <= max_tokens:
+                add_placeholder = True
+                max_tokens -= placeholder_tokens
+                num_kept = bisect_right(tail_tokens, max_tokens)
+
+        kept = list(messages[len(messages) - num_kept :])
+        truncated_index = len(messages) - num_kept - 1
+        truncated_message = self.truncate_message(
+            messages[truncated_index],
+            max_tokens=max_tokens - (tail_tokens[num_kept - 1] if num_kept else 0),
+            message_tokens=messages_tokens[truncated_index],
+        )
+        if truncated_message is not None:
+            kept.insert(0, truncated_message)
+
+        if add_placeholder and len(kept) < len(messages):
+            kept.insert(0, self._get_placeholder_message(len(messages) - len(kept)))
+        return kept
+
+    def trim(self, messages: List, max_tokens: int) -> Tuple[List, int]:
+        """
+        Trim the messages to use <= `max_tokens`. All system messages are combined into 1 system message, at the start.
+
+        Returns the trimmed messages + the number of tokens they use.
+        """
+        system_contents: List[str] = []
+        conversation: List = []
+        for message in messages:
+            if message["role"] == "system":
+                system_contents.append(message["content"])
+            else:
+                conversation.append(message)
+
+        # tokens available for the messages
+        budget = max_tokens - self.base_tokens
+        system_messages: List[dict] = []
+        if system_contents:
+            system_message = {"role": "system", "content": "\n".join(system_contents)}
+            system_message_tokens = self.get_message_tokens(system_message)
+            if system_message_tokens >= budget:
+                # the system message(s) use the whole budget
+                system_message = (
+                    self.truncate_message(
+                        system_message,
+                        max_tokens=budget,
+                        message_tokens=system_message_tokens,
+                    )
+                    or system_message
+                )
+                return [system_message], self._count_tokens(messages=[system_message])
+            system_messages = [system_message]
+            budget -= system_message_tokens
+
+        messages_tokens = [self.get_message_tokens(message) for message in conversation]
+        while True:
+            trimmed_messages = system_messages + self._select_messages(
+                messages=conversation,
+                messages_tokens=messages_tokens,
+                max_tokens=budget,
+            )
+            used_tokens = self._count_tokens(messages=trimmed_messages)
+            # per-message counts add up exactly for openai models - other tokenizers can merge tokens across messages, so re-select with a smaller budget if needed
+            excess_tokens = used_tokens - max_tokens
+            if excess_tokens <= 0 or budget <= 0:
+                return trimmed_messages, used_tokens
+            budget -= excess_tokens
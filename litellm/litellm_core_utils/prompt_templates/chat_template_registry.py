@@ -0,0 +1,189 @@
+"""
+Registry for huggingface chat templates - used by `hf_chat_template()`
+
+- tokenizer configs are fetched from huggingface.co once per model (success or failure is kept in `litellm.known_tokenizer_config`)
+- if `LITELLM_HF_TOKENIZER_CONFIG_DIR` is set, fetched tokenizer configs are persisted to / read from that dir. Put `<org>--<model>.json` files there to run offline.
+- templates are compiled once per (model, template hash) and rendered with 1 shared jinja environment
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import MAX_COMPILED_CHAT_TEMPLATES
+from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+
+def _raise_exception(message):
+    raise Exception(f"Error message - {message}")
+
+
+class CompiledChatTemplate:
+    __slots__ = ("template", "supports_system_message")
+
+    def __init__(self, template: Any):
+        self.template = template
+        self.supports_system_message = self._is_system_in_template()
+
+    def _is_system_in_template(self) -> bool:
+        try:
+            # Try rendering the template with a system message
+            self.template.render(
+                messages=[{"role": "system", "content": "test"}],
+                eos_token="<eos>",
+                bos_token="<bos>",
+            )
+            return True
+
+        # This will be raised if Jinja attempts to render the system message and it can't
+        except Exception:
+            return False
+
+
+class ChatTemplateRegistry:
+    def __init__(self, max_compiled_templates: int = MAX_COMPILED_CHAT_TEMPLATES):
+        self.env = ImmutableSandboxedEnvironment()
+        self.env.globals["raise_exception"] = _raise_exception
+        self.compiled_templates: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=max_compiled_templates
+        )
+        self._tokenizer_config_lock = threading.Lock()
+        # 1 lock per model being fetched - a slow fetch doesn't block lookups of other models
+        self._tokenizer_config_model_locks: Dict[str, threading.Lock] = {}
+
+    ## TOKENIZER CONFIGS ##
+
+    @staticmethod
+    def get_tokenizer_config_dir() -> Optional[str]:
+        return os.getenv("LITELLM_HF_TOKENIZER_CONFIG_DIR")
+
+    @staticmethod
+    def _get_tokenizer_config_file_path(config_dir: str, model: str) -> str:
+        return os.path.join(config_dir, model.replace("/", "--") + ".json")
+
+    def get_tokenizer_config(self, model: str) -> dict:
+        """
+        Returns `{"status": "success", "tokenizer": {...}}` or `{"status": "failure"}`
+
+        Looked up in memory, then in `LITELLM_HF_TOKENIZER_CONFIG_DIR`, then fetched from huggingface.co - at most once per model.
+        """
+        tokenizer_config = litellm.known_tokenizer_config.get(model)
+        if tokenizer_config is not None:
+            return tokenizer_config
+
+        with self._tokenizer_config_lock:
+            model_lock = self._tokenizer_config_model_locks.setdefault(
+                model, threading.Lock()
+            )
+
+        try:
+            with model_lock:
+                tokenizer_config = litellm.known_tokenizer_config.get(model)
+                if tokenizer_config is not None:
+                    return tokenizer_config
+
+                config_dir = self.get_tokenizer_config_dir()
+                tokenizer_config = (
+                    self._read_tokenizer_config(config_dir=config_dir, model=model)
+                    if config_dir is not None
+                    else None
+                )
+                if tokenizer_config is None:
+                    tokenizer_config = self._fetch_tokenizer_config(model)
+                    if (
+                        config_dir is not None
+                        and tokenizer_config["status"] == "success"
+                    ):
+                        self._write_tokenizer_config(
+                            config_dir=config_dir,
+                            model=model,
+                            tokenizer=tokenizer_config["tokenizer"],
+                        )
+                litellm.known_tokenizer_config.update({model: tokenizer_config})
+                return tokenizer_config
+        finally:
+            with self._tokenizer_config_lock:
+                self._tokenizer_config_model_locks.pop(model, None)
+
+    def _read_tokenizer_config(self, config_dir: str, model: str) -> Optional[dict]:
+        file_path = self._get_tokenizer_config_file_path(config_dir, model)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "r") as f:
+                return {"status": "success", "tokenizer": json.load(f)}
+        except Exception as e:
+            verbose_logger.warning(
+                "Unable to read tokenizer config for model=%s from %s - %s",
+                model,
+                file_path,
+                str(e),
+            )
+            return None
+
+    def _write_tokenizer_config(self, config_dir: str, model: str, tokenizer: dict):
+        file_path = self._get_tokenizer_config_file_path(config_dir, model)
+        try:
+            os.makedirs(config_dir, exist_ok=True)
+            # write to a temp file + rename, so concurrent workers never read a partial file
+            tmp_file_path = f"{file_path}.{os.getpid()}.tmp"
+            with open(tmp_file_path, "w") as f:
+                json.dump(tokenizer, f)
+            os.replace(tmp_file_path, file_path)
+        except Exception as e:
+            verbose_logger.warning(
+                "Unable to persist tokenizer config for model=%s to %s - %s",
+                model,
+                file_path,
+                str(e),
+            )
+
+    def _fetch_tokenizer_config(self, hf_model_name: str) -> dict:
+        url = f"https://huggingface.co/{hf_model_name}/raw/main/tokenizer_config.json"
+        # Make a GET request to fetch the JSON data
+        client = HTTPHandler(concurrent_limit=1)
+        try:
+            response = client.get(url)
+        finally:
+            client.close()
+        if response.status_code == 200:
+            # Parse the JSON data
+            tokenizer_config = json.loads(response.content)
+            return {"status": "success", "tokenizer": tokenizer_config}
+        else:
+            return {"status": "failure"}
+
+    ## COMPILED TEMPLATES ##
+
+    def get_compiled_template(
+        self, model: str, chat_template: str
+    ) -> CompiledChatTemplate:
+        """
+        Compile `chat_template` once per (model, template hash)
+        """
+        key: Tuple[str, str] = (
+            model,
+            hashlib.sha256(chat_template.encode("utf-8")).hexdigest(),
+        )
+        compiled_template: Optional[CompiledChatTemplate] = self.compiled_templates.get(
+            key
+        )
+        if compiled_template is None:
+            compiled_template = CompiledChatTemplate(
+                template=self.env.from_string(chat_template)
+            )
+            self.compiled_templates[key] = compiled_template
+        return compiled_template
+
+    def clear(self):
+        self.compiled_templates.clear()
+
+
+chat_template_registry = ChatTemplateRegistry()
@@ -7,16 +7,13 @@ import xml.etree.ElementTree as ET
 from enum import Enum
 from typing import Any, List, Optional, Tuple, cast, overload
 
-from jinja2.sandbox import ImmutableSandboxedEnvironment
-
 import litellm
 import litellm.types
 import litellm.types.llms
 from litellm import verbose_logger
-from litellm.llms.custom_httpx.http_handler import HTTPHandler, get_async_httpx_client
+from litellm.llms.custom_httpx.http_handler import HTTPHandler
 from litellm.types.llms.anthropic import *
 from litellm.types.llms.bedrock import MessageBlock as BedrockMessageBlock
-from litellm.types.llms.custom_http import httpxSpecialProvider
 from litellm.types.llms.ollama import OllamaVisionModelObject
 from litellm.types.llms.openai import (
     AllMessageValues,
@@ -35,8 +32,10 @@ from litellm.types.llms.vertex_ai import FunctionResponse as VertexFunctionRespo
 from litellm.types.llms.vertex_ai import PartType as VertexPartType
 from litellm.types.utils import GenericImageParsingChunk
 
+from .chat_template_registry import chat_template_registry
 from .common_utils import convert_content_list_to_str, is_non_content_values_set
 from .image_handling import convert_url_to_base64
+from .media_fetcher import FetchedMedia, media_fetcher
 
 
 def default_pt(messages):
@@ -328,41 +327,11 @@ def phind_codellama_pt(messages):
 def hf_chat_template(  # noqa: PLR0915
     model: str, messages: list, chat_template: Optional[Any] = None
 ):
-    # Define Jinja2 environment
-    env = ImmutableSandboxedEnvironment()
-
-    def raise_exception(message):
-        raise Exception(f"Error message - {message}")
-
-    # Create a template object from the template text
-    env.globals["raise_exception"] = raise_exception
-
     ## get the tokenizer config from huggingface
     bos_token = ""
     eos_token = ""
     if chat_template is None:
-
-        def _get_tokenizer_config(hf_model_name):
-            try:
-                url = f"https://huggingface.co/{hf_model_name}/raw/main/tokenizer_config.json"
-                # Make a GET request to fetch the JSON data
-                client = HTTPHandler(concurrent_limit=1)
-
-                response = client.get(url)
-            except Exception as e:
-                raise e
-            if response.status_code == 200:
-                # Parse the JSON data
-                tokenizer_config = json.loads(response.content)
-                return {"status": "success", "tokenizer": tokenizer_config}
-            else:
-                return {"status": "failure"}
-
-        if model in litellm.known_tokenizer_config:
-            tokenizer_config = litellm.known_tokenizer_config[model]
-        else:
-            tokenizer_config = _get_tokenizer_config(model)
-            litellm.known_tokenizer_config.update({model: tokenizer_config})
+        tokenizer_config = chat_template_registry.get_tokenizer_config(model)
 
         if (
             tokenizer_config["status"] == "failure"
@@ -381,29 +350,17 @@ def hf_chat_template(  # noqa: PLR0915
             if isinstance(eos_token, dict):
                 eos_token = eos_token.get("content", None)
         chat_template = tokenizer_config["chat_template"]  # type: ignore
-    try:
-        template = env.from_string(chat_template)  # type: ignore
-    except Exception as e:
-        raise e
-
-    def _is_system_in_template():
-        try:
-            # Try rendering the template with a system message
-            template.render(
-                messages=[{"role": "system", "content": "test"}],
-                eos_token="<eos>",
-                bos_token="<bos>",
-            )
-            return True
 
-        # This will be raised if Jinja attempts to render the system message and it can't
-        except Exception:
-            return False
+    # compiled once per (model, template), rendered with a shared jinja environment
+    compiled_template = chat_template_registry.get_compiled_template(
+        model=model, chat_template=chat_template  # type: ignore
+    )
+    template = compiled_template.template
 
     try:
         rendered_text = ""
         # Render the template with the provided values
-        if _is_system_in_template():
+        if compiled_template.supports_system_message:
             rendered_text = template.render(
                 bos_token=bos_token,
                 eos_token=eos_token,
@@ -1971,20 +1928,17 @@ def _load_image_from_url(image_url):
     from io import BytesIO
 
     try:
-        # Send a GET request to the image URL
-        client = HTTPHandler(concurrent_limit=1)
-        response = client.get(image_url)
-        response.raise_for_status()  # Raise an exception for HTTP errors
+        media = media_fetcher.fetch(image_url)
 
         # Check the response's content type to ensure it is an image
-        content_type = response.headers.get("content-type")
+        content_type = media.content_type
         if not content_type or "image" not in content_type:
             raise ValueError(
                 f"URL does not point to a valid image (content-type: {content_type})"
             )
 
         # Load the image from the response content
-        return Image.open(BytesIO(response.content))
+        return Image.open(BytesIO(media.content))
 
     except Exception as e:
         raise e
@@ -2139,12 +2093,9 @@ def stringify_json_tool_call_content(messages: List) -> List:
 
 ###### AMAZON BEDROCK #######
 
-import base64
 import mimetypes
 from email.message import Message
 
-import httpx
-
 from litellm.types.llms.bedrock import ContentBlock as BedrockContentBlock
 from litellm.types.llms.bedrock import DocumentBlock as BedrockDocumentBlock
 from litellm.types.llms.bedrock import ImageBlock as BedrockImageBlock
@@ -2171,33 +2122,24 @@ class BedrockImageProcessor:
     """Handles both sync and async image processing for Bedrock conversations."""
 
     @staticmethod
-    def _post_call_image_processing(response: httpx.Response) -> Tuple[str, str]:
+    def _post_call_image_processing(media: FetchedMedia) -> Tuple[str, str]:
         # Check the response's content type to ensure it is an image
-        content_type = response.headers.get("content-type")
+        content_type = media.content_type
         if not content_type:
             raise ValueError(
                 f"URL does not contain content-type (content-type: {content_type})"
             )
         content_type = _parse_content_type(content_type)
 
-        # Convert the image content to base64 bytes
-        base64_bytes = base64.b64encode(response.content).decode("utf-8")
-
-        return base64_bytes, content_type
+        # base64 encoding is cached with the fetched media
+        return media.base64, content_type
 
     @staticmethod
     async def get_image_details_async(image_url) -> Tuple[str, str]:
         try:
-
-            client = get_async_httpx_client(
-                llm_provider=httpxSpecialProvider.PromptFactory,
-                params={"concurrent_limit": 1},
-            )
-            # Send a GET request to the image URL
-            response = await client.get(image_url, follow_redirects=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-
-            return BedrockImageProcessor._post_call_image_processing(response)
+            # pooled client, cached + deduplicated fetches
+            media = await media_fetcher.afetch(image_url)
+            return BedrockImageProcessor._post_call_image_processing(media)
 
         except Exception as e:
             raise e
@@ -2205,12 +2147,8 @@ class BedrockImageProcessor:
     @staticmethod
     def get_image_details(image_url) -> Tuple[str, str]:
         try:
-            client = HTTPHandler(concurrent_limit=1)
-            # Send a GET request to the image URL
-            response = client.get(image_url, follow_redirects=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-
-            return BedrockImageProcessor._post_call_image_processing(response)
+            media = media_fetcher.fetch(image_url)
+            return BedrockImageProcessor._post_call_image_processing(media)
 
         except Exception as e:
             raise e
@@ -2,29 +2,13 @@
 Helper functions to handle images passed in messages
 """
 
-import base64
-
-from httpx import Response
-
-import litellm
 from litellm import verbose_logger
-from litellm.caching.caching import InMemoryCache
-
-MAX_IMGS_IN_MEMORY = 10
-
-in_memory_cache = InMemoryCache(max_size_in_memory=MAX_IMGS_IN_MEMORY)
 
+from .media_fetcher import FetchedMedia, MediaFetchSizeLimitError, media_fetcher
 
-def _process_image_response(response: Response, url: str) -> str:
-    if response.status_code != 200:
-        raise Exception(
-            f"Error: Unable to fetch image from URL. Status code: {response.status_code}, url={url}"
-        )
 
-    image_bytes = response.content
-    base64_image = base64.b64encode(image_bytes).decode("utf-8")
-
-    image_type = response.headers.get("Content-Type")
+def _process_image_response(media: FetchedMedia, url: str) -> str:
+    image_type = media.content_type
     if image_type is None:
         img_type = url.split(".")[-1].lower()
         _img_type = {
@@ -42,21 +26,17 @@ def _process_image_response(response: Response, url: str) -> str:
     else:
         img_type = image_type
 
-    result = f"data:{img_type};base64,{base64_image}"
-    in_memory_cache.set_cache(url, result)
-    return result
+    # base64 encoding is cached with the fetched media
+    return media.get_data_url(img_type)
 
 
 async def async_convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
-    if cached_result:
-        return cached_result
-
-    client = litellm.module_level_aclient
     for _ in range(3):
         try:
-            response = await client.get(url, follow_redirects=True)
-            return _process_image_response(response, url)
+            media = await media_fetcher.afetch(url)
+            return _process_image_response(media, url)
+        except MediaFetchSizeLimitError:
+            raise
         except Exception:
             pass
     raise Exception(
@@ -65,15 +45,12 @@ async def async_convert_url_to_base64(url: str) -> str:
 
 
 def convert_url_to_base64(url: str) -> str:
-    cached_result = in_memory_cache.get_cache(url)
-    if cached_result:
-        return cached_result
-
-    client = litellm.module_level_client
     for _ in range(3):
         try:
-            response = client.get(url, follow_redirects=True)
-            return _process_image_response(response, url)
+            media = media_fetcher.fetch(url)
+            return _process_image_response(media, url)
+        except MediaFetchSizeLimitError:
+            raise
         except Exception as e:
             verbose_logger.exception(e)
             # print(e)
@@ -0,0 +1,517 @@
+"""
+Fetch + cache remote media (images / pdfs) passed as urls in messages.
+
+Used by the prompt converters that inline url content for providers (anthropic, bedrock, gemini, ollama, ...).
+
+- pooled http clients (1 sync + 1 async client, shared across requests)
+- concurrent fetches of the same url are deduplicated
+- downloads larger than MAX_MEDIA_FETCH_SIZE_BYTES are rejected
+- content is cached by content hash (sha256), urls point to content. Same image under multiple urls is stored once.
+- cached urls are revalidated after MEDIA_FETCH_CACHE_TTL_SECONDS (conditional GET, if the response had an ETag)
+- in-memory cache is bounded by MEDIA_FETCH_CACHE_MAX_SIZE_IN_MEMORY_BYTES. If `LITELLM_MEDIA_CACHE_DIR` is set, media is also persisted to disk (bounded by MEDIA_FETCH_CACHE_MAX_SIZE_ON_DISK_BYTES). `afetch()` does disk reads / writes in a thread, not on the event loop.
+- base64 / data url encoding is done once per content, converters get the encoding they need via `FetchedMedia`
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from litellm._logging import verbose_logger
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
+from litellm.constants import (
+    MAX_MEDIA_FETCH_SIZE_BYTES,
+    MEDIA_FETCH_CACHE_MAX_SIZE_IN_MEMORY_BYTES,
+    MEDIA_FETCH_CACHE_MAX_SIZE_ON_DISK_BYTES,
+    MEDIA_FETCH_CACHE_TTL_SECONDS,
+)
+from litellm.llms.custom_httpx.http_handler import (
+    _get_httpx_client,
+    get_async_httpx_client,
+)
+from litellm.types.llms.custom_http import httpxSpecialProvider
+
+MAX_CACHED_MEDIA_URLS = 10000
+
+
+class MediaFetchSizeLimitError(ValueError):
+    pass
+
+
+class MediaContent:
+    """
+    Content-addressed media bytes. Encodings are computed once and reused.
+    """
+
+    __slots__ = ("content", "content_hash", "_base64", "_data_url")
+
+    def __init__(self, content: bytes, content_hash: str):
+        self.content = content
+        self.content_hash = content_hash
+        self._base64: Optional[str] = None
+        self._data_url: Optional[Tuple[str, str]] = None  # (media type, data url)
+
+    @property
+    def base64(self) -> str:
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.content).decode("utf-8")
+        return self._base64
+
+    def get_data_url(self, media_type: str) -> str:
+        if self._data_url is None or self._data_url[0] != media_type:
+            self._data_url = (media_type, f"data:{media_type};base64,{self.base64}")
+        return self._data_url[1]
+
+    @property
+    def size_in_memory(self) -> int:
+        """
+        raw bytes + base64 + data url
+        """
+        base64_size = 4 * ((len(self.content) + 2) // 3)
+        return len(self.content) + 2 * base64_size
+
+
+class FetchedMedia:
+    """
+    Returned by `MediaFetcher.fetch()` / `MediaFetcher.afetch()`
+    """
+
+    __slots__ = ("url", "content_type", "media_content")
+
+    def __init__(
+        self, url: str, content_type: Optional[str], media_content: MediaContent
+    ):
+        self.url = url
+        self.content_type = content_type  # raw `content-type` header of the response
+        self.media_content = media_content
+
+    @property
+    def content(self) -> bytes:
+        return self.media_content.content
+
+    @property
+    def base64(self) -> str:
+        return self.media_content.base64
+
+    def get_data_url(self, media_type: str) -> str:
+        return self.media_content.get_data_url(media_type)
+
+
+class MediaUrlEntry:
+    __slots__ = ("content_hash", "content_type", "etag", "fetched_at")
+
+    def __init__(
+        self,
+        content_hash: str,
+        content_type: Optional[str],
+        etag: Optional[str],
+        fetched_at: float,
+    ):
+        self.content_hash = content_hash
+        self.content_type = content_type
+        self.etag = etag
+        self.fetched_at = fetched_at
+
+
+class MediaFetchCache:
+    def __init__(
+        self,
+        max_size_in_memory: int = MEDIA_FETCH_CACHE_MAX_SIZE_IN_MEMORY_BYTES,
+        max_size_on_disk: int = MEDIA_FETCH_CACHE_MAX_SIZE_ON_DISK_BYTES,
+        ttl: float = MEDIA_FETCH_CACHE_TTL_SECONDS,
+        cache_dir: Optional[str] = None,
+    ):
+        self.max_size_in_memory = max_size_in_memory
+        self.max_size_on_disk = max_size_on_disk
+        self.ttl = ttl
+        self._cache_dir = cache_dir
+        self.url_entries: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=MAX_CACHED_MEDIA_URLS
+        )
+        self.contents: "OrderedDict[str, MediaContent]" = OrderedDict()
+        self.size_in_memory = 0
+        self._lock = threading.Lock()
+
+    @property
+    def cache_dir(self) -> Optional[str]:
+        # read on use - the proxy can set env vars from the config after import
+        return self._cache_dir or os.getenv("LITELLM_MEDIA_CACHE_DIR")
+
+    def is_fresh(self, url_entry: MediaUrlEntry) -> bool:
+        return time.time() - url_entry.fetched_at < self.ttl
+
+    ## URL ENTRIES ##
+
+    def get_url_entry(
+        self, url: str, read_disk: bool = True
+    ) -> Optional[MediaUrlEntry]:
+        url_entry = self.url_entries.get(url)
+        if url_entry is None and read_disk and self.cache_dir is not None:
+            url_entry = self._read_url_entry_from_disk(url)
+            if url_entry is not None:
+                self.url_entries[url] = url_entry
+        return url_entry
+
+    def set_url_entry(self, url: str, url_entry: MediaUrlEntry):
+        self.url_entries[url] = url_entry
+        if self.cache_dir is not None:
+            self._write_to_disk(
+                file_path=self._get_url_entry_path(url),
+                data=json.dumps(
+                    {
+                        "url": url,
+                        "content_hash": url_entry.content_hash,
+                        "content_type": url_entry.content_type,
+                        "etag": url_entry.etag,
+                        "fetched_at": url_entry.fetched_at,
+                    }
+                ).encode("utf-8"),
+            )
+
+    ## CONTENT ##
+
+    def get_content(
+        self, content_hash: str, read_disk: bool = True
+    ) -> Optional[MediaContent]:
+        with self._lock:
+            media_content = self.contents.get(content_hash)
+            if media_content is not None:
+                self.contents.move_to_end(content_hash)
+                return media_content
+        if not read_disk or self.cache_dir is None:
+            return None
+        content = self._read_content_from_disk(content_hash)
+        if content is None:
+            return None
+        media_content = MediaContent(content=content, content_hash=content_hash)
+        self._set_content_in_memory(media_content)
+        return media_content
+
+    def set_content(self, media_content: MediaContent):
+        self._set_content_in_memory(media_content)
+        if self.cache_dir is not None:
+            self._write_to_disk(
+                file_path=self._get_content_path(media_content.content_hash),
+                data=media_content.content,
+            )
+            self._prune_disk()
+
+    def _set_content_in_memory(self, media_content: MediaContent):
+        size_in_memory = media_content.size_in_memory
+        if size_in_memory > self.max_size_in_memory:
+            return
+        with self._lock:
+            existing_content = self.contents.pop(media_content.content_hash, None)
+            if existing_content is not None:
+                self.size_in_memory -= existing_content.size_in_memory
+            self.contents[media_content.content_hash] = media_content
+            self.size_in_memory += size_in_memory
+            # evict least recently used content
+            while self.size_in_memory > self.max_size_in_memory:
+                _, evicted_content = self.contents.popitem(last=False)
+                self.size_in_memory -= evicted_content.size_in_memory
+
+    ## DISK ##
+
+    def _get_url_entry_path(self, url: str) -> str:
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir or "", "urls", f"{url_hash}.json")
+
+    def _get_content_path(self, content_hash: str) -> str:
+        return os.path.join(self.cache_dir or "", "content", content_hash)
+
+    def _read_url_entry_from_disk(self, url: str) -> Optional[MediaUrlEntry]:
+        file_path = self._get_url_entry_path(url)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "r") as f:
+                data = json.load(f)
+            if data.get("url") != url:
+                return None
+            return MediaUrlEntry(
+                content_hash=data["content_hash"],
+                content_type=data.get("content_type"),
+                etag=data.get("etag"),
+                fetched_at=data["fetched_at"],
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "media fetch cache: unable to read %s - %s", file_path, str(e)
+            )
+            return None
+
+    def _read_content_from_disk(self, content_hash: str) -> Optional[bytes]:
+        file_path = self._get_content_path(content_hash)
+        try:
+            with open(file_path, "rb") as f:
+                content = f.read()
+            # keep recently used content when pruning
+            os.utime(file_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            verbose_logger.debug(
+                "media fetch cache: unable to read %s - %s", file_path, str(e)
+            )
+            return None
+        if hashlib.sha256(content).hexdigest() != content_hash:
+            return None
+        return content
+
+    def _write_to_disk(self, file_path: str, data: bytes):
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            # write to a temp file + rename, so other workers never read a partial file
+            tmp_file_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_file_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_file_path, file_path)
+        except Exception as e:
+            verbose_logger.warning(
+                "media fetch cache: unable to write %s - %s", file_path, str(e)
+            )
+
+    def _prune_disk(self):
+        """
+        Delete least recently used content files, until the content dir is below max_size_on_disk
+        """
+        content_dir = os.path.join(self.cache_dir or "", "content")
+        try:
+            files = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(content_dir)
+                if entry.is_file()
+            ]
+        except FileNotFoundError:
+            return
+        total_size = sum(size for _, size, _ in files)
+        if total_size <= self.max_size_on_disk:
+            return
+        for _, size, file_path in sorted(files):
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+            if total_size <= self.max_size_on_disk:
+                return
+
+
+class MediaFetcher:
+    def __init__(
+        self,
+        cache: Optional[MediaFetchCache] = None,
+        max_size_bytes: int = MAX_MEDIA_FETCH_SIZE_BYTES,
+    ):
+        self.cache = cache or MediaFetchCache()
+        self.max_size_bytes = max_size_bytes
+        self._async_inflight: Dict[str, asyncio.Task] = {}
+        self._sync_inflight: Dict[str, threading.Event] = {}
+        self._sync_inflight_lock = threading.Lock()
+
+    def _get_cached(
+        self, url: str, read_disk: bool = True
+    ) -> Tuple[Optional[FetchedMedia], Optional[MediaUrlEntry]]:
+        url_entry = self.cache.get_url_entry(url, read_disk=read_disk)
+        if url_entry is None:
+            return None, None
+        media_content = self.cache.get_content(
+            url_entry.content_hash, read_disk=read_disk
+        )
+        if media_content is None:
+            return None, None
+        return (
+            FetchedMedia(
+                url=url,
+                content_type=url_entry.content_type,
+                media_content=media_content,
+            ),
+            url_entry,
+        )
+
+    def fetch(self, url: str) -> FetchedMedia:
+        """
+        Sync fetch. Concurrent fetches of the same url (across threads) make 1 request.
+        """
+        cached_media, url_entry = self._get_cached(url)
+        if cached_media is not None and url_entry is not None:
+            if self.cache.is_fresh(url_entry):
+                return cached_media
+
+        with self._sync_inflight_lock:
+            inflight_event = self._sync_inflight.get(url)
+            if inflight_event is None:
+                self._sync_inflight[url] = threading.Event()
+
+        if inflight_event is not None:
+            # another thread is fetching this url - use its result
+            inflight_event.wait()
+            cached_media, _ = self._get_cached(url)
+            if cached_media is not None:
+                return cached_media
+            return self._fetch_sync(url=url, cached_media=None, url_entry=None)
+
+        try:
+            return self._fetch_sync(
+                url=url, cached_media=cached_media, url_entry=url_entry
+            )
+        finally:
+            with self._sync_inflight_lock:
+                self._sync_inflight.pop(url).set()
+
+    async def afetch(self, url: str) -> FetchedMedia:
+        """
+        Async fetch. Concurrent fetches of the same url make 1 request.
+        """
+        cached_media, url_entry = self._get_cached(url, read_disk=False)
+        if cached_media is None:
+            cached_media, url_entry = await self._run_disk_io(self._get_cached, url)
+        if cached_media is not None and url_entry is not None:
+            if self.cache.is_fresh(url_entry):
+                return cached_media
+
+        inflight_task = self._async_inflight.get(url)
+        if (
+            inflight_task is None
+            or inflight_task.get_loop() is not asyncio.get_running_loop()
+        ):
+            inflight_task = asyncio.ensure_future(
+                self._fetch_async(
+                    url=url, cached_media=cached_media, url_entry=url_entry
+                )
+            )
+            self._async_inflight[url] = inflight_task
+            inflight_task.add_done_callback(
+                lambda task: self._on_async_fetch_done(url=url, task=task)
+            )
+        # shield - a cancelled caller does not cancel the fetch for other callers
+        return await asyncio.shield(inflight_task)
+
+    async def _run_disk_io(self, fn, *args, **kwargs):
+        """
+        Run a cache operation that reads / writes `LITELLM_MEDIA_CACHE_DIR` in a thread - keeps disk I/O off the event loop
+        """
+        if self.cache.cache_dir is None:
+            return fn(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(fn, *args, **kwargs)
+        )
+
+    def _on_async_fetch_done(self, url: str, task: asyncio.Task):
+        if self._async_inflight.get(url) is task:
+            self._async_inflight.pop(url, None)
+        if not task.cancelled():
+            task.exception()  # mark the exception as retrieved, callers re-raise it
+
+    @staticmethod
+    def _get_request_headers(
+        cached_media: Optional[FetchedMedia], url_entry: Optional[MediaUrlEntry]
+    ) -> Optional[dict]:
+        if cached_media is not None and url_entry is not None and url_entry.etag:
+            return {"If-None-Match": url_entry.etag}
+        return None
+
+    def _check_size(self, url: str, size: int):
+        if size > self.max_size_bytes:
+            # "Error: Unable to fetch image from URL" - prompt converters re-raise errors with this prefix as-is
+            raise MediaFetchSizeLimitError(
+                f"Error: Unable to fetch image from URL. Media is larger than the max. allowed size of {self.max_size_bytes} bytes. url={url}"
+            )
+
+    def _check_content_length(self, url: str, response: httpx.Response):
+        content_length = response.headers.get("content-length")
+        if content_length is not None and content_length.isdigit():
+            self._check_size(url=url, size=int(content_length))
+
+    def _fetch_sync(
+        self,
+        url: str,
+        cached_media: Optional[FetchedMedia],
+        url_entry: Optional[MediaUrlEntry],
+    ) -> FetchedMedia:
+        client = _get_httpx_client()
+        with client.client.stream(
+            "GET",
+            url,
+            headers=self._get_request_headers(cached_media, url_entry),
+            follow_redirects=True,
+        ) as response:
+            if response.status_code == 304 and cached_media is not None:
+                return self._on_not_modified(url=url, cached_media=cached_media)
+            response.raise_for_status()
+            self._check_content_length(url=url, response=response)
+            content = bytearray()
+            for chunk in response.iter_bytes():
+                content += chunk
+                self._check_size(url=url, size=len(content))
+        return self._on_fetched(url=url, response=response, content=bytes(content))
+
+    async def _fetch_async(
+        self,
+        url: str,
+        cached_media: Optional[FetchedMedia],
+        url_entry: Optional[MediaUrlEntry],
+    ) -> FetchedMedia:
+        client = get_async_httpx_client(
+            llm_provider=httpxSpecialProvider.PromptFactory,
+        )
+        async with client.client.stream(
+            "GET",
+            url,
+            headers=self._get_request_headers(cached_media, url_entry),
+            follow_redirects=True,
+        ) as response:
+            if response.status_code == 304 and cached_media is not None:
+                return await self._run_disk_io(
+                    self._on_not_modified, url=url, cached_media=cached_media
+                )
+            response.raise_for_status()
+            self._check_content_length(url=url, response=response)
+            content = bytearray()
+            async for chunk in response.aiter_bytes():
+                content += chunk
+                self._check_size(url=url, size=len(content))
+        return await self._run_disk_io(
+            self._on_fetched, url=url, response=response, content=bytes(content)
+        )
+
+    def _on_not_modified(self, url: str, cached_media: FetchedMedia) -> FetchedMedia:
+        url_entry = self.cache.get_url_entry(url)
+        if url_entry is not None:
+            url_entry.fetched_at = time.time()
+            self.cache.set_url_entry(url=url, url_entry=url_entry)
+        return cached_media
+
+    def _on_fetched(
+        self, url: str, response: httpx.Response, content: bytes
+    ) -> FetchedMedia:
+        content_hash = hashlib.sha256(content).hexdigest()
+        media_content = self.cache.get_content(content_hash)
+        if media_content is None:
+            media_content = MediaContent(content=content, content_hash=content_hash)
+            self.cache.set_content(media_content)
+        content_type = response.headers.get("content-type")
+        self.cache.set_url_entry(
+            url=url,
+            url_entry=MediaUrlEntry(
+                content_hash=content_hash,
+                content_type=content_type,
+                etag=response.headers.get("etag"),
+                fetched_at=time.time(),
+            ),
+        )
+        return FetchedMedia(
+            url=url, content_type=content_type, media_content=media_content
+        )
+
+
+media_fetcher = MediaFetcher()
@@ -27,11 +27,17 @@ async with websockets.connect(  # type: ignore
 import asyncio
 import concurrent.futures
 import json
+import re
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import REALTIME_PARTIAL_LOGGING_INTERVAL_SECONDS
+from litellm.types.utils import Usage
 
 from .litellm_logging import Logging as LiteLLMLogging
+from .litellm_logging import get_standard_logging_object_payload
 
 # Create a thread pool with a maximum of 10 threads
 executor = concurrent.futures.ThreadPoolExecutor(max_workers=10)
@@ -42,6 +48,134 @@ DefaultLoggedRealTimeEventTypes = [
     "response.done",
 ]
 
+# events carrying base64 audio - never stored for logging
+RealTimeAudioEventTypes = {
+    "response.audio.delta",
+    "input_audio_buffer.append",
+}
+
+# `type` as the first key - how OpenAI / Azure send every event
+_EVENT_TYPE_PREFIX = re.compile(r'\s*\{\s*"type"\s*:\s*"([^"\\]*)"')
+# json strings + structural characters - a string (e.g. base64 audio) is skipped in 1 regex step
+_JSON_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:,]')
+
+
+def get_realtime_event_type(message: Union[str, bytes]) -> Optional[str]:
+    """
+    Returns the top-level `type` of a realtime event, without parsing the whole event.
+    """
+    if isinstance(message, bytes):
+        message = message.decode("utf-8")
+    match = _EVENT_TYPE_PREFIX.match(message)
+    if match is not None:
+        return match.group(1)
+    # scan the top-level keys of the event
+    depth = 0
+    previous_token = ""
+    is_type_value = False
+    for token_match in _JSON_TOKEN.finditer(message):
+        token = token_match.group()
+        if is_type_value and token[0] == '"':
+            return json.loads(token)
+        is_type_value = False
+        if token == "{" or token == "[":
+            depth += 1
+        elif token == "}" or token == "]":
+            depth -= 1
+        elif token == ":":
+            is_type_value = depth == 1 and previous_token == '"type"'
+        previous_token = token
+    return None
+
+
+class RealTimeUsage:
+    """
+    Usage of a realtime session, folded from the `usage` of its `response.done` events.
+    """
+
+    def __init__(self) -> None:
+        self.num_responses = 0
+        self.input_text_tokens = 0
+        self.input_audio_tokens = 0
+        self.cached_text_tokens = 0
+        self.cached_audio_tokens = 0
+        self.output_text_tokens = 0
+        self.output_audio_tokens = 0
+
+    def add_response_done_event(self, event: dict) -> None:
+        usage = (event.get("response") or {}).get("usage")
+        if not usage:
+            return
+        self.num_responses += 1
+        input_token_details = usage.get("input_token_details") or {}
+        output_token_details = usage.get("output_token_details") or {}
+        cached_tokens_details = input_token_details.get("cached_tokens_details") or {}
+        self.input_audio_tokens += input_token_details.get("audio_tokens") or 0
+        self.input_text_tokens += input_token_details.get("text_tokens", None) or (
+            (usage.get("input_tokens") or 0)
+            - (input_token_details.get("audio_tokens") or 0)
+        )
+        cached_audio_tokens = cached_tokens_details.get("audio_tokens") or 0
+        self.cached_audio_tokens += cached_audio_tokens
+        self.cached_text_tokens += cached_tokens_details.get("text_tokens", None) or (
+            (input_token_details.get("cached_tokens") or 0) - cached_audio_tokens
+        )
+        self.output_audio_tokens += output_token_details.get("audio_tokens") or 0
+        self.output_text_tokens += output_token_details.get("text_tokens", None) or (
+            (usage.get("output_tokens") or 0)
+            - (output_token_details.get("audio_tokens") or 0)
+        )
+
+    def get_usage(self) -> Usage:
+        prompt_tokens = self.input_text_tokens + self.input_audio_tokens
+        completion_tokens = self.output_text_tokens + self.output_audio_tokens
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+            prompt_tokens_details={
+                "cached_tokens": self.cached_text_tokens + self.cached_audio_tokens,
+                "text_tokens": self.input_text_tokens,
+                "audio_tokens": self.input_audio_tokens,
+            },
+            completion_tokens_details={
+                "text_tokens": self.output_text_tokens,
+                "audio_tokens": self.output_audio_tokens,
+            },
+        )
+
+    def get_cost(self, model: str, custom_llm_provider: Optional[str]) -> float:
+        """
+        Cost of the usage - audio tokens at the audio token prices, cached tokens at the cache read prices.
+        """
+        model_info = litellm.get_model_info(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+        input_cost_per_token = model_info.get("input_cost_per_token") or 0.0
+        input_cost_per_audio_token = (
+            model_info.get("input_cost_per_audio_token") or input_cost_per_token
+        )
+        cache_read_input_token_cost = (
+            model_info.get("cache_read_input_token_cost") or input_cost_per_token
+        )
+        cache_read_input_audio_token_cost = (
+            model_info.get("cache_read_input_audio_token_cost")
+            or input_cost_per_audio_token
+        )
+        output_cost_per_token = model_info.get("output_cost_per_token") or 0.0
+        output_cost_per_audio_token = (
+            model_info.get("output_cost_per_audio_token") or output_cost_per_token
+        )
+        return (
+            (self.input_text_tokens - self.cached_text_tokens) * input_cost_per_token
+            + self.cached_text_tokens * cache_read_input_token_cost
+            + (self.input_audio_tokens - self.cached_audio_tokens)
+            * input_cost_per_audio_token
+            + self.cached_audio_tokens * cache_read_input_audio_token_cost
+            + self.output_text_tokens * output_cost_per_token
+            + self.output_audio_tokens * output_cost_per_audio_token
+        )
+
 
 class RealTimeStreaming:
     def __init__(
@@ -54,7 +188,15 @@ class RealTimeStreaming:
         self.backend_ws = backend_ws
         self.logging_obj = logging_obj
         self.messages: List = []
-        self.input_message: Dict = {}
+        self.input_message: Union[Dict, str, bytes] = {}
+        self.usage = RealTimeUsage()
+        ## PARTIAL LOGGING - long sessions are logged every `partial_logging_interval` seconds
+        self.log_start_time = datetime.now()
+        self.num_logged_parts = 0
+        _partial_logging_interval = litellm.realtime_partial_logging_interval_seconds
+        if _partial_logging_interval is None:
+            _partial_logging_interval = REALTIME_PARTIAL_LOGGING_INTERVAL_SECONDS
+        self.partial_logging_interval = _partial_logging_interval
 
         _logged_real_time_event_types = litellm.logged_real_time_event_types
 
@@ -62,36 +204,130 @@ class RealTimeStreaming:
             _logged_real_time_event_types = DefaultLoggedRealTimeEventTypes
         self.logged_real_time_event_types = _logged_real_time_event_types
 
-    def _should_store_message(self, message: Union[str, bytes]) -> bool:
-        if isinstance(message, bytes):
-            message = message.decode("utf-8")
-        message_obj = json.loads(message)
-        _msg_type = message_obj["type"]
+    def _should_store_event_type(self, event_type: Optional[str]) -> bool:
+        if event_type in RealTimeAudioEventTypes:
+            return False
         if self.logged_real_time_event_types == "*":
             return True
-        if _msg_type in self.logged_real_time_event_types:
+        if event_type in self.logged_real_time_event_types:
             return True
         return False
 
+    def _should_store_message(self, message: Union[str, bytes]) -> bool:
+        return self._should_store_event_type(get_realtime_event_type(message))
+
     def store_message(self, message: Union[str, bytes]):
-        """Store message in list"""
-        if self._should_store_message(message):
+        """Store message in list, add the usage of `response.done` events"""
+        event_type = get_realtime_event_type(message)
+        if event_type == "response.done":
+            try:
+                self.usage.add_response_done_event(json.loads(message))
+            except Exception as e:
+                verbose_logger.debug(
+                    "RealTimeStreaming: unable to read usage from response.done event - %s",
+                    str(e),
+                )
+        if self._should_store_event_type(event_type):
             self.messages.append(message)
 
-    def store_input(self, message: dict):
+    def store_input(self, message: Union[str, bytes]):
         """Store input message"""
+        if get_realtime_event_type(message) in RealTimeAudioEventTypes:
+            return
         self.input_message = message
         if self.logging_obj:
             self.logging_obj.pre_call(input=message, api_key="")
 
-    async def log_messages(self):
-        """Log messages in list"""
+    def _should_log_partial(self) -> bool:
+        if not self.partial_logging_interval:
+            return False
+        return (
+            datetime.now() - self.log_start_time
+        ).total_seconds() >= self.partial_logging_interval
+
+    def _get_standard_logging_object(
+        self,
+        logging_obj: LiteLLMLogging,
+        response_id: str,
+        response_cost: Optional[float],
+        start_time: datetime,
+        end_time: datetime,
+    ):
+        return get_standard_logging_object_payload(
+            kwargs={**logging_obj.model_call_details, "response_cost": response_cost},
+            init_response_obj={
+                "id": response_id,
+                "object": "realtime.session",
+                "usage": self.usage.get_usage(),
+            },
+            start_time=start_time,
+            end_time=end_time,
+            logging_obj=logging_obj,
+            status="success",
+        )
+
+    async def log_messages(self, is_partial: bool = False):
+        """
+        Log the messages + usage since the last log, then start a new part.
+
+        Sessions logged in parts use `<litellm_call_id>_<part>` as id - every part is its own spend log.
+        """
+        if (
+            not is_partial
+            and self.num_logged_parts > 0
+            and not self.messages
+            and self.usage.num_responses == 0
+        ):
+            return  # nothing happened since the last part
         if self.logging_obj:
+            start_time = self.log_start_time
+            end_time = datetime.now()
+            messages = self.messages
+            response_id = self.logging_obj.litellm_call_id
+            if is_partial or self.num_logged_parts > 0:
+                response_id = f"{response_id}_{self.num_logged_parts}"
+            response_cost: Optional[float] = None
+            try:
+                response_cost = self.usage.get_cost(
+                    model=self.logging_obj.model,
+                    custom_llm_provider=self.logging_obj.model_call_details.get(
+                        "custom_llm_provider"
+                    ),
+                )
+            except Exception as e:
+                verbose_logger.debug(
+                    "RealTimeStreaming: unable to calculate cost - %s", str(e)
+                )
+            self.logging_obj.model_call_details["response_cost"] = response_cost
+            standard_logging_object = self._get_standard_logging_object(
+                logging_obj=self.logging_obj,
+                response_id=response_id,
+                response_cost=response_cost,
+                start_time=start_time,
+                end_time=end_time,
+            )
             ## ASYNC LOGGING
             # Create an event loop for the new thread
-            asyncio.create_task(self.logging_obj.async_success_handler(self.messages))
+            asyncio.create_task(
+                self.logging_obj.async_success_handler(
+                    messages,
+                    start_time=start_time,
+                    end_time=end_time,
+                    standard_logging_object=standard_logging_object,
+                )
+            )
             ## SYNC LOGGING
-            executor.submit(self.logging_obj.success_handler(self.messages))
+            executor.submit(
+                self.logging_obj.success_handler,
+                messages,
+                start_time,
+                end_time,
+                standard_logging_object=standard_logging_object,
+            )
+        self.num_logged_parts += 1
+        self.messages = []
+        self.usage = RealTimeUsage()
+        self.log_start_time = datetime.now()
 
     async def backend_to_client_send_messages(self):
         import websockets
@@ -103,6 +339,8 @@ class RealTimeStreaming:
 
                 ## LOGGING
                 self.store_message(message)
+                if self._should_log_partial():
+                    await self.log_messages(is_partial=True)
         except websockets.exceptions.ConnectionClosed:  # type: ignore
             pass
         except Exception:
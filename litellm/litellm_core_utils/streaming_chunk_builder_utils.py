@@ -253,7 +253,8 @@ class ChunkProcessor:
             id=id,
         )
 
-    def _usage_chunk_calculation_helper(self, usage_chunk: Usage) -> dict:
+    @staticmethod
+    def _usage_chunk_calculation_helper(usage_chunk: Usage) -> dict:
         prompt_tokens = 0
         completion_tokens = 0
         ## anthropic prompt caching information ##
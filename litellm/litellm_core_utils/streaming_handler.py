@@ -11,7 +11,7 @@ import httpx
 from pydantic import BaseModel
 
 import litellm
-from litellm import verbose_logger
+from litellm._logging import lazy_verbose_logger, verbose_logger
 from litellm.litellm_core_utils.redact_messages import LiteLLMLoggingObject
 from litellm.litellm_core_utils.thread_pool_executor import executor
 from litellm.types.utils import Delta
@@ -43,14 +43,6 @@ def is_async_iterable(obj: Any) -> bool:
     return isinstance(obj, collections.abc.AsyncIterable)
 
 
-def print_verbose(print_statement):
-    try:
-        if litellm.set_verbose:
-            print(print_statement)  # noqa
-    except Exception:
-        pass
-
-
 class CustomStreamWrapper:
     def __init__(
         self,
@@ -247,10 +239,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            lazy_verbose_logger.print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                lazy_verbose_logger.print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -290,10 +282,10 @@ class CustomStreamWrapper:
             text = ""
             is_finished = False
             finish_reason = ""
-            print_verbose(f"chunk: {chunk}")
+            lazy_verbose_logger.print_verbose("chunk: %s", chunk)
             if chunk.startswith("data:"):
                 data_json = json.loads(chunk[5:])
-                print_verbose(f"data json: {data_json}")
+                lazy_verbose_logger.print_verbose("data json: %s", data_json)
                 if "token" in data_json and "text" in data_json["token"]:
                     text = data_json["token"]["text"]
                 if data_json.get("details", False) and data_json["details"].get(
@@ -396,7 +388,7 @@ class CustomStreamWrapper:
         is_finished = False
         finish_reason = ""
         text = ""
-        print_verbose(f"chunk: {chunk}")
+        lazy_verbose_logger.print_verbose("chunk: %s", chunk)
         if "data: [DONE]" in chunk:
             text = ""
             is_finished = True
@@ -415,8 +407,11 @@ class CustomStreamWrapper:
                     if data_json["choices"][0].get("finish_reason", None):
                         is_finished = True
                         finish_reason = data_json["choices"][0]["finish_reason"]
-                print_verbose(
-                    f"text: {text}; is_finished: {is_finished}; finish_reason: {finish_reason}"
+                lazy_verbose_logger.print_verbose(
+                    "text: %s; is_finished: %s; finish_reason: %s",
+                    text,
+                    is_finished,
+                    finish_reason,
                 )
                 return {
                     "text": text,
@@ -459,7 +454,7 @@ class CustomStreamWrapper:
 
     def handle_openai_chat_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            lazy_verbose_logger.print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             str_line = chunk
             text = ""
             is_finished = False
@@ -503,7 +498,7 @@ class CustomStreamWrapper:
 
     def handle_azure_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            lazy_verbose_logger.print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -524,7 +519,7 @@ class CustomStreamWrapper:
 
     def handle_openai_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            lazy_verbose_logger.print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -609,7 +604,7 @@ class CustomStreamWrapper:
                     "finish_reason": finish_reason,
                 }
             elif "message" in json_chunk:
-                print_verbose(f"delta content: {json_chunk}")
+                lazy_verbose_logger.print_verbose("delta content: %s", json_chunk)
                 text = json_chunk["message"]["content"]
                 return {
                     "text": text,
@@ -639,7 +634,9 @@ class CustomStreamWrapper:
                         "completion_tokens": 0,
                     }
             else:
-                print_verbose(f"chunk: {chunk} (Type: {type(chunk)})")
+                lazy_verbose_logger.print_verbose(
+                    "chunk: %s (Type: %s)", chunk, type(chunk)
+                )
                 raise ValueError(
                     f"Unable to parse response. Original response: {chunk}"
                 )
@@ -728,8 +725,11 @@ class CustomStreamWrapper:
         response_obj: Dict[str, Any],
     ):
 
-        print_verbose(
-            f"completion_obj: {completion_obj}, model_response.choices[0]: {model_response.choices[0]}, response_obj: {response_obj}"
+        lazy_verbose_logger.print_verbose(
+            "completion_obj: %s, model_response.choices[0]: %s, response_obj: %s",
+            completion_obj,
+            model_response.choices[0],
+            response_obj,
         )
         if (
             "content" in completion_obj
@@ -758,7 +758,9 @@ class CustomStreamWrapper:
                 chunk=completion_obj["content"],
                 finish_reason=model_response.choices[0].finish_reason,
             )  # filter out bos/eos tokens from openai-compatible hf endpoints
-            print_verbose(f"hold - {hold}, model_response_str - {model_response_str}")
+            lazy_verbose_logger.print_verbose(
+                "hold - %s, model_response_str - %s", hold, model_response_str
+            )
             if hold is False:
                 ## check if openai/azure chunk
                 original_chunk = response_obj.get("original_chunk", None)
@@ -774,11 +776,15 @@ class CustomStreamWrapper:
                                     choice_json.pop(
                                         "finish_reason", None
                                     )  # for mistral etc. which return a value in their last chunk (not-openai compatible).
-                                    print_verbose(f"choice_json: {choice_json}")
+                                    lazy_verbose_logger.print_verbose(
+                                        "choice_json: %s", choice_json
+                                    )
                                     choices.append(StreamingChoices(**choice_json))
                             except Exception:
                                 choices.append(StreamingChoices())
-                        print_verbose(f"choices in streaming: {choices}")
+                        lazy_verbose_logger.print_verbose(
+                            "choices in streaming: %s", choices
+                        )
                         setattr(model_response, "choices", choices)
                     else:
                         return
@@ -790,7 +796,9 @@ class CustomStreamWrapper:
                         "citations",
                         getattr(original_chunk, "citations", None),
                     )
-                    print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
+                    lazy_verbose_logger.print_verbose(
+                        "self.sent_first_chunk: %s", self.sent_first_chunk
+                    )
                     if self.sent_first_chunk is False:
                         model_response.choices[0].delta["role"] = "assistant"
                         self.sent_first_chunk = True
@@ -800,8 +808,9 @@ class CustomStreamWrapper:
                         _initial_delta = model_response.choices[0].delta.model_dump()
                         _initial_delta.pop("role", None)
                         model_response.choices[0].delta = Delta(**_initial_delta)
-                    print_verbose(
-                        f"model_response.choices[0].delta: {model_response.choices[0].delta}"
+                    lazy_verbose_logger.print_verbose(
+                        "model_response.choices[0].delta: %s",
+                        model_response.choices[0].delta,
                     )
                 else:
                     ## else
@@ -817,7 +826,9 @@ class CustomStreamWrapper:
                     _index: Optional[int] = completion_obj.get("index")
                     if _index is not None:
                         model_response.choices[0].index = _index
-                print_verbose(f"returning model_response: {model_response}")
+                lazy_verbose_logger.print_verbose(
+                    "returning model_response: %s", model_response
+                )
                 return model_response
             else:
                 return
@@ -1071,19 +1082,25 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "ollama_chat":
                 response_obj = self.handle_ollama_chat_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                lazy_verbose_logger.print_verbose(
+                    "completion obj content: %s", completion_obj["content"]
+                )
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "triton":
                 response_obj = self.handle_triton_stream(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                lazy_verbose_logger.print_verbose(
+                    "completion obj content: %s", completion_obj["content"]
+                )
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "text-completion-openai":
                 response_obj = self.handle_openai_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                lazy_verbose_logger.print_verbose(
+                    "completion obj content: %s", completion_obj["content"]
+                )
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if response_obj["usage"] is not None:
@@ -1097,7 +1114,9 @@ class CustomStreamWrapper:
                     chunk
                 )
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                lazy_verbose_logger.print_verbose(
+                    "completion obj content: %s", completion_obj["content"]
+                )
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
                 if "usage" in response_obj is not None:
@@ -1109,7 +1128,9 @@ class CustomStreamWrapper:
             elif self.custom_llm_provider == "azure_text":
                 response_obj = self.handle_azure_text_completion_chunk(chunk)
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                lazy_verbose_logger.print_verbose(
+                    "completion obj content: %s", completion_obj["content"]
+                )
                 if response_obj["is_finished"]:
                     self.received_finish_reason = response_obj["finish_reason"]
             elif self.custom_llm_provider == "cached_response":
@@ -1128,7 +1149,9 @@ class CustomStreamWrapper:
                 completion_obj["content"] = response_obj["text"]
                 if response_obj["tool_calls"] is not None:
                     completion_obj["tool_calls"] = response_obj["tool_calls"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                lazy_verbose_logger.print_verbose(
+                    "completion obj content: %s", completion_obj["content"]
+                )
                 if hasattr(chunk, "id"):
                     model_response.id = chunk.id
                     self.response_id = chunk.id
@@ -1145,7 +1168,9 @@ class CustomStreamWrapper:
                 if response_obj is None:
                     return
                 completion_obj["content"] = response_obj["text"]
-                print_verbose(f"completion obj content: {completion_obj['content']}")
+                lazy_verbose_logger.print_verbose(
+                    "completion obj content: %s", completion_obj["content"]
+                )
                 if response_obj["is_finished"]:
                     if response_obj["finish_reason"] == "error":
                         raise Exception(
@@ -1196,8 +1221,10 @@ class CustomStreamWrapper:
                         )
 
             model_response.model = self.model
-            print_verbose(
-                f"model_response finish reason 3: {self.received_finish_reason}; response_obj={response_obj}"
+            lazy_verbose_logger.print_verbose(
+                "model_response finish reason 3: %s; response_obj=%s",
+                self.received_finish_reason,
+                response_obj,
             )
             ## FUNCTION CALL PARSING
             if (
@@ -1249,7 +1276,9 @@ class CustomStreamWrapper:
                                             ):
                                                 t.function.arguments = ""
                             _json_delta = delta.model_dump()
-                            print_verbose(f"_json_delta: {_json_delta}")
+                            lazy_verbose_logger.print_verbose(
+                                "_json_delta: %s", _json_delta
+                            )
                             if "role" not in _json_delta or _json_delta["role"] is None:
                                 _json_delta["role"] = (
                                     "assistant"  # mistral's api returns role as None
@@ -1285,10 +1314,12 @@ class CustomStreamWrapper:
                                 if original_chunk.choices[0].delta is None
                                 else dict(original_chunk.choices[0].delta)
                             )
-                            print_verbose(f"original delta: {delta}")
+                            lazy_verbose_logger.print_verbose(
+                                "original delta: %s", delta
+                            )
                             model_response.choices[0].delta = Delta(**delta)
-                            print_verbose(
-                                f"new delta: {model_response.choices[0].delta}"
+                            lazy_verbose_logger.print_verbose(
+                                "new delta: %s", model_response.choices[0].delta
                             )
                         except Exception:
                             model_response.choices[0].delta = Delta()
@@ -1299,10 +1330,14 @@ class CustomStreamWrapper:
                     ):
                         return model_response
                     return
-            print_verbose(
-                f"model_response.choices[0].delta: {model_response.choices[0].delta}; completion_obj: {completion_obj}"
+            lazy_verbose_logger.print_verbose(
+                "model_response.choices[0].delta: %s; completion_obj: %s",
+                model_response.choices[0].delta,
+                completion_obj,
+            )
+            lazy_verbose_logger.print_verbose(
+                "self.sent_first_chunk: %s", self.sent_first_chunk
             )
-            print_verbose(f"self.sent_first_chunk: {self.sent_first_chunk}")
 
             ## CHECK FOR TOOL USE
             if "tool_calls" in completion_obj and len(completion_obj["tool_calls"]) > 0:
@@ -1419,13 +1454,17 @@ class CustomStreamWrapper:
                 else:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
-                    print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                    lazy_verbose_logger.print_verbose(
+                        "PROCESSED CHUNK PRE CHUNK CREATOR: %s; custom_llm_provider: %s",
+                        chunk,
+                        self.custom_llm_provider,
                     )
                     response: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    lazy_verbose_logger.print_verbose(
+                        "PROCESSED CHUNK POST CHUNK CREATOR: %s", response
+                    )
 
                     if response is None:
                         continue
@@ -1556,13 +1595,15 @@ class CustomStreamWrapper:
                         continue
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
-                    print_verbose(f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}")
+                    lazy_verbose_logger.print_verbose(
+                        "PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk
+                    )
 
                     processed_chunk: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
-                    print_verbose(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                    lazy_verbose_logger.print_verbose(
+                        "PROCESSED ASYNC CHUNK POST CHUNK CREATOR: %s", processed_chunk
                     )
                     if processed_chunk is None:
                         continue
@@ -1595,7 +1636,9 @@ class CustomStreamWrapper:
 
                         # Create a new object without the removed attribute
                         processed_chunk = self.model_response_creator(chunk=obj_dict)
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    lazy_verbose_logger.print_verbose(
+                        "final returned processed chunk: %s", processed_chunk
+                    )
                     return processed_chunk
                 raise StopAsyncIteration
             else:  # temporary patch for non-aiohttp async calls
@@ -1608,12 +1651,14 @@ class CustomStreamWrapper:
                     else:
                         chunk = next(self.completion_stream)
                     if chunk is not None and chunk != b"":
-                        print_verbose(f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}")
+                        lazy_verbose_logger.print_verbose(
+                            "PROCESSED CHUNK PRE CHUNK CREATOR: %s", chunk
+                        )
                         processed_chunk: Optional[ModelResponseStream] = (
                             self.chunk_creator(chunk=chunk)
                         )
-                        print_verbose(
-                            f"PROCESSED CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        lazy_verbose_logger.print_verbose(
+                            "PROCESSED CHUNK POST CHUNK CREATOR: %s", processed_chunk
                         )
                         if processed_chunk is None:
                             continue
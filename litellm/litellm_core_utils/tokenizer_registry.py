@@ -0,0 +1,130 @@
+"""
+Process-wide registry of loaded huggingface tokenizers.
+
+Loading a tokenizer (downloading it from the huggingface hub, parsing its vocab + merges) is slow - it's done once per tokenizer per process:
+- models using the same tokenizer share 1 loaded tokenizer (e.g. all llama-3 models)
+- concurrent first requests for a model wait for 1 load, instead of each loading the tokenizer
+- with `litellm.tokenizer_cache_dir` set (env: `LITELLM_TOKENIZER_CACHE_DIR`), tokenizers are read from `{tokenizer_cache_dir}/<org>--<model>.json` (`<org>--<model>@<revision>.json` for a non-default revision) before trying the hub, and downloaded tokenizers are saved there - later starts / workers load them offline
+
+`litellm.utils.load_tokenizers()` loads the tokenizers of a list of models at startup (`litellm_settings.preload_tokenizers` on the proxy - per worker).
+"""
+
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+from tokenizers import Tokenizer
+
+import litellm
+from litellm._logging import verbose_logger
+
+DEFAULT_TOKENIZER_REVISION = "main"
+
+
+def _get_tokenizer_cache_path(
+    identifier: str, revision: Optional[str]
+) -> Optional[str]:
+    if not litellm.tokenizer_cache_dir:
+        return None
+    file_name = identifier.replace("/", "--")
+    if revision is not None and revision != DEFAULT_TOKENIZER_REVISION:
+        file_name += f"@{revision}"
+    return os.path.join(litellm.tokenizer_cache_dir, file_name + ".json")
+
+
+def _save_tokenizer_to_cache(tokenizer: Tokenizer, cache_path: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # write to a temp file + rename, so concurrent workers never read a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        tokenizer.save(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        verbose_logger.warning(
+            "Unable to persist tokenizer to %s - %s", cache_path, str(e)
+        )
+
+
+class TokenizerRegistry:
+    def __init__(self) -> None:
+        self._tokenizers: Dict[str, Tokenizer] = {}
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_load(self, key: str, load: Callable[[], Tokenizer]) -> Tokenizer:
+        tokenizer = self._tokenizers.get(key)
+        if tokenizer is not None:
+            return tokenizer
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            tokenizer = self._tokenizers.get(key)
+            if tokenizer is None:
+                # a failed load raises, and is retried by the next call
+                tokenizer = load()
+                self._tokenizers[key] = tokenizer
+        return tokenizer
+
+    def get_huggingface_tokenizer(
+        self,
+        identifier: str,
+        revision: Optional[str] = None,
+        auth_token: Optional[str] = None,
+    ) -> Tokenizer:
+        """
+        Returns the tokenizer of a huggingface hub repo - from the registry, the local cache dir, or the hub
+        """
+        return self._get_or_load(
+            key=f"{identifier}@{revision or DEFAULT_TOKENIZER_REVISION}",
+            load=lambda: self._load_huggingface_tokenizer(
+                identifier=identifier, revision=revision, auth_token=auth_token
+            ),
+        )
+
+    def get_tokenizer_from_str(self, name: str, json_str: str) -> Tokenizer:
+        """
+        Returns the tokenizer serialized in `json_str` (e.g. a tokenizer shipped with litellm), loaded once per `name`
+        """
+        return self._get_or_load(key=name, load=lambda: Tokenizer.from_str(json_str))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokenizers.clear()
+            self._load_locks.clear()
+
+    def _load_huggingface_tokenizer(
+        self, identifier: str, revision: Optional[str], auth_token: Optional[str]
+    ) -> Tokenizer:
+        cache_path = _get_tokenizer_cache_path(identifier=identifier, revision=revision)
+        if cache_path is not None and os.path.isfile(cache_path):
+            return Tokenizer.from_file(cache_path)
+
+        if litellm.disable_hf_tokenizer_download is True:
+            raise ValueError(
+                f"Tokenizer {identifier} not found in tokenizer_cache_dir={litellm.tokenizer_cache_dir}, and huggingface tokenizer download is disabled"
+            )
+
+        from_pretrained_kwargs: Dict[str, str] = {}
+        if revision is not None:
+            from_pretrained_kwargs["revision"] = revision
+        try:
+            if auth_token is not None:
+                tokenizer = Tokenizer.from_pretrained(
+                    identifier, auth_token=auth_token, **from_pretrained_kwargs  # type: ignore
+                )
+            else:
+                tokenizer = Tokenizer.from_pretrained(identifier, **from_pretrained_kwargs)  # type: ignore
+        except Exception as e:
+            if auth_token is None:
+                raise
+            verbose_logger.error(
+                f"Error creating pretrained tokenizer: {e}. Defaulting to version without 'auth_token'."
+            )
+            tokenizer = Tokenizer.from_pretrained(identifier, **from_pretrained_kwargs)  # type: ignore
+
+        if cache_path is not None:
+            _save_tokenizer_to_cache(tokenizer=tokenizer, cache_path=cache_path)
+        return tokenizer
+
+
+tokenizer_registry = TokenizerRegistry()
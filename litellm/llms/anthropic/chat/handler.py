@@ -511,7 +511,9 @@ class ModelResponseIterator:
         tool_use: Optional[ChatCompletionToolCallChunk] = None
         provider_specific_fields = {}
         content_block = ContentBlockDelta(**chunk)  # type: ignore
-        self.content_blocks.append(content_block)
+        # text deltas are not needed by `check_empty_tool_call_args()` - not kept, so a long text block doesn't grow the list
+        if content_block["delta"].get("type") != "text_delta":
+            self.content_blocks.append(content_block)
         if "text" in content_block["delta"]:
             text = content_block["delta"]["text"]
         elif "partial_json" in content_block["delta"]:
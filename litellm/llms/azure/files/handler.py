@@ -1,4 +1,4 @@
-from typing import Any, Coroutine, Optional, Union, cast
+from typing import Any, AsyncIterator, Coroutine, Optional, Union, cast
 
 import httpx
 from openai import AsyncAzureOpenAI, AzureOpenAI
@@ -126,6 +126,53 @@ class AzureOpenAIFilesAPI(BaseLLM):
 
         return HttpxBinaryResponseContent(response=response.response)
 
+    async def afile_content_stream(
+        self,
+        file_content_request: FileContentRequest,
+        api_base: Optional[str],
+        api_key: Optional[str],
+        timeout: Union[float, httpx.Timeout],
+        max_retries: Optional[int],
+        api_version: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        client: Optional[AsyncAzureOpenAI] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields the file content in chunks, without reading the whole file into memory
+        """
+        openai_client = get_azure_openai_client(
+            api_key=api_key,
+            api_base=api_base,
+            timeout=timeout,
+            api_version=api_version,
+            max_retries=max_retries,
+            organization=None,
+            client=client,
+            _is_async=True,
+        )
+        if not isinstance(openai_client, AsyncAzureOpenAI):
+            raise ValueError(
+                "AzureOpenAI client is not an instance of AsyncAzureOpenAI. Make sure you passed an AsyncAzureOpenAI client."
+            )
+        extra_body = file_content_request.get("extra_body")
+        if extra_body is not None and "azure_ad_token" in extra_body:
+            # auth param - not sent in the request body, same as `file_content`
+            file_content_request = FileContentRequest(
+                **{
+                    **file_content_request,
+                    "extra_body": {
+                        key: value
+                        for key, value in extra_body.items()
+                        if key != "azure_ad_token"
+                    },
+                }
+            )
+        async with openai_client.files.with_streaming_response.content(
+            **file_content_request
+        ) as response:
+            async for chunk in response.iter_bytes(chunk_size):
+                yield chunk
+
     async def aretrieve_file(
         self,
         file_id: str,
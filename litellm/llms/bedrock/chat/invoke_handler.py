@@ -2,6 +2,7 @@
 TODO: DELETE FILE. Bedrock LLM is no longer used. Goto `litellm/llms/bedrock/chat/invoke_transformations/base_invoke_transformation.py`
 """
 
+import base64
 import copy
 import json
 import time
@@ -62,8 +63,8 @@ from litellm.utils import CustomStreamWrapper, get_secret
 
 from ..base_aws_llm import BaseAWSLLM
 from ..common_utils import BedrockError, ModelResponseIterator, get_bedrock_tool_name
+from ..event_stream import AWSEventStreamParser
 
-_response_stream_shape_cache = None
 bedrock_tool_name_mappings: InMemoryCache = InMemoryCache(
     max_size_in_memory=50, default_ttl=600
 )
@@ -1201,27 +1202,9 @@ class BedrockLLM(BaseAWSLLM):
         return self.encode_model_id(model_id=model_id)
 
 
-def get_response_stream_shape():
-    global _response_stream_shape_cache
-    if _response_stream_shape_cache is None:
-
-        from botocore.loaders import Loader
-        from botocore.model import ServiceModel
-
-        loader = Loader()
-        bedrock_service_dict = loader.load_service_model("bedrock-runtime", "service-2")
-        bedrock_service_model = ServiceModel(bedrock_service_dict)
-        _response_stream_shape_cache = bedrock_service_model.shape_for("ResponseStream")
-
-    return _response_stream_shape_cache
-
-
 class AWSEventStreamDecoder:
     def __init__(self, model: str) -> None:
-        from botocore.parsers import EventStreamJSONParser
-
         self.model = model
-        self.parser = EventStreamJSONParser()
         self.content_blocks: List[ContentBlockDeltaEvent] = []
 
     def check_empty_tool_call_args(self) -> bool:
@@ -1246,7 +1229,7 @@ class AWSEventStreamDecoder:
 
     def converse_chunk_parser(self, chunk_data: dict) -> GChunk:
         try:
-            verbose_logger.debug("\n\nRaw Chunk: {}\n\n".format(chunk_data))
+            verbose_logger.debug("\n\nRaw Chunk: %s\n\n", chunk_data)
             text = ""
             tool_use: Optional[ChatCompletionToolCallChunk] = None
             is_finished = False
@@ -1391,66 +1374,66 @@ class AWSEventStreamDecoder:
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[GChunk]:
         """Given an iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        event_stream_parser = AWSEventStreamParser()
         for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                message = self._parse_message_from_event(event)
-                if message:
-                    # sse_event = ServerSentEvent(data=message, event="completion")
-                    _data = json.loads(message)
-                    yield self._chunk_parser(chunk_data=_data)
+            for message in event_stream_parser.feed(chunk):
+                payload = self._get_event_payload(
+                    headers=message.headers, body=message.payload
+                )
+                if payload:
+                    yield self._chunk_parser(chunk_data=json.loads(payload))
 
     async def aiter_bytes(
         self, iterator: AsyncIterator[bytes]
     ) -> AsyncIterator[GChunk]:
         """Given an async iterator that yields lines, iterate over it & yield every event encountered"""
-        from botocore.eventstream import EventStreamBuffer
-
-        event_stream_buffer = EventStreamBuffer()
+        event_stream_parser = AWSEventStreamParser()
         async for chunk in iterator:
-            event_stream_buffer.add_data(chunk)
-            for event in event_stream_buffer:
-                message = self._parse_message_from_event(event)
-                if message:
-                    _data = json.loads(message)
-                    yield self._chunk_parser(chunk_data=_data)
+            for message in event_stream_parser.feed(chunk):
+                payload = self._get_event_payload(
+                    headers=message.headers, body=message.payload
+                )
+                if payload:
+                    yield self._chunk_parser(chunk_data=json.loads(payload))
 
-    def _parse_message_from_event(self, event) -> Optional[str]:
-        response_dict = event.to_response_dict()
-        parsed_response = self.parser.parse(response_dict, get_response_stream_shape())
-
-        if response_dict["status_code"] != 200:
-            decoded_body = response_dict["body"].decode()
-            if isinstance(decoded_body, dict):
-                error_message = decoded_body.get("message")
-            elif isinstance(decoded_body, str):
-                error_message = decoded_body
-            else:
-                error_message = ""
-            exception_status = response_dict["headers"].get(":exception-type")
-            error_message = exception_status + " " + error_message
+    def _get_event_payload(self, headers: dict, body: bytes) -> Optional[bytes]:
+        """
+        Returns the json payload of an event stream message - None if it's empty.
+
+        - /invoke streams send `chunk` events - {"bytes": "<base64 encoded model chunk>"}
+        - /converse streams send the converse event as the payload (messageStart, contentBlockDelta, etc.)
+
+        Raises a BedrockError for error / exception messages.
+        """
+        message_type = headers.get(":message-type")
+        if message_type == "error" or message_type == "exception":
+            exception_status = (
+                headers.get(":exception-type") or headers.get(":error-code") or ""
+            )
+            error_message = (
+                body.decode() if body else headers.get(":error-message") or ""
+            )
             raise BedrockError(
-                status_code=response_dict["status_code"],
-                message=(
-                    json.dumps(error_message)
-                    if isinstance(error_message, dict)
-                    else error_message
-                ),
+                status_code=400,
+                message="{} {}".format(exception_status, error_message),
             )
-        if "chunk" in parsed_response:
-            chunk = parsed_response.get("chunk")
-            if not chunk:
-                return None
-            return chunk.get("bytes").decode()  # type: ignore[no-any-return]
-        else:
-            chunk = response_dict.get("body")
-            if not chunk:
+        if not body:
+            return None
+        if headers.get(":event-type") == "chunk":
+            chunk_bytes = json.loads(body).get("bytes")
+            if not chunk_bytes:
                 return None
+            return base64.b64decode(chunk_bytes)
+        return body
 
-            return chunk.decode()  # type: ignore[no-any-return]
+    def _parse_message_from_event(self, event) -> Optional[str]:
+        response_dict = event.to_response_dict()
+        payload = self._get_event_payload(
+            headers=response_dict["headers"], body=response_dict["body"]
+        )
+        if not payload:
+            return None
+        return payload.decode()
 
 
 class AmazonAnthropicClaudeStreamDecoder(AWSEventStreamDecoder):
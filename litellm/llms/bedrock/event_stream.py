@@ -0,0 +1,157 @@
+"""
+Incremental parser for the AWS event stream encoding (`application/vnd.amazon.eventstream`) - used by bedrock streaming responses.
+
+Each message is: prelude (total length, headers length, prelude crc) | headers | payload | message crc
+Ref: https://docs.aws.amazon.com/transcribe/latest/dg/streaming-setting-up.html#streaming-event-stream
+
+Received bytes are appended to 1 reusable buffer, and messages are read from it through a memoryview - the rest of the buffer isn't copied for every message.
+"""
+
+import struct
+from binascii import crc32
+from typing import Dict, List, Union
+
+_PRELUDE_LENGTH = 12
+_MESSAGE_CRC_LENGTH = 4
+_MAX_HEADERS_LENGTH = 128 * 1024  # 128 KB
+_MAX_PAYLOAD_LENGTH = 24 * 1024 * 1024  # 24 MB
+
+_PRELUDE = struct.Struct("!III")
+_UINT16 = struct.Struct("!H")
+_UINT32 = struct.Struct("!I")
+# header value type -> fixed size value format
+_FIXED_SIZE_HEADER_VALUES = {
+    2: struct.Struct("!b"),  # byte
+    3: struct.Struct("!h"),  # short
+    4: struct.Struct("!i"),  # integer
+    5: struct.Struct("!q"),  # long
+    8: struct.Struct("!q"),  # timestamp (ms since epoch)
+}
+_HEADER_VALUE_TYPE_BYTE_ARRAY = 6
+_HEADER_VALUE_TYPE_STRING = 7
+_HEADER_VALUE_TYPE_UUID = 9
+
+EventStreamHeaderValue = Union[bool, int, bytes, str]
+
+
+class AWSEventStreamError(Exception):
+    """
+    Raised on a malformed event stream (checksum mismatch, invalid lengths / header types)
+    """
+
+    pass
+
+
+class AWSEventStreamMessage:
+    __slots__ = ("headers", "payload")
+
+    def __init__(self, headers: Dict[str, EventStreamHeaderValue], payload: bytes):
+        self.headers = headers
+        self.payload = payload
+
+
+def _parse_headers(
+    data: memoryview, start: int, end: int
+) -> Dict[str, EventStreamHeaderValue]:
+    headers: Dict[str, EventStreamHeaderValue] = {}
+    pos = start
+    while pos < end:
+        name_length = data[pos]
+        pos += 1
+        name = bytes(data[pos : pos + name_length]).decode("utf-8")
+        pos += name_length
+        value_type = data[pos]
+        pos += 1
+        value: EventStreamHeaderValue
+        if value_type == _HEADER_VALUE_TYPE_STRING:
+            (value_length,) = _UINT16.unpack_from(data, pos)
+            pos += 2
+            value = bytes(data[pos : pos + value_length]).decode("utf-8")
+            pos += value_length
+        elif value_type == _HEADER_VALUE_TYPE_BYTE_ARRAY:
+            (value_length,) = _UINT16.unpack_from(data, pos)
+            pos += 2
+            value = bytes(data[pos : pos + value_length])
+            pos += value_length
+        elif value_type == 0 or value_type == 1:
+            value = value_type == 0
+        elif value_type in _FIXED_SIZE_HEADER_VALUES:
+            value_struct = _FIXED_SIZE_HEADER_VALUES[value_type]
+            (value,) = value_struct.unpack_from(data, pos)
+            pos += value_struct.size
+        elif value_type == _HEADER_VALUE_TYPE_UUID:
+            value = bytes(data[pos : pos + 16])
+            pos += 16
+        else:
+            raise AWSEventStreamError(
+                "Invalid event stream header value type={} for header={}".format(
+                    value_type, name
+                )
+            )
+        if name in headers:
+            raise AWSEventStreamError("Duplicate event stream header={}".format(name))
+        headers[name] = value
+    if pos != end:
+        raise AWSEventStreamError("Event stream headers overrun the headers length")
+    return headers
+
+
+class AWSEventStreamParser:
+    """
+    Feed it the response bytes as they arrive - `feed()` returns the messages completed so far.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[AWSEventStreamMessage]:
+        buffer = self._buffer
+        buffer += data
+        messages: List[AWSEventStreamMessage] = []
+        offset = 0
+        view = memoryview(buffer)
+        try:
+            while len(buffer) - offset >= _PRELUDE_LENGTH:
+                total_length, headers_length, prelude_crc = _PRELUDE.unpack_from(
+                    buffer, offset
+                )
+                if crc32(view[offset : offset + 8]) != prelude_crc:
+                    raise AWSEventStreamError("Event stream prelude checksum mismatch")
+                payload_length = (
+                    total_length
+                    - headers_length
+                    - _PRELUDE_LENGTH
+                    - _MESSAGE_CRC_LENGTH
+                )
+                if headers_length > _MAX_HEADERS_LENGTH:
+                    raise AWSEventStreamError(
+                        "Invalid event stream headers length={}".format(headers_length)
+                    )
+                if payload_length < 0 or payload_length > _MAX_PAYLOAD_LENGTH:
+                    raise AWSEventStreamError(
+                        "Invalid event stream payload length={}".format(payload_length)
+                    )
+                if len(buffer) - offset < total_length:
+                    break  # wait for the rest of the message
+
+                headers_end = offset + _PRELUDE_LENGTH + headers_length
+                payload_end = headers_end + payload_length
+                (message_crc,) = _UINT32.unpack_from(buffer, payload_end)
+                # the message crc covers everything before it, incl. the prelude
+                if crc32(view[offset:payload_end]) != message_crc:
+                    raise AWSEventStreamError("Event stream message checksum mismatch")
+                messages.append(
+                    AWSEventStreamMessage(
+                        headers=_parse_headers(
+                            view, offset + _PRELUDE_LENGTH, headers_end
+                        ),
+                        payload=bytes(view[headers_end:payload_end]),
+                    )
+                )
+                offset += total_length
+        finally:
+            view.release()
+        if offset:
+            # bytearray deletes from the front in O(1) - no copy of the remaining bytes
+            del buffer[:offset]
+        return messages
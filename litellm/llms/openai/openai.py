@@ -1563,6 +1563,39 @@ class OpenAIFilesAPI(BaseLLM):
 
         return HttpxBinaryResponseContent(response=response.response)
 
+    async def afile_content_stream(
+        self,
+        file_content_request: FileContentRequest,
+        api_base: str,
+        api_key: Optional[str],
+        timeout: Union[float, httpx.Timeout],
+        max_retries: Optional[int],
+        organization: Optional[str],
+        chunk_size: Optional[int] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yields the file content in chunks, without reading the whole file into memory
+        """
+        openai_client = self.get_openai_client(
+            api_key=api_key,
+            api_base=api_base,
+            timeout=timeout,
+            max_retries=max_retries,
+            organization=organization,
+            client=client,
+            _is_async=True,
+        )
+        if not isinstance(openai_client, AsyncOpenAI):
+            raise ValueError(
+                "OpenAI client is not an instance of AsyncOpenAI. Make sure you passed an AsyncOpenAI client."
+            )
+        async with openai_client.files.with_streaming_response.content(
+            **file_content_request
+        ) as response:
+            async for chunk in response.iter_bytes(chunk_size):
+                yield chunk
+
     async def aretrieve_file(
         self,
         file_id: str,
@@ -97,7 +97,7 @@ from litellm.utils import (
     validate_chat_completion_tool_choice,
 )
 
-from ._logging import verbose_logger
+from ._logging import lazy_verbose_logger, verbose_logger
 from .caching.caching import disable_cache, enable_cache, update_cache
 from .litellm_core_utils.fallback_utils import (
     async_completion_with_fallbacks,
@@ -493,11 +493,13 @@ async def acompletion(
 
 async def _async_streaming(response, model, custom_llm_provider, args):
     try:
-        print_verbose(f"received response in _async_streaming: {response}")
+        lazy_verbose_logger.print_verbose(
+            "received response in _async_streaming: %s", response
+        )
         if asyncio.iscoroutine(response):
             response = await response
         async for line in response:
-            print_verbose(f"line in async streaming: {line}")
+            lazy_verbose_logger.print_verbose("line in async streaming: %s", line)
             yield line
     except Exception as e:
         custom_llm_provider = custom_llm_provider or "openai"
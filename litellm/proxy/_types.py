@@ -1283,6 +1283,33 @@ class ConfigGeneralSettings(LiteLLMPydanticObjectBase):
     health_check_interval: int = Field(
         300, description="background health check interval in seconds"
     )
+    health_check_max_concurrency: int = Field(
+        10, description="max number of deployments health checked at the same time"
+    )
+    health_check_jitter: float = Field(
+        0.1,
+        description="background health checks run every `health_check_interval` +/- this fraction of it",
+    )
+    passive_health_checks: bool = Field(
+        True,
+        description="derive the health of deployments with live traffic from their requests - background health checks only call idle deployments",
+    )
+    raw_sse_passthrough: bool = Field(
+        False,
+        description="forward the SSE bytes of openai-compatible streaming /chat/completions responses unchanged, when no streaming hooks need the parsed chunks",
+    )
+    stream_coalescing_window_ms: float = Field(
+        0,
+        description="buffer the SSE events of streaming responses for up to this many ms, and write them as 1 message. 0 disables coalescing. The first event is always written immediately",
+    )
+    stream_coalescing_route_window_ms: Optional[Dict[str, float]] = Field(
+        None,
+        description="per route `stream_coalescing_window_ms` - e.g. {'/v1/chat/completions': 10}",
+    )
+    stream_coalescing_max_bytes: int = Field(
+        8192,
+        description="write the coalesced SSE events once this many bytes are buffered",
+    )
     alerting: Optional[List] = Field(
         None,
         description="List of alerting integrations. Today, just slack - `alerting: ['slack']`",
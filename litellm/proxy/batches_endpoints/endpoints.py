@@ -5,18 +5,31 @@
 import asyncio
 
 ######################################################################
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
 
 import litellm
 from litellm._logging import verbose_proxy_logger
+from litellm.batches.local_batches import (
+    LOCAL_BATCH_ENDPOINT_TO_ROUTE,
+    is_local_file_id,
+    local_batches_instance,
+    validate_local_batch_request_body,
+)
 from litellm.batches.main import (
     CancelBatchRequest,
     CreateBatchRequest,
     RetrieveBatchRequest,
 )
 from litellm.proxy._types import *
+from litellm.proxy.auth.auth_checks import (
+    _team_model_access_check,
+    can_key_call_model,
+    can_user_call_model,
+    get_user_object,
+)
+from litellm.proxy.auth.auth_utils import is_request_body_safe
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 from litellm.proxy.common_utils.http_parsing_utils import _read_request_body
 from litellm.proxy.common_utils.openai_endpoint_utils import (
@@ -28,6 +41,118 @@ from litellm.proxy.utils import handle_exception_on_proxy
 router = APIRouter()
 
 
+def _get_local_batch_models(
+    input_file_id: str,
+    endpoint: str,
+    general_settings: dict,
+    llm_router: Optional[litellm.Router],
+) -> Set[str]:
+    """
+    Runs the /chat/completions request body checks on every line of a local batch input file.
+
+    Returns the models the batch requests are made with. Lines that are not valid JSON are skipped - the batch writes an error for them.
+    """
+    models: Set[str] = set()
+    for line in local_batches_instance.store.iter_file_lines(input_file_id):
+        try:
+            body = json.loads(line)["body"]
+        except Exception:
+            continue
+        model = body.get("model") if isinstance(body, dict) else None
+        try:
+            if isinstance(body, dict):
+                is_request_body_safe(
+                    request_body=body,
+                    general_settings=general_settings,
+                    llm_router=llm_router,
+                    model=model or "",
+                )
+            validate_local_batch_request_body(endpoint=endpoint, body=body)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail={"error": str(e)})
+        if model is not None:
+            models.add(str(model))
+    return models
+
+
+async def _check_local_batch_requests(
+    input_file_id: str,
+    endpoint: str,
+    user_api_key_dict: UserAPIKeyAuth,
+    general_settings: dict,
+    llm_router: Optional[litellm.Router],
+):
+    """
+    Local batches run every input file line through the proxy's router - check each line like a /chat/completions request.
+
+    Raises HTTPException if a line has an unsafe / unsupported param, or a model the key / team / user can't call.
+    """
+    from litellm.proxy.proxy_server import (
+        llm_model_list,
+        prisma_client,
+        proxy_logging_obj,
+        user_api_key_cache,
+    )
+
+    if endpoint not in LOCAL_BATCH_ENDPOINT_TO_ROUTE:
+        return  # rejected when the batch is created
+    models = await asyncio.get_running_loop().run_in_executor(
+        None,
+        _get_local_batch_models,
+        input_file_id,
+        endpoint,
+        general_settings,
+        llm_router,
+    )
+    if not models:
+        return
+
+    team_object: Optional[LiteLLM_TeamTable] = None
+    if user_api_key_dict.team_id is not None:
+        team_object = LiteLLM_TeamTable(
+            team_id=user_api_key_dict.team_id,
+            models=user_api_key_dict.team_models,
+        )
+    user_object: Optional[LiteLLM_UserTable] = None
+    if team_object is None and user_api_key_dict.user_id is not None:
+        try:
+            user_object = await get_user_object(
+                user_id=user_api_key_dict.user_id,
+                prisma_client=prisma_client,
+                user_api_key_cache=user_api_key_cache,
+                user_id_upsert=False,
+                proxy_logging_obj=proxy_logging_obj,
+            )
+        except Exception:
+            user_object = (
+                None  # same as user_api_key_auth - no user object, no user model check
+            )
+
+    for model in sorted(models):
+        try:
+            if "all-team-models" not in user_api_key_dict.models:
+                await can_key_call_model(
+                    model=model,
+                    llm_model_list=llm_model_list,
+                    valid_token=user_api_key_dict,
+                    llm_router=llm_router,
+                )
+            _team_model_access_check(
+                model=model,
+                team_object=team_object,
+                llm_router=llm_router,
+                team_model_aliases=user_api_key_dict.team_model_aliases,
+            )
+            if team_object is None:
+                await can_user_call_model(
+                    model=model, llm_router=llm_router, user_object=user_object
+                )
+        except ProxyException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=401, detail={"error": str(e)})
+
+
 @router.post(
     "/{provider}/v1/batches",
     dependencies=[Depends(user_api_key_auth)],
@@ -104,6 +229,14 @@ async def create_batch(
             provider or data.pop("custom_llm_provider", None) or "openai"
         )
         _create_batch_data = CreateBatchRequest(**data)
+        if is_local_file_id(_create_batch_data.get("input_file_id")):
+            await _check_local_batch_requests(
+                input_file_id=_create_batch_data["input_file_id"],
+                endpoint=_create_batch_data["endpoint"],
+                user_api_key_dict=user_api_key_dict,
+                general_settings=general_settings,
+                llm_router=llm_router,
+            )
         if (
             litellm.enable_loadbalancing_on_batch_endpoints is True
             and is_router_model
@@ -118,6 +251,11 @@ async def create_batch(
                 )
 
             response = await llm_router.acreate_batch(**_create_batch_data)  # type: ignore
+        elif custom_llm_provider == "local":
+            # run the batch requests through the proxy's router
+            response = await litellm.acreate_batch(
+                custom_llm_provider=custom_llm_provider, llm_router=llm_router, **_create_batch_data  # type: ignore
+            )
         else:
             response = await litellm.acreate_batch(
                 custom_llm_provider=custom_llm_provider, **_create_batch_data  # type: ignore
@@ -231,10 +231,12 @@ def initialize_callbacks_on_proxy(  # noqa: PLR0915
             from litellm.proxy.proxy_server import app
 
             verbose_proxy_logger.debug("Starting Prometheus Metrics on /metrics")
-            from prometheus_client import make_asgi_app
+            from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+                get_prometheus_metrics_asgi_app,
+            )
 
             # Add prometheus asgi middleware to route /metrics requests
-            metrics_app = make_asgi_app()
+            metrics_app = get_prometheus_metrics_asgi_app()
             app.mount("/metrics", metrics_app)
     else:
         litellm.callbacks = [
@@ -0,0 +1,254 @@
+"""
+Raw SSE passthrough for streaming /chat/completions (`general_settings.raw_sse_passthrough: true`)
+
+For openai-compatible upstreams the upstream SSE bytes are forwarded to the client unchanged - no ModelResponseStream per chunk, no per-chunk hooks, no re-serializing each chunk.
+A side-channel parser reads only what logging + spend tracking need (content, tool calls, finish reason, usage) and the complete response is logged (+ cached, if caching is on) when the stream ends.
+
+Streams fall back to the regular (parsed) path when something needs the parsed chunks:
+- callbacks implementing `async_post_call_streaming_hook` (e.g. guardrails)
+- `litellm.post_call_rules`
+"""
+
+import asyncio
+import json
+import traceback
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+from openai import AsyncStream
+
+import litellm
+from litellm._logging import verbose_proxy_logger
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.litellm_logging import (
+    get_custom_logger_compatible_class,
+)
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.types.utils import ModelResponse, ModelResponseStream, Usage
+
+
+class _StreamedChoice:
+    __slots__ = ("content", "other_deltas", "finish_reason")
+
+    def __init__(self) -> None:
+        self.content: List[str] = []
+        self.other_deltas: List[dict] = []  # tool calls, function calls, etc.
+        self.finish_reason: Optional[str] = None
+
+
+class OpenAIStreamSniffer:
+    """
+    Reads the content, tool calls, finish reason and usage of an openai chat completion stream from its SSE bytes.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self.first_chunk: Optional[dict] = None
+        self.choices: Dict[int, _StreamedChoice] = {}
+        self.usage: Optional[dict] = None
+
+    def feed(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        start = 0
+        while True:
+            end = buffer.find(b"\n", start)
+            if end == -1:
+                break
+            if buffer.startswith(b"data:", start):
+                payload = buffer[start + 5 : end].strip()
+                if payload and payload != b"[DONE]":
+                    self._process_chunk(payload)
+            start = end + 1
+        if start:
+            del buffer[:start]
+
+    def _process_chunk(self, payload: bytearray) -> None:
+        try:
+            chunk = json.loads(payload)
+        except ValueError:
+            verbose_proxy_logger.debug(
+                "OpenAIStreamSniffer: skipping non-json SSE data - %s", payload
+            )
+            return
+        if not isinstance(chunk, dict):
+            return
+        if self.first_chunk is None:
+            self.first_chunk = chunk
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+        for choice in chunk.get("choices") or []:
+            index = choice.get("index", 0)
+            streamed_choice = self.choices.get(index)
+            if streamed_choice is None:
+                streamed_choice = self.choices[index] = _StreamedChoice()
+            delta = choice.get("delta") or {}
+            content = delta.get("content")
+            if content:
+                streamed_choice.content.append(content)
+            other_delta = {
+                key: value
+                for key, value in delta.items()
+                if key not in ("content", "role") and value is not None
+            }
+            if other_delta:
+                streamed_choice.other_deltas.append(other_delta)
+            if choice.get("finish_reason"):
+                streamed_choice.finish_reason = choice["finish_reason"]
+
+    def get_complete_streaming_response(
+        self, messages: Optional[list] = None
+    ) -> Optional[ModelResponse]:
+        """
+        Build the complete response for logging - 1 chunk per choice (+ 1 per tool call / function call delta), combined with `litellm.stream_chunk_builder`
+        """
+        if self.first_chunk is None:
+            return None
+        chunk_params = {
+            "id": self.first_chunk.get("id"),
+            "created": self.first_chunk.get("created"),
+            "model": self.first_chunk.get("model"),
+            "system_fingerprint": self.first_chunk.get("system_fingerprint"),
+        }
+        chunks: List[ModelResponseStream] = []
+        for index, streamed_choice in sorted(self.choices.items()):
+            chunks.append(
+                ModelResponseStream(
+                    **chunk_params,
+                    choices=[
+                        {
+                            "index": index,
+                            "delta": {
+                                "role": "assistant",
+                                "content": "".join(streamed_choice.content) or None,
+                            },
+                        }
+                    ],
+                )
+            )
+            for delta in streamed_choice.other_deltas:
+                chunks.append(
+                    ModelResponseStream(
+                        **chunk_params, choices=[{"index": index, "delta": delta}]
+                    )
+                )
+            chunks.append(
+                ModelResponseStream(
+                    **chunk_params,
+                    choices=[
+                        {
+                            "index": index,
+                            "delta": {},
+                            "finish_reason": streamed_choice.finish_reason or "stop",
+                        }
+                    ],
+                )
+            )
+        if self.usage is not None:
+            chunks.append(
+                ModelResponseStream(
+                    **chunk_params, choices=[], usage=Usage(**self.usage)
+                )
+            )
+        complete_streaming_response = litellm.stream_chunk_builder(
+            chunks=chunks, messages=messages
+        )
+        if isinstance(complete_streaming_response, ModelResponse):
+            return complete_streaming_response
+        return None
+
+
+def _has_streaming_hooks() -> bool:
+    if litellm.post_call_rules:
+        return True
+    for callback in litellm.callbacks:
+        _callback: Any = callback
+        if isinstance(callback, str):
+            _callback = get_custom_logger_compatible_class(callback)  # type: ignore
+        if (
+            isinstance(_callback, CustomLogger)
+            and type(_callback).async_post_call_streaming_hook
+            is not CustomLogger.async_post_call_streaming_hook
+        ):
+            return True
+    return False
+
+
+def get_raw_sse_passthrough_response(response: Any) -> Optional[httpx.Response]:
+    """
+    Returns the upstream http response, if the stream can be forwarded as raw SSE bytes. Else None.
+    """
+    if not isinstance(response, CustomStreamWrapper):
+        return None
+    # streams returning openai chat completion chunks - openai-compatible providers stream through the openai client too
+    custom_llm_provider = (
+        response.logging_obj.model_call_details.get("custom_llm_provider")
+        or response.custom_llm_provider
+    )
+    if (
+        custom_llm_provider != "openai"
+        and custom_llm_provider not in litellm.openai_compatible_providers
+    ):
+        return None
+    completion_stream = response.completion_stream
+    # chunks already read (e.g. by a mid-stream fallback) would be lost
+    if not isinstance(completion_stream, AsyncStream) or response.chunks:
+        return None
+    if _has_streaming_hooks():
+        return None
+    return completion_stream.response
+
+
+def log_raw_sse_stream_first_chunk(response: CustomStreamWrapper) -> None:
+    logging_obj = response.logging_obj
+    if logging_obj.completion_start_time is None:
+        logging_obj.completion_start_time = datetime.now()
+        logging_obj.model_call_details["completion_start_time"] = (
+            logging_obj.completion_start_time
+        )
+
+
+def log_raw_sse_stream_success(
+    response: CustomStreamWrapper, sniffer: OpenAIStreamSniffer
+) -> None:
+    complete_streaming_response = sniffer.get_complete_streaming_response(
+        messages=response.messages
+    )
+    caching_handler = response.logging_obj._llm_caching_handler
+    if (
+        litellm.cache is not None
+        and caching_handler is not None
+        and complete_streaming_response is not None
+    ):
+        asyncio.create_task(
+            caching_handler.async_set_cache(
+                result=complete_streaming_response,
+                original_function=caching_handler.original_function,
+                kwargs=caching_handler.request_kwargs,
+            )
+        )
+    asyncio.create_task(
+        response.logging_obj.async_success_handler(
+            complete_streaming_response,
+            cache_hit=False,
+            start_time=None,
+            end_time=None,
+        )
+    )
+    executor.submit(
+        response.logging_obj.success_handler,
+        complete_streaming_response,
+        cache_hit=False,
+        start_time=None,
+        end_time=None,
+    )
+
+
+def log_raw_sse_stream_failure(response: CustomStreamWrapper, e: Exception) -> None:
+    traceback_exception = traceback.format_exc()
+    asyncio.create_task(
+        response.logging_obj.async_failure_handler(e, traceback_exception)
+    )
+    executor.submit(response.logging_obj.failure_handler, e, traceback_exception)
@@ -0,0 +1,161 @@
+"""
+Coalesce the SSE events of streaming responses into fewer, larger writes.
+
+Fast providers (Groq, Cerebras, local vLLM) stream thousands of token-sized chunks per second - every chunk is 1 ASGI message, and the per-message overhead of the server dominates proxy CPU.
+Events are buffered for a short window (`window_ms`) or until `max_bytes` are buffered, then written as 1 message.
+
+- the first event is always written immediately - time to first token is unaffected
+- an event is never held longer than the window, even when the upstream pauses
+
+Config (window_ms = 0 disables coalescing):
+- general_settings.stream_coalescing_window_ms: default window
+- general_settings.stream_coalescing_route_window_ms: {route: window_ms} - per route window
+- general_settings.stream_coalescing_max_bytes: flush once this many bytes are buffered
+- key metadata `stream_coalescing_window_ms`: per key window
+"""
+
+import asyncio
+import math
+from typing import AsyncIterator, List, Optional, Union
+from urllib.parse import urlparse
+
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import DEFAULT_STREAM_COALESCING_MAX_BYTES
+from litellm.proxy._types import UserAPIKeyAuth
+
+SSEChunk = Union[str, bytes]
+
+
+def _get_request_route(request_data: dict) -> Optional[str]:
+    url = (request_data.get("proxy_server_request") or {}).get("url")
+    if not url:
+        return None
+    return urlparse(url).path
+
+
+def get_stream_coalescing_window_ms(
+    general_settings: dict,
+    user_api_key_dict: UserAPIKeyAuth,
+    request_data: dict,
+) -> float:
+    """
+    Window for the request - key metadata > route > default
+    """
+    key_window_ms = (user_api_key_dict.metadata or {}).get(
+        "stream_coalescing_window_ms"
+    )
+    if key_window_ms is not None:
+        try:
+            window_ms = float(key_window_ms)
+        except (TypeError, ValueError):
+            window_ms = math.nan
+        if math.isfinite(window_ms):
+            return window_ms
+        # set by whoever can edit the key - don't fail the request on a bad value
+        verbose_proxy_logger.warning(
+            "Invalid key metadata stream_coalescing_window_ms=%r - using the default window",
+            key_window_ms,
+        )
+    route_window_ms = general_settings.get("stream_coalescing_route_window_ms") or {}
+    if route_window_ms:
+        route = _get_request_route(request_data)
+        if route is not None and route in route_window_ms:
+            return float(route_window_ms[route])
+    return float(general_settings.get("stream_coalescing_window_ms") or 0)
+
+
+def _join(chunks: List[SSEChunk]) -> SSEChunk:
+    if isinstance(chunks[0], bytes):
+        return b"".join(chunks)  # type: ignore
+    return "".join(chunks)  # type: ignore
+
+
+class _CoalescingBuffer:
+    """
+    Filled by 1 background task per stream - reading an event costs a list append, no task / timer per event.
+    """
+
+    def __init__(self, window: float, max_bytes: int):
+        self.window = window
+        self.max_bytes = max_bytes
+        self.chunks: List[SSEChunk] = []
+        self.buffered_bytes = 0
+        self.flush_at = 0.0
+        self.done = False
+        self.exception: Optional[BaseException] = None
+        self.has_data = asyncio.Event()
+        self.full = asyncio.Event()
+        self.drained = asyncio.Event()
+
+    async def fill(self, iterator: AsyncIterator[SSEChunk]):
+        loop = asyncio.get_running_loop()
+        try:
+            async for chunk in iterator:
+                self.chunks.append(chunk)
+                self.buffered_bytes += len(chunk)
+                if len(self.chunks) == 1:
+                    self.flush_at = loop.time() + self.window
+                    self.has_data.set()
+                if self.buffered_bytes >= self.max_bytes:
+                    # backpressure - don't read ahead of a slow client
+                    self.drained.clear()
+                    self.full.set()
+                    await self.drained.wait()
+        except Exception as e:
+            self.exception = e
+        finally:
+            self.done = True
+            self.has_data.set()
+            self.full.set()
+
+    def take(self) -> List[SSEChunk]:
+        chunks = self.chunks
+        self.chunks = []
+        self.buffered_bytes = 0
+        self.has_data.clear()
+        if not self.done:
+            self.full.clear()
+        self.drained.set()
+        return chunks
+
+
+async def coalesce_sse_stream(
+    stream: AsyncIterator[SSEChunk],
+    window_ms: float,
+    max_bytes: int = DEFAULT_STREAM_COALESCING_MAX_BYTES,
+) -> AsyncIterator[SSEChunk]:
+    iterator = stream.__aiter__()
+    try:
+        first_chunk = await iterator.__anext__()
+    except StopAsyncIteration:
+        return
+    yield first_chunk  # flush the first chunk immediately - keeps time to first token
+
+    loop = asyncio.get_running_loop()
+    buffer = _CoalescingBuffer(window=window_ms / 1000, max_bytes=max_bytes)
+    fill_task = asyncio.create_task(buffer.fill(iterator))
+    try:
+        while True:
+            await buffer.has_data.wait()
+            if not buffer.full.is_set():
+                try:
+                    await asyncio.wait_for(
+                        buffer.full.wait(),
+                        timeout=max(buffer.flush_at - loop.time(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            chunks = buffer.take()
+            if chunks:
+                yield _join(chunks)
+            if buffer.done and not buffer.chunks:
+                break
+        if buffer.exception is not None:
+            raise buffer.exception
+    finally:
+        if not fill_task.done():
+            fill_task.cancel()
+            try:
+                await fill_task
+            except asyncio.CancelledError:
+                pass
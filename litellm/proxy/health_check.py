@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import random
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple, Union
 
 import litellm
 
@@ -79,13 +79,11 @@ async def run_with_timeout(task, timeout):
         return {"error": "Timeout exceeded"}
 
 
-async def _perform_health_check(model_list: list, details: Optional[bool] = True):
+async def _run_health_check_for_deployment(model: dict) -> Union[dict, Exception]:
     """
-    Perform a health check for each model in the list.
+    Run the health check for 1 deployment. Returns the health check result, or the exception it raised.
     """
-
-    tasks = []
-    for model in model_list:
+    try:
         litellm_params = model["litellm_params"]
         model_info = model.get("model_info", {})
         mode = model_info.get("mode", None)
@@ -94,7 +92,7 @@ async def _perform_health_check(model_list: list, details: Optional[bool] = True
         )
         timeout = model_info.get("health_check_timeout") or HEALTH_CHECK_TIMEOUT_SECONDS
 
-        task = run_with_timeout(
+        return await run_with_timeout(
             litellm.ahealth_check(
                 model["litellm_params"],
                 mode=mode,
@@ -103,27 +101,61 @@ async def _perform_health_check(model_list: list, details: Optional[bool] = True
             ),
             timeout,
         )
+    except Exception as e:
+        return e
+
+
+def _get_health_check_endpoint_data(
+    model: dict, is_healthy: Any, details: Optional[bool] = True
+) -> Tuple[bool, dict]:
+    """
+    Returns (is healthy, endpoint data to display) for a health check result
+    """
+    litellm_params = model["litellm_params"]
 
-        tasks.append(task)
+    if isinstance(is_healthy, dict) and "error" not in is_healthy:
+        return True, _clean_endpoint_data({**litellm_params, **is_healthy}, details)
+    elif isinstance(is_healthy, dict):
+        return False, _clean_endpoint_data({**litellm_params, **is_healthy}, details)
+    else:
+        return False, _clean_endpoint_data(litellm_params, details)
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+async def _perform_health_check(
+    model_list: list,
+    details: Optional[bool] = True,
+    max_concurrency: Optional[int] = None,
+):
+    """
+    Perform a health check for each model in the list.
+
+    `max_concurrency` - max number of health checks running at the same time (None = no limit)
+    """
+    semaphore = (
+        asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+    )
+
+    async def _run(model: dict):
+        if semaphore is None:
+            return await _run_health_check_for_deployment(model)
+        async with semaphore:
+            return await _run_health_check_for_deployment(model)
+
+    results = await asyncio.gather(
+        *[_run(model) for model in model_list], return_exceptions=True
+    )
 
     healthy_endpoints = []
     unhealthy_endpoints = []
 
     for is_healthy, model in zip(results, model_list):
-        litellm_params = model["litellm_params"]
-
-        if isinstance(is_healthy, dict) and "error" not in is_healthy:
-            healthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
-            )
-        elif isinstance(is_healthy, dict):
-            unhealthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
-            )
+        healthy, endpoint_data = _get_health_check_endpoint_data(
+            model, is_healthy, details
+        )
+        if healthy:
+            healthy_endpoints.append(endpoint_data)
         else:
-            unhealthy_endpoints.append(_clean_endpoint_data(litellm_params, details))
+            unhealthy_endpoints.append(endpoint_data)
 
     return healthy_endpoints, unhealthy_endpoints
 
@@ -149,10 +181,14 @@ async def perform_health_check(
     model: Optional[str] = None,
     cli_model: Optional[str] = None,
     details: Optional[bool] = True,
+    max_concurrency: Optional[int] = None,
 ):
     """
     Perform a health check on the system.
 
+    `max_concurrency` - max number of health checks running at the same time. None (default) = no limit, the on-demand `/health` checks all deployments at once.
+    The background health checks are limited by `HealthCheckScheduler`.
+
     Returns:
         (bool): True if the health check passes, False otherwise.
     """
@@ -176,7 +212,7 @@ async def perform_health_check(
         model_list=model_list
     )  # filter duplicate deployments (e.g. when model alias'es are used)
     healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
-        model_list, details
+        model_list, details, max_concurrency=max_concurrency
     )
 
     return healthy_endpoints, unhealthy_endpoints
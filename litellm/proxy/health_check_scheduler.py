@@ -0,0 +1,322 @@
+"""
+Background health check scheduler for the proxy (`background_health_checks: true`).
+
+- every deployment is checked every `health_check_interval` seconds (`model_info.health_check_interval` overrides it per deployment), +/- `health_check_jitter` of the interval - so checks are spread out instead of firing at once
+- at most `health_check_max_concurrency` health checks run at the same time
+- passive health checks: a deployment that served live traffic since its last check gets its health from those requests (router success / failure events) - active health checks (real completion / embedding calls) only run for idle deployments
+- results are shared across proxy workers through redis - a worker reuses a result another worker wrote in the current interval, instead of checking the deployment again
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.caching.redis_cache import RedisCache
+from litellm.constants import (
+    HEALTH_CHECK_JITTER,
+    HEALTH_CHECK_MAX_CONCURRENCY,
+    HEALTH_CHECK_SCHEDULER_MIN_SLEEP_SECONDS,
+)
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.proxy.health_check import (
+    _clean_endpoint_data,
+    _get_health_check_endpoint_data,
+    _run_health_check_for_deployment,
+    filter_deployments_by_id,
+)
+
+HEALTH_CHECK_REDIS_KEY_PREFIX = "litellm:health_check"
+
+# errors caused by the request, not the deployment - these don't make a deployment unhealthy
+_REQUEST_ERROR_STATUS_CODES = {400, 413, 422}
+
+
+def _is_deployment_error(exception: Any) -> bool:
+    status_code = getattr(exception, "status_code", None)
+    return not (
+        isinstance(status_code, int) and status_code in _REQUEST_ERROR_STATUS_CODES
+    )
+
+
+class DeploymentHealthState:
+    def __init__(self, deployment: dict, next_check_time: float):
+        self.deployment = deployment
+        self.next_check_time = next_check_time
+        self.last_checked_at: Optional[float] = None
+        self.is_healthy: Optional[bool] = None
+        self.endpoint_data: Optional[dict] = None
+        # live traffic - from the router's success / failure events
+        self.last_success_time: Optional[float] = None
+        self.last_failure_time: Optional[float] = None
+        self.last_failure_error: Optional[str] = None
+
+
+class HealthCheckScheduler(CustomLogger):
+    def __init__(
+        self,
+        model_list: List[dict],
+        interval: float,
+        max_concurrency: int = HEALTH_CHECK_MAX_CONCURRENCY,
+        jitter: float = HEALTH_CHECK_JITTER,
+        passive_health_checks: bool = True,
+        details: Optional[bool] = True,
+        redis_cache: Optional[RedisCache] = None,
+    ):
+        super().__init__()
+        self.interval = float(interval)
+        self.max_concurrency = max_concurrency
+        self.jitter = jitter
+        self.passive_health_checks = passive_health_checks
+        self.details = details
+        self.redis_cache = redis_cache
+        self.started_at = time.time()
+        self.deployments: Dict[str, DeploymentHealthState] = {}
+        for deployment in filter_deployments_by_id(model_list=model_list):
+            deployment_id = (deployment.get("model_info") or {}).get("id")
+            if deployment_id is None:
+                continue
+            deployment_id = str(deployment_id)
+            self.deployments[deployment_id] = DeploymentHealthState(
+                deployment=deployment,
+                # spread the first checks over the first `jitter` of the interval
+                next_check_time=self.started_at
+                + random.uniform(0, self._get_interval(deployment) * self.jitter),
+            )
+
+    def _get_interval(self, deployment: dict) -> float:
+        model_info = deployment.get("model_info") or {}
+        return float(model_info.get("health_check_interval") or self.interval)
+
+    def _schedule_next_check(self, state: DeploymentHealthState, checked_at: float):
+        interval = self._get_interval(state.deployment)
+        state.next_check_time = checked_at + interval * (
+            1 + random.uniform(-self.jitter, self.jitter)
+        )
+
+    def _set_result(
+        self,
+        state: DeploymentHealthState,
+        is_healthy: bool,
+        endpoint_data: dict,
+        checked_at: float,
+    ):
+        state.is_healthy = is_healthy
+        state.endpoint_data = endpoint_data
+        state.last_checked_at = checked_at
+        self._schedule_next_check(state, checked_at)
+
+    ## PASSIVE HEALTH CHECKS ##
+
+    def _record_event(self, kwargs: dict, exception: Optional[Any] = None):
+        model_info = (kwargs.get("litellm_params") or {}).get("model_info") or {}
+        state = self.deployments.get(str(model_info.get("id")))
+        if state is None:
+            return
+        if exception is None:
+            state.last_success_time = time.time()
+        elif _is_deployment_error(exception):
+            state.last_failure_time = time.time()
+            state.last_failure_error = str(exception)
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self._record_event(kwargs)
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self._record_event(kwargs)
+
+    def log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        self._record_event(kwargs, exception=kwargs.get("exception"))
+
+    async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
+        self._record_event(kwargs, exception=kwargs.get("exception"))
+
+    def _get_passive_health(
+        self, state: DeploymentHealthState, since: float
+    ) -> Optional[Tuple[bool, dict]]:
+        """
+        Health of the deployment from its live traffic since `since` - None if it was idle
+        """
+        last_success_time = (
+            state.last_success_time
+            if state.last_success_time is not None and state.last_success_time >= since
+            else None
+        )
+        last_failure_time = (
+            state.last_failure_time
+            if state.last_failure_time is not None and state.last_failure_time >= since
+            else None
+        )
+        if last_success_time is None and last_failure_time is None:
+            return None
+        # healthy if the latest request succeeded
+        is_healthy = last_failure_time is None or (
+            last_success_time is not None and last_success_time > last_failure_time
+        )
+        endpoint_data: dict = {
+            **state.deployment["litellm_params"],
+            "health_check_source": "passive",
+        }
+        if not is_healthy:
+            endpoint_data["error"] = state.last_failure_error
+        return is_healthy, _clean_endpoint_data(endpoint_data, self.details)
+
+    ## SHARED RESULTS (REDIS) ##
+
+    @staticmethod
+    def _get_redis_key(deployment_id: str) -> str:
+        return f"{HEALTH_CHECK_REDIS_KEY_PREFIX}:{deployment_id}"
+
+    async def _load_shared_results(
+        self, due: Dict[str, DeploymentHealthState]
+    ) -> List[str]:
+        """
+        Use results other workers wrote for the deployments that are due. Returns the deployment ids that got a result.
+        """
+        if self.redis_cache is None or not due:
+            return []
+        try:
+            values = await self.redis_cache.async_batch_get_cache(
+                key_list=[self._get_redis_key(deployment_id) for deployment_id in due]
+            )
+        except Exception as e:
+            verbose_proxy_logger.debug(
+                "HealthCheckScheduler: failed to read shared results - %s", str(e)
+            )
+            return []
+        loaded: List[str] = []
+        for deployment_id, state in due.items():
+            value = values.get(self._get_redis_key(deployment_id))
+            if not isinstance(value, dict):
+                continue
+            checked_at = value.get("checked_at") or 0
+            if checked_at > (state.last_checked_at or 0):
+                self._set_result(
+                    state,
+                    is_healthy=bool(value.get("is_healthy")),
+                    endpoint_data=value.get("endpoint_data") or {},
+                    checked_at=checked_at,
+                )
+                loaded.append(deployment_id)
+        return loaded
+
+    async def _save_shared_results(self, deployment_ids: List[str]):
+        if self.redis_cache is None or not deployment_ids:
+            return
+        try:
+            await self.redis_cache.async_set_cache_pipeline(
+                cache_list=[
+                    (
+                        self._get_redis_key(deployment_id),
+                        {
+                            "checked_at": self.deployments[
+                                deployment_id
+                            ].last_checked_at,
+                            "is_healthy": self.deployments[deployment_id].is_healthy,
+                            "endpoint_data": self.deployments[
+                                deployment_id
+                            ].endpoint_data,
+                        },
+                    )
+                    for deployment_id in deployment_ids
+                ],
+                ttl=self.interval,
+            )
+        except Exception as e:
+            verbose_proxy_logger.debug(
+                "HealthCheckScheduler: failed to write shared results - %s", str(e)
+            )
+
+    ## ACTIVE HEALTH CHECKS ##
+
+    async def _run_active_health_check(
+        self, deployment_id: str, semaphore: asyncio.Semaphore
+    ):
+        state = self.deployments[deployment_id]
+        async with semaphore:
+            result = await _run_health_check_for_deployment(state.deployment)
+        is_healthy, endpoint_data = _get_health_check_endpoint_data(
+            state.deployment, result, self.details
+        )
+        self._set_result(state, is_healthy, endpoint_data, checked_at=time.time())
+
+    async def run_due_checks(self) -> int:
+        """
+        Update the health of every deployment that is due. Returns the number of active health checks run.
+        """
+        now = time.time()
+        due = {
+            deployment_id: state
+            for deployment_id, state in self.deployments.items()
+            if state.next_check_time <= now
+        }
+        for deployment_id in await self._load_shared_results(due):
+            due.pop(deployment_id)
+
+        updated: List[str] = []
+        to_check: List[str] = []
+        for deployment_id, state in due.items():
+            passive_health = (
+                self._get_passive_health(
+                    state, since=state.last_checked_at or self.started_at
+                )
+                if self.passive_health_checks
+                else None
+            )
+            if passive_health is not None:
+                self._set_result(state, *passive_health, checked_at=now)
+                updated.append(deployment_id)
+            else:
+                to_check.append(deployment_id)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(
+            *[
+                self._run_active_health_check(deployment_id, semaphore)
+                for deployment_id in to_check
+            ]
+        )
+        await self._save_shared_results(updated + to_check)
+        return len(to_check)
+
+    def get_health_check_results(self) -> dict:
+        healthy_endpoints = []
+        unhealthy_endpoints = []
+        for state in self.deployments.values():
+            if state.endpoint_data is None:
+                continue
+            if state.is_healthy:
+                healthy_endpoints.append(state.endpoint_data)
+            else:
+                unhealthy_endpoints.append(state.endpoint_data)
+        return {
+            "healthy_endpoints": healthy_endpoints,
+            "unhealthy_endpoints": unhealthy_endpoints,
+            "healthy_count": len(healthy_endpoints),
+            "unhealthy_count": len(unhealthy_endpoints),
+        }
+
+    def get_seconds_until_next_check(self) -> float:
+        if not self.deployments:
+            return self.interval
+        next_check_time = min(
+            state.next_check_time for state in self.deployments.values()
+        )
+        return max(
+            next_check_time - time.time(), HEALTH_CHECK_SCHEDULER_MIN_SLEEP_SECONDS
+        )
+
+    async def run(self, health_check_results: dict):
+        """
+        Run health checks forever - `health_check_results` is updated in place after every round
+        """
+        while True:
+            try:
+                await self.run_due_checks()
+                health_check_results.update(self.get_health_check_results())
+            except Exception as e:
+                verbose_proxy_logger.exception(
+                    "HealthCheckScheduler: failed to run health checks - %s", str(e)
+                )
+            await asyncio.sleep(self.get_seconds_until_next_check())
@@ -7,6 +7,7 @@ from litellm.caching.caching import DualCache
 from litellm.integrations.custom_logger import Span
 from litellm.proxy._types import UserAPIKeyAuth
 from litellm.router_strategy.budget_limiter import RouterBudgetLimiting
+from litellm.router_utils.budget_spend_table import BudgetSpendTable
 from litellm.types.llms.openai import AllMessageValues
 from litellm.types.utils import (
     BudgetConfig,
@@ -26,7 +27,7 @@ class _PROXY_VirtualKeyModelMaxBudgetLimiter(RouterBudgetLimiting):
 
     def __init__(self, dual_cache: DualCache):
         self.dual_cache = dual_cache
-        self.redis_increment_operation_queue = []
+        self.spend_table = BudgetSpendTable()
 
     async def is_key_within_model_budget(
         self,
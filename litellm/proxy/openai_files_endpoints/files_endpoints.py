@@ -7,7 +7,7 @@
 
 import asyncio
 import traceback
-from typing import Optional
+from typing import IO, Optional
 
 import httpx
 from fastapi import (
@@ -58,7 +58,7 @@ def get_files_provider_config(
     custom_llm_provider: str,
 ):
     global files_config
-    if custom_llm_provider == "vertex_ai":
+    if custom_llm_provider in ["vertex_ai", "local"]:
         return None
     if files_config is None:
         raise ValueError("files_config is not set, set it on your config.yaml file.")
@@ -81,6 +81,15 @@ def get_first_json_object(file_content_bytes: bytes) -> Optional[dict]:
         return None
 
 
+def _read_first_line(file_content: IO[bytes]) -> bytes:
+    """
+    Read the first line of the uploaded file, then rewind it so it can be streamed to the provider
+    """
+    first_line = file_content.readline()
+    file_content.seek(0)
+    return first_line
+
+
 def get_model_from_json_obj(json_object: dict) -> Optional[str]:
     body = json_object.get("body", {}) or {}
     model = body.get("model")
@@ -154,9 +163,8 @@ async def create_file(
 
     data: Dict = {}
     try:
-        # Use orjson to parse JSON data, orjson speeds up requests significantly
-        # Read the file content
-        file_content = await file.read()
+        # Don't read the file into memory - it's streamed from the upload's spooled temp file
+        file_content = file.file
         custom_llm_provider = (
             provider
             or await get_custom_llm_provider_from_request_body(request=request)
@@ -183,7 +191,9 @@ async def create_file(
         router_model: Optional[str] = None
         is_router_model = False
         if litellm.enable_loadbalancing_on_batch_endpoints is True:
-            json_obj = get_first_json_object(file_content_bytes=file_content)
+            json_obj = get_first_json_object(
+                file_content_bytes=_read_first_line(file_content)
+            )
             if json_obj:
                 router_model = get_model_from_json_obj(json_object=json_obj)
                 is_router_model = is_known_model(
@@ -10,12 +10,12 @@ from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
 from litellm.litellm_core_utils.litellm_logging import (
     get_standard_logging_object_payload,
 )
-from litellm.llms.anthropic.chat.handler import (
-    ModelResponseIterator as AnthropicModelResponseIterator,
-)
 from litellm.llms.anthropic.chat.transformation import AnthropicConfig
 from litellm.proxy._types import PassThroughEndpointLoggingTypedDict
 from litellm.proxy.auth.auth_utils import get_end_user_id_from_request_body
+from litellm.proxy.pass_through_endpoints.streaming_accumulator import (
+    AnthropicPassThroughStreamingAccumulator,
+)
 from litellm.proxy.pass_through_endpoints.types import PassthroughStandardLoggingPayload
 from litellm.types.utils import ModelResponse, TextCompletionResponse
 
@@ -171,6 +171,27 @@ class AnthropicPassthroughLoggingHandler:
                 model=model,
             )
         )
+        return AnthropicPassthroughLoggingHandler._handle_logging_anthropic_streaming_response(
+            litellm_logging_obj=litellm_logging_obj,
+            model=model,
+            complete_streaming_response=complete_streaming_response,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    @staticmethod
+    def _handle_logging_anthropic_streaming_response(
+        litellm_logging_obj: LiteLLMLoggingObj,
+        model: str,
+        complete_streaming_response: Optional[
+            Union[ModelResponse, TextCompletionResponse]
+        ],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> PassThroughEndpointLoggingTypedDict:
+        """
+        Creates the standard logging object for a complete response, built from an Anthropic passthrough stream
+        """
         if complete_streaming_response is None:
             verbose_proxy_logger.error(
                 "Unable to build complete streaming response for Anthropic passthrough endpoint, not logging..."
@@ -206,30 +227,10 @@ class AnthropicPassthroughLoggingHandler:
         - Converts generic chunks to litellm chunks (OpenAI format)
         - Builds complete response from litellm chunks
         """
-        anthropic_model_response_iterator = AnthropicModelResponseIterator(
-            streaming_response=None,
-            sync_stream=False,
-        )
-        litellm_custom_stream_wrapper = litellm.CustomStreamWrapper(
-            completion_stream=anthropic_model_response_iterator,
+        streaming_accumulator = AnthropicPassThroughStreamingAccumulator(
+            litellm_logging_obj=litellm_logging_obj,
             model=model,
-            logging_obj=litellm_logging_obj,
-            custom_llm_provider="anthropic",
         )
-        all_openai_chunks = []
         for _chunk_str in all_chunks:
-            try:
-                generic_chunk = anthropic_model_response_iterator.convert_str_chunk_to_generic_chunk(
-                    chunk=_chunk_str
-                )
-                litellm_chunk = litellm_custom_stream_wrapper.chunk_creator(
-                    chunk=generic_chunk
-                )
-                if litellm_chunk is not None:
-                    all_openai_chunks.append(litellm_chunk)
-            except (StopIteration, StopAsyncIteration):
-                break
-        complete_streaming_response = litellm.stream_chunk_builder(
-            chunks=all_openai_chunks
-        )
-        return complete_streaming_response
+            streaming_accumulator.add_line(_chunk_str)
+        return streaming_accumulator.get_complete_streaming_response()
@@ -11,10 +11,10 @@ from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
 from litellm.litellm_core_utils.litellm_logging import (
     get_standard_logging_object_payload,
 )
-from litellm.llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
-    ModelResponseIterator as VertexModelResponseIterator,
-)
 from litellm.proxy._types import PassThroughEndpointLoggingTypedDict
+from litellm.proxy.pass_through_endpoints.streaming_accumulator import (
+    VertexPassThroughStreamingAccumulator,
+)
 from litellm.types.utils import (
     EmbeddingResponse,
     ImageResponse,
@@ -144,7 +144,6 @@ class VertexPassthroughLoggingHandler:
         - Creates standard logging object
         - Logs in litellm callbacks
         """
-        kwargs: Dict[str, Any] = {}
         model = VertexPassthroughLoggingHandler.extract_model_from_url(url_route)
         complete_streaming_response = (
             VertexPassthroughLoggingHandler._build_complete_streaming_response(
@@ -153,7 +152,30 @@ class VertexPassthroughLoggingHandler:
                 model=model,
             )
         )
+        return (
+            VertexPassthroughLoggingHandler._handle_logging_vertex_streaming_response(
+                litellm_logging_obj=litellm_logging_obj,
+                model=model,
+                complete_streaming_response=complete_streaming_response,
+                start_time=start_time,
+                end_time=end_time,
+            )
+        )
 
+    @staticmethod
+    def _handle_logging_vertex_streaming_response(
+        litellm_logging_obj: LiteLLMLoggingObj,
+        model: str,
+        complete_streaming_response: Optional[
+            Union[ModelResponse, TextCompletionResponse]
+        ],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> PassThroughEndpointLoggingTypedDict:
+        """
+        Creates the standard logging object for a complete response, built from a Vertex passthrough stream
+        """
+        kwargs: Dict[str, Any] = {}
         if complete_streaming_response is None:
             verbose_proxy_logger.error(
                 "Unable to build complete streaming response for Vertex passthrough endpoint, not logging..."
@@ -183,30 +205,13 @@ class VertexPassthroughLoggingHandler:
         litellm_logging_obj: LiteLLMLoggingObj,
         model: str,
     ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
-        vertex_iterator = VertexModelResponseIterator(
-            streaming_response=None,
-            sync_stream=False,
-        )
-        litellm_custom_stream_wrapper = litellm.CustomStreamWrapper(
-            completion_stream=vertex_iterator,
+        streaming_accumulator = VertexPassThroughStreamingAccumulator(
+            litellm_logging_obj=litellm_logging_obj,
             model=model,
-            logging_obj=litellm_logging_obj,
-            custom_llm_provider="vertex_ai",
         )
-        all_openai_chunks = []
         for chunk in all_chunks:
-            generic_chunk = vertex_iterator._common_chunk_parsing_logic(chunk)
-            litellm_chunk = litellm_custom_stream_wrapper.chunk_creator(
-                chunk=generic_chunk
-            )
-            if litellm_chunk is not None:
-                all_openai_chunks.append(litellm_chunk)
-
-        complete_streaming_response = litellm.stream_chunk_builder(
-            chunks=all_openai_chunks
-        )
-
-        return complete_streaming_response
+            streaming_accumulator.add_line(chunk)
+        return streaming_accumulator.get_complete_streaming_response()
 
     @staticmethod
     def extract_model_from_url(url: str) -> str:
@@ -0,0 +1,323 @@
+"""
+Incremental parsing of pass-through streaming responses, for logging + spend tracking.
+
+The response bytes are parsed as they are forwarded to the client:
+- `IncrementalLineDecoder` splits the bytes into SSE / NDJSON lines
+- a per-provider `PassThroughStreamingAccumulator` converts each line to a litellm chunk, and merges it into a `StreamingChunkAccumulator`
+
+Only the merged state is kept (response text, tool calls, finish reason, usage) - not the raw bytes or the chunks, so memory doesn't grow with the number of events in the stream.
+"""
+
+from abc import ABC, abstractmethod
+from io import StringIO
+from typing import Any, List, Optional, Union
+
+import litellm
+from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
+from litellm.llms.anthropic.chat.handler import (
+    ModelResponseIterator as AnthropicModelResponseIterator,
+)
+from litellm.llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
+    ModelResponseIterator as VertexModelResponseIterator,
+)
+from litellm.types.utils import (
+    CompletionTokensDetails,
+    GenericStreamingChunk,
+    ModelResponse,
+    ModelResponseStream,
+    PromptTokensDetails,
+    TextCompletionResponse,
+    Usage,
+)
+
+
+class IncrementalLineDecoder:
+    """
+    Splits streamed bytes into stripped, non-empty str lines - same lines as joining all the bytes + `.split("\\n")`, without keeping the bytes.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[str]:
+        buffer = self._buffer
+        buffer += data
+        end = buffer.rfind(b"\n")
+        if end == -1:
+            return []
+        # a utf-8 multi-byte character never contains b"\n" - complete lines always decode
+        lines = buffer[:end].decode("utf-8").split("\n")
+        del buffer[: end + 1]
+        return [line.strip() for line in lines if line.strip()]
+
+    def flush(self) -> List[str]:
+        """
+        Returns the last line, if the stream didn't end with a newline
+        """
+        line = self._buffer.decode("utf-8").strip()
+        self._buffer.clear()
+        return [line] if line else []
+
+
+class _StreamedToolCall:
+    __slots__ = ("index", "id", "type", "name", "arguments")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.id: Optional[str] = None
+        self.type: Optional[str] = None
+        self.name: Optional[str] = None
+        self.arguments = StringIO()
+
+
+class StreamingChunkAccumulator:
+    """
+    Merges litellm chunks as they arrive. `get_complete_streaming_response()` returns the same response as `litellm.stream_chunk_builder()` on all the chunks.
+
+    Like `stream_chunk_builder()`, only the first choice of each chunk is used.
+    """
+
+    def __init__(self) -> None:
+        self.first_chunk: Optional[ModelResponseStream] = None
+        self.last_chunk: Optional[ModelResponseStream] = None
+        self.response_id: Optional[str] = None
+        self.role: Optional[str] = None
+        self.finish_reason: Optional[str] = None
+        self.content = StringIO()
+        self.has_content = False
+        self.tool_calls: List[_StreamedToolCall] = []
+        # function call / audio chunks - not streamed by the pass-through providers, kept as is
+        self.other_chunks: List[ModelResponseStream] = []
+        ## merged usage - see `ChunkProcessor.calculate_usage()`
+        self.has_usage = False
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cache_creation_input_tokens: Optional[int] = None
+        self.cache_read_input_tokens: Optional[int] = None
+        self.completion_tokens_details: Optional[CompletionTokensDetails] = None
+        self.prompt_tokens_details: Optional[PromptTokensDetails] = None
+
+    def add(self, chunk: ModelResponseStream) -> None:
+        if self.first_chunk is None:
+            self.first_chunk = chunk
+        self.last_chunk = chunk
+        if self.response_id is None and chunk.get("id"):
+            self.response_id = chunk["id"]
+        if "usage" in chunk and chunk["usage"] is not None:
+            self._add_usage(chunk["usage"])
+        if len(chunk["choices"]) == 0:
+            return
+        choice = chunk["choices"][0]
+        self.finish_reason = choice.finish_reason
+        delta = choice.delta
+        if chunk is self.first_chunk:
+            self.role = delta.role
+        if delta.content is not None:
+            self.has_content = True
+            self.content.write(delta.content)
+        if delta.tool_calls:
+            self._add_tool_call_delta(delta.tool_calls[0])
+        if (
+            getattr(delta, "function_call", None) is not None
+            or getattr(delta, "audio", None) is not None
+        ):
+            self.other_chunks.append(chunk)
+
+    def _add_tool_call_delta(self, tool_call_delta: Any) -> None:
+        if tool_call_delta.function is None:
+            return
+        # a new tool call starts when the index changes - see `ChunkProcessor.get_combined_tool_content()`
+        if tool_call_delta.index or not self.tool_calls:
+            index = tool_call_delta.index or 0
+            if not self.tool_calls or self.tool_calls[-1].index != index:
+                self.tool_calls.append(_StreamedToolCall(index=index))
+        tool_call = self.tool_calls[-1]
+        if tool_call_delta.id:
+            tool_call.id = tool_call_delta.id
+        if tool_call_delta.type:
+            tool_call.type = tool_call_delta.type
+        if tool_call_delta.function.name:
+            tool_call.name = tool_call_delta.function.name
+        if tool_call_delta.function.arguments:
+            tool_call.arguments.write(tool_call_delta.function.arguments)
+
+    def _add_usage(self, usage_chunk: Usage) -> None:
+        usage_chunk_dict = ChunkProcessor._usage_chunk_calculation_helper(usage_chunk)
+        self.has_usage = True
+        if (usage_chunk_dict["prompt_tokens"] or 0) > 0:
+            self.prompt_tokens = usage_chunk_dict["prompt_tokens"]
+        if (usage_chunk_dict["completion_tokens"] or 0) > 0:
+            self.completion_tokens = usage_chunk_dict["completion_tokens"]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None:
+            self.cache_creation_input_tokens = usage_chunk_dict[
+                "cache_creation_input_tokens"
+            ]
+        if usage_chunk_dict["cache_read_input_tokens"] is not None:
+            self.cache_read_input_tokens = usage_chunk_dict["cache_read_input_tokens"]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            self.completion_tokens_details = usage_chunk_dict[
+                "completion_tokens_details"
+            ]
+        self.prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
+
+    def _get_usage(self) -> Usage:
+        usage = Usage(
+            prompt_tokens=self.prompt_tokens,
+            completion_tokens=self.completion_tokens,
+            total_tokens=self.prompt_tokens + self.completion_tokens,
+            completion_tokens_details=self.completion_tokens_details,
+            prompt_tokens_details=self.prompt_tokens_details,
+        )
+        if self.cache_creation_input_tokens is not None:
+            setattr(
+                usage, "cache_creation_input_tokens", self.cache_creation_input_tokens
+            )
+        if self.cache_read_input_tokens is not None:
+            setattr(usage, "cache_read_input_tokens", self.cache_read_input_tokens)
+        return usage
+
+    def get_complete_streaming_response(
+        self, messages: Optional[list] = None
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        Build the complete response - from 1 chunk per merged field, combined with `litellm.stream_chunk_builder`
+        """
+        first_chunk = self.first_chunk
+        if first_chunk is None or self.last_chunk is None:
+            return None
+        chunk_params = {
+            "id": self.response_id,
+            "created": first_chunk.created,
+            "model": first_chunk.model,
+            "system_fingerprint": first_chunk.system_fingerprint,
+        }
+        chunks: List[ModelResponseStream] = [
+            ModelResponseStream(
+                **chunk_params,
+                choices=[
+                    {
+                        "index": 0,
+                        "delta": {
+                            "role": self.role,
+                            "content": (
+                                self.content.getvalue() if self.has_content else None
+                            ),
+                        },
+                    }
+                ],
+            )
+        ]
+        for tool_call in self.tool_calls:
+            # tool call start (id, name) + arguments, as streamed - `stream_chunk_builder` adds the arguments of a tool call's first chunk to the previous tool call
+            for tool_call_delta in (
+                {
+                    "index": tool_call.index,
+                    "id": tool_call.id,
+                    "type": tool_call.type,
+                    "function": {"name": tool_call.name, "arguments": ""},
+                },
+                {
+                    "index": tool_call.index,
+                    "function": {"arguments": tool_call.arguments.getvalue()},
+                },
+            ):
+                chunks.append(
+                    ModelResponseStream(
+                        **chunk_params,
+                        choices=[
+                            {"index": 0, "delta": {"tool_calls": [tool_call_delta]}}
+                        ],
+                    )
+                )
+        chunks.extend(self.other_chunks)
+        last_chunk = ModelResponseStream(
+            **chunk_params,
+            choices=[{"index": 0, "delta": {}, "finish_reason": self.finish_reason}],
+        )
+        if self.has_usage:
+            setattr(last_chunk, "usage", self._get_usage())
+        # `stream_chunk_builder` copies the hidden params of the last chunk
+        last_chunk._hidden_params = self.last_chunk._hidden_params
+        chunks.append(last_chunk)
+        return litellm.stream_chunk_builder(chunks=chunks, messages=messages)
+
+
+class PassThroughStreamingAccumulator(ABC):
+    """
+    Converts the lines of a provider's stream to litellm chunks, and merges them as they arrive.
+    """
+
+    custom_llm_provider: str
+
+    def __init__(self, litellm_logging_obj: LiteLLMLoggingObj, model: str) -> None:
+        self.model = model
+        self.completion_stream = self._get_completion_stream()
+        self.custom_stream_wrapper = litellm.CustomStreamWrapper(
+            completion_stream=self.completion_stream,
+            model=model,
+            logging_obj=litellm_logging_obj,
+            custom_llm_provider=self.custom_llm_provider,
+        )
+        self.chunk_accumulator = StreamingChunkAccumulator()
+        self.is_finished = False
+
+    @abstractmethod
+    def _get_completion_stream(self) -> Any:
+        pass
+
+    @abstractmethod
+    def _convert_line_to_generic_chunk(self, line: str) -> GenericStreamingChunk:
+        pass
+
+    def add_line(self, line: str) -> None:
+        if self.is_finished:
+            return
+        try:
+            generic_chunk = self._convert_line_to_generic_chunk(line)
+            litellm_chunk = self.custom_stream_wrapper.chunk_creator(
+                chunk=generic_chunk
+            )
+        except (StopIteration, StopAsyncIteration):
+            # end of the stream
+            self.is_finished = True
+            return
+        if litellm_chunk is not None:
+            self.chunk_accumulator.add(litellm_chunk)
+
+    def get_complete_streaming_response(
+        self,
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        return self.chunk_accumulator.get_complete_streaming_response()
+
+
+class AnthropicPassThroughStreamingAccumulator(PassThroughStreamingAccumulator):
+    custom_llm_provider = "anthropic"
+
+    def _get_completion_stream(self) -> AnthropicModelResponseIterator:
+        return AnthropicModelResponseIterator(
+            streaming_response=None,
+            sync_stream=False,
+        )
+
+    def add_line(self, line: str) -> None:
+        # `event:` lines carry no data - the event type is repeated in the `data:` line
+        if not line.startswith("data:"):
+            return
+        super().add_line(line)
+
+    def _convert_line_to_generic_chunk(self, line: str) -> GenericStreamingChunk:
+        return self.completion_stream.convert_str_chunk_to_generic_chunk(chunk=line)
+
+
+class VertexPassThroughStreamingAccumulator(PassThroughStreamingAccumulator):
+    custom_llm_provider = "vertex_ai"
+
+    def _get_completion_stream(self) -> VertexModelResponseIterator:
+        return VertexModelResponseIterator(
+            streaming_response=None,
+            sync_stream=False,
+        )
+
+    def _convert_line_to_generic_chunk(self, line: str) -> GenericStreamingChunk:
+        return self.completion_stream._common_chunk_parsing_logic(line)
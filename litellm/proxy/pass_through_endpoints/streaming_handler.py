@@ -16,6 +16,12 @@ from .llm_provider_handlers.anthropic_passthrough_logging_handler import (
 from .llm_provider_handlers.vertex_passthrough_logging_handler import (
     VertexPassthroughLoggingHandler,
 )
+from .streaming_accumulator import (
+    AnthropicPassThroughStreamingAccumulator,
+    IncrementalLineDecoder,
+    PassThroughStreamingAccumulator,
+    VertexPassThroughStreamingAccumulator,
+)
 from .success_handler import PassThroughEndpointLogging
 from .types import EndpointType
 
@@ -34,13 +40,34 @@ class PassThroughStreamingHandler:
     ):
         """
         - Yields chunks from the response
-        - Collect non-empty chunks for post-processing (logging)
+        - Parses the chunks as they arrive, for post-processing (logging)
         """
         try:
-            raw_bytes: List[bytes] = []
+            line_decoder = IncrementalLineDecoder()
+            streaming_accumulator = (
+                PassThroughStreamingHandler._get_streaming_accumulator(
+                    litellm_logging_obj=litellm_logging_obj,
+                    request_body=request_body or {},
+                    endpoint_type=endpoint_type,
+                    url_route=url_route,
+                )
+            )
             async for chunk in response.aiter_bytes():
-                raw_bytes.append(chunk)
                 yield chunk
+                if streaming_accumulator is not None:
+                    streaming_accumulator = (
+                        PassThroughStreamingHandler._add_lines_to_accumulator(
+                            streaming_accumulator=streaming_accumulator,
+                            lines=line_decoder.feed(chunk),
+                        )
+                    )
+            if streaming_accumulator is not None:
+                streaming_accumulator = (
+                    PassThroughStreamingHandler._add_lines_to_accumulator(
+                        streaming_accumulator=streaming_accumulator,
+                        lines=line_decoder.flush(),
+                    )
+                )
 
             # After all chunks are processed, handle post-processing
             end_time = datetime.now()
@@ -53,7 +80,7 @@ class PassThroughStreamingHandler:
                     request_body=request_body or {},
                     endpoint_type=endpoint_type,
                     start_time=start_time,
-                    raw_bytes=raw_bytes,
+                    streaming_accumulator=streaming_accumulator,
                     end_time=end_time,
                 )
             )
@@ -61,6 +88,43 @@ class PassThroughStreamingHandler:
             verbose_proxy_logger.error(f"Error in chunk_processor: {str(e)}")
             raise
 
+    @staticmethod
+    def _get_streaming_accumulator(
+        litellm_logging_obj: LiteLLMLoggingObj,
+        request_body: dict,
+        endpoint_type: EndpointType,
+        url_route: str,
+    ) -> Optional[PassThroughStreamingAccumulator]:
+        if endpoint_type == EndpointType.ANTHROPIC:
+            return AnthropicPassThroughStreamingAccumulator(
+                litellm_logging_obj=litellm_logging_obj,
+                model=request_body.get("model", ""),
+            )
+        elif endpoint_type == EndpointType.VERTEX_AI:
+            return VertexPassThroughStreamingAccumulator(
+                litellm_logging_obj=litellm_logging_obj,
+                model=VertexPassthroughLoggingHandler.extract_model_from_url(url_route),
+            )
+        return None
+
+    @staticmethod
+    def _add_lines_to_accumulator(
+        streaming_accumulator: PassThroughStreamingAccumulator,
+        lines: List[str],
+    ) -> Optional[PassThroughStreamingAccumulator]:
+        """
+        Returns None if a line can't be parsed - the stream itself is never interrupted by logging
+        """
+        try:
+            for line in lines:
+                streaming_accumulator.add_line(line)
+            return streaming_accumulator
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "Error parsing pass-through stream for logging: %s", str(e)
+            )
+            return None
+
     @staticmethod
     async def _route_streaming_logging_to_handler(
         litellm_logging_obj: LiteLLMLoggingObj,
@@ -69,32 +133,31 @@ class PassThroughStreamingHandler:
         request_body: dict,
         endpoint_type: EndpointType,
         start_time: datetime,
-        raw_bytes: List[bytes],
+        streaming_accumulator: Optional[PassThroughStreamingAccumulator],
         end_time: datetime,
     ):
         """
-        Route the logging for the collected chunks to the appropriate handler
+        Route the logging for the parsed stream to the appropriate handler
 
         Supported endpoint types:
         - Anthropic
         - Vertex AI
         """
-        all_chunks = PassThroughStreamingHandler._convert_raw_bytes_to_str_lines(
-            raw_bytes
+        complete_streaming_response = (
+            streaming_accumulator.get_complete_streaming_response()
+            if streaming_accumulator is not None
+            else None
         )
         standard_logging_response_object: Optional[
             PassThroughEndpointLoggingResultValues
         ] = None
         kwargs: dict = {}
         if endpoint_type == EndpointType.ANTHROPIC:
-            anthropic_passthrough_logging_handler_result = AnthropicPassthroughLoggingHandler._handle_logging_anthropic_collected_chunks(
+            anthropic_passthrough_logging_handler_result = AnthropicPassthroughLoggingHandler._handle_logging_anthropic_streaming_response(
                 litellm_logging_obj=litellm_logging_obj,
-                passthrough_success_handler_obj=passthrough_success_handler_obj,
-                url_route=url_route,
-                request_body=request_body,
-                endpoint_type=endpoint_type,
+                model=request_body.get("model", ""),
+                complete_streaming_response=complete_streaming_response,
                 start_time=start_time,
-                all_chunks=all_chunks,
                 end_time=end_time,
             )
             standard_logging_response_object = (
@@ -102,17 +165,12 @@ class PassThroughStreamingHandler:
             )
             kwargs = anthropic_passthrough_logging_handler_result["kwargs"]
         elif endpoint_type == EndpointType.VERTEX_AI:
-            vertex_passthrough_logging_handler_result = (
-                VertexPassthroughLoggingHandler._handle_logging_vertex_collected_chunks(
-                    litellm_logging_obj=litellm_logging_obj,
-                    passthrough_success_handler_obj=passthrough_success_handler_obj,
-                    url_route=url_route,
-                    request_body=request_body,
-                    endpoint_type=endpoint_type,
-                    start_time=start_time,
-                    all_chunks=all_chunks,
-                    end_time=end_time,
-                )
+            vertex_passthrough_logging_handler_result = VertexPassthroughLoggingHandler._handle_logging_vertex_streaming_response(
+                litellm_logging_obj=litellm_logging_obj,
+                model=VertexPassthroughLoggingHandler.extract_model_from_url(url_route),
+                complete_streaming_response=complete_streaming_response,
+                start_time=start_time,
+                end_time=end_time,
             )
             standard_logging_response_object = (
                 vertex_passthrough_logging_handler_result["result"]
@@ -121,7 +179,7 @@ class PassThroughStreamingHandler:
 
         if standard_logging_response_object is None:
             standard_logging_response_object = StandardPassThroughResponseObject(
-                response=f"cannot parse chunks to standard response object. Chunks={all_chunks}"
+                response="cannot parse chunks to standard response object"
             )
         threading.Thread(
             target=litellm_logging_obj.success_handler,
@@ -254,6 +254,18 @@ def run_server(  # noqa: PLR0915
     log_config,
 ):
     args = locals()
+    # must run before prometheus_client is imported - aggregates /metrics across workers
+    from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+        is_prometheus_multiprocess_mode,
+        mark_prometheus_worker_dead,
+        setup_prometheus_multiprocess_dir,
+    )
+
+    setup_prometheus_multiprocess_dir(num_workers=num_workers)
+    # must run before the proxy server is imported - caches of all workers are backed by this file
+    from litellm.caching.shared_memory_cache import setup_shared_memory_cache_path
+
+    setup_shared_memory_cache_path(num_workers=num_workers)
     if local:
         from proxy_server import (
             KeyManagementSettings,
@@ -747,6 +759,8 @@ def run_server(  # noqa: PLR0915
                 "timeout": 600,  # default to very high number, bedrock/anthropic.claude-v2:1 can take 30+ seconds for the 1st chunk to come in
                 "access_log_format": '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s',
             }
+            if is_prometheus_multiprocess_mode():
+                gunicorn_options["child_exit"] = mark_prometheus_worker_dead
 
             if ssl_certfile_path is not None and ssl_keyfile_path is not None:
                 print(  # noqa
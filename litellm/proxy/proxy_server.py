@@ -105,14 +105,26 @@ from contextlib import asynccontextmanager
 
 import litellm
 from litellm import Router
-from litellm._logging import verbose_proxy_logger, verbose_router_logger
+from litellm._logging import (
+    lazy_verbose_proxy_logger,
+    verbose_proxy_logger,
+    verbose_router_logger,
+)
 from litellm.caching.caching import DualCache, RedisCache
+from litellm.caching.shared_memory_cache import get_shared_memory_cache
+from litellm.constants import (
+    DEFAULT_SPEND_FLUSH_SIZE_THRESHOLD,
+    DEFAULT_STREAM_COALESCING_MAX_BYTES,
+    HEALTH_CHECK_JITTER,
+    HEALTH_CHECK_MAX_CONCURRENCY,
+)
 from litellm.exceptions import RejectedRequestError
 from litellm.integrations.SlackAlerting.slack_alerting import SlackAlerting
 from litellm.litellm_core_utils.core_helpers import (
     _get_parent_otel_span_from_kwargs,
     get_litellm_metadata_from_kwargs,
 )
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.proxy._types import *
 from litellm.proxy.analytics_endpoints.analytics_endpoints import (
@@ -159,6 +171,17 @@ from litellm.proxy.common_utils.openai_endpoint_utils import (
     remove_sensitive_info_from_deployment,
 )
 from litellm.proxy.common_utils.proxy_state import ProxyState
+from litellm.proxy.common_utils.raw_sse_passthrough import (
+    OpenAIStreamSniffer,
+    get_raw_sse_passthrough_response,
+    log_raw_sse_stream_failure,
+    log_raw_sse_stream_first_chunk,
+    log_raw_sse_stream_success,
+)
+from litellm.proxy.common_utils.sse_coalescing import (
+    coalesce_sse_stream,
+    get_stream_coalescing_window_ms,
+)
 from litellm.proxy.common_utils.swagger_utils import ERROR_RESPONSES
 from litellm.proxy.fine_tuning_endpoints.endpoints import router as fine_tuning_router
 from litellm.proxy.fine_tuning_endpoints.endpoints import set_fine_tuning_config
@@ -167,7 +190,7 @@ from litellm.proxy.guardrails.init_guardrails import (
     init_guardrails_v2,
     initialize_guardrails,
 )
-from litellm.proxy.health_check import perform_health_check
+from litellm.proxy.health_check_scheduler import HealthCheckScheduler
 from litellm.proxy.health_endpoints._health_endpoints import router as health_router
 from litellm.proxy.hooks.model_max_budget_limiter import (
     _PROXY_VirtualKeyModelMaxBudgetLimiter,
@@ -227,6 +250,7 @@ from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
 )
 from litellm.proxy.rerank_endpoints.endpoints import router as rerank_router
 from litellm.proxy.route_llm_request import route_request
+from litellm.proxy.spend_tracking.spend_accumulator import get_team_member_spend_id
 from litellm.proxy.spend_tracking.spend_management_endpoints import (
     router as spend_management_router,
 )
@@ -237,6 +261,7 @@ from litellm.proxy.ui_crud_endpoints.proxy_setting_endpoints import (
 from litellm.proxy.utils import (
     PrismaClient,
     ProxyLogging,
+    ProxyUpdateSpend,
     _cache_user_row,
     _get_docs_url,
     _get_projected_spend_over_limit,
@@ -536,6 +561,9 @@ async def proxy_startup_event(app: FastAPI):
     ## [Optional] Initialize dd tracer
     ProxyStartupEvent._init_dd_tracer()
 
+    ## RESUME LOCAL BATCHES INTERRUPTED BY A RESTART ##
+    await ProxyStartupEvent._resume_local_batches(llm_router=llm_router)
+
     # End of startup event
     yield
 
@@ -731,7 +759,8 @@ master_key: Optional[str] = None
 otel_logging = False
 prisma_client: Optional[PrismaClient] = None
 user_api_key_cache = DualCache(
-    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value
+    default_in_memory_ttl=UserAPIKeyCacheTTLEnum.in_memory_cache_ttl.value,
+    shared_memory_cache=get_shared_memory_cache(namespace="user_api_key_cache"),
 )
 model_max_budget_limiter = _PROXY_VirtualKeyModelMaxBudgetLimiter(
     dual_cache=user_api_key_cache
@@ -747,6 +776,9 @@ use_background_health_checks = None
 use_queue = False
 health_check_interval = None
 health_check_details = None
+health_check_max_concurrency = HEALTH_CHECK_MAX_CONCURRENCY
+health_check_jitter = HEALTH_CHECK_JITTER
+passive_health_checks = True
 health_check_results = {}
 queue: List = []
 litellm_proxy_budget_name = "litellm-proxy-budget"
@@ -1004,16 +1036,14 @@ async def update_database(  # noqa: PLR0915
                     ### KEY CHANGE ###
                     for _id in user_ids:
                         if _id is not None:
-                            prisma_client.user_list_transactons[_id] = (
-                                response_cost
-                                + prisma_client.user_list_transactons.get(_id, 0)
+                            prisma_client.spend_accumulator.add(
+                                entity_type="user", entity_id=_id, spend=response_cost
                             )
                     if end_user_id is not None:
-                        prisma_client.end_user_list_transactons[end_user_id] = (
-                            response_cost
-                            + prisma_client.end_user_list_transactons.get(
-                                end_user_id, 0
-                            )
+                        prisma_client.spend_accumulator.add(
+                            entity_type="end_user",
+                            entity_id=end_user_id,
+                            spend=response_cost,
                         )
             except Exception as e:
                 verbose_proxy_logger.info(
@@ -1030,9 +1060,8 @@ async def update_database(  # noqa: PLR0915
                 if hashed_token is None:
                     return
                 if prisma_client is not None:
-                    prisma_client.key_list_transactons[hashed_token] = (
-                        response_cost
-                        + prisma_client.key_list_transactons.get(hashed_token, 0)
+                    prisma_client.spend_accumulator.add(
+                        entity_type="key", entity_id=hashed_token, spend=response_cost
                     )
             except Exception as e:
                 verbose_proxy_logger.exception(
@@ -1077,20 +1106,18 @@ async def update_database(  # noqa: PLR0915
                     )
                     return
                 if prisma_client is not None:
-                    prisma_client.team_list_transactons[team_id] = (
-                        response_cost
-                        + prisma_client.team_list_transactons.get(team_id, 0)
+                    prisma_client.spend_accumulator.add(
+                        entity_type="team", entity_id=team_id, spend=response_cost
                     )
 
                     try:
                         # Track spend of the team member within this team
-                        # key is "team_id::<value>::user_id::<value>"
-                        team_member_key = f"team_id::{team_id}::user_id::{user_id}"
-                        prisma_client.team_member_list_transactons[team_member_key] = (
-                            response_cost
-                            + prisma_client.team_member_list_transactons.get(
-                                team_member_key, 0
-                            )
+                        prisma_client.spend_accumulator.add(
+                            entity_type="team_member",
+                            entity_id=get_team_member_spend_id(
+                                team_id=team_id, user_id=user_id
+                            ),
+                            spend=response_cost,
                         )
                     except Exception:
                         pass
@@ -1114,9 +1141,8 @@ async def update_database(  # noqa: PLR0915
                     )
                     return
                 if prisma_client is not None:
-                    prisma_client.org_list_transactons[org_id] = (
-                        response_cost
-                        + prisma_client.org_list_transactons.get(org_id, 0)
+                    prisma_client.spend_accumulator.add(
+                        entity_type="org", entity_id=org_id, spend=response_cost
                     )
             except Exception as e:
                 verbose_proxy_logger.info(
@@ -1413,7 +1439,7 @@ async def _run_background_health_check():
 
     Update health_check_results, based on this.
     """
-    global health_check_results, llm_model_list, health_check_interval, health_check_details
+    global health_check_results, llm_model_list, health_check_interval, health_check_details, health_check_max_concurrency, health_check_jitter, passive_health_checks
 
     # make 1 deep copy of llm_model_list -> use this for all background health checks
     _llm_model_list = copy.deepcopy(llm_model_list)
@@ -1421,21 +1447,19 @@ async def _run_background_health_check():
     if _llm_model_list is None:
         return
 
-    while True:
-        healthy_endpoints, unhealthy_endpoints = await perform_health_check(
-            model_list=_llm_model_list, details=health_check_details
-        )
-
-        # Update the global variable with the health check results
-        health_check_results["healthy_endpoints"] = healthy_endpoints
-        health_check_results["unhealthy_endpoints"] = unhealthy_endpoints
-        health_check_results["healthy_count"] = len(healthy_endpoints)
-        health_check_results["unhealthy_count"] = len(unhealthy_endpoints)
-
-        if health_check_interval is not None and isinstance(
-            health_check_interval, float
-        ):
-            await asyncio.sleep(health_check_interval)
+    health_check_scheduler = HealthCheckScheduler(
+        model_list=_llm_model_list,
+        interval=float(health_check_interval or 300),
+        max_concurrency=health_check_max_concurrency,
+        jitter=health_check_jitter,
+        passive_health_checks=passive_health_checks,
+        details=health_check_details,
+        redis_cache=redis_usage_cache,
+    )
+    if passive_health_checks:
+        # derive health from live traffic - active health checks only run for idle deployments
+        litellm.logging_callback_manager.add_litellm_callback(health_check_scheduler)
+    await health_check_scheduler.run(health_check_results=health_check_results)
 
 
 class ProxyConfig:
@@ -1734,7 +1758,7 @@ class ProxyConfig:
         """
         Load config values into proxy global state
         """
-        global master_key, user_config_file_path, otel_logging, user_custom_auth, user_custom_auth_path, user_custom_key_generate, user_custom_sso, use_background_health_checks, health_check_interval, use_queue, proxy_budget_rescheduler_max_time, proxy_budget_rescheduler_min_time, ui_access_mode, litellm_master_key_hash, proxy_batch_write_at, disable_spend_logs, prompt_injection_detection_obj, redis_usage_cache, store_model_in_db, premium_user, open_telemetry_logger, health_check_details, callback_settings
+        global master_key, user_config_file_path, otel_logging, user_custom_auth, user_custom_auth_path, user_custom_key_generate, user_custom_sso, use_background_health_checks, health_check_interval, use_queue, proxy_budget_rescheduler_max_time, proxy_budget_rescheduler_min_time, ui_access_mode, litellm_master_key_hash, proxy_batch_write_at, disable_spend_logs, prompt_injection_detection_obj, redis_usage_cache, store_model_in_db, premium_user, open_telemetry_logger, health_check_details, health_check_max_concurrency, health_check_jitter, passive_health_checks, callback_settings
 
         config: dict = await self.get_config(config_file_path=config_file_path)
 
@@ -1906,10 +1930,12 @@ class ProxyConfig:
                                 verbose_proxy_logger.debug(
                                     "Starting Prometheus Metrics on /metrics"
                                 )
-                                from prometheus_client import make_asgi_app
+                                from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+                                    get_prometheus_metrics_asgi_app,
+                                )
 
                                 # Add prometheus asgi middleware to route /metrics requests
-                                metrics_app = make_asgi_app()
+                                metrics_app = get_prometheus_metrics_asgi_app()
                                 app.mount("/metrics", metrics_app)
                     print(  # noqa
                         f"{blue_color_code} Initialized Success Callbacks - {litellm.success_callback} {reset_color_code}"
@@ -1954,6 +1980,16 @@ class ProxyConfig:
                         f"{blue_color_code} setting litellm.{key}={value}{reset_color_code}"
                     )
                     setattr(litellm, key, value)
+                elif key == "preload_tokenizers":
+                    from litellm.utils import load_tokenizers
+
+                    # tokenizer_cache_dir can come after preload_tokenizers in the config
+                    if litellm_settings.get("tokenizer_cache_dir") is not None:
+                        litellm.tokenizer_cache_dir = litellm_settings[
+                            "tokenizer_cache_dir"
+                        ]
+                    litellm.preload_tokenizers = value
+                    load_tokenizers(models=value or [])
                 elif key == "upperbound_key_generate_params":
                     if value is not None and isinstance(value, dict):
                         for _k, _v in value.items():
@@ -2087,6 +2123,13 @@ class ProxyConfig:
             )
             health_check_interval = general_settings.get("health_check_interval", 300)
             health_check_details = general_settings.get("health_check_details", True)
+            health_check_max_concurrency = general_settings.get(
+                "health_check_max_concurrency", HEALTH_CHECK_MAX_CONCURRENCY
+            )
+            health_check_jitter = general_settings.get(
+                "health_check_jitter", HEALTH_CHECK_JITTER
+            )
+            passive_health_checks = general_settings.get("passive_health_checks", True)
 
             ### RBAC ###
             rbac_role_permissions = general_settings.get("role_permissions", None)
@@ -3006,12 +3049,12 @@ async def async_assistants_data_generator(
 async def async_data_generator(
     response, user_api_key_dict: UserAPIKeyAuth, request_data: dict
 ):
-    verbose_proxy_logger.debug("inside generator")
+    lazy_verbose_proxy_logger.debug("inside generator")
     try:
         time.time()
         async for chunk in response:
-            verbose_proxy_logger.debug(
-                "async_data_generator: received streaming chunk - {}".format(chunk)
+            lazy_verbose_proxy_logger.debug(
+                "async_data_generator: received streaming chunk - %s", chunk
             )
             ### CALL HOOKS ### - modify outgoing data
             chunk = await proxy_logging_obj.async_post_call_streaming_hook(
@@ -3040,8 +3083,9 @@ async def async_data_generator(
             original_exception=e,
             request_data=request_data,
         )
-        verbose_proxy_logger.debug(
-            f"\033[1;31mAn error occurred: {e}\n\n Debug this by setting `--debug`, e.g. `litellm --model gpt-3.5-turbo --debug`"
+        lazy_verbose_proxy_logger.debug(
+            "\033[1;31mAn error occurred: %s\n\n Debug this by setting `--debug`, e.g. `litellm --model gpt-3.5-turbo --debug`",
+            e,
         )
 
         if isinstance(e, HTTPException):
@@ -3063,12 +3107,12 @@ async def async_data_generator(
 async def async_data_generator_anthropic(
     response, user_api_key_dict: UserAPIKeyAuth, request_data: dict
 ):
-    verbose_proxy_logger.debug("inside generator")
+    lazy_verbose_proxy_logger.debug("inside generator")
     try:
         time.time()
         async for chunk in response:
-            verbose_proxy_logger.debug(
-                "async_data_generator: received streaming chunk - {}".format(chunk)
+            lazy_verbose_proxy_logger.debug(
+                "async_data_generator: received streaming chunk - %s", chunk
             )
             ### CALL HOOKS ### - modify outgoing data
             chunk = await proxy_logging_obj.async_post_call_streaming_hook(
@@ -3092,8 +3136,9 @@ async def async_data_generator_anthropic(
             original_exception=e,
             request_data=request_data,
         )
-        verbose_proxy_logger.debug(
-            f"\033[1;31mAn error occurred: {e}\n\n Debug this by setting `--debug`, e.g. `litellm --model gpt-3.5-turbo --debug`"
+        lazy_verbose_proxy_logger.debug(
+            "\033[1;31mAn error occurred: %s\n\n Debug this by setting `--debug`, e.g. `litellm --model gpt-3.5-turbo --debug`",
+            e,
         )
 
         if isinstance(e, HTTPException):
@@ -3112,11 +3157,90 @@ async def async_data_generator_anthropic(
         yield f"data: {error_returned}\n\n"
 
 
+async def async_raw_sse_data_generator(
+    response: CustomStreamWrapper,
+    raw_response: httpx.Response,
+    user_api_key_dict: UserAPIKeyAuth,
+    request_data: dict,
+):
+    """
+    Forward the upstream SSE bytes unchanged - see `general_settings.raw_sse_passthrough`
+    """
+    sniffer = OpenAIStreamSniffer()
+    try:
+        async for chunk in raw_response.aiter_bytes():
+            if sniffer.first_chunk is None:
+                log_raw_sse_stream_first_chunk(response)
+            sniffer.feed(chunk)
+            yield chunk
+        log_raw_sse_stream_success(response, sniffer)
+    except Exception as e:
+        verbose_proxy_logger.exception(
+            "litellm.proxy.proxy_server.async_raw_sse_data_generator(): Exception occured - {}".format(
+                str(e)
+            )
+        )
+        log_raw_sse_stream_failure(response, e)
+        await proxy_logging_obj.post_call_failure_hook(
+            user_api_key_dict=user_api_key_dict,
+            original_exception=e,
+            request_data=request_data,
+        )
+        proxy_exception = ProxyException(
+            message=getattr(e, "message", str(e)),
+            type=getattr(e, "type", "None"),
+            param=getattr(e, "param", "None"),
+            code=getattr(e, "status_code", 500),
+        )
+        error_returned = json.dumps({"error": proxy_exception.to_dict()})
+        yield f"data: {error_returned}\n\n"
+    finally:
+        await raw_response.aclose()
+
+
+def _coalesce_data_generator(
+    data_generator, user_api_key_dict: UserAPIKeyAuth, request_data: dict
+):
+    """
+    Coalesce the SSE events into fewer writes, if `stream_coalescing_window_ms` is set for the route / key
+    """
+    window_ms = get_stream_coalescing_window_ms(
+        general_settings=general_settings,
+        user_api_key_dict=user_api_key_dict,
+        request_data=request_data,
+    )
+    if window_ms <= 0:
+        return data_generator
+    return coalesce_sse_stream(
+        data_generator,
+        window_ms=window_ms,
+        max_bytes=general_settings.get(
+            "stream_coalescing_max_bytes", DEFAULT_STREAM_COALESCING_MAX_BYTES
+        ),
+    )
+
+
 def select_data_generator(
     response, user_api_key_dict: UserAPIKeyAuth, request_data: dict
 ):
-    return async_data_generator(
-        response=response,
+    data_generator = None
+    if general_settings.get("raw_sse_passthrough", False) is True:
+        raw_response = get_raw_sse_passthrough_response(response)
+        if raw_response is not None:
+            data_generator = async_raw_sse_data_generator(
+                response=response,
+                raw_response=raw_response,
+                user_api_key_dict=user_api_key_dict,
+                request_data=request_data,
+            )
+    if data_generator is None:
+        data_generator = async_data_generator(
+            response=response,
+            user_api_key_dict=user_api_key_dict,
+            request_data=request_data,
+        )
+    return _coalesce_data_generator(
+        data_generator,
         user_api_key_dict=user_api_key_dict,
         request_data=request_data,
     )
@@ -3228,6 +3352,38 @@ class ProxyStartupEvent:
             )
         )
 
+    @classmethod
+    def _initialize_spend_accumulator(
+        cls,
+        general_settings: dict,
+        prisma_client: PrismaClient,
+        proxy_batch_write_at: int,
+        proxy_logging_obj: ProxyLogging,
+    ):
+        """
+        - flush the spend of an entity type early, once `spend_flush_size_threshold` entities are waiting for the next batch write
+        - with `use_redis_spend_aggregation`, sum the spend of all proxy pods in redis - 1 pod writes it to the db per batch write interval
+        """
+        spend_accumulator = prisma_client.spend_accumulator
+        spend_accumulator.flush_size_threshold = general_settings.get(
+            "spend_flush_size_threshold", DEFAULT_SPEND_FLUSH_SIZE_THRESHOLD
+        )
+        spend_accumulator.flush_callback = (
+            lambda: ProxyUpdateSpend.update_accumulated_spend(
+                n_retry_times=3,
+                prisma_client=prisma_client,
+                proxy_logging_obj=proxy_logging_obj,
+            )
+        )
+        if general_settings.get("use_redis_spend_aggregation", False) is True:
+            if redis_usage_cache is None:
+                verbose_proxy_logger.warning(
+                    "`use_redis_spend_aggregation` requires redis caching to be set up - writing spend per pod"
+                )
+                return
+            spend_accumulator.redis_cache = redis_usage_cache
+            spend_accumulator.flush_lock_ttl = proxy_batch_write_at
+
     @classmethod
     async def initialize_scheduled_background_jobs(
         cls,
@@ -3255,6 +3411,12 @@ class ProxyStartupEvent:
             )
 
         ### UPDATE SPEND ###
+        cls._initialize_spend_accumulator(
+            general_settings=general_settings,
+            prisma_client=prisma_client,
+            proxy_batch_write_at=proxy_batch_write_at,
+            proxy_logging_obj=proxy_logging_obj,
+        )
         scheduler.add_job(
             update_spend,
             "interval",
@@ -3368,6 +3530,31 @@ class ProxyStartupEvent:
                 await prisma_client.health_check()
         return prisma_client
 
+    @classmethod
+    async def _resume_local_batches(cls, llm_router: Optional[Router]):
+        """
+        Resume local batches (`custom_llm_provider="local"`) that were running when the proxy stopped.
+
+        Every worker calls this - a batch is resumed by the 1st worker that locks it.
+        """
+        from litellm.batches.local_batches import local_batch_executor
+
+        try:
+            resumed_batch_ids = await local_batch_executor.resume_batches(
+                llm_router=llm_router
+            )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "litellm.proxy.proxy_server.py::_resume_local_batches() - Error resuming local batches - {}".format(
+                    str(e)
+                )
+            )
+            return
+        if len(resumed_batch_ids) > 0:
+            verbose_proxy_logger.info(
+                "Resumed local batches: {}".format(resumed_batch_ids)
+            )
+
     @classmethod
     def _init_dd_tracer(cls):
         """
@@ -5655,8 +5842,12 @@ async def anthropic_response(  # noqa: PLR0915
         if (
             "stream" in data and data["stream"] is True
         ):  # use generate_responses to stream responses
-            selected_data_generator = async_data_generator_anthropic(
-                response=response,
+            selected_data_generator = _coalesce_data_generator(
+                async_data_generator_anthropic(
+                    response=response,
+                    user_api_key_dict=user_api_key_dict,
+                    request_data=data,
+                ),
                 user_api_key_dict=user_api_key_dict,
                 request_data=data,
             )
@@ -0,0 +1,262 @@
+"""
+In-memory spend accumulator - spend of every request, summed per entity until the next batch write to the db (`update_spend`).
+
+- 1 shard per entity type (user, end_user, key, team, team_member, org) - each shard is flushed on its own
+- shards are columnar: parallel entity id / spend columns + an entity id -> row index
+- double-buffered: a flush swaps the shard out for an empty one before writing it - increments arriving while the db write is in flight go to the new shard, and are never dropped by the flush. A failed write is merged back into the active shard.
+- flush on size: once a shard holds `flush_size_threshold` entities, an early flush is started (`general_settings.spend_flush_size_threshold`)
+- redis aggregation (`general_settings.use_redis_spend_aggregation`): every pod adds its spend to a redis hash per entity type, and the pod holding the flush lock writes the combined spend of all pods - 1 db write per interval, instead of 1 per pod
+"""
+
+import asyncio
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import (
+    DEFAULT_SPEND_FLUSH_SIZE_THRESHOLD,
+    REDIS_SPEND_ACCUMULATOR_KEY_PREFIX,
+)
+
+if TYPE_CHECKING:
+    from litellm.caching.redis_cache import RedisCache
+else:
+    RedisCache = Any
+
+SpendEntityType = Literal["user", "end_user", "key", "team", "team_member", "org"]
+
+SPEND_ENTITY_TYPES: Tuple[SpendEntityType, ...] = (
+    "user",
+    "end_user",
+    "key",
+    "team",
+    "team_member",
+    "org",
+)
+
+DEFAULT_SPEND_FLUSH_LOCK_TTL_SECONDS = 10
+
+
+def get_team_member_spend_id(team_id: str, user_id: Optional[str]) -> str:
+    # team member spend id is "team_id::<value>::user_id::<value>"
+    return f"team_id::{team_id}::user_id::{user_id}"
+
+
+class SpendShard:
+    """
+    Spend per entity id of 1 entity type
+    """
+
+    __slots__ = ("entity_ids", "spend", "_rows")
+
+    def __init__(self) -> None:
+        self.entity_ids: List[str] = []
+        self.spend = array("d")
+        self._rows: Dict[str, int] = {}
+
+    def add(self, entity_id: str, spend: float) -> None:
+        row = self._rows.get(entity_id)
+        if row is None:
+            self._rows[entity_id] = len(self.entity_ids)
+            self.entity_ids.append(entity_id)
+            self.spend.append(spend)
+        else:
+            self.spend[row] += spend
+
+    def merge(self, other: "SpendShard") -> None:
+        for entity_id, spend in other.items():
+            self.add(entity_id, spend)
+
+    def get(self, entity_id: str, default: float = 0.0) -> float:
+        row = self._rows.get(entity_id)
+        if row is None:
+            return default
+        return self.spend[row]
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        return zip(self.entity_ids, self.spend)
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self.items())
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+
+class SpendAccumulator:
+    def __init__(
+        self,
+        flush_size_threshold: int = DEFAULT_SPEND_FLUSH_SIZE_THRESHOLD,
+        redis_cache: Optional[RedisCache] = None,
+        flush_lock_ttl: int = DEFAULT_SPEND_FLUSH_LOCK_TTL_SECONDS,
+    ) -> None:
+        self._shards: Dict[str, SpendShard] = {
+            entity_type: SpendShard() for entity_type in SPEND_ENTITY_TYPES
+        }
+        self.flush_size_threshold = flush_size_threshold
+        self.redis_cache = redis_cache
+        self.flush_lock_ttl = flush_lock_ttl
+        # set by the proxy on startup - writes all shards to the db
+        self.flush_callback: Optional[Callable[[], Awaitable[Any]]] = None
+        self._early_flush_task: Optional[asyncio.Task] = None
+
+    def add(self, entity_type: SpendEntityType, entity_id: str, spend: float) -> None:
+        shard = self._shards[entity_type]
+        shard.add(entity_id, spend)
+        if len(shard) >= self.flush_size_threshold:
+            self._start_early_flush()
+
+    def get_shard(self, entity_type: SpendEntityType) -> SpendShard:
+        """
+        Returns the active shard of an entity type - spend not yet picked up by a flush
+        """
+        return self._shards[entity_type]
+
+    def swap(self, entity_type: SpendEntityType) -> SpendShard:
+        """
+        Returns the shard accumulated so far, and installs an empty shard for incoming increments
+        """
+        shard = self._shards[entity_type]
+        self._shards[entity_type] = SpendShard()
+        return shard
+
+    def restore(self, entity_type: SpendEntityType, shard: SpendShard) -> None:
+        """
+        Merge the spend of a failed flush back into the active shard - written by the next flush
+        """
+        self._shards[entity_type].merge(shard)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Number of entities waiting for the next flush, per entity type
+        """
+        return {entity_type: len(shard) for entity_type, shard in self._shards.items()}
+
+    def _start_early_flush(self) -> None:
+        if self.flush_callback is None:
+            return
+        if self._early_flush_task is not None and not self._early_flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        verbose_proxy_logger.debug(
+            "Spend accumulator reached flush_size_threshold=%s - flushing early: %s",
+            self.flush_size_threshold,
+            self.get_stats(),
+        )
+        self._early_flush_task = loop.create_task(self._early_flush())
+
+    async def _early_flush(self) -> None:
+        if self.flush_callback is None:
+            return
+        try:
+            await self.flush_callback()
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "[Non-Blocking] Spend accumulator - early flush failed: %s", str(e)
+            )
+
+    ### REDIS AGGREGATION ###
+
+    def _get_redis_key(self, name: str) -> str:
+        key = f"{REDIS_SPEND_ACCUMULATOR_KEY_PREFIX}:{name}"
+        if self.redis_cache is None:
+            return key
+        return self.redis_cache.check_and_fix_namespace(key=key)
+
+    async def acquire_flush_lock(self) -> bool:
+        """
+        Returns True if this pod writes the spend to the db in this interval.
+
+        Always True without redis aggregation. With redis aggregation, the 1st pod to flush in an interval (`flush_lock_ttl`) gets the lock.
+        """
+        if self.redis_cache is None:
+            return True
+        try:
+            async with self.redis_cache.init_async_client() as redis_client:
+                acquired = await redis_client.set(
+                    self._get_redis_key("flush_lock"),
+                    "1",
+                    nx=True,
+                    ex=self.flush_lock_ttl,
+                )
+            return bool(acquired)
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "Spend accumulator - unable to get the redis flush lock, writing this pod's spend: %s",
+                str(e),
+            )
+            return True
+
+    async def get_spend_to_write(
+        self, entity_type: SpendEntityType, holds_flush_lock: bool = True
+    ) -> SpendShard:
+        """
+        Swaps out the active shard, and returns the spend to write to the db.
+
+        With redis aggregation, the shard is added to the redis hash of the entity type - the pod holding the flush lock gets the spend of all pods, other pods get an empty shard.
+        """
+        shard = self.swap(entity_type)
+        if self.redis_cache is None:
+            return shard
+        try:
+            await self._push_to_redis(entity_type=entity_type, shard=shard)
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "Spend accumulator - unable to add spend to redis, writing this pod's spend: %s",
+                str(e),
+            )
+            return shard
+        if holds_flush_lock is not True:
+            return SpendShard()
+        try:
+            return await self._pop_from_redis(entity_type=entity_type)
+        except Exception as e:
+            # the redis hash is only deleted with the read - the spend is written by the next flush
+            verbose_proxy_logger.warning(
+                "Spend accumulator - unable to read spend from redis: %s", str(e)
+            )
+            return SpendShard()
+
+    async def _push_to_redis(
+        self, entity_type: SpendEntityType, shard: SpendShard
+    ) -> None:
+        if len(shard) == 0 or self.redis_cache is None:
+            return
+        redis_key = self._get_redis_key(entity_type)
+        async with self.redis_cache.init_async_client() as redis_client:
+            # all or nothing - on failure the caller writes the whole shard to the db, so no part of it may be in redis
+            async with redis_client.pipeline(transaction=True) as pipe:
+                for entity_id, spend in shard.items():
+                    pipe.hincrbyfloat(redis_key, entity_id, spend)
+                await pipe.execute()
+
+    async def _pop_from_redis(self, entity_type: SpendEntityType) -> SpendShard:
+        shard = SpendShard()
+        if self.redis_cache is None:
+            return shard
+        redis_key = self._get_redis_key(entity_type)
+        async with self.redis_cache.init_async_client() as redis_client:
+            # read + delete in 1 transaction - spend added by other pods is either in this read, or in the next hash
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.hgetall(redis_key)
+                pipe.delete(redis_key)
+                results = await pipe.execute()
+        for entity_id, spend in (results[0] or {}).items():
+            if isinstance(entity_id, bytes):
+                entity_id = entity_id.decode("utf-8")
+            shard.add(entity_id, float(spend))
+        return shard
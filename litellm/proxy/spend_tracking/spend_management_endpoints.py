@@ -3,7 +3,7 @@ import collections
 import os
 from datetime import datetime, timedelta, timezone
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import fastapi
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -13,6 +13,13 @@ from litellm._logging import verbose_proxy_logger
 from litellm.proxy._types import *
 from litellm.proxy._types import ProviderBudgetResponse, ProviderBudgetResponseObject
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+from litellm.proxy.spend_tracking.spend_rollups import (
+    SpendRollupEntityType,
+    SpendRollupGranularity,
+    backfill_spend_rollups,
+    get_spend_rollup_timeseries,
+    get_top_entities_by_spend,
+)
 from litellm.proxy.spend_tracking.spend_tracking_utils import (
     get_spend_by_team_and_customer,
 )
@@ -26,6 +33,25 @@ else:
 router = APIRouter()
 
 
+def _should_use_spend_rollups() -> bool:
+    """
+    Read report data from "LiteLLM_SpendRollups" instead of aggregating "LiteLLM_SpendLogs" at query time.
+
+    Enable with `general_settings::use_spend_rollups: true`, after running `/global/spend/rollups/backfill` for historic data.
+    """
+    from litellm.proxy.proxy_server import general_settings
+
+    return general_settings.get("use_spend_rollups") is True
+
+
+def _get_last_30d_rollup_window() -> Tuple[datetime, datetime]:
+    """[start, end) window matching the `CURRENT_DATE - INTERVAL '30 days'` filter used by the spend views"""
+    today = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+    )
+    return today - timedelta(days=30), today + timedelta(days=1)
+
+
 @router.get(
     "/spend/keys",
     tags=["Budget & Spend Tracking"],
@@ -2237,6 +2263,22 @@ async def global_spend_logs(
         if prometheus_api_enabled:
             response = await get_daily_spend_from_prometheus(api_key=api_key)
             return response
+        elif _should_use_spend_rollups():
+            start_date, end_date = _get_last_30d_rollup_window()
+            rows = await get_spend_rollup_timeseries(
+                prisma_client=prisma_client,
+                start_date=start_date,
+                end_date=end_date,
+                entity_type="key",
+                entity_id=api_key,
+            )
+            response = []
+            for row in rows:
+                _row = {"date": row["date"], "spend": row["spend"]}
+                if api_key is not None:
+                    _row["api_key"] = api_key
+                response.append(_row)
+            return response
         else:
             if api_key is None:
                 sql_query = """SELECT * FROM "MonthlyGlobalSpend" ORDER BY "date";"""
@@ -2298,6 +2340,16 @@ async def global_spend():
 
         if prisma_client is None:
             raise HTTPException(status_code=500, detail={"error": "No db connected"})
+        if _should_use_spend_rollups():
+            start_date, end_date = _get_last_30d_rollup_window()
+            rows = await get_spend_rollup_timeseries(
+                prisma_client=prisma_client,
+                start_date=start_date,
+                end_date=end_date,
+                entity_type="key",
+            )
+            total_spend = sum(row.get("spend") or 0.0 for row in rows)
+            return {"spend": total_spend, "max_budget": litellm.max_budget}
         sql_query = """SELECT SUM(spend) as total_spend FROM "MonthlyGlobalSpend";"""
         response = await prisma_client.db.query_raw(query=sql_query)
         if response is not None:
@@ -2402,6 +2454,10 @@ async def global_spend_keys(
         return response
     if prisma_client is None:
         raise HTTPException(status_code=500, detail={"error": "No db connected"})
+    if _should_use_spend_rollups():
+        return await _get_top_keys_by_spend_from_rollups(
+            prisma_client=prisma_client, limit=limit
+        )
     sql_query = f"""SELECT * FROM "Last30dKeysBySpend" LIMIT {limit};"""
 
     response = await prisma_client.db.query_raw(query=sql_query)
@@ -2409,6 +2465,38 @@ async def global_spend_keys(
     return response
 
 
+async def _get_top_keys_by_spend_from_rollups(
+    prisma_client: PrismaClient, limit: Optional[int]
+) -> List[dict]:
+    """Same response shape as the "Last30dKeysBySpend" view, read from the daily key rollups"""
+    start_date, end_date = _get_last_30d_rollup_window()
+    rows = await get_top_entities_by_spend(
+        prisma_client=prisma_client,
+        entity_type="key",
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+    )
+    api_keys = [row["entity_id"] for row in rows]
+    key_rows = await prisma_client.db.litellm_verificationtoken.find_many(
+        where={"token": {"in": api_keys}}
+    )
+    keys_by_token = {key_row.token: key_row for key_row in key_rows}
+
+    response = []
+    for row in rows:
+        key_row = keys_by_token.get(row["entity_id"])
+        response.append(
+            {
+                "api_key": row["entity_id"],
+                "key_alias": getattr(key_row, "key_alias", None),
+                "key_name": getattr(key_row, "key_name", None),
+                "total_spend": row["total_spend"],
+            }
+        )
+    return response
+
+
 @router.get(
     "/global/spend/teams",
     tags=["Budget & Spend Tracking"],
@@ -2652,6 +2740,20 @@ async def global_spend_models(
     if prisma_client is None:
         raise HTTPException(status_code=500, detail={"error": "No db connected"})
 
+    if _should_use_spend_rollups():
+        start_date, end_date = _get_last_30d_rollup_window()
+        rows = await get_top_entities_by_spend(
+            prisma_client=prisma_client,
+            entity_type="model",
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+        )
+        return [
+            {"model": row["entity_id"], "total_spend": row["total_spend"]}
+            for row in rows
+        ]
+
     sql_query = f"""SELECT * FROM "Last30dModelsBySpend" LIMIT {limit};"""
 
     response = await prisma_client.db.query_raw(query=sql_query)
@@ -2659,6 +2761,105 @@ async def global_spend_models(
     return response
 
 
+@router.get(
+    "/global/spend/rollups",
+    tags=["Budget & Spend Tracking"],
+    dependencies=[Depends(user_api_key_auth)],
+)
+async def global_spend_rollups(
+    start_date: str = fastapi.Query(
+        description="Time from which to start viewing spend. Format: YYYY-MM-DD",
+    ),
+    end_date: str = fastapi.Query(
+        description="Time till which to view spend (inclusive). Format: YYYY-MM-DD",
+    ),
+    entity_type: SpendRollupEntityType = fastapi.Query(
+        default="key",
+        description="Entity to aggregate spend over - key, team, user, model or tag",
+    ),
+    entity_id: Optional[str] = fastapi.Query(
+        default=None,
+        description="Only return spend for this entity. Example entity_id='my-team-id'",
+    ),
+    granularity: SpendRollupGranularity = fastapi.Query(
+        default="day",
+        description="Bucket size - hour or day",
+    ),
+):
+    """
+    View hourly / daily spend, read from the pre-aggregated spend rollups.
+
+    Example Request:
+    ```
+    curl -X GET "http://0.0.0.0:4000/global/spend/rollups?start_date=2024-05-01&end_date=2024-05-31&entity_type=team&entity_id=my-team" \
+-H "Authorization: Bearer sk-1234"
+    ```
+    """
+    from litellm.proxy.proxy_server import prisma_client
+
+    if prisma_client is None:
+        raise HTTPException(status_code=500, detail={"error": "No db connected"})
+
+    return await get_spend_rollup_timeseries(
+        prisma_client=prisma_client,
+        start_date=datetime.strptime(start_date, "%Y-%m-%d"),
+        end_date=datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1),
+        entity_type=entity_type,
+        entity_id=entity_id,
+        granularity=granularity,
+    )
+
+
+@router.post(
+    "/global/spend/rollups/backfill",
+    tags=["Budget & Spend Tracking"],
+    dependencies=[Depends(user_api_key_auth)],
+)
+async def global_spend_rollups_backfill(
+    start_date: str = fastapi.Query(
+        description="First day to backfill. Format: YYYY-MM-DD",
+    ),
+    end_date: str = fastapi.Query(
+        description="Last day to backfill (inclusive). Format: YYYY-MM-DD",
+    ),
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """
+    ADMIN ONLY / MASTER KEY Only Endpoint
+
+    Recompute "LiteLLM_SpendRollups" from "LiteLLM_SpendLogs" for a date range, one day at a time.
+
+    Run this once for historic data before setting `general_settings::use_spend_rollups: true`.
+    """
+    from litellm.proxy.proxy_server import prisma_client
+
+    if prisma_client is None:
+        raise HTTPException(status_code=500, detail={"error": "No db connected"})
+
+    if user_api_key_dict.user_role != LitellmUserRoles.PROXY_ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={
+                "error": "Only proxy admins can backfill spend rollups. Your role={}".format(
+                    user_api_key_dict.user_role
+                )
+            },
+        )
+
+    rows_written = await backfill_spend_rollups(
+        prisma_client=prisma_client,
+        start_date=datetime.strptime(start_date, "%Y-%m-%d"),
+        end_date=datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1),
+    )
+    return {
+        "message": "Spend rollups backfilled from {} to {}".format(
+            start_date, end_date
+        ),
+        "rows_written": rows_written,
+        "status": "success",
+    }
+
+
 @router.get("/provider/budgets", response_model=ProviderBudgetResponse)
 async def provider_budgets() -> ProviderBudgetResponse:
     """
@@ -2790,7 +2991,25 @@ async def ui_get_spend_by_tags(
         raise HTTPException(status_code=500, detail={"error": "No db connected"})
 
     response = None
-    if tags_list is None or (isinstance(tags_list, list) and "all-tags" in tags_list):
+    if _should_use_spend_rollups():
+        rows = await get_top_entities_by_spend(
+            prisma_client=prisma_client,
+            entity_type="tag",
+            start_date=datetime.strptime(start_date, "%Y-%m-%d"),
+            end_date=datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1),
+            entity_ids=(
+                None if tags_list is None or "all-tags" in tags_list else tags_list
+            ),
+        )
+        response = [
+            {
+                "individual_request_tag": row["entity_id"],
+                "log_count": row["api_requests"],
+                "total_spend": row["total_spend"],
+            }
+            for row in rows
+        ]
+    elif tags_list is None or (isinstance(tags_list, list) and "all-tags" in tags_list):
         # Get spend for all tags
         sql_query = """
         SELECT
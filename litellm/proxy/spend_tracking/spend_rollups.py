@@ -0,0 +1,442 @@
+"""
+Incremental spend rollups - hourly + daily aggregates per key / team / user / model / tag.
+
+Report endpoints aggregating over "LiteLLM_SpendLogs" at query time get slow on
+large tables. Instead, every flushed batch of spend logs is folded in-memory into
+(granularity, bucket_start, entity_type, entity_id) rows, and upserted into
+"LiteLLM_SpendRollups" with a single `INSERT ... ON CONFLICT DO UPDATE` statement.
+
+- `update_spend_rollups`: called by `ProxyUpdateSpend.update_spend_logs` after a batch is written
+- `backfill_spend_rollups`: recompute rollups for a time range from "LiteLLM_SpendLogs"
+- `get_spend_rollup_timeseries` / `get_top_entities_by_spend`: read helpers used by the spend endpoints
+
+Both writers hold a postgres advisory lock - the backfill holds it exclusively while it rewrites a chunk, so
+increments written while it runs are not overwritten.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, Tuple
+
+from litellm._logging import verbose_proxy_logger
+
+if TYPE_CHECKING:
+    from litellm.proxy.utils import PrismaClient
+else:
+    PrismaClient = Any
+
+SpendRollupGranularity = Literal["hour", "day"]
+SpendRollupEntityType = Literal["key", "team", "user", "model", "tag"]
+
+SPEND_ROLLUP_GRANULARITIES: Tuple[SpendRollupGranularity, ...] = ("hour", "day")
+SPEND_ROLLUP_ENTITY_TYPES: Tuple[SpendRollupEntityType, ...] = (
+    "key",
+    "team",
+    "user",
+    "model",
+    "tag",
+)
+
+# (granularity, bucket_start, entity_type, entity_id)
+SpendRollupKey = Tuple[str, datetime, str, str]
+
+# advisory lock of the rollup table - shared by incremental updates, exclusive for the backfill
+SPEND_ROLLUPS_ADVISORY_LOCK_ID = 7261835204918
+
+
+# SQL expression for the entity id of each entity type, used by the backfill query
+_ENTITY_ID_SQL: Dict[str, str] = {
+    "key": 's."api_key"',
+    "team": 's."team_id"',
+    "user": 's."user"',
+    "model": 's."model"',
+    "tag": "tag",
+}
+
+
+def _get_rollup_id_sql(
+    granularity: str, bucket_start: str, entity_type: str, entity_id: str
+) -> str:
+    """
+    SQL expression for the id of a rollup row - the same for the incremental update and the backfill.
+
+    `bucket_start` must be a `timestamp` expression, it's formatted explicitly so the id doesn't depend on how the bucket was passed in.
+    """
+    return f"""md5({granularity} || to_char({bucket_start}, 'YYYY-MM-DD"T"HH24:MI:SS') || {entity_type} || {entity_id})"""
+
+
+async def _acquire_spend_rollups_lock(transaction: Any, exclusive: bool) -> None:
+    """Take the rollup advisory lock, released when `transaction` ends"""
+    lock_fn = "pg_advisory_xact_lock" if exclusive else "pg_advisory_xact_lock_shared"
+    await transaction.query_raw(
+        f"SELECT 1 AS locked FROM {lock_fn}($1::bigint)",
+        SPEND_ROLLUPS_ADVISORY_LOCK_ID,
+    )
+
+
+@dataclass
+class SpendRollupRow:
+    # token / request counts are BIGINT columns - sums over busy deployments overflow int32
+    spend: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    api_requests: int = 0
+
+
+def _get_bucket_start(
+    timestamp: datetime, granularity: SpendRollupGranularity
+) -> datetime:
+    """Truncate a timestamp to the start of its hour / day, as a naive UTC datetime"""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    if granularity == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _parse_start_time(start_time: Any) -> Optional[datetime]:
+    if isinstance(start_time, datetime):
+        return start_time
+    if isinstance(start_time, str):
+        try:
+            return datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return None
+
+
+def _get_request_tags(request_tags: Any) -> List[str]:
+    if isinstance(request_tags, str):
+        try:
+            request_tags = json.loads(request_tags)
+        except json.JSONDecodeError:
+            return []
+    if isinstance(request_tags, list):
+        return [str(tag) for tag in request_tags if tag]
+    return []
+
+
+def _get_entity_ids(spend_log: dict) -> List[Tuple[str, str]]:
+    """
+    Returns the (entity_type, entity_id) pairs a spend log contributes to.
+
+    Keys are always included (even the empty key), so summing "key" rollups gives global spend.
+    """
+    entity_ids: List[Tuple[str, str]] = [("key", spend_log.get("api_key") or "")]
+    for entity_type, field in (
+        ("team", "team_id"),
+        ("user", "user"),
+        ("model", "model"),
+    ):
+        value = spend_log.get(field)
+        if value:
+            entity_ids.append((entity_type, str(value)))
+    for tag in _get_request_tags(spend_log.get("request_tags")):
+        entity_ids.append(("tag", tag))
+    return entity_ids
+
+
+def aggregate_spend_logs_into_rollups(
+    spend_logs: Iterable[dict],
+) -> Dict[SpendRollupKey, SpendRollupRow]:
+    """
+    Fold a batch of spend logs (`SpendLogsPayload` dicts) into rollup rows.
+
+    A batch of 1000 logs typically collapses to a few dozen rows, so the db write is small.
+    """
+    rollups: Dict[SpendRollupKey, SpendRollupRow] = {}
+    for spend_log in spend_logs:
+        start_time = _parse_start_time(spend_log.get("startTime"))
+        if start_time is None:
+            continue
+        spend = float(spend_log.get("spend") or 0.0)
+        prompt_tokens = int(spend_log.get("prompt_tokens") or 0)
+        completion_tokens = int(spend_log.get("completion_tokens") or 0)
+        total_tokens = int(spend_log.get("total_tokens") or 0)
+        entity_ids = _get_entity_ids(spend_log)
+        for granularity in SPEND_ROLLUP_GRANULARITIES:
+            bucket_start = _get_bucket_start(start_time, granularity)
+            for entity_type, entity_id in entity_ids:
+                key = (granularity, bucket_start, entity_type, entity_id)
+                row = rollups.get(key)
+                if row is None:
+                    row = rollups[key] = SpendRollupRow()
+                row.spend += spend
+                row.prompt_tokens += prompt_tokens
+                row.completion_tokens += completion_tokens
+                row.total_tokens += total_tokens
+                row.api_requests += 1
+    return rollups
+
+
+async def update_spend_rollups(
+    prisma_client: PrismaClient, spend_logs: List[dict]
+) -> int:
+    """
+    Increment the rollup table with a batch of flushed spend logs.
+
+    All rows are sent as column arrays and upserted with one statement. Returns the number of rollup rows written.
+    """
+    rollups = aggregate_spend_logs_into_rollups(spend_logs)
+    if len(rollups) == 0:
+        return 0
+
+    granularities: List[str] = []
+    bucket_starts: List[str] = []
+    entity_types: List[str] = []
+    entity_ids: List[str] = []
+    spends: List[str] = []
+    prompt_tokens: List[str] = []
+    completion_tokens: List[str] = []
+    total_tokens: List[str] = []
+    api_requests: List[str] = []
+    for (granularity, bucket_start, entity_type, entity_id), row in rollups.items():
+        granularities.append(granularity)
+        bucket_starts.append(bucket_start.isoformat())
+        entity_types.append(entity_type)
+        entity_ids.append(entity_id)
+        spends.append(repr(row.spend))
+        prompt_tokens.append(str(row.prompt_tokens))
+        completion_tokens.append(str(row.completion_tokens))
+        total_tokens.append(str(row.total_tokens))
+        api_requests.append(str(row.api_requests))
+
+    rollup_id_sql = _get_rollup_id_sql(
+        granularity="u.granularity",
+        bucket_start="u.bucket_start::timestamp",
+        entity_type="u.entity_type",
+        entity_id="u.entity_id",
+    )
+    sql_query = f"""
+    INSERT INTO "LiteLLM_SpendRollups" (
+        id, granularity, bucket_start, entity_type, entity_id,
+        spend, prompt_tokens, completion_tokens, total_tokens, api_requests, updated_at
+    )
+    SELECT
+        {rollup_id_sql},
+        u.granularity,
+        u.bucket_start::timestamp,
+        u.entity_type,
+        u.entity_id,
+        u.spend::double precision,
+        u.prompt_tokens::bigint,
+        u.completion_tokens::bigint,
+        u.total_tokens::bigint,
+        u.api_requests::bigint,
+        NOW()
+    FROM UNNEST(
+        $1::text[], $2::text[], $3::text[], $4::text[], $5::text[],
+        $6::text[], $7::text[], $8::text[], $9::text[]
+    ) AS u(
+        granularity, bucket_start, entity_type, entity_id, spend,
+        prompt_tokens, completion_tokens, total_tokens, api_requests
+    )
+    ON CONFLICT (granularity, bucket_start, entity_type, entity_id) DO UPDATE SET
+        spend = "LiteLLM_SpendRollups".spend + EXCLUDED.spend,
+        prompt_tokens = "LiteLLM_SpendRollups".prompt_tokens + EXCLUDED.prompt_tokens,
+        completion_tokens = "LiteLLM_SpendRollups".completion_tokens + EXCLUDED.completion_tokens,
+        total_tokens = "LiteLLM_SpendRollups".total_tokens + EXCLUDED.total_tokens,
+        api_requests = "LiteLLM_SpendRollups".api_requests + EXCLUDED.api_requests,
+        updated_at = NOW();
+    """
+    async with prisma_client.db.tx(timeout=timedelta(seconds=60)) as transaction:
+        await _acquire_spend_rollups_lock(transaction=transaction, exclusive=False)
+        await transaction.execute_raw(
+            sql_query,
+            granularities,
+            bucket_starts,
+            entity_types,
+            entity_ids,
+            spends,
+            prompt_tokens,
+            completion_tokens,
+            total_tokens,
+            api_requests,
+        )
+    verbose_proxy_logger.debug(
+        "Updated %s spend rollup rows from %s spend logs",
+        len(rollups),
+        len(spend_logs),
+    )
+    return len(rollups)
+
+
+def _get_backfill_query(
+    granularity: SpendRollupGranularity, entity_type: SpendRollupEntityType
+) -> str:
+    entity_id_sql = _ENTITY_ID_SQL[entity_type]
+    from_clause = '"LiteLLM_SpendLogs" s'
+    where_clause = 's."startTime" >= $1::timestamp AND s."startTime" < $2::timestamp'
+    if entity_type == "tag":
+        from_clause += ", jsonb_array_elements_text(s.request_tags) AS tag"
+        where_clause += " AND jsonb_typeof(s.request_tags) = 'array'"
+    if entity_type == "key":
+        entity_id_sql = f"COALESCE({entity_id_sql}, '')"
+    else:
+        where_clause += f" AND {entity_id_sql} IS NOT NULL AND {entity_id_sql} <> ''"
+
+    rollup_id_sql = _get_rollup_id_sql(
+        granularity=f"'{granularity}'",
+        bucket_start="agg.bucket_start",
+        entity_type=f"'{entity_type}'",
+        entity_id="agg.entity_id",
+    )
+
+    return f"""
+    INSERT INTO "LiteLLM_SpendRollups" (
+        id, granularity, bucket_start, entity_type, entity_id,
+        spend, prompt_tokens, completion_tokens, total_tokens, api_requests, updated_at
+    )
+    SELECT
+        {rollup_id_sql},
+        '{granularity}', agg.bucket_start, '{entity_type}', agg.entity_id,
+        agg.spend, agg.prompt_tokens, agg.completion_tokens, agg.total_tokens, agg.api_requests,
+        NOW()
+    FROM (
+        SELECT
+            date_trunc('{granularity}', s."startTime") AS bucket_start,
+            {entity_id_sql} AS entity_id,
+            SUM(s.spend) AS spend,
+            SUM(s.prompt_tokens)::bigint AS prompt_tokens,
+            SUM(s.completion_tokens)::bigint AS completion_tokens,
+            SUM(s.total_tokens)::bigint AS total_tokens,
+            COUNT(*) AS api_requests
+        FROM {from_clause}
+        WHERE {where_clause}
+        GROUP BY 1, 2
+    ) agg
+    ON CONFLICT (granularity, bucket_start, entity_type, entity_id) DO UPDATE SET
+        spend = EXCLUDED.spend,
+        prompt_tokens = EXCLUDED.prompt_tokens,
+        completion_tokens = EXCLUDED.completion_tokens,
+        total_tokens = EXCLUDED.total_tokens,
+        api_requests = EXCLUDED.api_requests,
+        updated_at = NOW();
+    """
+
+
+async def backfill_spend_rollups(
+    prisma_client: PrismaClient,
+    start_date: datetime,
+    end_date: datetime,
+    chunk_size: timedelta = timedelta(days=1),
+    chunk_timeout: timedelta = timedelta(minutes=10),
+) -> int:
+    """
+    Recompute rollups for [start_date, end_date) from "LiteLLM_SpendLogs".
+
+    Runs one day at a time (by default), so each chunk only scans one day of the `startTime` index.
+    A chunk is rewritten in 1 transaction holding the rollup lock exclusively - incremental updates
+    wait for it instead of being overwritten. Existing rollup rows in the range are replaced by the
+    sums of the spend logs, so the backfill is idempotent.
+
+    Returns the number of rollup rows written.
+    """
+    start_date = _get_bucket_start(start_date, "day")
+    rows_written = 0
+    window_start = start_date
+    while window_start < end_date:
+        window_end = min(window_start + chunk_size, end_date)
+        async with prisma_client.db.tx(timeout=chunk_timeout) as transaction:
+            await _acquire_spend_rollups_lock(transaction=transaction, exclusive=True)
+            for granularity in SPEND_ROLLUP_GRANULARITIES:
+                for entity_type in SPEND_ROLLUP_ENTITY_TYPES:
+                    result = await transaction.execute_raw(
+                        _get_backfill_query(
+                            granularity=granularity, entity_type=entity_type
+                        ),
+                        window_start.isoformat(),
+                        window_end.isoformat(),
+                    )
+                    if isinstance(result, int):
+                        rows_written += result
+        verbose_proxy_logger.info(
+            "Backfilled spend rollups for %s - %s", window_start, window_end
+        )
+        window_start = window_end
+    return rows_written
+
+
+async def get_spend_rollup_timeseries(
+    prisma_client: PrismaClient,
+    start_date: datetime,
+    end_date: datetime,
+    entity_type: SpendRollupEntityType = "key",
+    entity_id: Optional[str] = None,
+    granularity: SpendRollupGranularity = "day",
+) -> List[dict]:
+    """
+    Spend per bucket in [start_date, end_date), summed across all entities of `entity_type` (or one `entity_id`).
+
+    Returns rows of `{"date", "spend", "prompt_tokens", "completion_tokens", "total_tokens", "api_requests"}`
+    """
+    params: List[Any] = [granularity, entity_type, start_date, end_date]
+    entity_filter = ""
+    if entity_id is not None:
+        params.append(entity_id)
+        entity_filter = "AND entity_id = $5"
+
+    sql_query = f"""
+    SELECT
+        bucket_start AS date,
+        SUM(spend) AS spend,
+        SUM(prompt_tokens)::bigint AS prompt_tokens,
+        SUM(completion_tokens)::bigint AS completion_tokens,
+        SUM(total_tokens)::bigint AS total_tokens,
+        SUM(api_requests)::bigint AS api_requests
+    FROM "LiteLLM_SpendRollups"
+    WHERE granularity = $1
+        AND entity_type = $2
+        AND bucket_start >= $3::timestamp
+        AND bucket_start < $4::timestamp
+        {entity_filter}
+    GROUP BY bucket_start
+    ORDER BY bucket_start;
+    """
+    response = await prisma_client.db.query_raw(sql_query, *params)
+    return response or []
+
+
+async def get_top_entities_by_spend(
+    prisma_client: PrismaClient,
+    entity_type: SpendRollupEntityType,
+    start_date: datetime,
+    end_date: datetime,
+    limit: Optional[int] = None,
+    entity_ids: Optional[List[str]] = None,
+) -> List[dict]:
+    """
+    Entities of `entity_type` ordered by spend in [start_date, end_date), read from the daily rollups.
+
+    Returns rows of `{"entity_id", "total_spend", "total_tokens", "api_requests"}`
+    """
+    params: List[Any] = [entity_type, start_date, end_date]
+    entity_filter = ""
+    if entity_ids is not None:
+        params.append(entity_ids)
+        entity_filter = f"AND entity_id = ANY(${len(params)}::text[])"
+    limit_clause = ""
+    if limit is not None:
+        params.append(int(limit))
+        limit_clause = f"LIMIT ${len(params)}"
+
+    sql_query = f"""
+    SELECT
+        entity_id,
+        SUM(spend) AS total_spend,
+        SUM(total_tokens)::bigint AS total_tokens,
+        SUM(api_requests)::bigint AS api_requests
+    FROM "LiteLLM_SpendRollups"
+    WHERE granularity = 'day'
+        AND entity_type = $1
+        AND bucket_start >= $2::timestamp
+        AND bucket_start < $3::timestamp
+        {entity_filter}
+    GROUP BY entity_id
+    ORDER BY total_spend DESC
+    {limit_clause};
+    """
+    response = await prisma_client.db.query_raw(sql_query, *params)
+    return response or []
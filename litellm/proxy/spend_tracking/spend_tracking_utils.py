@@ -11,7 +11,7 @@ import litellm
 from litellm._logging import verbose_proxy_logger
 from litellm.proxy._types import SpendLogsMetadata, SpendLogsPayload
 from litellm.proxy.utils import PrismaClient, hash_token
-from litellm.types.utils import StandardLoggingPayload
+from litellm.types.utils import CallTypes, StandardLoggingPayload
 from litellm.utils import get_end_user_id_for_cost_tracking
 
 
@@ -92,6 +92,18 @@ def get_logging_payload(  # noqa: PLR0915
     standard_logging_payload = cast(
         Optional[StandardLoggingPayload], kwargs.get("standard_logging_object", None)
     )
+    if (
+        call_type == CallTypes.arealtime.value
+        and not response_obj
+        and standard_logging_payload is not None
+    ):
+        # realtime sessions - logged as a list of events, the id + usage are only in the standard logging payload
+        id = standard_logging_payload["id"]
+        usage = {
+            "prompt_tokens": standard_logging_payload["prompt_tokens"],
+            "completion_tokens": standard_logging_payload["completion_tokens"],
+            "total_tokens": standard_logging_payload["total_tokens"],
+        }
 
     end_user_id = get_end_user_id_for_cost_tracking(litellm_params)
 
@@ -37,6 +37,7 @@ from litellm import EmbeddingResponse, ImageResponse, ModelResponse, Router
 from litellm._logging import verbose_proxy_logger
 from litellm._service_logger import ServiceLogging, ServiceTypes
 from litellm.caching.caching import DualCache, RedisCache
+from litellm.caching.shared_memory_cache import get_shared_memory_cache
 from litellm.exceptions import RejectedRequestError
 from litellm.integrations.custom_guardrail import CustomGuardrail
 from litellm.integrations.custom_logger import CustomLogger
@@ -64,6 +65,12 @@ from litellm.proxy.hooks.parallel_request_limiter import (
     _PROXY_MaxParallelRequestsHandler,
 )
 from litellm.proxy.litellm_pre_call_utils import LiteLLMProxyRequestSetup
+from litellm.proxy.spend_tracking.spend_accumulator import (
+    SPEND_ENTITY_TYPES,
+    SpendAccumulator,
+    SpendEntityType,
+    SpendShard,
+)
 from litellm.secret_managers.main import str_to_bool
 from litellm.types.integrations.slack_alerting import DEFAULT_ALERT_TYPES
 from litellm.types.utils import CallTypes, LoggedLiteLLMParams
@@ -240,7 +247,12 @@ class ProxyLogging:
         self.call_details: dict = {}
         self.call_details["user_api_key_cache"] = user_api_key_cache
         self.internal_usage_cache: InternalUsageCache = InternalUsageCache(
-            dual_cache=DualCache(default_in_memory_ttl=1)  # ping redis cache every 1s
+            dual_cache=DualCache(
+                default_in_memory_ttl=1,  # ping redis cache every 1s
+                shared_memory_cache=get_shared_memory_cache(
+                    namespace="internal_usage_cache"
+                ),
+            )
         )
         self.max_parallel_request_limiter = _PROXY_MaxParallelRequestsHandler(
             self.internal_usage_cache
@@ -1051,12 +1063,6 @@ def jsonify_object(data: dict) -> dict:
 
 
 class PrismaClient:
-    user_list_transactons: dict = {}
-    end_user_list_transactons: dict = {}
-    key_list_transactons: dict = {}
-    team_list_transactons: dict = {}
-    team_member_list_transactons: dict = {}  # key is ["team_id" + "user_id"]
-    org_list_transactons: dict = {}
     spend_log_transactions: List = []
 
     def __init__(
@@ -1067,6 +1073,8 @@ class PrismaClient:
     ):
         ## init logging object
         self.proxy_logging_obj = proxy_logging_obj
+        ## spend per user / end-user / key / team / team member / org, until the next batch write
+        self.spend_accumulator = SpendAccumulator()
         self.iam_token_db_auth: Optional[bool] = str_to_bool(
             os.getenv("IAM_TOKEN_DB_AUTH")
         )
@@ -2433,8 +2441,18 @@ async def reset_budget(prisma_client: PrismaClient):
 class ProxyUpdateSpend:
     @staticmethod
     async def update_end_user_spend(
-        n_retry_times: int, prisma_client: PrismaClient, proxy_logging_obj: ProxyLogging
+        n_retry_times: int,
+        prisma_client: PrismaClient,
+        proxy_logging_obj: ProxyLogging,
+        holds_flush_lock: bool = True,
     ):
+        end_user_transactions = (
+            await prisma_client.spend_accumulator.get_spend_to_write(
+                entity_type="end_user", holds_flush_lock=holds_flush_lock
+            )
+        )
+        if len(end_user_transactions) == 0:
+            return
         for i in range(n_retry_times + 1):
             start_time = time.time()
             try:
@@ -2445,7 +2463,7 @@ class ProxyUpdateSpend:
                         for (
                             end_user_id,
                             response_cost,
-                        ) in prisma_client.end_user_list_transactons.items():
+                        ) in end_user_transactions.items():
                             if litellm.max_end_user_budget is not None:
                                 pass
                             batcher.litellm_endusertable.upsert(
@@ -2463,19 +2481,135 @@ class ProxyUpdateSpend:
                 break
             except DB_CONNECTION_ERROR_TYPES as e:
                 if i >= n_retry_times:  # If we've reached the maximum number of retries
+                    # the end user transactions are not restored - prevent bad data from causing issues
+                    _raise_failed_update_spend_exception(
+                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
+                    )
+                # Optionally, sleep for a bit before retrying
+                await asyncio.sleep(2**i)  # Exponential backoff
+            except Exception as e:
+                _raise_failed_update_spend_exception(
+                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
+                )
+
+    @staticmethod
+    def _add_entity_spend_to_batch(
+        batcher: Any,
+        entity_type: SpendEntityType,
+        entity_id: str,
+        response_cost: float,
+    ):
+        # 'update_many' prevents error from being raised if no row exists
+        data = {"spend": {"increment": response_cost}}
+        if entity_type == "user":
+            batcher.litellm_usertable.update_many(
+                where={"user_id": entity_id}, data=data
+            )
+        elif entity_type == "key":
+            batcher.litellm_verificationtoken.update_many(
+                where={"token": entity_id}, data=data
+            )
+        elif entity_type == "team":
+            verbose_proxy_logger.debug(
+                "Updating spend for team id=%s by %s", entity_id, response_cost
+            )
+            batcher.litellm_teamtable.update_many(
+                where={"team_id": entity_id}, data=data
+            )
+        elif entity_type == "team_member":
+            # entity id is "team_id::<value>::user_id::<value>"
+            team_id = entity_id.split("::")[1]
+            user_id = entity_id.split("::")[3]
+            batcher.litellm_teammembership.update_many(
+                where={"team_id": team_id, "user_id": user_id}, data=data
+            )
+        elif entity_type == "org":
+            batcher.litellm_organizationtable.update_many(
+                where={"organization_id": entity_id}, data=data
+            )
+
+    @staticmethod
+    async def update_entity_spend(
+        entity_type: SpendEntityType,
+        n_retry_times: int,
+        prisma_client: PrismaClient,
+        proxy_logging_obj: ProxyLogging,
+        holds_flush_lock: bool = True,
+    ):
+        """
+        Batch write the accumulated spend of an entity type (user / key / team / team member / org) to the db.
+
+        The spend is swapped out of the accumulator before the write - spend of a failed write is restored, and written by the next flush.
+        """
+        spend_accumulator = prisma_client.spend_accumulator
+        transactions: SpendShard = await spend_accumulator.get_spend_to_write(
+            entity_type=entity_type, holds_flush_lock=holds_flush_lock
+        )
+        if len(transactions) == 0:
+            return
+        for i in range(n_retry_times + 1):
+            start_time = time.time()
+            try:
+                async with prisma_client.db.tx(
+                    timeout=timedelta(seconds=60)
+                ) as transaction:
+                    async with transaction.batch_() as batcher:
+                        for entity_id, response_cost in transactions.items():
+                            ProxyUpdateSpend._add_entity_spend_to_batch(
+                                batcher=batcher,
+                                entity_type=entity_type,
+                                entity_id=entity_id,
+                                response_cost=response_cost,
+                            )
+                break
+            except DB_CONNECTION_ERROR_TYPES as e:
+                if i >= n_retry_times:  # If we've reached the maximum number of retries
+                    spend_accumulator.restore(
+                        entity_type=entity_type, shard=transactions
+                    )
                     _raise_failed_update_spend_exception(
                         e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
                     )
                 # Optionally, sleep for a bit before retrying
                 await asyncio.sleep(2**i)  # Exponential backoff
             except Exception as e:
+                spend_accumulator.restore(entity_type=entity_type, shard=transactions)
                 _raise_failed_update_spend_exception(
                     e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
                 )
-            finally:
-                prisma_client.end_user_list_transactons = (
-                    {}
-                )  # reset the end user list transactions - prevent bad data from causing issues
+
+    @staticmethod
+    async def update_accumulated_spend(
+        n_retry_times: int,
+        prisma_client: PrismaClient,
+        proxy_logging_obj: ProxyLogging,
+    ):
+        """
+        Batch write the spend of all entity types in the spend accumulator to the db.
+
+        Runs on the `update_spend` interval, and early once a shard reaches `flush_size_threshold` entities.
+        """
+        verbose_proxy_logger.debug(
+            "Spend accumulator transactions: %s",
+            prisma_client.spend_accumulator.get_stats(),
+        )
+        holds_flush_lock = await prisma_client.spend_accumulator.acquire_flush_lock()
+        for entity_type in SPEND_ENTITY_TYPES:
+            if entity_type == "end_user":
+                await ProxyUpdateSpend.update_end_user_spend(
+                    n_retry_times=n_retry_times,
+                    prisma_client=prisma_client,
+                    proxy_logging_obj=proxy_logging_obj,
+                    holds_flush_lock=holds_flush_lock,
+                )
+            else:
+                await ProxyUpdateSpend.update_entity_spend(
+                    entity_type=entity_type,
+                    n_retry_times=n_retry_times,
+                    prisma_client=prisma_client,
+                    proxy_logging_obj=proxy_logging_obj,
+                    holds_flush_lock=holds_flush_lock,
+                )
 
     @staticmethod
     async def update_spend_logs(
@@ -2514,6 +2648,10 @@ class ProxyUpdateSpend:
                                     len(logs_to_process) :
                                 ]
                             )
+                            await ProxyUpdateSpend.update_spend_rollups(
+                                prisma_client=prisma_client,
+                                logs_to_process=logs_to_process,
+                            )
                     else:
                         for j in range(0, len(logs_to_process), BATCH_SIZE):
                             batch = logs_to_process[j : j + BATCH_SIZE]
@@ -2534,6 +2672,10 @@ class ProxyUpdateSpend:
                         verbose_proxy_logger.debug(
                             f"{len(logs_to_process)} logs processed. Remaining in queue: {len(prisma_client.spend_log_transactions)}"
                         )
+                        await ProxyUpdateSpend.update_spend_rollups(
+                            prisma_client=prisma_client,
+                            logs_to_process=logs_to_process,
+                        )
                     break
                 except DB_CONNECTION_ERROR_TYPES:
                     if i is None:
@@ -2549,8 +2691,30 @@ class ProxyUpdateSpend:
                 e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
             )
 
+    @staticmethod
+    async def update_spend_rollups(
+        prisma_client: PrismaClient,
+        logs_to_process: List[dict],
+    ):
+        """
+        Fold a flushed batch of spend logs into the hourly / daily rollup table.
+
+        Runs once per flushed batch (not per retry), so rollups are not double counted.
+        Non-blocking - a failure here never prevents spend logs from being written.
+        """
+        from litellm.proxy.spend_tracking.spend_rollups import update_spend_rollups
+
+        try:
+            await update_spend_rollups(
+                prisma_client=prisma_client, spend_logs=logs_to_process
+            )
+        except Exception as e:
+            verbose_proxy_logger.exception(
+                "[Non-Blocking] Failed to update spend rollups - {}".format(str(e))
+            )
+
 
-async def update_spend(  # noqa: PLR0915
+async def update_spend(
     prisma_client: PrismaClient,
     db_writer_client: Optional[HTTPHandler],
     proxy_logging_obj: ProxyLogging,
@@ -2567,202 +2731,12 @@ async def update_spend(  # noqa: PLR0915
     spend_logs: list,
     """
     n_retry_times = 3
-    i = None
-    ### UPDATE USER TABLE ###
-    if len(prisma_client.user_list_transactons.keys()) > 0:
-        for i in range(n_retry_times + 1):
-            start_time = time.time()
-            try:
-                async with prisma_client.db.tx(
-                    timeout=timedelta(seconds=60)
-                ) as transaction:
-                    async with transaction.batch_() as batcher:
-                        for (
-                            user_id,
-                            response_cost,
-                        ) in prisma_client.user_list_transactons.items():
-                            batcher.litellm_usertable.update_many(
-                                where={"user_id": user_id},
-                                data={"spend": {"increment": response_cost}},
-                            )
-                prisma_client.user_list_transactons = (
-                    {}
-                )  # Clear the remaining transactions after processing all batches in the loop.
-                break
-            except DB_CONNECTION_ERROR_TYPES as e:
-                if i >= n_retry_times:  # If we've reached the maximum number of retries
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-                # Optionally, sleep for a bit before retrying
-                await asyncio.sleep(2**i)  # Exponential backoff
-            except Exception as e:
-                _raise_failed_update_spend_exception(
-                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                )
-
-    ### UPDATE END-USER TABLE ###
-    verbose_proxy_logger.debug(
-        "End-User Spend transactions: {}".format(
-            len(prisma_client.end_user_list_transactons.keys())
-        )
+    ### UPDATE USER / END-USER / KEY / TEAM / TEAM MEMBER / ORG TABLES ###
+    await ProxyUpdateSpend.update_accumulated_spend(
+        n_retry_times=n_retry_times,
+        prisma_client=prisma_client,
+        proxy_logging_obj=proxy_logging_obj,
     )
-    if len(prisma_client.end_user_list_transactons.keys()) > 0:
-        await ProxyUpdateSpend.update_end_user_spend(
-            n_retry_times=n_retry_times,
-            prisma_client=prisma_client,
-            proxy_logging_obj=proxy_logging_obj,
-        )
-    ### UPDATE KEY TABLE ###
-    verbose_proxy_logger.debug(
-        "KEY Spend transactions: {}".format(
-            len(prisma_client.key_list_transactons.keys())
-        )
-    )
-    if len(prisma_client.key_list_transactons.keys()) > 0:
-        for i in range(n_retry_times + 1):
-            start_time = time.time()
-            try:
-                async with prisma_client.db.tx(
-                    timeout=timedelta(seconds=60)
-                ) as transaction:
-                    async with transaction.batch_() as batcher:
-                        for (
-                            token,
-                            response_cost,
-                        ) in prisma_client.key_list_transactons.items():
-                            batcher.litellm_verificationtoken.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                where={"token": token},
-                                data={"spend": {"increment": response_cost}},
-                            )
-                prisma_client.key_list_transactons = (
-                    {}
-                )  # Clear the remaining transactions after processing all batches in the loop.
-                break
-            except DB_CONNECTION_ERROR_TYPES as e:
-                if i >= n_retry_times:  # If we've reached the maximum number of retries
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-                # Optionally, sleep for a bit before retrying
-                await asyncio.sleep(2**i)  # Exponential backoff
-            except Exception as e:
-                _raise_failed_update_spend_exception(
-                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                )
-
-    ### UPDATE TEAM TABLE ###
-    verbose_proxy_logger.debug(
-        "Team Spend transactions: {}".format(
-            len(prisma_client.team_list_transactons.keys())
-        )
-    )
-    if len(prisma_client.team_list_transactons.keys()) > 0:
-        for i in range(n_retry_times + 1):
-            start_time = time.time()
-            try:
-                async with prisma_client.db.tx(
-                    timeout=timedelta(seconds=60)
-                ) as transaction:
-                    async with transaction.batch_() as batcher:
-                        for (
-                            team_id,
-                            response_cost,
-                        ) in prisma_client.team_list_transactons.items():
-                            verbose_proxy_logger.debug(
-                                "Updating spend for team id={} by {}".format(
-                                    team_id, response_cost
-                                )
-                            )
-                            batcher.litellm_teamtable.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                where={"team_id": team_id},
-                                data={"spend": {"increment": response_cost}},
-                            )
-                prisma_client.team_list_transactons = (
-                    {}
-                )  # Clear the remaining transactions after processing all batches in the loop.
-                break
-            except DB_CONNECTION_ERROR_TYPES as e:
-                if i >= n_retry_times:  # If we've reached the maximum number of retries
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-                # Optionally, sleep for a bit before retrying
-                await asyncio.sleep(2**i)  # Exponential backoff
-            except Exception as e:
-                _raise_failed_update_spend_exception(
-                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                )
-
-    ### UPDATE TEAM Membership TABLE with spend ###
-    if len(prisma_client.team_member_list_transactons.keys()) > 0:
-        for i in range(n_retry_times + 1):
-            start_time = time.time()
-            try:
-                async with prisma_client.db.tx(
-                    timeout=timedelta(seconds=60)
-                ) as transaction:
-                    async with transaction.batch_() as batcher:
-                        for (
-                            key,
-                            response_cost,
-                        ) in prisma_client.team_member_list_transactons.items():
-                            # key is "team_id::<value>::user_id::<value>"
-                            team_id = key.split("::")[1]
-                            user_id = key.split("::")[3]
-
-                            batcher.litellm_teammembership.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                where={"team_id": team_id, "user_id": user_id},
-                                data={"spend": {"increment": response_cost}},
-                            )
-                prisma_client.team_member_list_transactons = (
-                    {}
-                )  # Clear the remaining transactions after processing all batches in the loop.
-                break
-            except DB_CONNECTION_ERROR_TYPES as e:
-                if i >= n_retry_times:  # If we've reached the maximum number of retries
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-                # Optionally, sleep for a bit before retrying
-                await asyncio.sleep(2**i)  # Exponential backoff
-            except Exception as e:
-                _raise_failed_update_spend_exception(
-                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                )
-
-    ### UPDATE ORG TABLE ###
-    if len(prisma_client.org_list_transactons.keys()) > 0:
-        for i in range(n_retry_times + 1):
-            start_time = time.time()
-            try:
-                async with prisma_client.db.tx(
-                    timeout=timedelta(seconds=60)
-                ) as transaction:
-                    async with transaction.batch_() as batcher:
-                        for (
-                            org_id,
-                            response_cost,
-                        ) in prisma_client.org_list_transactons.items():
-                            batcher.litellm_organizationtable.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                where={"organization_id": org_id},
-                                data={"spend": {"increment": response_cost}},
-                            )
-                prisma_client.org_list_transactons = (
-                    {}
-                )  # Clear the remaining transactions after processing all batches in the loop.
-                break
-            except DB_CONNECTION_ERROR_TYPES as e:
-                if i >= n_retry_times:  # If we've reached the maximum number of retries
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-                # Optionally, sleep for a bit before retrying
-                await asyncio.sleep(2**i)  # Exponential backoff
-            except Exception as e:
-                _raise_failed_update_spend_exception(
-                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                )
 
     ### UPDATE SPEND LOGS ###
     verbose_proxy_logger.debug(
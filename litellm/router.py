@@ -43,8 +43,14 @@ import litellm
 import litellm.litellm_core_utils
 import litellm.litellm_core_utils.exception_mapping_utils
 from litellm import get_secret_str
-from litellm._logging import verbose_router_logger
+from litellm._logging import (
+    LazyArg,
+    lazy_verbose_router_logger,
+    verbose_router_logger,
+)
+from litellm.batches.local_batches import is_native_batch_api_provider
 from litellm.caching.caching import DualCache, InMemoryCache, RedisCache
+from litellm.caching.shared_memory_cache import get_shared_memory_cache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.asyncify import run_async_function
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
@@ -83,6 +89,9 @@ from litellm.router_utils.handle_error import (
     async_raise_no_deployment_exception,
     send_llm_exception_alert,
 )
+from litellm.router_utils.pre_call_checks.deployment_pre_call_info import (
+    DeploymentPreCallInfo,
+)
 from litellm.router_utils.pre_call_checks.prompt_caching_deployment_check import (
     PromptCachingDeploymentCheck,
 )
@@ -123,6 +132,7 @@ from litellm.utils import (
     Rules,
     function_setup,
     get_llm_provider,
+    get_model_cost_map_key,
     get_non_default_completion_params,
     get_secret,
     get_utc_datetime,
@@ -318,6 +328,9 @@ class Router:
             []
         )  # names of models under litellm_params. ex. azure/chatgpt-v-2
         self.deployment_latency_map = {}
+        self.deployment_pre_call_info: Dict[str, DeploymentPreCallInfo] = (
+            {}
+        )  # model id -> info used by pre-call checks, see `_get_deployment_pre_call_info`
         ### CACHING ###
         cache_type: Literal["local", "redis", "redis-semantic", "s3", "disk"] = (
             "local"  # default to an in-memory cache
@@ -351,7 +364,9 @@ class Router:
                 litellm.cache = litellm.Cache(type=cache_type, **cache_config)  # type: ignore
             self.cache_responses = cache_responses
         self.cache = DualCache(
-            redis_cache=redis_cache, in_memory_cache=InMemoryCache()
+            redis_cache=redis_cache,
+            in_memory_cache=InMemoryCache(),
+            shared_memory_cache=get_shared_memory_cache(namespace="router"),
         )  # use a dual cache (Redis+In-Memory) for tracking cooldowns, usage, etc.
 
         ### SCHEDULER ###
@@ -599,6 +614,7 @@ class Router:
         litellm.logging_callback_manager.remove_callback_from_list_by_object(
             litellm.callbacks, self
         )
+        self.cooldown_cache.stop_cooldown_events_listener()
 
     def _update_redis_cache(self, cache: RedisCache):
         """
@@ -917,8 +933,8 @@ class Router:
             {}
         )  # this is a temporary dict to debug timeout issues
         try:
-            verbose_router_logger.debug(
-                f"Inside _acompletion()- model: {model}; kwargs: {kwargs}"
+            lazy_verbose_router_logger.debug(
+                "Inside _acompletion()- model: %s; kwargs: %s", model, kwargs
             )
             parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
             start_time = time.time()
@@ -1013,8 +1029,8 @@ class Router:
                     )
 
             self.success_calls[model_name] += 1
-            verbose_router_logger.info(
-                f"litellm.acompletion(model={model_name})\033[32m 200 OK\033[0m"
+            lazy_verbose_router_logger.info(
+                "litellm.acompletion(model=%s)\033[32m 200 OK\033[0m", model_name
             )
             # debug how often this deployment picked
             self._track_deployment_metrics(
@@ -1034,8 +1050,10 @@ class Router:
             e.message += f"\n\nDeployment Info: request_timeout: {deployment_request_timeout_param}\ntimeout: {deployment_timeout_param}"
             raise e
         except Exception as e:
-            verbose_router_logger.info(
-                f"litellm.acompletion(model={model_name})\033[31m Exception {str(e)}\033[0m"
+            lazy_verbose_router_logger.info(
+                "litellm.acompletion(model=%s)\033[31m Exception %s\033[0m",
+                model_name,
+                e,
             )
             if model_name is not None:
                 self.fail_calls[model_name] += 1
@@ -2517,6 +2535,13 @@ class Router:
             stripped_model, custom_llm_provider, _, _ = get_llm_provider(
                 model=data["model"]
             )
+            if not is_native_batch_api_provider(custom_llm_provider):
+                # no native batch api - store the file locally, batch lines keep the model group name and are load balanced by this router
+                response = await litellm.acreate_file(
+                    **{**kwargs, "custom_llm_provider": "local"}
+                )
+                self.success_calls[model_name] += 1
+                return response
             kwargs["file"] = replace_model_in_jsonl(
                 file_content=kwargs["file"], new_model_name=stripped_model
             )
@@ -2607,6 +2632,14 @@ class Router:
                 messages=[{"role": "user", "content": "files-api-fake-text"}],
                 specific_deployment=kwargs.pop("specific_deployment", None),
             )
+            _, custom_llm_provider, _, _ = get_llm_provider(
+                model=deployment["litellm_params"]["model"]
+            )
+            if not is_native_batch_api_provider(custom_llm_provider):
+                # no native batch api - run the batch requests through this router
+                return await litellm.acreate_batch(
+                    **{**kwargs, "custom_llm_provider": "local", "llm_router": self}
+                )
             metadata_variable_name = _get_router_metadata_variable_name(
                 function_name="_acreate_batch"
             )
@@ -2629,9 +2662,6 @@ class Router:
             )
             self.total_calls[model_name] += 1
 
-            ## SET CUSTOM PROVIDER TO SELECTED DEPLOYMENT ##
-            _, custom_llm_provider, _, _ = get_llm_provider(model=data["model"])
-
             response = litellm.acreate_batch(
                 **{
                     **data,
@@ -2703,6 +2733,8 @@ class Router:
                     _, custom_llm_provider, _, _ = get_llm_provider(  # type: ignore
                         model=model_name["litellm_params"]["model"]
                     )
+                    if not is_native_batch_api_provider(custom_llm_provider):
+                        custom_llm_provider = "local"
                     new_kwargs = copy.deepcopy(kwargs)
                     new_kwargs.pop("custom_llm_provider", None)
                     return await litellm.aretrieve_batch(
@@ -3122,8 +3154,8 @@ class Router:
             )
 
     async def async_function_with_retries(self, *args, **kwargs):  # noqa: PLR0915
-        verbose_router_logger.debug(
-            f"Inside async function with retries: args - {args}; kwargs - {kwargs}"
+        lazy_verbose_router_logger.debug(
+            "Inside async function with retries: args - %s; kwargs - %s", args, kwargs
         )
         original_function = kwargs.pop("original_function")
         fallbacks = kwargs.pop("fallbacks", self.fallbacks)
@@ -3144,8 +3176,10 @@ class Router:
             if model_list is not None:
                 _metadata.update({"model_group_size": len(model_list)})
 
-        verbose_router_logger.debug(
-            f"async function w/ retries: original_function - {original_function}, num_retries - {num_retries}"
+        lazy_verbose_router_logger.debug(
+            "async function w/ retries: original_function - %s, num_retries - %s",
+            original_function,
+            num_retries,
         )
         try:
             self._handle_mock_testing_rate_limit_error(
@@ -3202,8 +3236,8 @@ class Router:
             else:
                 raise
 
-            verbose_router_logger.info(
-                f"Retrying request with num_retries: {num_retries}"
+            lazy_verbose_router_logger.info(
+                "Retrying request with num_retries: %s", num_retries
             )
             # decides how long to sleep before retry
             retry_after = self._time_to_sleep_before_retry(
@@ -4084,6 +4118,7 @@ class Router:
     def set_model_list(self, model_list: list):
         original_model_list = copy.deepcopy(model_list)
         self.model_list = []
+        self.deployment_pre_call_info = {}
         # we add api_base/api_key each model so load balancing between azure/gpt on api_base1 and api_base2 works
 
         for model in original_model_list:
@@ -4323,6 +4358,7 @@ class Router:
         try:
             if deployment_idx is not None:
                 item = self.model_list.pop(deployment_idx)
+                self.deployment_pre_call_info.pop(id, None)
                 return item
             else:
                 return None
@@ -5194,12 +5230,76 @@ class Router:
                     )
                 return client
 
+    def _get_deployment_pre_call_info(
+        self, deployment: dict, model_group: str
+    ) -> DeploymentPreCallInfo:
+        """
+        Returns the (cached) info `_pre_call_checks` needs for a deployment - model info is only resolved once per deployment, and again if the model cost map changed
+        """
+        model_id = deployment.get("model_info", {}).get("id", None)
+        model_cost_map_key = get_model_cost_map_key()
+        pre_call_info = (
+            self.deployment_pre_call_info.get(model_id)
+            if model_id is not None
+            else None
+        )
+        if (
+            pre_call_info is not None
+            and pre_call_info.deployment is deployment
+            and pre_call_info.model_cost_map_key == model_cost_map_key
+        ):
+            return pre_call_info
+
+        base_model = deployment.get("model_info", {}).get("base_model", None)
+        if base_model is None:
+            base_model = deployment.get("litellm_params", {}).get("base_model", None)
+        litellm_model = deployment.get("litellm_params", {}).get("model", None)
+        max_input_tokens: Optional[int] = None
+        try:
+            model_info = self.get_router_model_info(
+                deployment=deployment, received_model_name=model_group
+            )
+            if isinstance(model_info, dict) and isinstance(
+                model_info.get("max_input_tokens", None), int
+            ):
+                max_input_tokens = model_info["max_input_tokens"]
+        except Exception as e:
+            verbose_router_logger.exception("An error occurs - {}".format(str(e)))
+
+        pre_call_info = DeploymentPreCallInfo(
+            deployment=deployment,
+            model=base_model or litellm_model,
+            max_input_tokens=max_input_tokens,
+            model_cost_map_key=model_cost_map_key,
+        )
+        # wildcard deployments resolve their model info from the requested model name - don't cache them
+        if model_id is not None and "*" not in (litellm_model or ""):
+            self.deployment_pre_call_info[model_id] = pre_call_info
+        return pre_call_info
+
+    def _get_input_tokens(
+        self, messages: Optional[List[Dict[str, str]]]
+    ) -> Optional[int]:
+        """
+        Count the request's input tokens once - shared by `_pre_call_checks` and the routing strategies. None if counting failed.
+        """
+        try:
+            return litellm.token_counter(messages=messages)
+        except Exception as e:
+            verbose_router_logger.error(
+                "litellm.router.py::_pre_call_checks: failed to count tokens. Returning initial list of deployments. Got - {}".format(
+                    str(e)
+                )
+            )
+            return None
+
     def _pre_call_checks(  # noqa: PLR0915
         self,
         model: str,
         healthy_deployments: List,
         messages: List[Dict[str, str]],
         request_kwargs: Optional[dict] = None,
+        input_tokens: Optional[int] = None,
     ):
         """
         Filter out model in model group, if:
@@ -5208,26 +5308,22 @@ class Router:
         - filter models above rpm limits
         - if region given, filter out models not in that region / unknown region
         - [TODO] function call and model doesn't support function calling
-        """
 
-        verbose_router_logger.debug(
-            f"Starting Pre-call checks for deployments in model={model}"
-        )
+        `input_tokens` - the token count of `messages`, if already counted for this request.
 
-        _returned_deployments = copy.deepcopy(healthy_deployments)
+        Returns the deployments that passed the checks - the same deployment dicts as `healthy_deployments`, not copies.
+        """
 
-        invalid_model_indices = []
+        lazy_verbose_router_logger.debug(
+            "Starting Pre-call checks for deployments in model=%s", model
+        )
 
-        try:
-            input_tokens = litellm.token_counter(messages=messages)
-        except Exception as e:
-            verbose_router_logger.error(
-                "litellm.router.py::_pre_call_checks: failed to count tokens. Returning initial list of deployments. Got - {}".format(
-                    str(e)
-                )
-            )
-            return _returned_deployments
+        if input_tokens is None:
+            input_tokens = self._get_input_tokens(messages=messages)
+            if input_tokens is None:
+                return list(healthy_deployments)
 
+        is_valid = [True] * len(healthy_deployments)
         _context_window_error = False
         _potential_error_str = ""
         _rate_limit_error = False
@@ -5243,42 +5339,35 @@ class Router:
             )
             or {}
         )  # check the in-memory cache used by lowest_latency and usage-based routing. Only check the local cache.
-        for idx, deployment in enumerate(_returned_deployments):
-            # see if we have the info for this model
-            try:
-                base_model = deployment.get("model_info", {}).get("base_model", None)
-                if base_model is None:
-                    base_model = deployment.get("litellm_params", {}).get(
-                        "base_model", None
-                    )
-                model_info = self.get_router_model_info(
-                    deployment=deployment, received_model_name=model
-                )
-                model = base_model or deployment.get("litellm_params", {}).get(
-                    "model", None
-                )
+        allowed_model_region = (
+            request_kwargs.get("allowed_model_region")
+            if request_kwargs is not None
+            else None
+        )
+        non_default_params = (
+            litellm.utils.get_non_default_params(passed_params=request_kwargs)
+            if request_kwargs is not None and litellm.drop_params is False
+            else None
+        )
+        special_params = ["response_format"]
+        for idx, deployment in enumerate(healthy_deployments):
+            pre_call_info = self._get_deployment_pre_call_info(
+                deployment=deployment, model_group=model
+            )
 
-                if (
-                    isinstance(model_info, dict)
-                    and model_info.get("max_input_tokens", None) is not None
-                ):
-                    if (
-                        isinstance(model_info["max_input_tokens"], int)
-                        and input_tokens > model_info["max_input_tokens"]
-                    ):
-                        invalid_model_indices.append(idx)
-                        _context_window_error = True
-                        _potential_error_str += (
-                            "Model={}, Max Input Tokens={}, Got={}".format(
-                                model, model_info["max_input_tokens"], input_tokens
-                            )
-                        )
-                        continue
-            except Exception as e:
-                verbose_router_logger.exception("An error occurs - {}".format(str(e)))
+            ## CONTEXT WINDOW CHECK ##
+            if (
+                pre_call_info.max_input_tokens is not None
+                and input_tokens > pre_call_info.max_input_tokens
+            ):
+                is_valid[idx] = False
+                _context_window_error = True
+                _potential_error_str += "Model={}, Max Input Tokens={}, Got={}".format(
+                    pre_call_info.model, pre_call_info.max_input_tokens, input_tokens
+                )
+                continue
 
-            _litellm_params = deployment.get("litellm_params", {})
-            model_id = deployment.get("model_info", {}).get("id", "")
+            model_id = pre_call_info.model_id
             ## RPM CHECK ##
             ### get local router cache ###
             current_request_cache_local = (
@@ -5299,61 +5388,39 @@ class Router:
                 )
 
                 if (
-                    isinstance(_litellm_params, dict)
-                    and _litellm_params.get("rpm", None) is not None
+                    isinstance(pre_call_info.rpm, int)
+                    and pre_call_info.rpm <= current_request
                 ):
-                    if (
-                        isinstance(_litellm_params["rpm"], int)
-                        and _litellm_params["rpm"] <= current_request
-                    ):
-                        invalid_model_indices.append(idx)
-                        _rate_limit_error = True
-                        continue
+                    is_valid[idx] = False
+                    _rate_limit_error = True
+                    continue
 
             ## REGION CHECK ##
-            if (
-                request_kwargs is not None
-                and request_kwargs.get("allowed_model_region") is not None
-            ):
-                allowed_model_region = request_kwargs.get("allowed_model_region")
-
-                if allowed_model_region is not None:
-                    if not is_region_allowed(
-                        litellm_params=LiteLLM_Params(**_litellm_params),
-                        allowed_model_region=allowed_model_region,
-                    ):
-                        invalid_model_indices.append(idx)
-                        continue
+            if allowed_model_region is not None:
+                if not is_region_allowed(
+                    litellm_params=pre_call_info.litellm_params,
+                    allowed_model_region=allowed_model_region,
+                ):
+                    is_valid[idx] = False
+                    continue
 
             ## INVALID PARAMS ## -> catch 'gpt-3.5-turbo-16k' not supporting 'response_format' param
-            if request_kwargs is not None and litellm.drop_params is False:
+            if non_default_params is not None:
                 # get supported params
-                model, custom_llm_provider, _, _ = litellm.get_llm_provider(
-                    model=model, litellm_params=LiteLLM_Params(**_litellm_params)
-                )
-
-                supported_openai_params = litellm.get_supported_openai_params(
-                    model=model, custom_llm_provider=custom_llm_provider
-                )
+                supported_openai_params = pre_call_info.get_supported_openai_params()
 
                 if supported_openai_params is None:
                     continue
-                else:
-                    # check the non-default openai params in request kwargs
-                    non_default_params = litellm.utils.get_non_default_params(
-                        passed_params=request_kwargs
-                    )
-                    special_params = ["response_format"]
-                    # check if all params are supported
-                    for k, v in non_default_params.items():
-                        if k not in supported_openai_params and k in special_params:
-                            # if not -> invalid model
-                            verbose_router_logger.debug(
-                                f"INVALID MODEL INDEX @ REQUEST KWARG FILTERING, k={k}"
-                            )
-                            invalid_model_indices.append(idx)
+                # check the non-default openai params in request kwargs
+                for k in non_default_params:
+                    if k not in supported_openai_params and k in special_params:
+                        # if not -> invalid model
+                        lazy_verbose_router_logger.debug(
+                            "INVALID MODEL INDEX @ REQUEST KWARG FILTERING, k=%s", k
+                        )
+                        is_valid[idx] = False
 
-        if len(invalid_model_indices) == len(_returned_deployments):
+        if len(healthy_deployments) > 0 and not any(is_valid):
             """
             - no healthy deployments available b/c context window checks or rate limit error
 
@@ -5373,9 +5440,11 @@ class Router:
                     model=model,
                     llm_provider="",
                 )
-        if len(invalid_model_indices) > 0:
-            for idx in reversed(invalid_model_indices):
-                _returned_deployments.pop(idx)
+        _returned_deployments = [
+            deployment
+            for deployment, valid in zip(healthy_deployments, is_valid)
+            if valid
+        ]
 
         ## ORDER FILTERING ## -> if user set 'order' in deployments, return deployments with lowest order (e.g. order=1 > order=2)
         if len(_returned_deployments) > 0:
@@ -5468,8 +5537,8 @@ class Router:
             # check if the user sent in a deployment name instead
             healthy_deployments = self._get_deployment_by_litellm_model(model=model)
 
-        verbose_router_logger.debug(
-            f"initial list of deployments: {healthy_deployments}"
+        lazy_verbose_router_logger.debug(
+            "initial list of deployments: %s", healthy_deployments
         )
 
         if len(healthy_deployments) == 0:
@@ -5529,10 +5598,12 @@ class Router:
             cooldown_deployments = await _async_get_cooldown_deployments(
                 litellm_router_instance=self, parent_otel_span=parent_otel_span
             )
-            verbose_router_logger.debug(
-                f"async cooldown deployments: {cooldown_deployments}"
+            lazy_verbose_router_logger.debug(
+                "async cooldown deployments: %s", cooldown_deployments
+            )
+            lazy_verbose_router_logger.debug(
+                "cooldown_deployments: %s", cooldown_deployments
             )
-            verbose_router_logger.debug(f"cooldown_deployments: {cooldown_deployments}")
             healthy_deployments = self._filter_cooldown_deployments(
                 healthy_deployments=healthy_deployments,
                 cooldown_deployments=cooldown_deployments,
@@ -5550,13 +5621,22 @@ class Router:
                 parent_otel_span=parent_otel_span,
             )
 
+            input_tokens: Optional[int] = (
+                None  # counted once per request - shared by the pre-call checks + routing strategy
+            )
             if self.enable_pre_call_checks and messages is not None:
-                healthy_deployments = self._pre_call_checks(
-                    model=model,
-                    healthy_deployments=cast(List[Dict], healthy_deployments),
-                    messages=messages,
-                    request_kwargs=request_kwargs,
-                )
+                input_tokens = self._get_input_tokens(messages=messages)
+                # None if counting failed (already logged) - the checks are skipped, not counted again
+                if input_tokens is not None:
+                    healthy_deployments = self._pre_call_checks(
+                        model=model,
+                        healthy_deployments=cast(List[Dict], healthy_deployments),
+                        messages=messages,
+                        request_kwargs=request_kwargs,
+                        input_tokens=input_tokens,
+                    )
+            if input is not None:
+                input_tokens = None  # routing strategies count messages + input
             # check if user wants to do tag based routing
             healthy_deployments = await get_deployments_for_tag(  # type: ignore
                 llm_router_instance=self,
@@ -5583,6 +5663,7 @@ class Router:
                         healthy_deployments=healthy_deployments,  # type: ignore
                         messages=messages,
                         input=input,
+                        input_tokens=input_tokens,
                     )
                 )
             elif (
@@ -5595,6 +5676,7 @@ class Router:
                         healthy_deployments=healthy_deployments,  # type: ignore
                         messages=messages,
                         input=input,
+                        input_tokens=input_tokens,
                     )
                 )
             elif (
@@ -5608,6 +5690,7 @@ class Router:
                         messages=messages,
                         input=input,
                         request_kwargs=request_kwargs,
+                        input_tokens=input_tokens,
                     )
                 )
             elif self.routing_strategy == "simple-shuffle":
@@ -5635,8 +5718,11 @@ class Router:
                     parent_otel_span=parent_otel_span,
                 )
                 raise exception
-            verbose_router_logger.info(
-                f"get_available_deployment for model: {model}, Selected deployment: {self.print_deployment(deployment)} for model: {model}"
+            lazy_verbose_router_logger.info(
+                "get_available_deployment for model: %s, Selected deployment: %s for model: %s",
+                model,
+                LazyArg(self.print_deployment, deployment),
+                model,
             )
 
             end_time = time.time()
@@ -5707,13 +5793,22 @@ class Router:
         )
 
         # filter pre-call checks
+        input_tokens: Optional[int] = (
+            None  # counted once per request - shared by the pre-call checks + routing strategy
+        )
         if self.enable_pre_call_checks and messages is not None:
-            healthy_deployments = self._pre_call_checks(
-                model=model,
-                healthy_deployments=healthy_deployments,
-                messages=messages,
-                request_kwargs=request_kwargs,
-            )
+            input_tokens = self._get_input_tokens(messages=messages)
+            # None if counting failed (already logged) - the checks are skipped, not counted again
+            if input_tokens is not None:
+                healthy_deployments = self._pre_call_checks(
+                    model=model,
+                    healthy_deployments=healthy_deployments,
+                    messages=messages,
+                    request_kwargs=request_kwargs,
+                    input_tokens=input_tokens,
+                )
+        if input is not None:
+            input_tokens = None  # routing strategies count messages + input
 
         if len(healthy_deployments) == 0:
             model_ids = self.get_model_ids(model_name=model)
@@ -5760,6 +5855,7 @@ class Router:
                 healthy_deployments=healthy_deployments,  # type: ignore
                 messages=messages,
                 input=input,
+                input_tokens=input_tokens,
             )
         elif (
             self.routing_strategy == "usage-based-routing-v2"
@@ -5770,6 +5866,7 @@ class Router:
                 healthy_deployments=healthy_deployments,  # type: ignore
                 messages=messages,
                 input=input,
+                input_tokens=input_tokens,
             )
         else:
             deployment = None
@@ -29,6 +29,7 @@ from litellm.caching.redis_cache import RedisPipelineIncrementOperation
 from litellm.integrations.custom_logger import CustomLogger, Span
 from litellm.litellm_core_utils.duration_parser import duration_in_seconds
 from litellm.router_strategy.tag_based_routing import _get_tags_from_request_kwargs
+from litellm.router_utils.budget_spend_table import BudgetSpendTable
 from litellm.router_utils.cooldown_callbacks import (
     _get_prometheus_logger_from_callbacks,
 )
@@ -51,7 +52,8 @@ class RouterBudgetLimiting(CustomLogger):
         ] = None,
     ):
         self.dual_cache = dual_cache
-        self.redis_increment_operation_queue: List[RedisPipelineIncrementOperation] = []
+        self.spend_table = BudgetSpendTable()
+        self._initial_spend_sync_done = False
         asyncio.create_task(self.periodic_sync_in_memory_spend_with_redis())
         self.provider_budget_config: Optional[GenericBudgetConfigType] = (
             provider_budget_config
@@ -66,6 +68,13 @@ class RouterBudgetLimiting(CustomLogger):
         if isinstance(litellm.callbacks, list):
             litellm.logging_callback_manager.add_litellm_callback(self)  # type: ignore
 
+    @property
+    def redis_increment_operation_queue(self) -> List[RedisPipelineIncrementOperation]:
+        """
+        Spend increments not yet pushed to Redis - one operation per spend key
+        """
+        return self.spend_table.get_pending_increments()
+
     async def async_filter_deployments(
         self,
         model: str,
@@ -101,18 +110,12 @@ class RouterBudgetLimiting(CustomLogger):
             )
         )
 
-        # Single cache read for all spend values
+        # Spend values are read from the local spend table - no cache / Redis I/O per request
         if len(cache_keys) > 0:
-            _current_spends = await self.dual_cache.async_batch_get_cache(
-                keys=cache_keys,
-                parent_otel_span=parent_otel_span,
-            )
-            current_spends: List = _current_spends or [0.0] * len(cache_keys)
-
-            # Map spends to their respective keys
-            spend_map: Dict[str, float] = {}
-            for idx, key in enumerate(cache_keys):
-                spend_map[key] = float(current_spends[idx] or 0.0)
+            await self._ensure_initial_spend_sync()
+            spend_map: Dict[str, float] = {
+                key: self.spend_table.get_spend(key) for key in cache_keys
+            }
 
             potential_deployments, deployment_above_budget_info = (
                 self._filter_out_deployments_above_budget(
@@ -129,7 +132,7 @@ class RouterBudgetLimiting(CustomLogger):
 
             if len(potential_deployments) == 0:
                 raise ValueError(
-                    f"{RouterErrors.no_deployments_with_provider_budget_routing.value}: {deployment_above_budget_info}"
+                    f"{RouterErrors.no_deployments_with_provider_budget_routing.value}: {deployment_above_budget_info.strip()}. spend_staleness_seconds={self.get_spend_staleness_seconds()}"
                 )
 
             return potential_deployments
@@ -322,6 +325,9 @@ class RouterBudgetLimiting(CustomLogger):
         await self.dual_cache.async_set_cache(
             key=start_time_key, value=current_time, ttl=ttl_seconds
         )
+        self.spend_table.set_window_spend(
+            key=spend_key, spend=response_cost, ttl=ttl_seconds
+        )
         return current_time
 
     async def _increment_spend_in_current_window(
@@ -332,20 +338,19 @@ class RouterBudgetLimiting(CustomLogger):
 
         Runs once the budget start time exists in Redis Cache (on the 2nd and subsequent requests to the same provider)
 
-        - Increments the spend in memory cache (so spend instantly updated in memory)
-        - Queues the increment operation to Redis Pipeline (using batched pipeline to optimize performance. Using Redis for multi instance environment of LiteLLM)
+        - Increments the spend in memory cache + local spend table (so spend instantly updated in memory)
+        - Adds the increment to the pending delta for `spend_key`, pushed to Redis in a batched pipeline on the next sync (Using Redis for multi instance environment of LiteLLM)
         """
         await self.dual_cache.in_memory_cache.async_increment(
             key=spend_key,
             value=response_cost,
             ttl=ttl,
         )
-        increment_op = RedisPipelineIncrementOperation(
+        self.spend_table.increment(
             key=spend_key,
             increment_value=response_cost,
             ttl=ttl,
         )
-        self.redis_increment_operation_queue.append(increment_op)
 
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         """Original method now uses helper functions"""
@@ -478,29 +483,29 @@ class RouterBudgetLimiting(CustomLogger):
     async def _push_in_memory_increments_to_redis(self):
         """
         How this works:
-        - async_log_success_event collects all provider spend increments in `redis_increment_operation_queue`
-        - This function pushes all increments to Redis in a batched pipeline to optimize performance
+        - async_log_success_event accumulates spend increments per key in `spend_table`
+        - This function pushes one INCRBYFLOAT per key to Redis in a batched pipeline to optimize performance
+
+        If the push fails, the increments are kept and retried on the next sync.
 
         Only runs if Redis is initialized
         """
-        try:
-            if not self.dual_cache.redis_cache:
-                return  # Redis is not initialized
-
-            verbose_router_logger.debug(
-                "Pushing Redis Increment Pipeline for queue: %s",
-                self.redis_increment_operation_queue,
-            )
-            if len(self.redis_increment_operation_queue) > 0:
-                asyncio.create_task(
-                    self.dual_cache.redis_cache.async_increment_pipeline(
-                        increment_list=self.redis_increment_operation_queue,
-                    )
-                )
+        if not self.dual_cache.redis_cache:
+            return  # Redis is not initialized
 
-            self.redis_increment_operation_queue = []
+        increment_list = self.spend_table.pop_pending_increments()
+        if len(increment_list) == 0:
+            return
 
+        verbose_router_logger.debug(
+            "Pushing Redis Increment Pipeline for queue: %s", increment_list
+        )
+        try:
+            await self.dual_cache.redis_cache.async_increment_pipeline(
+                increment_list=increment_list,
+            )
         except Exception as e:
+            self.spend_table.restore_pending_increments(increment_list)
             verbose_router_logger.error(
                 f"Error syncing in-memory cache with Redis: {str(e)}"
             )
@@ -515,7 +520,9 @@ class RouterBudgetLimiting(CustomLogger):
 
         What this does:
         1. Push all provider spend increments to Redis
-        2. Fetch all current provider spend from Redis to update in-memory cache
+        2. Fetch all current provider spend from Redis to update in-memory cache + local spend table
+
+        Budget filtering only reads the local spend table, so spend from other instances is at most ~DEFAULT_REDIS_SYNC_INTERVAL seconds stale. See `get_spend_staleness_seconds`.
         """
 
         try:
@@ -527,38 +534,27 @@ class RouterBudgetLimiting(CustomLogger):
             await self._push_in_memory_increments_to_redis()
 
             # 2. Fetch all current provider spend from Redis to update in-memory cache
-            cache_keys = []
-
-            if self.provider_budget_config is not None:
-                for provider, config in self.provider_budget_config.items():
-                    if config is None:
-                        continue
-                    cache_keys.append(
-                        f"provider_spend:{provider}:{config.budget_duration}"
-                    )
-
-            if self.deployment_budget_config is not None:
-                for model_id, config in self.deployment_budget_config.items():
-                    if config is None:
-                        continue
-                    cache_keys.append(
-                        f"deployment_spend:{model_id}:{config.budget_duration}"
-                    )
-
-            if self.tag_budget_config is not None:
-                for tag, config in self.tag_budget_config.items():
-                    if config is None:
-                        continue
-                    cache_keys.append(f"tag_spend:{tag}:{config.budget_duration}")
+            spend_key_ttls = self._get_spend_key_ttls()
 
             # Batch fetch current spend values from Redis
             redis_values = await self.dual_cache.redis_cache.async_batch_get_cache(
-                key_list=cache_keys
+                key_list=list(spend_key_ttls.keys())
             )
 
-            # Update in-memory cache with Redis values
+            # Update in-memory cache + local spend table with Redis values
             if isinstance(redis_values, dict):  # Check if redis_values is a dictionary
                 for key, value in redis_values.items():
+                    ttl = spend_key_ttls.get(key, 0)
+                    if value is not None and not self.spend_table.has_window(key):
+                        # window started on another instance - ends when the key expires in Redis
+                        ttl = await self._get_remaining_window_ttl(
+                            spend_key=key, budget_window_ttl=ttl
+                        )
+                    self.spend_table.set_remote_spend(
+                        key=key,
+                        remote_spend=float(value) if value is not None else None,
+                        ttl=ttl,
+                    )
                     if value is not None:
                         await self.dual_cache.in_memory_cache.async_set_cache(
                             key=key, value=float(value)
@@ -566,12 +562,72 @@ class RouterBudgetLimiting(CustomLogger):
                         verbose_router_logger.debug(
                             f"Updated in-memory cache for {key}: {value}"
                         )
+                self.spend_table.mark_synced()
 
         except Exception as e:
             verbose_router_logger.error(
                 f"Error syncing in-memory cache with Redis: {str(e)}"
             )
 
+    async def _ensure_initial_spend_sync(self):
+        """
+        Load the spend from Redis before the first budget check - on a cold start the local spend table is empty until the 1st periodic sync.
+
+        Only attempted once, later requests rely on the periodic sync.
+        """
+        if self._initial_spend_sync_done:
+            return
+        self._initial_spend_sync_done = True
+        if self.spend_table.get_staleness_seconds() is None:
+            await self._sync_in_memory_spend_with_redis()
+
+    async def _get_remaining_window_ttl(
+        self, spend_key: str, budget_window_ttl: int
+    ) -> int:
+        """
+        Seconds left in the budget window of `spend_key` - the TTL of the key in Redis.
+
+        Falls back to the full window without Redis, or if the key has no TTL.
+        """
+        if self.dual_cache.redis_cache is None:
+            return budget_window_ttl
+        ttl_seconds = await self.dual_cache.redis_cache.async_get_ttl(spend_key)
+        if ttl_seconds is None or ttl_seconds <= 0:
+            return budget_window_ttl
+        return min(ttl_seconds, budget_window_ttl)
+
+    def _get_spend_key_ttls(self) -> Dict[str, int]:
+        """
+        Returns all spend keys for the configured provider, deployment and tag budgets, mapped to their budget window in seconds
+        """
+        spend_key_ttls: Dict[str, int] = {}
+        budget_configs = [
+            ("provider_spend", self.provider_budget_config),
+            ("deployment_spend", self.deployment_budget_config),
+            ("tag_spend", self.tag_budget_config),
+        ]
+        for key_prefix, budget_config in budget_configs:
+            if budget_config is None:
+                continue
+            for name, config in budget_config.items():
+                if config is None or config.budget_duration is None:
+                    continue
+                spend_key_ttls[f"{key_prefix}:{name}:{config.budget_duration}"] = (
+                    duration_in_seconds(config.budget_duration)
+                )
+        return spend_key_ttls
+
+    def get_spend_staleness_seconds(self) -> Optional[float]:
+        """
+        Upper bound on how stale the spend used for budget filtering may be.
+
+        - 0.0 if Redis is not used (spend is only tracked by this instance)
+        - seconds since the last successful sync with Redis otherwise, None if the first sync hasn't completed yet
+        """
+        if self.dual_cache.redis_cache is None:
+            return 0.0
+        return self.spend_table.get_staleness_seconds()
+
     def _get_budget_config_for_deployment(
         self,
         model_id: str,
@@ -697,6 +753,14 @@ class RouterBudgetLimiting(CustomLogger):
             await self.dual_cache.async_set_cache(
                 key=spend_key, value=0.0, ttl=ttl_seconds
             )
+        elif ttl_seconds is not None:
+            self.spend_table.set_remote_spend(
+                key=spend_key,
+                remote_spend=float(_spend_key),
+                ttl=await self._get_remaining_window_ttl(
+                    spend_key=spend_key, budget_window_ttl=ttl_seconds
+                ),
+            )
 
     @staticmethod
     def should_init_router_budget_limiter(
@@ -200,9 +200,12 @@ class LowestCostLoggingHandler(CustomLogger):
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
+        input_tokens: Optional[int] = None,
     ):
         """
         Returns a deployment with the lowest cost
+
+        `input_tokens` - the request's token count, if the router already counted it
         """
         cost_key = f"{model_group}_map"
 
@@ -229,10 +232,11 @@ class LowestCostLoggingHandler(CustomLogger):
                     precise_minute: {"tpm": 0, "rpm": 0},
                 }
 
-        try:
-            input_tokens = token_counter(messages=messages, text=input)
-        except Exception:
-            input_tokens = 0
+        if input_tokens is None:
+            try:
+                input_tokens = token_counter(messages=messages, text=input)
+            except Exception:
+                input_tokens = 0
 
         # randomly sample from all_deployments, incase all deployments have latency=0.0
         _items = all_deployments.items()
@@ -392,6 +392,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
         request_count_dict: Optional[Dict] = None,
+        input_tokens: Optional[int] = None,
     ):
         """Common logic for both sync and async get_available_deployments"""
 
@@ -420,10 +421,11 @@ class LowestLatencyLoggingHandler(CustomLogger):
                     precise_minute: {"tpm": 0, "rpm": 0},
                 }
 
-        try:
-            input_tokens = token_counter(messages=messages, text=input)
-        except Exception:
-            input_tokens = 0
+        if input_tokens is None:
+            try:
+                input_tokens = token_counter(messages=messages, text=input)
+            except Exception:
+                input_tokens = 0
 
         # randomly sample from all_deployments, incase all deployments have latency=0.0
         _items = all_deployments.items()
@@ -533,6 +535,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
+        input_tokens: Optional[int] = None,
     ):
         # get list of potential deployments
         latency_key = f"{model_group}_map"
@@ -554,6 +557,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
             input,
             request_kwargs,
             request_count_dict,
+            input_tokens,
         )
 
     def get_available_deployments(
@@ -563,6 +567,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
+        input_tokens: Optional[int] = None,
     ):
         """
         Returns a deployment with the lowest latency
@@ -587,4 +592,5 @@ class LowestLatencyLoggingHandler(CustomLogger):
             input,
             request_kwargs,
             request_count_dict,
+            input_tokens,
         )
@@ -158,9 +158,12 @@ class LowestTPMLoggingHandler(CustomLogger):
         healthy_deployments: list,
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
+        input_tokens: Optional[int] = None,
     ):
         """
         Returns a deployment with the lowest TPM/RPM usage.
+
+        `input_tokens` - the request's token count, if the router already counted it
         """
         # get list of potential deployments
         verbose_router_logger.debug(
@@ -176,10 +179,11 @@ class LowestTPMLoggingHandler(CustomLogger):
         verbose_router_logger.debug(
             f"tpm_key={tpm_key}, tpm_dict: {tpm_dict}, rpm_dict: {rpm_dict}"
         )
-        try:
-            input_tokens = token_counter(messages=messages, text=input)
-        except Exception:
-            input_tokens = 0
+        if input_tokens is None:
+            try:
+                input_tokens = token_counter(messages=messages, text=input)
+            except Exception:
+                input_tokens = 0
         verbose_router_logger.debug(f"input_tokens={input_tokens}")
         # -----------------------
         # Find lowest used model
@@ -380,9 +380,12 @@ class LowestTPMLoggingHandler_v2(CustomLogger):
         rpm_values: Optional[list],
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
+        input_tokens: Optional[int] = None,
     ) -> Optional[dict]:
         """
         Common checks for get available deployment, across sync + async implementations
+
+        `input_tokens` - the request's token count, if the router already counted it
         """
 
         if tpm_values is None or rpm_values is None:
@@ -396,10 +399,11 @@ class LowestTPMLoggingHandler_v2(CustomLogger):
         for idx, key in enumerate(rpm_keys):
             rpm_dict[rpm_keys[idx].split(":")[0]] = rpm_values[idx]
 
-        try:
-            input_tokens = token_counter(messages=messages, text=input)
-        except Exception:
-            input_tokens = 0
+        if input_tokens is None:
+            try:
+                input_tokens = token_counter(messages=messages, text=input)
+            except Exception:
+                input_tokens = 0
         verbose_router_logger.debug(f"input_tokens={input_tokens}")
         # -----------------------
         # Find lowest used model
@@ -437,6 +441,7 @@ class LowestTPMLoggingHandler_v2(CustomLogger):
         healthy_deployments: list,
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
+        input_tokens: Optional[int] = None,
     ):
         """
         Async implementation of get deployments.
@@ -486,6 +491,7 @@ class LowestTPMLoggingHandler_v2(CustomLogger):
             rpm_values=rpm_values,
             messages=messages,
             input=input,
+            input_tokens=input_tokens,
         )
 
         try:
@@ -558,6 +564,7 @@ class LowestTPMLoggingHandler_v2(CustomLogger):
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
         parent_otel_span: Optional[Span] = None,
+        input_tokens: Optional[int] = None,
     ):
         """
         Returns a deployment with the lowest TPM/RPM usage.
@@ -598,6 +605,7 @@ class LowestTPMLoggingHandler_v2(CustomLogger):
             rpm_values=rpm_values,
             messages=messages,
             input=input,
+            input_tokens=input_tokens,
         )
 
         try:
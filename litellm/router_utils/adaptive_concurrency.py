@@ -0,0 +1,204 @@
+"""
+AIMD (additive increase / multiplicative decrease) concurrency limit for fanning out many requests against rate limited deployments.
+
+- slow start: until the first rate limit error, every successful request grows the limit by 1 (i.e. it doubles per window of requests)
+- after that, every successful request grows the limit by 1 / limit (i.e. +1 per window of successful requests)
+- a rate limit error shrinks the limit by `decrease_factor` (at most once per `decrease_cooldown_seconds`, so a burst of 429s only counts once)
+- if the provider returned a `retry-after`, no new requests are started until it has passed
+- if the provider's `x-ratelimit-remaining-requests` header says the requests in flight use up the remaining requests, no new requests are started until `x-ratelimit-reset-requests`
+"""
+
+import asyncio
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
+
+import litellm
+from litellm.constants import (
+    DEFAULT_ADAPTIVE_CONCURRENCY_DECREASE_FACTOR,
+    DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL,
+    DEFAULT_ADAPTIVE_CONCURRENCY_MAX,
+)
+from litellm.litellm_core_utils.exception_mapping_utils import _get_response_headers
+
+T = TypeVar("T")
+
+# e.g. "1s", "6m0s", "20ms", "1h2m3.5s" (openai) or "0.5" (seconds)
+_DURATION_PART_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNIT_SECONDS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _parse_rate_limit_reset_seconds(value: Any) -> Optional[float]:
+    """
+    Parse a `x-ratelimit-reset-*` header value into seconds
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART_PATTERN.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNIT_SECONDS[unit] for number, unit in parts)
+
+
+def _get_header(headers: dict, name: str) -> Any:
+    # litellm forwards provider headers as `llm_provider-{header}`
+    value = headers.get(name, None)
+    if value is None:
+        value = headers.get(f"llm_provider-{name}", None)
+    return value
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        initial_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_INITIAL,
+        min_concurrency: int = 1,
+        max_concurrency: int = DEFAULT_ADAPTIVE_CONCURRENCY_MAX,
+        decrease_factor: float = DEFAULT_ADAPTIVE_CONCURRENCY_DECREASE_FACTOR,
+        decrease_cooldown_seconds: float = 1.0,
+    ):
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError(
+                f"Invalid concurrency bounds - min_concurrency={min_concurrency}, max_concurrency={max_concurrency}"
+            )
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency: float = float(
+            min(max(initial_concurrency, min_concurrency), max_concurrency)
+        )
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.in_flight = 0
+        self.num_rate_limit_errors = 0
+        self.slow_start = True
+        self._paused_until = 0.0
+        self._last_decrease_time = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_concurrency, int(self.concurrency))
+
+    def _get_condition(self) -> asyncio.Condition:
+        # created lazily, so the limiter can be created outside of an event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        """
+        Wait for a free slot (and for any `retry-after` pause to pass)
+        """
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                pause_seconds = self._paused_until - time.monotonic()
+                if pause_seconds > 0:
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout=pause_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+                elif self.in_flight < self.limit:
+                    break
+                else:
+                    await condition.wait()
+            self.in_flight += 1
+
+    async def release(self):
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    def on_success(self):
+        increase = 1 if self.slow_start else 1 / self.concurrency
+        self.concurrency = min(float(self.max_concurrency), self.concurrency + increase)
+
+    def on_response_headers(self, response_headers: Optional[dict]):
+        """
+        Pause new requests until `x-ratelimit-reset-requests`, if more requests are in flight than `x-ratelimit-remaining-requests`
+        """
+        if not response_headers:
+            return
+        remaining_requests = _get_header(
+            response_headers, "x-ratelimit-remaining-requests"
+        )
+        reset_seconds = _parse_rate_limit_reset_seconds(
+            _get_header(response_headers, "x-ratelimit-reset-requests")
+        )
+        if remaining_requests is None or reset_seconds is None or reset_seconds <= 0:
+            return
+        try:
+            remaining_requests = int(remaining_requests)
+        except (TypeError, ValueError):
+            return
+        if remaining_requests < self.in_flight:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + reset_seconds
+            )
+
+    def on_rate_limit(self, retry_after: Optional[float] = None):
+        """
+        Called when a request got a 429. `retry_after` - seconds from the provider's `retry-after` header, if any.
+        """
+        self.num_rate_limit_errors += 1
+        self.slow_start = False
+        now = time.monotonic()
+        if now - self._last_decrease_time >= self.decrease_cooldown_seconds:
+            self.concurrency = max(
+                float(self.min_concurrency), self.concurrency * self.decrease_factor
+            )
+            self._last_decrease_time = now
+        if retry_after is not None and retry_after > 0:
+            self._paused_until = max(self._paused_until, now + retry_after)
+
+    async def call(
+        self, fn: Callable[[], Awaitable[T]], max_rate_limit_retries: int
+    ) -> T:
+        """
+        Run `fn` - the caller has to hold a slot (`acquire()` / `slot()`).
+
+        Rate limit errors shrink the limit, and are retried (with backoff) up to `max_rate_limit_retries` times - the last one is raised.
+        Successful responses grow the limit, and their rate limit headers are followed.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await fn()
+                break
+            except litellm.RateLimitError as e:
+                response_headers = _get_response_headers(original_exception=e)
+                self.on_rate_limit(
+                    retry_after=litellm.utils._get_retry_after_from_exception_header(
+                        response_headers=response_headers
+                    )
+                )
+                if attempt >= max_rate_limit_retries:
+                    raise e
+                await asyncio.sleep(
+                    litellm._calculate_retry_after(
+                        remaining_retries=max_rate_limit_retries - attempt,
+                        max_retries=max_rate_limit_retries,
+                        response_headers=response_headers,
+                    )
+                )
+                attempt += 1
+        self.on_success()
+        _hidden_params = getattr(response, "_hidden_params", None) or {}
+        if isinstance(_hidden_params, dict):
+            self.on_response_headers(_hidden_params.get("additional_headers", None))
+        return response
@@ -1,6 +1,12 @@
 import io
 import json
-from typing import Optional, Tuple, Union
+import operator
+import re
+import tempfile
+from os import PathLike
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+from litellm.constants import BATCH_FILE_SPOOL_MAX_SIZE_BYTES
 
 
 class InMemoryFile(io.BytesIO):
@@ -9,41 +15,120 @@ class InMemoryFile(io.BytesIO):
         self.name = name
 
 
+# matches `"body": {"model": "..."` - the layout of (almost) every openai batch request line.
+# `"` inside json strings is always escaped, so this can't match inside a string value.
+_BODY_MODEL_PATTERN = re.compile(
+    rb'"body"\s*:\s*\{\s*"model"\s*:\s*("(?:[^"\\]|\\.)*")'
+)
+
+
+class SpooledJsonlFile(tempfile.SpooledTemporaryFile):
+    """
+    Kept in memory until `max_size` bytes, then rolled over to a temp file on disk.
+
+    Has a fixed `name`, so it is uploaded as a named multipart file.
+    """
+
+    def __init__(
+        self,
+        name: str = "modified_file.jsonl",
+        max_size: int = BATCH_FILE_SPOOL_MAX_SIZE_BYTES,
+    ):
+        super().__init__(max_size=max_size, mode="w+b")
+        self._upload_name = name
+
+    # the upload name, also after rolling over to a temp file on disk
+    name = property(operator.attrgetter("_upload_name"))  # type: ignore
+
+
+def _get_jsonl_lines(file_content: Any) -> Iterable[Union[bytes, str]]:
+    """
+    Iterate over the lines of bytes / str / PathLike / file-like / (filename, content, ...) file content, without reading all of it into memory
+    """
+    if isinstance(file_content, tuple):
+        file_content = file_content[1]
+    if isinstance(file_content, bytes):
+        return io.BytesIO(file_content)
+    if isinstance(file_content, str):
+        return io.StringIO(file_content)
+    if isinstance(file_content, PathLike):
+        return _iter_file_lines(str(file_content))
+    if hasattr(file_content, "read"):
+        if hasattr(file_content, "__iter__"):
+            return file_content
+        return iter(file_content.readline, file_content.read(0))
+    raise TypeError(f"Unsupported file content type - {type(file_content)}")
+
+
+def _iter_file_lines(file_path: str) -> Iterator[bytes]:
+    with open(file_path, "rb") as f:
+        yield from f
+
+
+def _replace_model_in_jsonl_line(line: bytes, new_model_value: bytes) -> bytes:
+    """
+    Fast path - if `body.model` is the first key of `body` and there is no other `"model"` key in the line, splice in the new model without re-serializing the line.
+
+    Else - re-serialize the parsed line.
+
+    Every line is parsed, so invalid lines raise json.JSONDecodeError on both paths.
+    """
+    json_object = json.loads(line)
+    if (
+        "body" in json_object
+        and line.count(b'"model"') == 1
+        and line.count(b'"body"') == 1
+    ):
+        match = _BODY_MODEL_PATTERN.search(line)
+        if match is not None:
+            return line[: match.start(1)] + new_model_value + line[match.end(1) :]
+
+    if "body" in json_object:
+        json_object["body"]["model"] = json.loads(new_model_value)
+    return json.dumps(json_object).encode("utf-8")
+
+
+def stream_replace_model_in_jsonl(
+    file_content: Any,
+    new_model_name: str,
+    max_size_in_memory: int = BATCH_FILE_SPOOL_MAX_SIZE_BYTES,
+) -> SpooledJsonlFile:
+    """
+    Rewrite `body.model` on every line of a batch .jsonl file, 1 line at a time.
+
+    Reads from the upload stream and writes to a `SpooledJsonlFile` (rolled over to disk after `max_size_in_memory` bytes), so memory use doesn't grow with the file size.
+    The returned file is positioned at 0 - pass it as-is to the files api, to upload it in chunks.
+
+    Raises json.JSONDecodeError / UnicodeDecodeError / TypeError on invalid file content.
+    """
+    new_model_value = json.dumps(new_model_name).encode("utf-8")
+    modified_file = SpooledJsonlFile(max_size=max_size_in_memory)
+    try:
+        for line in _get_jsonl_lines(file_content):
+            if isinstance(line, str):
+                line = line.encode("utf-8")
+            line = line.strip()
+            if not line:
+                continue
+            modified_file.write(_replace_model_in_jsonl_line(line, new_model_value))
+            modified_file.write(b"\n")
+    except Exception:
+        modified_file.close()
+        raise
+    modified_file.seek(0)
+    return modified_file
+
+
 def replace_model_in_jsonl(
     file_content: Union[bytes, Tuple[str, bytes, str]], new_model_name: str
-) -> Optional[InMemoryFile]:
+) -> Optional[SpooledJsonlFile]:
+    """
+    Returns the batch file with `body.model` replaced by `new_model_name` on every line, or None if the file content is not valid jsonl.
+    """
     try:
-        # Decode the bytes to a string and split into lines
-        # If file_content is a file-like object, read the bytes
-        if hasattr(file_content, "read"):
-            file_content_bytes = file_content.read()  # type: ignore
-        elif isinstance(file_content, tuple):
-            file_content_bytes = file_content[1]
-        else:
-            file_content_bytes = file_content
-
-        # Decode the bytes to a string and split into lines
-        if isinstance(file_content_bytes, bytes):
-            file_content_str = file_content_bytes.decode("utf-8")
-        else:
-            file_content_str = file_content_bytes
-        lines = file_content_str.splitlines()
-        modified_lines = []
-        for line in lines:
-            # Parse each line as a JSON object
-            json_object = json.loads(line.strip())
-
-            # Replace the model name if it exists
-            if "body" in json_object:
-                json_object["body"]["model"] = new_model_name
-
-            # Convert the modified JSON object back to a string
-            modified_lines.append(json.dumps(json_object))
-
-        # Reassemble the modified lines and return as bytes
-        modified_file_content = "\n".join(modified_lines).encode("utf-8")
-        return InMemoryFile(modified_file_content, name="modified_file.jsonl")  # type: ignore
-
+        return stream_replace_model_in_jsonl(
+            file_content=file_content, new_model_name=new_model_name
+        )
     except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
         return None
 
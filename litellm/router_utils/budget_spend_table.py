@@ -0,0 +1,169 @@
+"""
+Local spend table for router budget windows (provider / deployment / tag budgets).
+
+Keeps the current-window spend for every budget key in process memory, so budget filtering is a dict lookup per key - no cache / Redis I/O per request.
+
+Multi-instance sync is done in the background by `RouterBudgetLimiting`:
+- local increments are accumulated as one pending delta per key, and pushed with a single Redis pipeline (INCRBYFLOAT)
+- remote totals are pulled on a schedule, and the local value becomes `remote total + deltas not yet pushed`
+
+Entries of ended budget windows are evicted when they are read, and all of them every `EVICTION_INTERVAL_SECONDS` when the table is written - keys that are never read again (e.g. per virtual key + model) don't accumulate.
+"""
+
+import math
+import time
+from typing import Dict, List, Optional
+
+from litellm.caching.redis_cache import RedisPipelineIncrementOperation
+
+EVICTION_INTERVAL_SECONDS = 60
+
+
+class BudgetWindowSpend:
+    __slots__ = ("spend", "pending_increment", "expires_at")
+
+    def __init__(self, spend: float, pending_increment: float, expires_at: float):
+        self.spend = (
+            spend  # last known total spend for the window (incl. pending increments)
+        )
+        self.pending_increment = (
+            pending_increment  # local spend not yet pushed to Redis
+        )
+        self.expires_at = expires_at  # unix timestamp when the budget window ends
+
+
+class BudgetSpendTable:
+    def __init__(self):
+        self._entries: Dict[str, BudgetWindowSpend] = {}
+        self.last_synced_at: Optional[float] = None
+        self._next_eviction_at: float = time.time() + EVICTION_INTERVAL_SECONDS
+
+    def _evict_expired_entries(self, current_time: float):
+        """
+        Remove the entries of all ended budget windows, at most once per `EVICTION_INTERVAL_SECONDS`
+        """
+        if current_time < self._next_eviction_at:
+            return
+        self._next_eviction_at = current_time + EVICTION_INTERVAL_SECONDS
+        for key in [
+            key
+            for key, entry in self._entries.items()
+            if entry.expires_at <= current_time
+        ]:
+            del self._entries[key]
+
+    def _get_entry(self, key: str, current_time: float) -> Optional[BudgetWindowSpend]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= current_time:
+            # budget window ended - spend resets
+            del self._entries[key]
+            return None
+        return entry
+
+    def get_spend(self, key: str) -> float:
+        """
+        O(1) - current window spend for `key`, 0.0 if there is no spend in the current window
+        """
+        entry = self._get_entry(key=key, current_time=time.time())
+        if entry is None:
+            return 0.0
+        return entry.spend
+
+    def has_window(self, key: str) -> bool:
+        """
+        True if `key` has spend tracked for a budget window that hasn't ended
+        """
+        return self._get_entry(key=key, current_time=time.time()) is not None
+
+    def increment(self, key: str, increment_value: float, ttl: float) -> float:
+        """
+        Increment the local spend for `key` and record the delta to push to Redis.
+
+        `ttl` is the time remaining in the budget window, only used if `key` has no window yet.
+        """
+        current_time = time.time()
+        self._evict_expired_entries(current_time=current_time)
+        entry = self._get_entry(key=key, current_time=current_time)
+        if entry is None:
+            entry = BudgetWindowSpend(
+                spend=0.0, pending_increment=0.0, expires_at=current_time + ttl
+            )
+            self._entries[key] = entry
+        entry.spend += increment_value
+        entry.pending_increment += increment_value
+        return entry.spend
+
+    def set_window_spend(self, key: str, spend: float, ttl: float):
+        """
+        Start a new budget window for `key` with `spend` (already written to the shared cache, nothing pending)
+        """
+        current_time = time.time()
+        self._evict_expired_entries(current_time=current_time)
+        self._entries[key] = BudgetWindowSpend(
+            spend=spend, pending_increment=0.0, expires_at=current_time + ttl
+        )
+
+    def set_remote_spend(self, key: str, remote_spend: Optional[float], ttl: float):
+        """
+        Reconcile `key` with the total spend across all instances (read from Redis).
+
+        Local increments that were not pushed yet are added on top of the remote total.
+        If the key does not exist in Redis (e.g. the window expired on another instance), only the pending increments are kept.
+
+        `ttl` is the time remaining in the budget window (the TTL of the key in Redis), only used if `key` has no window yet.
+        """
+        current_time = time.time()
+        self._evict_expired_entries(current_time=current_time)
+        entry = self._get_entry(key=key, current_time=current_time)
+        if entry is None:
+            if remote_spend is None:
+                return
+            entry = BudgetWindowSpend(
+                spend=0.0, pending_increment=0.0, expires_at=current_time + ttl
+            )
+            self._entries[key] = entry
+        entry.spend = (remote_spend or 0.0) + entry.pending_increment
+
+    def get_pending_increments(self) -> List[RedisPipelineIncrementOperation]:
+        """
+        One increment operation per key with unpushed spend. ttl is the time remaining in the window.
+        """
+        current_time = time.time()
+        return [
+            RedisPipelineIncrementOperation(
+                key=key,
+                increment_value=entry.pending_increment,
+                ttl=max(math.ceil(entry.expires_at - current_time), 1),
+            )
+            for key, entry in self._entries.items()
+            if entry.pending_increment != 0.0 and entry.expires_at > current_time
+        ]
+
+    def pop_pending_increments(self) -> List[RedisPipelineIncrementOperation]:
+        """
+        Returns the pending increments and clears them. Use `restore_pending_increments` if pushing them fails.
+        """
+        increment_list = self.get_pending_increments()
+        for entry in self._entries.values():
+            entry.pending_increment = 0.0
+        return increment_list
+
+    def restore_pending_increments(
+        self, increment_list: List[RedisPipelineIncrementOperation]
+    ):
+        current_time = time.time()
+        for increment_op in increment_list:
+            entry = self._get_entry(key=increment_op["key"], current_time=current_time)
+            if entry is not None:
+                entry.pending_increment += increment_op["increment_value"]
+
+    def mark_synced(self):
+        self.last_synced_at = time.time()
+
+    def get_staleness_seconds(self) -> Optional[float]:
+        """
+        Seconds since spend was last reconciled with Redis. None if it was never synced.
+        """
+        if self.last_synced_at is None:
+            return None
+        return time.time() - self.last_synced_at
@@ -1,13 +1,22 @@
 """
 Wrapper around router cache. Meant to handle model cooldown logic
+
+Cooled down deployments are also tracked in a local dict (model id -> cooldown value), so routing decisions don't need any I/O:
+- cooldowns set by this instance are added to it directly
+- with redis, every cooldown is published on `COOLDOWN_EVENTS_CHANNEL` - each instance subscribes to it and adds the cooldowns other instances set. Cooldowns expire locally at `timestamp + cooldown_time`.
+- until the subscription is up (or if it drops), cooldowns are read from the cache, like before
 """
 
+import asyncio
+import json
 import time
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, TypedDict
 
 from litellm import verbose_logger
 from litellm.caching.caching import DualCache
 from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.redis_cache import RedisCache
+from litellm.constants import COOLDOWN_EVENTS_RESUBSCRIBE_DELAY_SECONDS
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -24,11 +33,152 @@ class CooldownCacheValue(TypedDict):
     cooldown_time: float
 
 
+COOLDOWN_EVENTS_CHANNEL = "litellm:router:cooldown_events"
+
+
 class CooldownCache:
     def __init__(self, cache: DualCache, default_cooldown_time: float):
         self.cache = cache
         self.default_cooldown_time = default_cooldown_time
         self.in_memory_cache = InMemoryCache()
+        # model id -> cooldown value, for cooldowns set by this instance + cooldown events from other instances
+        self.local_cooldowns: Dict[str, CooldownCacheValue] = {}
+        self.is_subscribed_to_cooldown_events = False
+        # model ids whose cooldowns set before the subscription started were read from redis - each model id is read once per subscription
+        self._synced_cooldown_model_ids: Set[str] = set()
+        self._cooldown_events_task: Optional[asyncio.Task] = None
+
+    ## LOCAL COOLDOWNS ##
+
+    def _add_local_cooldown(self, model_id: str, cooldown_data: CooldownCacheValue):
+        existing_cooldown = self.local_cooldowns.get(model_id)
+        if existing_cooldown is not None and _get_cooldown_expiry(
+            existing_cooldown
+        ) > _get_cooldown_expiry(cooldown_data):
+            return
+        self.local_cooldowns[model_id] = cooldown_data
+
+    def _get_local_active_cooldowns(
+        self, model_ids: List[str]
+    ) -> List[Tuple[str, CooldownCacheValue]]:
+        current_time = time.time()
+        active_cooldowns: List[Tuple[str, CooldownCacheValue]] = []
+        for model_id in model_ids:
+            cooldown_data = self.local_cooldowns.get(model_id)
+            if cooldown_data is None:
+                continue
+            if _get_cooldown_expiry(cooldown_data) <= current_time:
+                self.local_cooldowns.pop(model_id, None)
+                continue
+            active_cooldowns.append((model_id, cooldown_data))
+        return active_cooldowns
+
+    def _can_use_local_cooldowns(self, model_ids: List[str]) -> bool:
+        """
+        True if the local cooldowns include every cooldown of `model_ids` - no redis, or subscribed to cooldown events + every model id synced
+        """
+        return self.cache.redis_cache is None or (
+            self.is_subscribed_to_cooldown_events
+            and self._synced_cooldown_model_ids.issuperset(model_ids)
+        )
+
+    ## COOLDOWN EVENTS (REDIS PUB/SUB) ##
+
+    def _publish_cooldown_event(self, model_id: str, cooldown_data: CooldownCacheValue):
+        redis_cache = self.cache.redis_cache
+        if redis_cache is None:
+            return
+        message = {"model_id": model_id, "cooldown": cooldown_data}
+        try:
+            asyncio.get_running_loop().create_task(
+                self._async_publish_cooldown_event(redis_cache, message)
+            )
+        except RuntimeError:  # no running event loop
+            try:
+                redis_cache.publish(COOLDOWN_EVENTS_CHANNEL, message)
+            except Exception as e:
+                verbose_logger.debug(
+                    "CooldownCache::_publish_cooldown_event - Exception occurred - {}".format(
+                        str(e)
+                    )
+                )
+
+    async def _async_publish_cooldown_event(
+        self, redis_cache: RedisCache, message: dict
+    ):
+        try:
+            await redis_cache.async_publish(COOLDOWN_EVENTS_CHANNEL, message)
+        except Exception as e:
+            verbose_logger.debug(
+                "CooldownCache::_async_publish_cooldown_event - Exception occurred - {}".format(
+                    str(e)
+                )
+            )
+
+    def _handle_cooldown_event(self, data: Any):
+        try:
+            event = json.loads(data)
+            self._add_local_cooldown(
+                model_id=str(event["model_id"]),
+                cooldown_data=CooldownCacheValue(**event["cooldown"]),  # type: ignore
+            )
+        except Exception as e:
+            verbose_logger.debug(
+                "CooldownCache::_handle_cooldown_event - Invalid cooldown event {} - {}".format(
+                    data, str(e)
+                )
+            )
+
+    def _start_cooldown_events_listener(self):
+        if self.cache.redis_cache is None:
+            return
+        if self._cooldown_events_task is not None:
+            if (
+                not self._cooldown_events_task.done()
+                and self._cooldown_events_task.get_loop() is asyncio.get_running_loop()
+            ):
+                return
+            # the listener stopped, or runs on another (e.g. closed) event loop
+            self.stop_cooldown_events_listener()
+        self._cooldown_events_task = asyncio.create_task(
+            self._listen_for_cooldown_events(self.cache.redis_cache)
+        )
+
+    def stop_cooldown_events_listener(self):
+        if self._cooldown_events_task is not None:
+            try:
+                self._cooldown_events_task.cancel()
+            except RuntimeError:  # its event loop is closed
+                pass
+            self._cooldown_events_task = None
+        self.is_subscribed_to_cooldown_events = False
+
+    async def _listen_for_cooldown_events(self, redis_cache: RedisCache):
+        channel = redis_cache.check_and_fix_namespace(key=COOLDOWN_EVENTS_CHANNEL)
+        while True:
+            pubsub = redis_cache.init_async_pubsub()
+            if pubsub is None:
+                verbose_logger.debug(
+                    "CooldownCache - redis client doesn't support pub/sub, reading cooldowns from the cache"
+                )
+                return
+            try:
+                async with pubsub:
+                    await pubsub.subscribe(channel)
+                    self._synced_cooldown_model_ids = set()
+                    self.is_subscribed_to_cooldown_events = True
+                    async for message in pubsub.listen():
+                        if message is not None and message.get("type") == "message":
+                            self._handle_cooldown_event(message["data"])
+            except Exception as e:
+                verbose_logger.debug(
+                    "CooldownCache::_listen_for_cooldown_events - Exception occurred - {}".format(
+                        str(e)
+                    )
+                )
+            finally:
+                self.is_subscribed_to_cooldown_events = False
+            await asyncio.sleep(COOLDOWN_EVENTS_RESUBSCRIBE_DELAY_SECONDS)
 
     def _common_add_cooldown_logic(
         self, model_id: str, original_exception, exception_status, cooldown_time: float
@@ -70,12 +220,15 @@ class CooldownCache:
                 cooldown_time=_cooldown_time,
             )
 
+            self._add_local_cooldown(model_id=model_id, cooldown_data=cooldown_data)
+
             # Set the cache with a TTL equal to the cooldown time
             self.cache.set_cache(
                 value=cooldown_data,
                 key=cooldown_key,
                 ttl=_cooldown_time,
             )
+            self._publish_cooldown_event(model_id=model_id, cooldown_data=cooldown_data)
         except Exception as e:
             verbose_logger.error(
                 "CooldownCache::add_deployment_to_cooldown - Exception occurred - {}".format(
@@ -91,6 +244,16 @@ class CooldownCache:
     async def async_get_active_cooldowns(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> List[Tuple[str, CooldownCacheValue]]:
+        self._start_cooldown_events_listener()
+        if self._can_use_local_cooldowns(model_ids):
+            return self._get_local_active_cooldowns(model_ids)
+
+        if self.is_subscribed_to_cooldown_events and self.cache.redis_cache is not None:
+            await self._async_sync_cooldowns_from_redis(
+                model_ids=model_ids, parent_otel_span=parent_otel_span
+            )
+            return self._get_local_active_cooldowns(model_ids)
+
         # Generate the keys for the deployments
         keys = [
             CooldownCache.get_cooldown_cache_key(model_id) for model_id in model_ids
@@ -113,13 +276,57 @@ class CooldownCache:
         for model_id, result in zip(model_ids, results):
             if result and isinstance(result, dict):
                 cooldown_cache_value = CooldownCacheValue(**result)  # type: ignore
+                self._add_local_cooldown(
+                    model_id=model_id, cooldown_data=cooldown_cache_value
+                )
                 active_cooldowns.append((model_id, cooldown_cache_value))
 
         return active_cooldowns
 
+    async def _async_sync_cooldowns_from_redis(
+        self, model_ids: List[str], parent_otel_span: Optional[Span]
+    ):
+        """
+        Just subscribed - read the cooldowns set before the subscription from redis, once per model id, then only use the local cooldowns for it
+        """
+        redis_cache = self.cache.redis_cache
+        if redis_cache is None:
+            return
+        unsynced_model_ids = [
+            model_id
+            for model_id in model_ids
+            if model_id not in self._synced_cooldown_model_ids
+        ]
+        keys = [
+            CooldownCache.get_cooldown_cache_key(model_id)
+            for model_id in unsynced_model_ids
+        ]
+        if not keys:
+            return
+        # failed reads are swallowed by the redis cache - its keys are missing from the results
+        redis_results = (
+            await redis_cache.async_batch_get_cache(
+                key_list=keys, parent_otel_span=parent_otel_span
+            )
+            or {}
+        )
+        for model_id, key in zip(unsynced_model_ids, keys):
+            if key not in redis_results:
+                continue  # not synced - read again on the next call
+            result = redis_results[key]
+            if result and isinstance(result, dict):
+                self._add_local_cooldown(
+                    model_id=model_id,
+                    cooldown_data=CooldownCacheValue(**result),  # type: ignore
+                )
+            self._synced_cooldown_model_ids.add(model_id)
+
     def get_active_cooldowns(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> List[Tuple[str, CooldownCacheValue]]:
+        if self._can_use_local_cooldowns(model_ids):
+            return self._get_local_active_cooldowns(model_ids)
+
         # Generate the keys for the deployments
         keys = [f"deployment:{model_id}:cooldown" for model_id in model_ids]
         # Retrieve the values for the keys using mget
@@ -164,6 +371,10 @@ class CooldownCache:
         return min_cooldown_time or self.default_cooldown_time
 
 
+def _get_cooldown_expiry(cooldown_data: CooldownCacheValue) -> float:
+    return cooldown_data["timestamp"] + cooldown_data["cooldown_time"]
+
+
 # Usage example:
 # cooldown_cache = CooldownCache(cache=your_cache_instance, cooldown_time=your_cooldown_time)
 # cooldown_cache.add_deployment_to_cooldown(deployment, original_exception, exception_status)
@@ -0,0 +1,49 @@
+"""
+Per-deployment info used by `Router._pre_call_checks()` (context window, rpm, region, supported params)
+
+Computed once per deployment and reused across requests, instead of resolving the model info / provider for every deployment on every request. Recomputed if the model cost map changed (e.g. `litellm.register_model`).
+"""
+
+from typing import Optional, Tuple
+
+import litellm
+from litellm.types.router import LiteLLM_Params
+
+
+class DeploymentPreCallInfo:
+    def __init__(
+        self,
+        deployment: dict,
+        model: Optional[str],
+        max_input_tokens: Optional[int],
+        model_cost_map_key: Tuple[int, int],
+    ):
+        self.deployment = deployment
+        self.model = model  # base model, or the litellm model - used in error messages + to get the supported params
+        self.max_input_tokens = max_input_tokens
+        self.model_cost_map_key = model_cost_map_key  # `max_input_tokens` is stale if the model cost map changed - see `litellm.utils.get_model_cost_map_key`
+        self.model_id = deployment.get("model_info", {}).get("id", "")
+        _litellm_params = deployment.get("litellm_params", {})
+        self.rpm = _litellm_params.get("rpm", None)
+        self._litellm_params: Optional[LiteLLM_Params] = None
+        self._supported_openai_params: Optional[list] = None
+        self._has_supported_openai_params = False
+
+    @property
+    def litellm_params(self) -> LiteLLM_Params:
+        if self._litellm_params is None:
+            self._litellm_params = LiteLLM_Params(
+                **self.deployment.get("litellm_params", {})
+            )
+        return self._litellm_params
+
+    def get_supported_openai_params(self) -> Optional[list]:
+        if not self._has_supported_openai_params:
+            model, custom_llm_provider, _, _ = litellm.get_llm_provider(
+                model=self.model or "", litellm_params=self.litellm_params
+            )
+            self._supported_openai_params = litellm.get_supported_openai_params(
+                model=model, custom_llm_provider=custom_llm_provider
+            )
+            self._has_supported_openai_params = True
+        return self._supported_openai_params
@@ -102,6 +102,7 @@ from litellm.litellm_core_utils.llm_response_utils.get_headers import (
 from litellm.litellm_core_utils.llm_response_utils.response_metadata import (
     ResponseMetadata,
 )
+from litellm.litellm_core_utils.message_trimming import MessageTrimmer, TrimStrategy
 from litellm.litellm_core_utils.redact_messages import (
     LiteLLMLoggingObject,
     redact_message_input_output_from_logging,
@@ -112,6 +113,7 @@ from litellm.litellm_core_utils.token_counter import (
     calculate_img_tokens,
     get_modified_max_tokens,
 )
+from litellm.litellm_core_utils.tokenizer_registry import tokenizer_registry
 from litellm.llms.bedrock.common_utils import BedrockModelInfo
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
 from litellm.router_utils.get_retry_from_policy import (
@@ -203,7 +205,12 @@ from litellm.llms.base_llm.image_variations.transformation import (
 )
 from litellm.llms.base_llm.rerank.transformation import BaseRerankConfig
 
-from ._logging import _is_debugging_on, verbose_logger
+from ._logging import (
+    LazyArg,
+    _is_debugging_on,
+    lazy_verbose_logger,
+    verbose_logger,
+)
 from .caching.caching import (
     Cache,
     QdrantSemanticCache,
@@ -269,6 +276,9 @@ additional_details: Optional[Dict[str, str]] = {}
 local_cache: Optional[Dict[str, str]] = {}
 last_fetched_at = None
 last_fetched_at_keys = None
+model_cost_map_version = (
+    0  # incremented by `register_model` - see `get_model_cost_map_key`
+)
 ######## Model Response #########################
 
 # All liteLLM Model responses will be in this format, Follows the OpenAI Format
@@ -494,8 +504,9 @@ def function_setup(  # noqa: PLR0915
                     litellm.logging_callback_manager.add_litellm_async_success_callback(callback)  # type: ignore
                 if callback not in litellm._async_failure_callback:
                     litellm.logging_callback_manager.add_litellm_async_failure_callback(callback)  # type: ignore
-            print_verbose(
-                f"Initialized litellm callbacks, Async Success Callbacks: {litellm._async_success_callback}"
+            lazy_verbose_logger.print_verbose(
+                "Initialized litellm callbacks, Async Success Callbacks: %s",
+                litellm._async_success_callback,
             )
 
         if (
@@ -1226,8 +1237,11 @@ def client(original_function):  # noqa: PLR0915
                     )
 
             # [OPTIONAL] CHECK CACHE
-            print_verbose(
-                f"ASYNC kwargs[caching]: {kwargs.get('caching', False)}; litellm.cache: {litellm.cache}; kwargs.get('cache'): {kwargs.get('cache', None)}"
+            lazy_verbose_logger.print_verbose(
+                "ASYNC kwargs[caching]: %s; litellm.cache: %s; kwargs.get('cache'): %s",
+                kwargs.get("caching", False),
+                litellm.cache,
+                kwargs.get("cache", None),
             )
             _caching_handler_response: CachingHandlerResponse = (
                 await _llm_caching_handler._async_get_cache(
@@ -1463,19 +1477,31 @@ def _select_tokenizer(
     model: str, custom_tokenizer: Optional[CustomHuggingfaceTokenizer] = None
 ):
     if custom_tokenizer is not None:
-        _tokenizer = create_pretrained_tokenizer(
+        _tokenizer = tokenizer_registry.get_huggingface_tokenizer(
             identifier=custom_tokenizer["identifier"],
             revision=custom_tokenizer["revision"],
             auth_token=custom_tokenizer["auth_token"],
         )
-        return _tokenizer
+        return {"type": "huggingface_tokenizer", "tokenizer": _tokenizer}
+    global _select_tokenizer_cache_dir
+    if litellm.tokenizer_cache_dir != _select_tokenizer_cache_dir:
+        # tokenizers selected before tokenizer_cache_dir was set / changed (e.g. the openai fallback with downloads disabled) are stale
+        _select_tokenizer_helper.cache_clear()
+        _select_tokenizer_cache_dir = litellm.tokenizer_cache_dir
     return _select_tokenizer_helper(model=model)
 
 
+# litellm.tokenizer_cache_dir the cached `_select_tokenizer_helper` results were selected with
+_select_tokenizer_cache_dir: Optional[str] = None
+
+
 @lru_cache(maxsize=128)
 def _select_tokenizer_helper(model: str) -> SelectTokenizerResponse:
 
-    if litellm.disable_hf_tokenizer_download is True:
+    if (
+        litellm.disable_hf_tokenizer_download is True
+        and not litellm.tokenizer_cache_dir
+    ):
         return _return_openai_tokenizer(model)
 
     try:
@@ -1496,21 +1522,27 @@ def _return_openai_tokenizer(model: str) -> SelectTokenizerResponse:
 def _return_huggingface_tokenizer(model: str) -> Optional[SelectTokenizerResponse]:
     if model in litellm.cohere_models and "command-r" in model:
         # cohere
-        cohere_tokenizer = Tokenizer.from_pretrained(
+        cohere_tokenizer = tokenizer_registry.get_huggingface_tokenizer(
             "Xenova/c4ai-command-r-v01-tokenizer"
         )
         return {"type": "huggingface_tokenizer", "tokenizer": cohere_tokenizer}
     # anthropic
     elif model in litellm.anthropic_models and "claude-3" not in model:
-        claude_tokenizer = Tokenizer.from_str(claude_json_str)
+        claude_tokenizer = tokenizer_registry.get_tokenizer_from_str(
+            name="anthropic", json_str=claude_json_str
+        )
         return {"type": "huggingface_tokenizer", "tokenizer": claude_tokenizer}
     # llama2
     elif "llama-2" in model.lower() or "replicate" in model.lower():
-        tokenizer = Tokenizer.from_pretrained("hf-internal-testing/llama-tokenizer")
+        tokenizer = tokenizer_registry.get_huggingface_tokenizer(
+            "hf-internal-testing/llama-tokenizer"
+        )
         return {"type": "huggingface_tokenizer", "tokenizer": tokenizer}
     # llama3
     elif "llama-3" in model.lower():
-        tokenizer = Tokenizer.from_pretrained("Xenova/llama-3-tokenizer")
+        tokenizer = tokenizer_registry.get_huggingface_tokenizer(
+            "Xenova/llama-3-tokenizer"
+        )
         return {"type": "huggingface_tokenizer", "tokenizer": tokenizer}
     else:
         return None
@@ -1536,12 +1568,59 @@ def encode(model="", text="", custom_tokenizer: Optional[dict] = None):
     return enc
 
 
+def encode_batch(
+    model="", texts: List[str] = [], custom_tokenizer: Optional[dict] = None
+) -> list:
+    """
+    Encodes a batch of texts - same result as `[encode(model=model, text=text) for text in texts]`.
+
+    The texts are encoded in parallel, by the tokenizer's native thread pool (huggingface tokenizers: rayon, tiktoken: a thread pool) - the GIL is released while encoding.
+
+    Args:
+        model (str): The name of the model to use for tokenization.
+        texts (List[str]): The texts to be encoded.
+        custom_tokenizer (Optional[dict]): A custom tokenizer created with the `create_pretrained_tokenizer` or `create_tokenizer` method. Default is None.
+
+    Returns:
+        list: The encoded texts, in the order of `texts`.
+    """
+    tokenizer_json = custom_tokenizer or _select_tokenizer(model=model)
+    if isinstance(tokenizer_json["tokenizer"], Encoding):
+        # tiktoken defaults to 8 threads - no more than the cpus available
+        return tokenizer_json["tokenizer"].encode_batch(
+            texts, num_threads=min(os.cpu_count() or 1, 8), disallowed_special=()
+        )
+    return tokenizer_json["tokenizer"].encode_batch(texts)
+
+
+def load_tokenizers(models: List[str]) -> None:
+    """
+    Loads the tokenizers of `models` now, instead of on the first request for each model. Used on proxy startup (`litellm_settings.preload_tokenizers`).
+    """
+    for model in models:
+        tokenizer_json = _select_tokenizer(model=model)
+        if tokenizer_json["type"] == "openai_tokenizer":
+            # the tiktoken encoding `openai_token_counter` uses for the model
+            _get_tiktoken_encoding(model=model)
+        verbose_logger.debug("loaded %s for model=%s", tokenizer_json["type"], model)
+
+
 def decode(model="", tokens: List[int] = [], custom_tokenizer: Optional[dict] = None):
     tokenizer_json = custom_tokenizer or _select_tokenizer(model=model)
     dec = tokenizer_json["tokenizer"].decode(tokens)
     return dec
 
 
+def _get_tiktoken_encoding(model: str) -> Encoding:
+    try:
+        if "gpt-4o" in model:
+            return tiktoken.get_encoding("o200k_base")
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        print_verbose("Warning: model not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def openai_token_counter(  # noqa: PLR0915
     messages: Optional[list] = None,
     model="gpt-3.5-turbo-0613",
@@ -1560,14 +1639,7 @@ def openai_token_counter(  # noqa: PLR0915
     Borrowed from https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb.
     """
     print_verbose(f"LiteLLM: Utils - Counting tokens for OpenAI model={model}")
-    try:
-        if "gpt-4o" in model:
-            encoding = tiktoken.get_encoding("o200k_base")
-        else:
-            encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        print_verbose("Warning: model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
+    encoding = _get_tiktoken_encoding(model=model)
     if model == "gpt-3.5-turbo-0301":
         tokens_per_message = (
             4  # every message follows <|start|>{role/name}\n{content}<|end|>\n
@@ -1786,7 +1858,9 @@ def token_counter(
     num_tokens = 0
     if text is None:
         if messages is not None:
-            print_verbose(f"token_counter messages received: {messages}")
+            lazy_verbose_logger.print_verbose(
+                "token_counter messages received: %s", messages
+            )
             text = ""
             for message in messages:
                 if message.get("content", None) is not None:
@@ -1846,8 +1920,8 @@ def token_counter(
                     # azure llms use gpt-35-turbo instead of gpt-3.5-turbo 🙃
                     model = model.replace("-35", "-3.5")
 
-                print_verbose(
-                    f"Token Counter - using OpenAI token counter, for model={model}"
+                lazy_verbose_logger.print_verbose(
+                    "Token Counter - using OpenAI token counter, for model=%s", model
                 )
                 num_tokens = openai_token_counter(
                     text=text,  # type: ignore
@@ -1861,8 +1935,8 @@ def token_counter(
                     or False,
                 )
             else:
-                print_verbose(
-                    f"Token Counter - using generic token counter, for model={model}"
+                lazy_verbose_logger.print_verbose(
+                    "Token Counter - using generic token counter, for model=%s", model
                 )
                 num_tokens = openai_token_counter(
                     text=text,  # type: ignore
@@ -2212,9 +2286,18 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
         elif value.get("litellm_provider") == "bedrock":
             if key not in litellm.bedrock_models:
                 litellm.bedrock_models.append(key)
+    global model_cost_map_version
+    model_cost_map_version += 1
     return model_cost
 
 
+def get_model_cost_map_key() -> Tuple[int, int]:
+    """
+    Changes when `litellm.model_cost` is replaced, or updated by `register_model` - used to invalidate values cached from the model cost map
+    """
+    return id(litellm.model_cost), model_cost_map_version
+
+
 def _should_drop_param(k, additional_drop_params) -> bool:
     if (
         additional_drop_params is not None
@@ -2941,14 +3024,17 @@ def get_optional_params(  # noqa: PLR0915
                 tool_function["parameters"] = new_parameters
 
     def _check_valid_arg(supported_params: List[str]):
-        verbose_logger.info(
-            f"\nLiteLLM completion() model= {model}; provider = {custom_llm_provider}"
+        lazy_verbose_logger.info(
+            "\nLiteLLM completion() model= %s; provider = %s",
+            model,
+            custom_llm_provider,
         )
-        verbose_logger.debug(
-            f"\nLiteLLM: Params passed to completion() {passed_params}"
+        lazy_verbose_logger.debug(
+            "\nLiteLLM: Params passed to completion() %s", passed_params
         )
-        verbose_logger.debug(
-            f"\nLiteLLM: Non-Default params passed to completion() {non_default_params}"
+        lazy_verbose_logger.debug(
+            "\nLiteLLM: Non-Default params passed to completion() %s",
+            non_default_params,
         )
         unsupported_params = {}
         for k in non_default_params.keys():
@@ -3557,10 +3643,11 @@ def get_optional_params(  # noqa: PLR0915
                 ),
             )
         else:
-            verbose_logger.debug(
-                "Azure optional params - api_version: api_version={}, litellm.api_version={}, os.environ['AZURE_API_VERSION']={}".format(
-                    api_version, litellm.api_version, get_secret("AZURE_API_VERSION")
-                )
+            lazy_verbose_logger.debug(
+                "Azure optional params - api_version: api_version=%s, litellm.api_version=%s, os.environ['AZURE_API_VERSION']=%s",
+                api_version,
+                litellm.api_version,
+                LazyArg(get_secret, "AZURE_API_VERSION"),
             )
             api_version = (
                 api_version
@@ -3620,7 +3707,9 @@ def get_optional_params(  # noqa: PLR0915
         for k in passed_params.keys():
             if k not in default_params.keys():
                 optional_params[k] = passed_params[k]
-    print_verbose(f"Final returned optional params: {optional_params}")
+    lazy_verbose_logger.print_verbose(
+        "Final returned optional params: %s", optional_params
+    )
     return optional_params
 
 
@@ -5403,105 +5492,25 @@ def read_config_args(config_path) -> dict:
 ########## experimental completion variants ############################
 
 
-def process_system_message(system_message, max_tokens, model):
-    system_message_event = {"role": "system", "content": system_message}
-    system_message_tokens = get_token_count([system_message_event], model)
-
-    if system_message_tokens > max_tokens:
-        print_verbose(
-            "`tokentrimmer`: Warning, system message exceeds token limit. Trimming..."
-        )
-        # shorten system message to fit within max_tokens
-        new_system_message = shorten_message_to_fit_limit(
-            system_message_event, max_tokens, model
-        )
-        system_message_tokens = get_token_count([new_system_message], model)
-
-    return system_message_event, max_tokens - system_message_tokens
-
-
-def process_messages(messages, max_tokens, model):
-    # Process messages from older to more recent
-    messages = messages[::-1]
-    final_messages = []
-
-    for message in messages:
-        used_tokens = get_token_count(final_messages, model)
-        available_tokens = max_tokens - used_tokens
-        if available_tokens <= 3:
-            break
-        final_messages = attempt_message_addition(
-            final_messages=final_messages,
-            message=message,
-            available_tokens=available_tokens,
-            max_tokens=max_tokens,
-            model=model,
-        )
-
-    return final_messages
-
-
-def attempt_message_addition(
-    final_messages, message, available_tokens, max_tokens, model
-):
-    temp_messages = [message] + final_messages
-    temp_message_tokens = get_token_count(messages=temp_messages, model=model)
-
-    if temp_message_tokens <= max_tokens:
-        return temp_messages
-
-    # if temp_message_tokens > max_tokens, try shortening temp_messages
-    elif "function_call" not in message:
-        # fit updated_message to be within temp_message_tokens - max_tokens (aka the amount temp_message_tokens is greate than max_tokens)
-        updated_message = shorten_message_to_fit_limit(message, available_tokens, model)
-        if can_add_message(updated_message, final_messages, max_tokens, model):
-            return [updated_message] + final_messages
-
-    return final_messages
-
-
-def can_add_message(message, messages, max_tokens, model):
-    if get_token_count(messages + [message], model) <= max_tokens:
-        return True
-    return False
-
-
 def get_token_count(messages, model):
     return token_counter(model=model, messages=messages)
 
 
 def shorten_message_to_fit_limit(message, tokens_needed, model: Optional[str]):
     """
-    Shorten a message to fit within a token limit by removing characters from the middle.
+    Shorten a message to fit within a token limit by removing tokens from the middle.
     """
 
     # For OpenAI models, even blank messages cost 7 token,
-    # and if the buffer is less than 3, the while loop will never end,
     # hence the value 10.
     if model is not None and "gpt" in model and tokens_needed <= 10:
         return message
 
-    content = message["content"]
-
-    while True:
-        total_tokens = get_token_count([message], model)
-
-        if total_tokens <= tokens_needed:
-            break
-
-        ratio = (tokens_needed) / total_tokens
-
-        new_length = int(len(content) * ratio) - 1
-        new_length = max(0, new_length)
-
-        half_length = new_length // 2
-        left_half = content[:half_length]
-        right_half = content[-half_length:]
-
-        trimmed_content = left_half + ".." + right_half
-        message["content"] = trimmed_content
-        content = trimmed_content
-
+    truncated_message = MessageTrimmer(model=model).truncate_message(
+        message, max_tokens=tokens_needed
+    )
+    if truncated_message is not None:
+        message["content"] = truncated_message["content"]
     return message
 
 
@@ -5514,6 +5523,7 @@ def trim_messages(
     trim_ratio: float = 0.75,
     return_response_tokens: bool = False,
     max_tokens=None,
+    trim_strategy: TrimStrategy = "keep_system_and_tail",
 ):
     """
     Trim a list of messages to fit within a model's token limit.
@@ -5524,13 +5534,15 @@ def trim_messages(
         trim_ratio: Target ratio of tokens to use after trimming. Default is 0.75, meaning it will trim messages so they use about 75% of the model's token limit.
         return_response_tokens: If True, also return the number of tokens left available for the response after trimming.
         max_tokens: Instead of specifying a model or trim_ratio, you can specify this directly.
+        trim_strategy: "keep_system_and_tail" (default) keeps the system message(s) + the most recent messages that fit. "placeholder" also replaces the removed messages with a placeholder message.
 
     Returns:
         Trimmed messages and optionally the number of tokens available for response.
     """
     # Initialize max_tokens
     # if users pass in max tokens, trim to this amount
-    messages = copy.deepcopy(messages)
+    # the input messages are never modified - truncated messages are copies
+    messages = list(messages)
     try:
         if max_tokens is None:
             # Check if model is valid
@@ -5545,12 +5557,6 @@ def trim_messages(
                 # do nothing, just return messages
                 return messages
 
-        system_message = ""
-        for message in messages:
-            if message["role"] == "system":
-                system_message += "\n" if system_message else ""
-                system_message += message["content"]
-
         ## Handle Tool Call ## - check if last message is a tool response, return as is - https://github.com/BerriAI/litellm/issues/4931
         tool_messages = []
 
@@ -5571,36 +5577,20 @@ def trim_messages(
 
         #### Trimming messages if current_tokens > max_tokens
         print_verbose(
-            f"Need to trim input messages: {messages}, current_tokens{current_tokens}, max_tokens: {max_tokens}"
+            f"Need to trim input messages, current_tokens{current_tokens}, max_tokens: {max_tokens}"
         )
-        system_message_event: Optional[dict] = None
-        if system_message:
-            system_message_event, max_tokens = process_system_message(
-                system_message=system_message, max_tokens=max_tokens, model=model
-            )
-
-            if max_tokens == 0:  # the system messages are too long
-                return [system_message_event]
-
-            # Since all system messages are combined and trimmed to fit the max_tokens,
-            # we remove all system messages from the messages list
-            messages = [message for message in messages if message["role"] != "system"]
-
-        final_messages = process_messages(
-            messages=messages, max_tokens=max_tokens, model=model
-        )
-
-        # Add system message to the beginning of the final messages
-        if system_message_event:
-            final_messages = [system_message_event] + final_messages
+        final_messages, final_tokens = MessageTrimmer(
+            model=model, trim_strategy=trim_strategy
+        ).trim(messages=messages, max_tokens=max_tokens)
 
         if len(tool_messages) > 0:
             final_messages.extend(tool_messages)
+            final_tokens = get_token_count(final_messages, model)
 
         if (
             return_response_tokens
         ):  # if user wants token count with new trimmed messages
-            response_tokens = max_tokens - get_token_count(final_messages, model)
+            response_tokens = max_tokens - final_tokens
             return final_messages, response_tokens
         return final_messages
     except Exception as e:  # [NON-Blocking, if error occurs just return final_messages
@@ -18,12 +18,11 @@ from typing import Optional
 import litellm
 from litellm import create_batch, create_file
 from litellm._logging import verbose_logger
+from litellm.types.llms.openai import Batch
 from litellm.batches.batch_utils import (
-    _batch_cost_calculator,
-    _get_file_content_as_dictionary,
-    _get_batch_job_cost_from_file_content,
-    _get_batch_job_total_usage_from_file_content,
-    _get_batch_job_usage_from_response_body,
+    BatchOutputUsageAggregator,
+    _aiter_jsonl_lines,
+    _get_batch_output_file_cost_and_usage,
     _get_response_from_batch_job_output_file,
     _batch_response_was_successful,
 )
@@ -129,43 +128,135 @@ def sample_file_content_dict():
     ]
 
 
-def test_get_file_content_as_dictionary(sample_file_content):
-    result = _get_file_content_as_dictionary(sample_file_content)
-    assert len(result) == 2
-    assert result[0]["id"] == "batch_req_6769ca596b38819093d7ae9f522de924"
-    assert result[0]["custom_id"] == "request-1"
-    assert result[0]["response"]["status_code"] == 200
-    assert result[0]["response"]["body"]["usage"]["total_tokens"] == 30
+def test_get_response_from_batch_job_output_file(sample_file_content_dict):
+    result = _get_response_from_batch_job_output_file(sample_file_content_dict[0])
+    assert result["id"] == "chatcmpl-AhjSMl7oZ79yIPHLRYgmgXSixTJr7"
+    assert result["object"] == "chat.completion"
+    assert result["usage"]["total_tokens"] == 30
+
+
+@pytest.mark.asyncio
+async def test_aiter_jsonl_lines():
+    async def _chunks():
+        for chunk in [b'{"a": 1}\n{"b"', b": 2}", b"\n\n", b'{"c": 3}']:
+            yield chunk
+
+    lines = [line async for line in _aiter_jsonl_lines(_chunks())]
+    assert lines == [b'{"a": 1}', b'{"b": 2}', b"", b'{"c": 3}']
+
 
+def test_batch_output_usage_aggregator_uses_batch_pricing(sample_file_content):
+    aggregator = BatchOutputUsageAggregator(custom_llm_provider="openai")
+    for line in sample_file_content.splitlines():
+        aggregator.add_line(line)
 
-def test_get_batch_job_total_usage_from_file_content(sample_file_content_dict):
-    usage = _get_batch_job_total_usage_from_file_content(
-        sample_file_content_dict, custom_llm_provider="openai"
+    model_info = litellm.model_cost["gpt-4o-mini-2024-07-18"]
+    assert aggregator.cost == pytest.approx(
+        42 * model_info["input_cost_per_token_batches"]
+        + 20 * model_info["output_cost_per_token_batches"]
     )
-    assert usage.total_tokens == 62  # 30 + 32
-    assert usage.prompt_tokens == 42  # 20 + 22
-    assert usage.completion_tokens == 20  # 10 + 10
+    assert aggregator.usage.total_tokens == 62
+    assert aggregator.usage.prompt_tokens == 42
+    assert aggregator.usage.completion_tokens == 20
 
 
-@pytest.mark.asyncio
-async def test_batch_cost_calculator(sample_file_content_dict):
-    """
-    mock litellm.completion_cost to return 0.5
+def test_batch_output_usage_aggregator_skips_malformed_lines(sample_file_content):
+    aggregator = BatchOutputUsageAggregator(custom_llm_provider="openai")
+    lines = sample_file_content.strip().splitlines()
+    for line in [lines[0], b'{"custom_id": "request-3", "resp', b"[1, 2]", lines[1]]:
+        aggregator.add_line(line)
+
+    assert aggregator.usage.total_tokens == 62
 
-    we know sample_file_content_dict has 2 successful responses
 
-    so we expect the cost to be 0.5 * 2 = 1.0
+def test_batch_output_usage_aggregator_without_batch_pricing(sample_file_content_dict):
     """
+    models without batch pricing in the model cost map are priced with litellm.completion_cost
+    """
+    aggregator = BatchOutputUsageAggregator(custom_llm_provider="openai")
     with patch("litellm.completion_cost", return_value=0.5):
-        cost = await _batch_cost_calculator(
-            file_content_dictionary=sample_file_content_dict,
-            custom_llm_provider="openai",
+        for item in sample_file_content_dict:
+            item["response"]["body"]["model"] = "gpt-3.5-turbo"
+            aggregator.add_item(item)
+        # failed requests are not priced
+        aggregator.add_item(
+            {"custom_id": "request-3", "response": {"status_code": 400}}
         )
-        assert cost == 1.0  # 0.5 * 2 successful responses
+    assert aggregator.cost == 1.0
+    assert aggregator.usage.total_tokens == 62
 
 
-def test_get_response_from_batch_job_output_file(sample_file_content_dict):
-    result = _get_response_from_batch_job_output_file(sample_file_content_dict[0])
-    assert result["id"] == "chatcmpl-AhjSMl7oZ79yIPHLRYgmgXSixTJr7"
-    assert result["object"] == "chat.completion"
-    assert result["usage"]["total_tokens"] == 30
+@pytest.mark.asyncio
+async def test_get_batch_output_file_cost_and_usage(sample_file_content):
+    """
+    the output file is read as a stream - lines split across chunks are parsed correctly
+    """
+
+    async def _mock_afile_content_stream(file_id, custom_llm_provider, chunk_size):
+        assert file_id == "file-output"
+        for i in range(0, len(sample_file_content), 7):
+            yield sample_file_content[i : i + 7]
+
+    batch = Batch(
+        id="batch_1",
+        completion_window="24h",
+        created_at=1734986202,
+        endpoint="/v1/chat/completions",
+        input_file_id="file-input",
+        object="batch",
+        status="completed",
+        output_file_id="file-output",
+    )
+    with patch(
+        "litellm.batches.batch_utils.afile_content_stream",
+        new=_mock_afile_content_stream,
+    ):
+        cost, usage = await _get_batch_output_file_cost_and_usage(
+            batch=batch, custom_llm_provider="openai"
+        )
+
+    aggregator = BatchOutputUsageAggregator(custom_llm_provider="openai")
+    for line in sample_file_content.splitlines():
+        aggregator.add_line(line)
+    assert cost == aggregator.cost
+    assert usage.total_tokens == 62
+
+
+@pytest.mark.asyncio
+async def test_azure_afile_content_stream_drops_azure_ad_token():
+    from contextlib import asynccontextmanager
+
+    from openai import AsyncAzureOpenAI
+
+    from litellm.llms.azure.files.handler import AzureOpenAIFilesAPI
+
+    content_kwargs = {}
+
+    class MockStreamingResponse:
+        async def iter_bytes(self, chunk_size=None):
+            yield b"line-1\n"
+
+    @asynccontextmanager
+    async def _mock_content(**kwargs):
+        content_kwargs.update(kwargs)
+        yield MockStreamingResponse()
+
+    client = MagicMock(spec=AsyncAzureOpenAI)
+    client.files = MagicMock()
+    client.files.with_streaming_response.content = _mock_content
+    extra_body = {"azure_ad_token": "secret-token", "foo": "bar"}
+
+    chunks = [
+        chunk
+        async for chunk in AzureOpenAIFilesAPI().afile_content_stream(
+            file_content_request={"file_id": "file-123", "extra_body": extra_body},
+            api_base=None,
+            api_key=None,
+            timeout=600,
+            max_retries=None,
+            client=client,
+        )
+    ]
+    assert chunks == [b"line-1\n"]
+    assert content_kwargs == {"file_id": "file-123", "extra_body": {"foo": "bar"}}
+    assert extra_body == {"azure_ad_token": "secret-token", "foo": "bar"}
@@ -0,0 +1,538 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system-path
+
+import litellm
+from litellm import Router
+from litellm.batches.local_batches import (
+    LocalBatchExecutor,
+    LocalBatchesAPI,
+    LocalBatchStore,
+)
+from litellm.router_utils.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+@pytest.fixture
+def local_batches(tmp_path, monkeypatch):
+    local_batches_instance = LocalBatchesAPI(
+        executor=LocalBatchExecutor(store=LocalBatchStore(base_dir=str(tmp_path)))
+    )
+    monkeypatch.setattr(
+        "litellm.batches.main.local_batches_instance", local_batches_instance
+    )
+    monkeypatch.setattr(
+        "litellm.files.main.local_batches_instance", local_batches_instance
+    )
+    return local_batches_instance
+
+
+def _get_batch_file(num_requests: int, model: str = "my-model") -> bytes:
+    return b"\n".join(
+        json.dumps(
+            {
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [{"role": "user", "content": f"Hello {i}"}],
+                },
+            }
+        ).encode("utf-8")
+        for i in range(num_requests)
+    )
+
+
+async def _wait_for_batch(batch_id: str, **kwargs):
+    for _ in range(200):
+        batch = await litellm.aretrieve_batch(
+            batch_id=batch_id, custom_llm_provider="local", **kwargs
+        )
+        if batch.status in ["completed", "failed", "cancelled", "expired"]:
+            return batch
+        await asyncio.sleep(0.05)
+    raise Exception(f"batch {batch_id} did not finish")
+
+
+async def _get_file_lines(file_id: str):
+    content = await litellm.afile_content(file_id=file_id, custom_llm_provider="local")
+    return [json.loads(line) for line in content.content.splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_local_batch_create_retrieve(local_batches):
+    router = Router(
+        model_list=[
+            {
+                "model_name": "my-model",
+                "litellm_params": {
+                    "model": "anthropic/claude-3-5-sonnet-20240620",
+                    "mock_response": "Hi!",
+                },
+            }
+        ]
+    )
+    file_obj = await litellm.acreate_file(
+        file=("batch.jsonl", _get_batch_file(20), "application/jsonl"),
+        purpose="batch",
+        custom_llm_provider="local",
+    )
+    batch = await litellm.acreate_batch(
+        completion_window="24h",
+        endpoint="/v1/chat/completions",
+        input_file_id=file_obj.id,
+        custom_llm_provider="local",
+        llm_router=router,
+    )
+    assert batch.status == "validating"
+
+    batch = await _wait_for_batch(batch.id)
+    assert batch.status == "completed"
+    assert batch.request_counts.total == 20
+    assert batch.request_counts.completed == 20
+    assert batch.error_file_id is None
+
+    output_lines = await _get_file_lines(batch.output_file_id)
+    assert sorted(line["custom_id"] for line in output_lines) == sorted(
+        f"request-{i}" for i in range(20)
+    )
+    for line in output_lines:
+        assert line["response"]["status_code"] == 200
+        assert line["response"]["body"]["choices"][0]["message"]["content"] == "Hi!"
+
+
+@pytest.mark.asyncio
+async def test_local_batch_errors_and_invalid_lines(local_batches):
+    requests = [
+        {"model": "gpt-4o", "mock_response": "Hi!"},
+        # no provider - raises a BadRequestError
+        {"model": "my-unknown-model"},
+    ]
+    file_content = b"\n".join(
+        [
+            json.dumps(
+                {
+                    "custom_id": f"request-{i}",
+                    "body": {
+                        **request,
+                        "messages": [{"role": "user", "content": "Hello"}],
+                    },
+                }
+            ).encode("utf-8")
+            for i, request in enumerate(requests)
+        ]
+        + [b"not json", b'{"custom_id": "no-body"}']
+    )
+    file_obj = await litellm.acreate_file(
+        file=file_content, purpose="batch", custom_llm_provider="local"
+    )
+    # without a router, requests go to litellm.acompletion
+    batch = await litellm.acreate_batch(
+        completion_window="24h",
+        endpoint="/v1/chat/completions",
+        input_file_id=file_obj.id,
+        custom_llm_provider="local",
+    )
+    batch = await _wait_for_batch(batch.id)
+    assert batch.status == "completed"
+    assert batch.request_counts.total == 4
+    assert batch.request_counts.completed == 1
+    assert batch.request_counts.failed == 3
+
+    error_lines = await _get_file_lines(batch.error_file_id)
+    request_error = next(
+        line for line in error_lines if line["custom_id"] == "request-1"
+    )
+    assert request_error["response"]["status_code"] == 400
+    assert sorted(
+        line["error"]["line"] for line in error_lines if line["error"] is not None
+    ) == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_local_batch_resumes_from_checkpoint(local_batches):
+    store = local_batches.store
+    file_obj = store.create_file(file=_get_batch_file(10), purpose="batch")
+    batch = local_batches.executor._create_batch_object(
+        {
+            "completion_window": "24h",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": file_obj.id,
+        }
+    )
+    store.save_batch(batch)
+
+    # simulate a crash after 4 requests, mid-write of the 5th
+    output_path = store.get_file_content_path(f"file-{batch.id}-output")
+    with open(output_path, "wb") as f:
+        for i in range(4):
+            f.write(
+                json.dumps(
+                    {"custom_id": f"request-{i}", "response": {"status_code": 200}}
+                ).encode("utf-8")
+                + b"\n"
+            )
+        f.write(b'{"custom_id": "request-4", "resp')
+
+    calls = []
+
+    class MockRouter:
+        async def acompletion(self, model, messages, **kwargs):
+            calls.append(messages[0]["content"])
+            return litellm.ModelResponse()
+
+    resumed_batch_ids = await local_batches.executor.resume_batches(
+        llm_router=MockRouter()
+    )
+    assert resumed_batch_ids == [batch.id]
+    batch = await _wait_for_batch(batch.id)
+
+    assert batch.status == "completed"
+    assert sorted(calls) == sorted(f"Hello {i}" for i in range(4, 10))
+    assert batch.request_counts.completed == 10
+    output_lines = await _get_file_lines(batch.output_file_id)
+    assert len(output_lines) == 10
+
+
+@pytest.mark.asyncio
+async def test_local_batch_backs_off_on_rate_limits(local_batches):
+    num_calls = {"total": 0, "rate_limited": 0}
+
+    class MockRouter:
+        async def acompletion(self, model, messages, **kwargs):
+            num_calls["total"] += 1
+            if num_calls["total"] % 3 == 0:
+                num_calls["rate_limited"] += 1
+                raise litellm.RateLimitError(
+                    message="rate limited", llm_provider="anthropic", model=model
+                )
+            await asyncio.sleep(0.001)
+            return litellm.ModelResponse()
+
+    store = local_batches.store
+    file_obj = store.create_file(file=_get_batch_file(30), purpose="batch")
+    local_batches.executor.max_rate_limit_retries = 5
+    batch = await local_batches.executor.acreate_batch(
+        create_batch_data={
+            "completion_window": "24h",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": file_obj.id,
+        },
+        llm_router=MockRouter(),
+    )
+    batch = await _wait_for_batch(batch.id)
+    assert batch.status == "completed"
+    assert batch.request_counts.completed == 30
+    assert num_calls["rate_limited"] > 0
+
+
+@pytest.mark.asyncio
+async def test_local_batch_cancel(local_batches):
+    class SlowRouter:
+        async def acompletion(self, model, messages, **kwargs):
+            await asyncio.sleep(0.05)
+            return litellm.ModelResponse()
+
+    store = local_batches.store
+    file_obj = store.create_file(file=_get_batch_file(200), purpose="batch")
+    local_batches.executor.initial_concurrency = 2
+    local_batches.executor.max_concurrency = 2
+    batch = await local_batches.executor.acreate_batch(
+        create_batch_data={
+            "completion_window": "24h",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": file_obj.id,
+        },
+        llm_router=SlowRouter(),
+    )
+    await asyncio.sleep(0.2)
+    batch = await litellm.acancel_batch(batch_id=batch.id, custom_llm_provider="local")
+    assert batch.status == "cancelling"
+
+    batch = await _wait_for_batch(batch.id)
+    assert batch.status == "cancelled"
+    assert 0 < batch.request_counts.completed < 200
+
+
+@pytest.mark.asyncio
+async def test_router_runs_batch_locally_for_providers_without_batch_api(
+    local_batches,
+):
+    router = Router(
+        model_list=[
+            {
+                "model_name": "my-model",
+                "litellm_params": {
+                    "model": "anthropic/claude-3-5-sonnet-20240620",
+                    "mock_response": "Hi!",
+                },
+            }
+        ]
+    )
+    file_obj = await router.acreate_file(
+        model="my-model",
+        file=("batch.jsonl", _get_batch_file(5), "application/jsonl"),
+        purpose="batch",
+    )
+    assert file_obj.id.startswith("file-local-")
+    batch = await router.acreate_batch(
+        model="my-model",
+        completion_window="24h",
+        endpoint="/v1/chat/completions",
+        input_file_id=file_obj.id,
+    )
+    for _ in range(100):
+        batch = await router.aretrieve_batch(batch_id=batch.id)
+        if batch.status == "completed":
+            break
+        await asyncio.sleep(0.05)
+    assert batch.status == "completed"
+    assert batch.request_counts.completed == 5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter():
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_concurrency=4, max_concurrency=8, decrease_cooldown_seconds=0
+    )
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.limit == 8
+
+    limiter.on_rate_limit()
+    assert limiter.limit == 4
+
+    await limiter.acquire()
+    limiter.on_rate_limit(retry_after=0.2)
+    await limiter.release()
+    assert limiter.limit == 2
+
+    # new requests wait for the retry-after pause
+    start_time = asyncio.get_running_loop().time()
+    async with limiter.slot():
+        assert limiter.in_flight == 1
+    assert asyncio.get_running_loop().time() - start_time >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_limiter_follows_rate_limit_headers():
+    limiter = AdaptiveConcurrencyLimiter(initial_concurrency=4)
+
+    async def _call():
+        response = litellm.ModelResponse()
+        response._hidden_params["additional_headers"] = {
+            "x-ratelimit-remaining-requests": 0,
+            "llm_provider-x-ratelimit-reset-requests": "200ms",
+        }
+        return response
+
+    async with limiter.slot():
+        await limiter.call(_call, max_rate_limit_retries=0)
+    assert limiter.limit == 5
+
+    # no requests left - new requests wait for the reset
+    start_time = asyncio.get_running_loop().time()
+    async with limiter.slot():
+        pass
+    assert asyncio.get_running_loop().time() - start_time >= 0.15
+
+    # as many requests left as in flight (incl. the one that got the headers) - no pause
+    async with limiter.slot():
+        limiter.on_response_headers(
+            {
+                "x-ratelimit-remaining-requests": 1,
+                "x-ratelimit-reset-requests": "6m0s",
+            }
+        )
+    start_time = asyncio.get_running_loop().time()
+    async with limiter.slot():
+        pass
+    assert asyncio.get_running_loop().time() - start_time < 0.1
+
+    # plenty of requests left - no pause
+    limiter.on_response_headers(
+        {
+            "x-ratelimit-remaining-requests": 100,
+            "x-ratelimit-reset-requests": "6m0s",
+        }
+    )
+    start_time = asyncio.get_running_loop().time()
+    async with limiter.slot():
+        pass
+    assert asyncio.get_running_loop().time() - start_time < 0.1
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform == "win32", reason="batches are locked with fcntl")
+async def test_local_batch_resumed_by_one_worker(local_batches):
+    store = local_batches.store
+    file_obj = store.create_file(file=_get_batch_file(5), purpose="batch")
+    batch = local_batches.executor._create_batch_object(
+        {
+            "completion_window": "24h",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": file_obj.id,
+        }
+    )
+    store.save_batch(batch)
+
+    # batch is running in another worker
+    lock_fd = store.try_lock_batch(batch.id)
+    assert lock_fd is not None
+    other_worker = LocalBatchExecutor(store=LocalBatchStore(base_dir=store.base_dir))
+    assert await other_worker.resume_batches() == []
+    assert (await other_worker.arun_batch(batch.id)).status == "validating"
+    store.unlock_batch(lock_fd)
+
+    class MockRouter:
+        async def acompletion(self, model, messages, **kwargs):
+            return litellm.ModelResponse()
+
+    assert await other_worker.resume_batches(llm_router=MockRouter()) == [batch.id]
+    assert await local_batches.executor.resume_batches() == []
+    batch = await _wait_for_batch(batch.id)
+    assert batch.status == "completed"
+    assert batch.request_counts.completed == 5
+
+
+@pytest.mark.asyncio
+async def test_local_batch_rejects_disallowed_body_params(local_batches):
+    file_content = b"\n".join(
+        json.dumps({"custom_id": f"request-{i}", "body": body}).encode("utf-8")
+        for i, body in enumerate(
+            [
+                {"model": "my-model", "messages": [{"role": "user", "content": "Hi"}]},
+                {
+                    "model": "my-model",
+                    "messages": [{"role": "user", "content": "Hi"}],
+                    "api_base": "https://attacker.example.com",
+                },
+                {"model": "my-model", "messages": [], "api_key": "sk-1234"},
+            ]
+        )
+    )
+    file_obj = local_batches.store.create_file(file=file_content, purpose="batch")
+    calls = []
+
+    class MockRouter:
+        async def acompletion(self, **kwargs):
+            calls.append(kwargs)
+            return litellm.ModelResponse()
+
+    batch = await local_batches.executor.acreate_batch(
+        create_batch_data={
+            "completion_window": "24h",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": file_obj.id,
+        },
+        llm_router=MockRouter(),
+    )
+    batch = await _wait_for_batch(batch.id)
+
+    assert batch.request_counts.completed == 1
+    assert batch.request_counts.failed == 2
+    assert len(calls) == 1 and "api_base" not in calls[0]
+    error_lines = await _get_file_lines(batch.error_file_id)
+    assert sorted(line["custom_id"] for line in error_lines) == [
+        "request-1",
+        "request-2",
+    ]
+    assert all(line["response"]["status_code"] == 400 for line in error_lines)
+
+
+@pytest.mark.asyncio
+async def test_local_batch_checkpoint_skips_corrupt_lines(local_batches):
+    store = local_batches.store
+    file_obj = store.create_file(file=_get_batch_file(4), purpose="batch")
+    batch = local_batches.executor._create_batch_object(
+        {
+            "completion_window": "24h",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": file_obj.id,
+        }
+    )
+    store.save_batch(batch)
+    with open(store.get_file_content_path(f"file-{batch.id}-output"), "wb") as f:
+        f.write(b'{"custom_id": "request-0", "response": {"status_code": 200}}\n')
+        f.write(b"\x00corrupt\n")
+        f.write(b'{"custom_id": "request-1", "response": {"status_code": 200}}\n')
+
+    calls = []
+
+    class MockRouter:
+        async def acompletion(self, model, messages, **kwargs):
+            calls.append(messages[0]["content"])
+            return litellm.ModelResponse()
+
+    await local_batches.executor.resume_batches(llm_router=MockRouter())
+    batch = await _wait_for_batch(batch.id)
+
+    assert batch.status == "completed"
+    assert sorted(calls) == ["Hello 2", "Hello 3"]
+    assert batch.request_counts.completed == 4
+    assert batch.request_counts.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_proxy_checks_local_batch_requests(local_batches, monkeypatch):
+    from fastapi import HTTPException
+
+    from litellm.proxy._types import UserAPIKeyAuth
+    from litellm.proxy.batches_endpoints.endpoints import _check_local_batch_requests
+
+    monkeypatch.setattr(
+        "litellm.proxy.batches_endpoints.endpoints.local_batches_instance",
+        local_batches,
+    )
+    router = Router(
+        model_list=[
+            {
+                "model_name": model_name,
+                "litellm_params": {"model": "openai/gpt-4o", "api_key": "sk-1234"},
+            }
+            for model_name in ["my-model", "other-model"]
+        ]
+    )
+    user_api_key_dict = UserAPIKeyAuth(api_key="sk-key", models=["my-model"])
+
+    async def check(file_content: bytes):
+        await _check_local_batch_requests(
+            input_file_id=local_batches.store.create_file(
+                file=file_content, purpose="batch"
+            ).id,
+            endpoint="/v1/chat/completions",
+            user_api_key_dict=user_api_key_dict,
+            general_settings={},
+            llm_router=router,
+        )
+
+    await check(_get_batch_file(2, model="my-model") + b"\nnot json")
+
+    # the key can't call other-model
+    with pytest.raises(Exception) as e:
+        await check(_get_batch_file(2, model="other-model"))
+    assert getattr(e.value, "code", None) == "401" or (
+        isinstance(e.value, HTTPException) and e.value.status_code == 401
+    )
+
+    unsafe_line = json.dumps(
+        {
+            "custom_id": "request-0",
+            "body": {
+                "model": "my-model",
+                "messages": [{"role": "user", "content": "Hi"}],
+                "api_base": "https://attacker.example.com",
+            },
+        }
+    ).encode("utf-8")
+    with pytest.raises(HTTPException) as e:
+        await check(unsafe_line)
+    assert e.value.status_code == 400
+    assert "api_base" in str(e.value.detail)
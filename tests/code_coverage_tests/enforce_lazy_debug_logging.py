@@ -0,0 +1,126 @@
+"""
+Hot paths (code running per request / per streamed chunk) must not format debug log messages eagerly.
+
+`verbose_logger.debug(f"chunk: {chunk}")` builds the repr of `chunk` even when debug logging is off.
+Use the lazy facade instead - `lazy_verbose_logger.debug("chunk: %s", chunk)` (see `litellm/_logging.py`).
+"""
+
+import ast
+import os
+
+LITELLM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../litellm")
+
+# file -> functions on the hot path (None = the whole file)
+HOT_PATHS = {
+    "litellm_core_utils/streaming_handler.py": None,
+    "main.py": ["_async_streaming"],
+    "utils.py": [
+        "function_setup",
+        "wrapper_async",
+        "token_counter",
+        "get_optional_params",
+    ],
+    "router.py": [
+        "_acompletion",
+        "async_function_with_retries",
+        "_common_checks_available_deployment",
+        "async_get_available_deployment",
+        "_pre_call_checks",
+    ],
+    "proxy/proxy_server.py": [
+        "async_data_generator",
+        "async_data_generator_anthropic",
+    ],
+}
+
+EAGER_LOGGERS = ["verbose_logger", "verbose_router_logger", "verbose_proxy_logger"]
+LOG_METHODS = ["debug", "info", "print_verbose"]
+
+
+def _get_log_message(node: ast.Call):
+    if node.args:
+        return node.args[0]
+    for keyword in node.keywords:
+        if keyword.arg == "msg":
+            return keyword.value
+    return None
+
+
+def _is_eagerly_formatted(message: ast.AST) -> bool:
+    if isinstance(message, ast.JoinedStr):  # f"..."
+        return True
+    if isinstance(message, ast.BinOp):  # "..." % x, "..." + x
+        return True
+    if (
+        isinstance(message, ast.Call)
+        and isinstance(message.func, ast.Attribute)
+        and message.func.attr == "format"
+    ):  # "...".format(x)
+        return True
+    return False
+
+
+def get_violations(file_path, function_names):
+    with open(file_path, "r") as file:
+        tree = ast.parse(file.read())
+
+    if function_names is None:
+        hot_path_nodes = [tree]
+    else:
+        hot_path_nodes = [
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name in function_names
+        ]
+        missing_functions = set(function_names) - {node.name for node in hot_path_nodes}
+        if missing_functions:
+            raise Exception(
+                f"hot path functions not found in {file_path}: {missing_functions}"
+            )
+
+    violations = []
+    for hot_path_node in hot_path_nodes:
+        for node in ast.walk(hot_path_node):
+            if not isinstance(node, ast.Call):
+                continue
+            func = node.func
+            if isinstance(func, ast.Name) and func.id == "print_verbose":
+                violations.append(
+                    (node.lineno, "use `lazy_verbose_logger.print_verbose`")
+                )
+            elif isinstance(func, ast.Attribute) and func.attr in LOG_METHODS:
+                if isinstance(func.value, ast.Name) and func.value.id in EAGER_LOGGERS:
+                    violations.append(
+                        (node.lineno, f"use `lazy_{func.value.id}.{func.attr}`")
+                    )
+                message = _get_log_message(node)
+                if message is not None and _is_eagerly_formatted(message):
+                    violations.append(
+                        (
+                            node.lineno,
+                            "pass the arguments to the logger - `debug('chunk: %s', chunk)`",
+                        )
+                    )
+    return violations
+
+
+def main():
+    all_violations = []
+    for relative_path, function_names in HOT_PATHS.items():
+        file_path = os.path.join(LITELLM_DIR, relative_path)
+        for lineno, fix in get_violations(file_path, function_names):
+            all_violations.append(f"litellm/{relative_path}:{lineno} - {fix}")
+
+    if all_violations:
+        print("Eagerly formatted debug logs on hot paths:")
+        for violation in all_violations:
+            print(f"- {violation}")
+        raise Exception(
+            f"{len(all_violations)} eagerly formatted debug logs found on hot paths"
+        )
+    print("All debug logs on hot paths are lazy.")
+
+
+if __name__ == "__main__":
+    main()
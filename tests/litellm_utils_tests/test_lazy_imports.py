@@ -0,0 +1,97 @@
+"""
+Module budget for `import litellm`.
+
+Provider configs + heavy subsystems (e.g. `litellm.Router`) are resolved lazily via `litellm.__getattr__`.
+The import time is benchmarked in tests/load_tests/test_import_time_load_test.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+import litellm
+
+# max. number of `litellm.*` modules loaded by a bare `import litellm`
+LITELLM_IMPORT_MODULE_BUDGET = 425
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"},
+        check=True,
+    )
+
+
+def test_import_litellm_does_not_load_lazy_modules():
+    result = _run_python(
+        "import json, sys, litellm; print(json.dumps(sorted(m for m in sys.modules if m.startswith('litellm'))))"
+    )
+    loaded_modules = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert "litellm.router" not in loaded_modules
+    assert "litellm.proxy.proxy_cli" not in loaded_modules
+    assert "litellm.llms.watsonx.embed.transformation" not in loaded_modules
+    assert (
+        len(loaded_modules) <= LITELLM_IMPORT_MODULE_BUDGET
+    ), f"`import litellm` loaded {len(loaded_modules)} litellm modules, budget is {LITELLM_IMPORT_MODULE_BUDGET}"
+
+
+@pytest.mark.parametrize("name", sorted(litellm._lazy_imports.keys()))
+def test_lazy_import_resolves(name):
+    value = getattr(litellm, name)
+    module_name, attribute_name = litellm._lazy_imports[name]
+    assert value is getattr(
+        sys.modules[
+            f"litellm{module_name}" if module_name.startswith(".") else module_name
+        ],
+        attribute_name,
+    )
+    assert name in dir(litellm)
+
+
+def test_lazy_config_instances_are_singletons():
+    for name, config_class_name in litellm._lazy_config_instances.items():
+        instance = getattr(litellm, name)
+        assert isinstance(instance, getattr(litellm, config_class_name))
+        assert getattr(litellm, name) is instance
+
+
+def test_lazy_import_from_statement():
+    from litellm import AnthropicConfig, Router, VertexAIConfig
+
+    assert VertexAIConfig is litellm.VertexGeminiConfig
+    assert AnthropicConfig.__name__ == "AnthropicConfig"
+    assert Router.__name__ == "Router"
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        litellm.ThisConfigDoesNotExist
+
+
+def test_submodule_attribute_resolves():
+    result = _run_python(
+        "import litellm; print(litellm.router.Router.__name__, litellm.proxy.__name__)"
+    )
+    assert result.stdout.strip().splitlines()[-1] == "Router litellm.proxy"
+
+
+def test_star_import_exports_lazy_names():
+    namespace: dict = {}
+    exec("from litellm import *", namespace)
+    assert namespace["Router"] is litellm.Router
+    assert "AmazonConverseConfig" in namespace
+    assert "openaiOSeriesConfig" in namespace
+    assert "completion" in namespace
@@ -0,0 +1,190 @@
+import asyncio
+import base64
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm.litellm_core_utils.prompt_templates.media_fetcher as media_fetcher_module
+from litellm.litellm_core_utils.prompt_templates.factory import (
+    BedrockImageProcessor,
+    convert_to_anthropic_image_obj,
+)
+from litellm.litellm_core_utils.prompt_templates.media_fetcher import (
+    MediaFetchCache,
+    MediaFetcher,
+    MediaFetchSizeLimitError,
+)
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+
+IMAGE_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024
+
+
+class MockMediaServer:
+    def __init__(self):
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/too-large.png":
+            return httpx.Response(
+                200, content=b"\x00" * 4096, headers={"content-type": "image/png"}
+            )
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=IMAGE_BYTES,
+            headers={"content-type": "image/png", "etag": '"v1"'},
+        )
+
+
+@pytest.fixture
+def mock_media_server(monkeypatch):
+    server = MockMediaServer()
+    sync_client = HTTPHandler(
+        client=httpx.Client(transport=httpx.MockTransport(server.handler))
+    )
+    async_client = AsyncHTTPHandler()
+    async_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(server.handler)
+    )
+    monkeypatch.setattr(media_fetcher_module, "_get_httpx_client", lambda: sync_client)
+    monkeypatch.setattr(
+        media_fetcher_module,
+        "get_async_httpx_client",
+        lambda llm_provider, params=None: async_client,
+    )
+    fetcher = MediaFetcher(cache=MediaFetchCache(), max_size_bytes=2048)
+    monkeypatch.setattr(media_fetcher_module, "media_fetcher", fetcher)
+    monkeypatch.setattr(
+        "litellm.litellm_core_utils.prompt_templates.factory.media_fetcher", fetcher
+    )
+    monkeypatch.setattr(
+        "litellm.litellm_core_utils.prompt_templates.image_handling.media_fetcher",
+        fetcher,
+    )
+    server.fetcher = fetcher
+    return server
+
+
+def test_media_fetcher_caches_url(mock_media_server):
+    url = "https://example.com/image.png"
+    media = mock_media_server.fetcher.fetch(url)
+    assert media.content == IMAGE_BYTES
+    assert media.base64 == base64.b64encode(IMAGE_BYTES).decode("utf-8")
+
+    # converters for different providers re-use the cached fetch + encoding
+    anthropic_image = convert_to_anthropic_image_obj(url)
+    bedrock_image = BedrockImageProcessor.get_image_details(url)
+    assert anthropic_image["data"] == bedrock_image[0] == media.base64
+    assert anthropic_image["media_type"] == bedrock_image[1] == "image/png"
+    assert len(mock_media_server.requests) == 1
+
+
+def test_media_fetcher_content_addressed(mock_media_server):
+    media_1 = mock_media_server.fetcher.fetch("https://example.com/a.png")
+    media_2 = mock_media_server.fetcher.fetch("https://example.com/b.png")
+    assert media_1.media_content is media_2.media_content
+    assert len(mock_media_server.fetcher.cache.contents) == 1
+
+
+def test_media_fetcher_revalidates_with_etag(mock_media_server):
+    url = "https://example.com/image.png"
+    fetcher = mock_media_server.fetcher
+    media = fetcher.fetch(url)
+    fetcher.cache.url_entries[url].fetched_at -= fetcher.cache.ttl + 1
+
+    assert fetcher.fetch(url).media_content is media.media_content
+    assert len(mock_media_server.requests) == 2
+    assert mock_media_server.requests[1].headers["if-none-match"] == '"v1"'
+    assert fetcher.cache.is_fresh(fetcher.cache.url_entries[url])
+
+
+def test_media_fetcher_size_limit(mock_media_server):
+    with pytest.raises(MediaFetchSizeLimitError):
+        mock_media_server.fetcher.fetch("https://example.com/too-large.png")
+
+    # size limit errors are not swallowed by the image url converters
+    with pytest.raises(Exception, match="larger than the max. allowed size"):
+        convert_to_anthropic_image_obj("https://example.com/too-large.png")
+
+
+@pytest.mark.asyncio
+async def test_media_fetcher_dedups_concurrent_fetches(mock_media_server):
+    url = "https://example.com/image.png"
+    results = await asyncio.gather(
+        *[mock_media_server.fetcher.afetch(url) for _ in range(10)]
+    )
+    assert len(mock_media_server.requests) == 1
+    assert all(result.content == IMAGE_BYTES for result in results)
+
+    await BedrockImageProcessor.get_image_details_async(url)
+    assert len(mock_media_server.requests) == 1
+
+
+def test_media_fetcher_disk_cache(mock_media_server, tmp_path):
+    url = "https://example.com/image.png"
+    mock_media_server.fetcher.cache = MediaFetchCache(cache_dir=str(tmp_path))
+    mock_media_server.fetcher.fetch(url)
+
+    # new worker - empty memory cache, reads from disk
+    new_fetcher = MediaFetcher(cache=MediaFetchCache(cache_dir=str(tmp_path)))
+    assert new_fetcher.fetch(url).content == IMAGE_BYTES
+    assert len(mock_media_server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_media_fetcher_async_disk_io_off_event_loop(
+    mock_media_server, tmp_path, monkeypatch
+):
+    import threading
+
+    url = "https://example.com/image.png"
+    disk_io_threads = []
+
+    def _record_thread(fn):
+        def wrapper(*args, **kwargs):
+            disk_io_threads.append(threading.get_ident())
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    for method_name in [
+        "_write_to_disk",
+        "_prune_disk",
+        "_read_url_entry_from_disk",
+        "_read_content_from_disk",
+    ]:
+        monkeypatch.setattr(
+            MediaFetchCache,
+            method_name,
+            _record_thread(getattr(MediaFetchCache, method_name)),
+        )
+    mock_media_server.fetcher.cache = MediaFetchCache(cache_dir=str(tmp_path))
+    assert (await mock_media_server.fetcher.afetch(url)).content == IMAGE_BYTES
+
+    # new worker - empty memory cache, reads from disk
+    new_fetcher = MediaFetcher(cache=MediaFetchCache(cache_dir=str(tmp_path)))
+    assert (await new_fetcher.afetch(url)).content == IMAGE_BYTES
+    assert len(mock_media_server.requests) == 1
+
+    assert len(disk_io_threads) > 0
+    assert threading.get_ident() not in disk_io_threads
+
+
+def test_media_fetch_cache_memory_bound():
+    cache = MediaFetchCache(max_size_in_memory=10 * 1024)
+    for i in range(10):
+        content = bytes([i]) * 1024
+        cache.set_content(
+            media_fetcher_module.MediaContent(content=content, content_hash=f"hash-{i}")
+        )
+    assert cache.size_in_memory <= 10 * 1024
+    assert "hash-9" in cache.contents
+    assert "hash-0" not in cache.contents
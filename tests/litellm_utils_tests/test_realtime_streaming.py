@@ -0,0 +1,141 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.realtime_streaming import (
+    RealTimeStreaming,
+    RealTimeUsage,
+    get_realtime_event_type,
+)
+
+
+def _response_done_event(input_text_tokens: int, input_audio_tokens: int) -> str:
+    return json.dumps(
+        {
+            "type": "response.done",
+            "event_id": "event_1",
+            "response": {
+                "id": "resp_1",
+                "status": "completed",
+                "output": [],
+                "usage": {
+                    "total_tokens": input_text_tokens + input_audio_tokens + 30,
+                    "input_tokens": input_text_tokens + input_audio_tokens,
+                    "output_tokens": 30,
+                    "input_token_details": {
+                        "cached_tokens": 10,
+                        "text_tokens": input_text_tokens,
+                        "audio_tokens": input_audio_tokens,
+                        "cached_tokens_details": {
+                            "text_tokens": 10,
+                            "audio_tokens": 0,
+                        },
+                    },
+                    "output_token_details": {"text_tokens": 10, "audio_tokens": 20},
+                },
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "message, expected_type",
+    [
+        ('{"type":"response.audio.delta","delta":"AAAA"}', "response.audio.delta"),
+        (b' { "type" : "session.created", "session": {}}', "session.created"),
+        # `type` not first - nested `type` keys and escaped quotes are skipped
+        (
+            '{"event_id":"e1","item":{"type":"message","text":"say \\"type\\": \\"x\\""},"type":"conversation.item.created"}',
+            "conversation.item.created",
+        ),
+        ('{"item":{"type":"message"}}', None),
+    ],
+)
+def test_get_realtime_event_type(message, expected_type):
+    assert get_realtime_event_type(message) == expected_type
+    if expected_type is not None:
+        assert json.loads(message)["type"] == expected_type
+
+
+def test_realtime_usage_folds_response_done_events():
+    usage = RealTimeUsage()
+    for _ in range(3):
+        usage.add_response_done_event(json.loads(_response_done_event(100, 50)))
+    usage.add_response_done_event({"type": "response.done", "response": {}})
+
+    assert usage.num_responses == 3
+    assert usage.get_usage().prompt_tokens == 450
+    assert usage.get_usage().completion_tokens == 90
+    assert usage.get_usage().prompt_tokens_details.audio_tokens == 150
+
+    model_info = litellm.get_model_info(
+        model="gpt-4o-realtime-preview", custom_llm_provider="openai"
+    )
+    expected_cost = 3 * (
+        90 * model_info["input_cost_per_token"]
+        + 10 * model_info["cache_read_input_token_cost"]
+        + 50 * model_info["input_cost_per_audio_token"]
+        + 10 * model_info["output_cost_per_token"]
+        + 20 * model_info["output_cost_per_audio_token"]
+    )
+    assert usage.get_cost(
+        model="gpt-4o-realtime-preview", custom_llm_provider="openai"
+    ) == pytest.approx(expected_cost)
+
+
+@pytest.mark.asyncio
+async def test_realtime_streaming_logs_usage_in_parts(monkeypatch):
+    """
+    Audio events are never stored, usage is folded from response.done events, long sessions are logged in parts with their own ids
+    """
+    monkeypatch.setattr(litellm, "realtime_partial_logging_interval_seconds", 3600)
+    logging_obj = MagicMock()
+    logging_obj.litellm_call_id = "call_1"
+    logging_obj.model = "gpt-4o-realtime-preview"
+    logging_obj.model_call_details = {"custom_llm_provider": "openai"}
+    logging_obj.async_success_handler = AsyncMock()
+    realtime_streaming = RealTimeStreaming(
+        websocket=MagicMock(), backend_ws=MagicMock(), logging_obj=logging_obj
+    )
+
+    realtime_streaming.store_message('{"type":"session.created","session":{}}')
+    realtime_streaming.store_message(
+        '{"type":"response.audio.delta","delta":"' + "A" * 10_000 + '"}'
+    )
+    realtime_streaming.store_message(_response_done_event(100, 50))
+    assert len(realtime_streaming.messages) == 2
+    assert not realtime_streaming._should_log_partial()
+
+    realtime_streaming.partial_logging_interval = 0.001
+    await asyncio.sleep(0.01)
+    assert realtime_streaming._should_log_partial()
+    await realtime_streaming.log_messages(is_partial=True)
+    assert realtime_streaming.messages == []
+    assert realtime_streaming.usage.num_responses == 0
+
+    realtime_streaming.store_message(_response_done_event(10, 0))
+    await realtime_streaming.log_messages()
+    await asyncio.sleep(0)
+
+    calls = logging_obj.async_success_handler.call_args_list
+    assert len(calls) == 2
+    first_part, last_part = (call.kwargs["standard_logging_object"] for call in calls)
+    assert first_part["id"] == "call_1_0"
+    assert first_part["prompt_tokens"] == 150
+    assert first_part["response_cost"] > 0
+    assert last_part["id"] == "call_1_1"
+    assert last_part["prompt_tokens"] == 10
+    assert len(calls[0].args[0]) == 2  # the stored events of the first part
+
+    # nothing happened since the last part - no empty log
+    await realtime_streaming.log_messages()
+    assert len(logging_obj.async_success_handler.call_args_list) == 2
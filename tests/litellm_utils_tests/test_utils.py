@@ -245,6 +245,28 @@ def test_trimming_with_tool_calls():
     assert len(result[0]) == 3  # final 3 messages are tool calls
 
 
+def test_trimming_response_tokens_include_tool_messages():
+    messages = [
+        {"role": "user", "content": f"message {i} " + "lorem ipsum " * 20}
+        for i in range(20)
+    ] + [
+        {
+            "tool_call_id": "call_G11shFcS024xEKjiAOSt6Tc9",
+            "role": "tool",
+            "name": "get_current_weather",
+            "content": '{"location": "San Francisco", "temperature": "72", "unit": "fahrenheit"}',
+        }
+    ]
+    trimmed_messages, response_tokens = trim_messages(
+        messages, max_tokens=200, model="gpt-4-0613", return_response_tokens=True
+    )
+
+    assert trimmed_messages[-1] == messages[-1]
+    assert response_tokens == 200 - get_token_count(
+        trimmed_messages, model="gpt-4-0613"
+    )
+
+
 def test_trimming_should_not_change_original_messages():
     messages = [
         {"role": "system", "content": "This is a short system message"},
@@ -274,6 +296,66 @@ def test_trimming_with_model_cost_max_input_tokens(model):
     )
 
 
+def test_trimming_keeps_most_recent_messages():
+    messages = [{"role": "system", "content": "You are a helpful assistant"}] + [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"message {i} " + "lorem ipsum dolor sit amet " * 10,
+        }
+        for i in range(50)
+    ]
+    trimmed_messages = trim_messages(messages, max_tokens=500, model="gpt-4-0613")
+
+    assert get_token_count(trimmed_messages, model="gpt-4-0613") <= 500
+    assert trimmed_messages[0] == messages[0]
+    # an unbroken run of the most recent messages - the oldest of them can be cut in the middle
+    num_kept = len(trimmed_messages) - 1
+    assert trimmed_messages[2:] == messages[-(num_kept - 1) :]
+    oldest_kept = trimmed_messages[1]
+    original = messages[-num_kept]
+    if oldest_kept != original:
+        head, tail = oldest_kept["content"].split("..")
+        assert original["content"].startswith(head)
+        assert original["content"].endswith(tail)
+
+
+def test_trimming_tokenizes_each_message_once():
+    messages = [
+        {"role": "user", "content": f"message {i} " + "lorem ipsum " * 20}
+        for i in range(200)
+    ]
+    with patch(
+        "litellm.utils.token_counter", wraps=litellm.utils.token_counter
+    ) as mock_token_counter:
+        trimmed_messages = trim_messages(messages, max_tokens=1000, model="gpt-4-0613")
+
+    assert get_token_count(trimmed_messages, model="gpt-4-0613") <= 1000
+    # 1 count per message + the initial and final counts of the whole list
+    assert mock_token_counter.call_count <= len(messages) + 5
+
+
+def test_trimming_with_placeholder_strategy():
+    messages = [{"role": "system", "content": "You are a helpful assistant"}] + [
+        {"role": "user", "content": f"message {i} " + "lorem ipsum " * 20}
+        for i in range(20)
+    ]
+    trimmed_messages = trim_messages(
+        messages, max_tokens=200, model="gpt-4-0613", trim_strategy="placeholder"
+    )
+
+    assert get_token_count(trimmed_messages, model="gpt-4-0613") <= 200
+    assert trimmed_messages[0] == messages[0]
+    placeholder = trimmed_messages[1]
+    num_removed = len(messages) - len(trimmed_messages) + 1
+    assert placeholder == {
+        "role": "user",
+        "content": litellm.constants.TRIM_MESSAGES_PLACEHOLDER.format(
+            num_messages=num_removed
+        ),
+    }
+    assert trimmed_messages[-1] == messages[-1]
+
+
 def test_aget_valid_models():
     old_environ = os.environ
     os.environ = {"OPENAI_API_KEY": "temp"}  # mock set only openai key in environ
@@ -1960,3 +2042,38 @@ def test_get_applied_guardrails(test_case):
 
     # Assert
     assert sorted(result) == sorted(test_case["expected"])
+
+
+def test_lazy_logger_formats_only_emitted_messages(caplog, capsys, monkeypatch):
+    import logging
+
+    from litellm._logging import LazyArg, LazyLogger
+
+    logger = logging.getLogger("LiteLLM Lazy Logger Test")
+    lazy_logger = LazyLogger(logger)
+    computed = []
+
+    def _expensive_repr():
+        computed.append(1)
+        return "expensive"
+
+    monkeypatch.setattr(litellm, "set_verbose", False)
+    logger.setLevel(logging.INFO)
+    lazy_logger.debug("value: %s", LazyArg(_expensive_repr))
+    lazy_logger.print_verbose("value: %s", LazyArg(_expensive_repr))
+    assert computed == []
+    assert lazy_logger.is_debug_enabled() is False
+
+    logger.setLevel(logging.DEBUG)
+    assert lazy_logger.is_debug_enabled() is True
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        lazy_logger.debug("value: %s", LazyArg(_expensive_repr))
+    assert computed == [1]
+    assert caplog.records[-1].getMessage() == "value: expensive"
+    # reported at the caller, not the facade
+    assert caplog.records[-1].filename == "test_utils.py"
+
+    logger.setLevel(logging.INFO)
+    monkeypatch.setattr(litellm, "set_verbose", True)
+    lazy_logger.print_verbose("value: %s - 100%%", 1)
+    assert "value: 1 - 100%" in capsys.readouterr().out
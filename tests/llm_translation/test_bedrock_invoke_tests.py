@@ -1,6 +1,7 @@
 from base_llm_unit_tests import BaseLLMChatTest
 import pytest
 import sys
+import json
 import os
 
 
@@ -151,3 +152,155 @@ def test_nova_invoke_streaming_chunk_parsing():
     print(result)
     assert result["is_finished"] is True
     assert result["finish_reason"] == "tool_calls"
+
+
+def _encode_event_stream_message(headers: dict, payload: bytes) -> bytes:
+    """
+    Encode an AWS event stream message (string headers only)
+    """
+    import struct
+    from binascii import crc32
+
+    encoded_headers = b""
+    for name, value in headers.items():
+        encoded_name = name.encode("utf-8")
+        encoded_value = value.encode("utf-8")
+        encoded_headers += (
+            struct.pack("!B", len(encoded_name))
+            + encoded_name
+            + struct.pack("!BH", 7, len(encoded_value))
+            + encoded_value
+        )
+    total_length = 12 + len(encoded_headers) + len(payload) + 4
+    prelude = struct.pack("!II", total_length, len(encoded_headers))
+    prelude += struct.pack("!I", crc32(prelude))
+    message = prelude + encoded_headers + payload
+    return message + struct.pack("!I", crc32(message))
+
+
+def _get_converse_stream_bytes() -> bytes:
+    events = [
+        ("messageStart", {"role": "assistant"}),
+        ("contentBlockDelta", {"contentBlockIndex": 0, "delta": {"text": "Hello"}}),
+        ("contentBlockDelta", {"contentBlockIndex": 0, "delta": {"text": " world"}}),
+        ("contentBlockStop", {"contentBlockIndex": 0}),
+        ("messageStop", {"stopReason": "end_turn"}),
+        (
+            "metadata",
+            {
+                "usage": {"inputTokens": 10, "outputTokens": 2, "totalTokens": 12},
+                "metrics": {"latencyMs": 100},
+            },
+        ),
+    ]
+    return b"".join(
+        _encode_event_stream_message(
+            headers={
+                ":event-type": event_type,
+                ":content-type": "application/json",
+                ":message-type": "event",
+            },
+            payload=json.dumps(event).encode("utf-8"),
+        )
+        for event_type, event in events
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024])
+def test_aws_event_stream_parser_matches_botocore(chunk_size):
+    """
+    The incremental event stream parser returns the same messages as botocore's EventStreamBuffer, for any chunking of the stream
+    """
+    from botocore.eventstream import EventStreamBuffer
+
+    from litellm.llms.bedrock.event_stream import AWSEventStreamParser
+
+    stream_bytes = _get_converse_stream_bytes()
+
+    botocore_buffer = EventStreamBuffer()
+    botocore_buffer.add_data(stream_bytes)
+    expected = [(event.headers, event.payload) for event in botocore_buffer]
+
+    parser = AWSEventStreamParser()
+    received = []
+    for i in range(0, len(stream_bytes), chunk_size):
+        for message in parser.feed(stream_bytes[i : i + chunk_size]):
+            received.append((message.headers, message.payload))
+
+    assert received == expected
+    assert len(received) == 6
+
+
+def test_aws_event_stream_parser_checksum_mismatch():
+    from litellm.llms.bedrock.event_stream import (
+        AWSEventStreamError,
+        AWSEventStreamParser,
+    )
+
+    stream_bytes = bytearray(_get_converse_stream_bytes())
+    stream_bytes[-10] ^= 0xFF  # corrupt the last message's payload
+
+    parser = AWSEventStreamParser()
+    with pytest.raises(AWSEventStreamError, match="message checksum mismatch"):
+        parser.feed(bytes(stream_bytes))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sync_mode", [True, False])
+async def test_aws_event_stream_decoder_converse_stream(sync_mode):
+    from litellm.llms.bedrock.chat.invoke_handler import AWSEventStreamDecoder
+
+    stream_bytes = _get_converse_stream_bytes()
+    byte_chunks = [stream_bytes[i : i + 50] for i in range(0, len(stream_bytes), 50)]
+    decoder = AWSEventStreamDecoder(model="anthropic.claude-3-sonnet-20240229-v1:0")
+
+    if sync_mode:
+        chunks = list(decoder.iter_bytes(iter(byte_chunks)))
+    else:
+
+        async def _aiter():
+            for byte_chunk in byte_chunks:
+                yield byte_chunk
+
+        chunks = [chunk async for chunk in decoder.aiter_bytes(_aiter())]
+
+    assert "".join(chunk["text"] for chunk in chunks) == "Hello world"
+    assert any(
+        chunk["is_finished"] and chunk["finish_reason"] == "stop" for chunk in chunks
+    )
+    assert chunks[-1]["usage"] is not None
+
+
+def test_aws_event_stream_decoder_invoke_chunks_and_errors():
+    """
+    /invoke streams wrap the model's chunks as base64 `bytes` in `chunk` events. Exception messages raise a BedrockError.
+    """
+    import base64
+
+    from litellm.llms.bedrock.chat.invoke_handler import (
+        AWSEventStreamDecoder,
+        BedrockError,
+    )
+
+    model_chunk = {"outputText": "Hello", "index": 0}
+    stream_bytes = _encode_event_stream_message(
+        headers={":event-type": "chunk", ":message-type": "event"},
+        payload=json.dumps(
+            {"bytes": base64.b64encode(json.dumps(model_chunk).encode()).decode()}
+        ).encode(),
+    ) + _encode_event_stream_message(
+        headers={
+            ":exception-type": "throttlingException",
+            ":message-type": "exception",
+        },
+        payload=b'{"message":"Too many requests, please wait before trying again."}',
+    )
+
+    decoder = AWSEventStreamDecoder(model="amazon.titan-text-express-v1")
+    chunks = decoder.iter_bytes(iter([stream_bytes]))
+    assert next(chunks)["text"] == "Hello"
+    with pytest.raises(BedrockError) as e:
+        next(chunks)
+    assert e.value.status_code == 400
+    assert "throttlingException" in e.value.message
+    assert "Too many requests" in e.value.message
@@ -1,5 +1,6 @@
 #### What this tests ####
 #    This tests if prompts are being correctly formatted
+import json
 import os
 import sys
 
@@ -765,3 +766,113 @@ def test_hf_chat_template():
         chat_template.rstrip()
         == """<｜begin▁of▁sentence｜>You are a helpful assistant.<｜User｜>What is the weather in Copenhagen?<｜Assistant｜><think>"""
     )
+
+
+def test_hf_chat_template_compiled_once():
+    from litellm.litellm_core_utils.prompt_templates.chat_template_registry import (
+        chat_template_registry,
+    )
+    from litellm.litellm_core_utils.prompt_templates.factory import (
+        hf_chat_template,
+    )
+
+    model = "mistralai/Mistral-7B-Instruct-v0.1"
+    messages = [{"role": "user", "content": "Hey, how's it going?"}]
+    chat_template_registry.clear()
+
+    with patch.object(
+        chat_template_registry.env,
+        "from_string",
+        wraps=chat_template_registry.env.from_string,
+    ) as mock_from_string:
+        first_prompt = hf_chat_template(model=model, messages=messages)
+        second_prompt = hf_chat_template(model=model, messages=messages)
+
+    assert first_prompt == second_prompt == "<s>[INST] Hey, how's it going? [/INST]"
+    mock_from_string.assert_called_once()
+
+
+def test_hf_chat_template_tokenizer_config_persisted_to_disk(monkeypatch, tmp_path):
+    from litellm.litellm_core_utils.prompt_templates.factory import (
+        hf_chat_template,
+    )
+
+    model = "my-org/my-hf-chat-model"
+    tokenizer_config = {
+        "chat_template": "{% for message in messages %}<{{ message['role'] }}>{{ message['content'] }}{% endfor %}",
+        "bos_token": "<s>",
+        "eos_token": "</s>",
+    }
+    monkeypatch.setenv("LITELLM_HF_TOKENIZER_CONFIG_DIR", str(tmp_path))
+    litellm.known_tokenizer_config.pop(model, None)
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps(tokenizer_config).encode("utf-8")
+    messages = [{"role": "user", "content": "hi"}]
+    with patch(
+        "litellm.litellm_core_utils.prompt_templates.chat_template_registry.HTTPHandler.get",
+        return_value=mock_response,
+    ) as mock_get:
+        assert hf_chat_template(model=model, messages=messages) == "<user>hi"
+        assert hf_chat_template(model=model, messages=messages) == "<user>hi"
+        mock_get.assert_called_once()
+
+        # new process - read from disk, no fetch
+        litellm.known_tokenizer_config.pop(model)
+        assert hf_chat_template(model=model, messages=messages) == "<user>hi"
+        mock_get.assert_called_once()
+
+    assert json.loads((tmp_path / "my-org--my-hf-chat-model.json").read_text()) == (
+        tokenizer_config
+    )
+    litellm.known_tokenizer_config.pop(model, None)
+
+
+def test_tokenizer_config_fetched_once_per_model_without_blocking_other_models():
+    import threading
+
+    from litellm.litellm_core_utils.prompt_templates.chat_template_registry import (
+        ChatTemplateRegistry,
+    )
+
+    registry = ChatTemplateRegistry()
+    slow_model, fast_model = "my-org/slow-model", "my-org/fast-model"
+    for model in (slow_model, fast_model):
+        litellm.known_tokenizer_config.pop(model, None)
+
+    slow_fetch_started = threading.Event()
+    release_slow_fetch = threading.Event()
+    fetched_models = []
+
+    def _fetch_tokenizer_config(hf_model_name):
+        fetched_models.append(hf_model_name)
+        if hf_model_name == slow_model:
+            slow_fetch_started.set()
+            release_slow_fetch.wait(timeout=10)
+        return {"status": "success", "tokenizer": {"name": hf_model_name}}
+
+    with patch.object(
+        registry, "_fetch_tokenizer_config", side_effect=_fetch_tokenizer_config
+    ):
+        slow_lookups = [
+            threading.Thread(target=registry.get_tokenizer_config, args=(slow_model,))
+            for _ in range(3)
+        ]
+        for thread in slow_lookups:
+            thread.start()
+        assert slow_fetch_started.wait(timeout=10)
+
+        # not blocked by the slow fetch
+        assert registry.get_tokenizer_config(fast_model)["tokenizer"] == {
+            "name": fast_model
+        }
+
+        release_slow_fetch.set()
+        for thread in slow_lookups:
+            thread.join(timeout=10)
+
+    assert sorted(fetched_models) == [fast_model, slow_model]
+    assert litellm.known_tokenizer_config[slow_model]["status"] == "success"
+    for model in (slow_model, fast_model):
+        litellm.known_tokenizer_config.pop(model, None)
@@ -0,0 +1,105 @@
+"""
+Benchmark requests / second + peak memory of `batch_completion()` (thread pool) vs. `abatch_completion()` (asyncio, adaptive concurrency) against a mock OpenAI-compatible server.
+
+The mock server runs in the same process - on small machines both are CPU bound (request building / response parsing), so compare them at the same concurrency.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import pytest
+from aiohttp import web
+
+import litellm
+
+NUM_REQUESTS = int(os.getenv("BATCH_COMPLETION_BENCHMARK_REQUESTS", 500))
+MOCK_LATENCY_SECONDS = 0.05
+CONCURRENCY = int(os.getenv("BATCH_COMPLETION_BENCHMARK_CONCURRENCY", 20))
+
+
+async def _mock_chat_completion(request: web.Request) -> web.Response:
+    await asyncio.sleep(MOCK_LATENCY_SECONDS)
+    return web.json_response(
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion",
+            "created": 1677652288,
+            "model": "gpt-4o",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Hello!"},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 9, "completion_tokens": 2, "total_tokens": 11},
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_server_api_base():
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_post("/chat/completions", _mock_chat_completion)
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{port}"
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(results) == NUM_REQUESTS
+    assert all(not isinstance(result, Exception) for result in results)
+    return NUM_REQUESTS / elapsed, peak
+
+
+def test_batch_completion_throughput(mock_server_api_base):
+    messages = [
+        [{"role": "user", "content": f"Hello {i}"}] for i in range(NUM_REQUESTS)
+    ]
+    completion_kwargs = {
+        "model": "openai/gpt-4o",
+        "api_base": mock_server_api_base,
+        "api_key": "sk-1234",
+    }
+
+    threads_rps, threads_peak = _measure(
+        lambda: litellm.batch_completion(
+            messages=messages, max_workers=CONCURRENCY, **completion_kwargs
+        )
+    )
+    async_rps, async_peak = _measure(
+        lambda: asyncio.run(
+            litellm.abatch_completion(
+                messages=messages,
+                initial_concurrency=CONCURRENCY,
+                max_concurrency=CONCURRENCY,
+                **completion_kwargs,
+            )
+        )
+    )
+    print(
+        f"{NUM_REQUESTS} requests, {CONCURRENCY} concurrent, {MOCK_LATENCY_SECONDS * 1000:.0f}ms mock latency - "
+        f"batch_completion: {threads_rps:.0f} req/s, peak {threads_peak / 1024 / 1024:.1f}MB; "
+        f"abatch_completion: {async_rps:.0f} req/s, peak {async_peak / 1024 / 1024:.1f}MB"
+    )
+    # no thread + sync client per in flight request
+    assert async_peak < threads_peak
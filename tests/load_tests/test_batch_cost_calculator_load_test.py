@@ -0,0 +1,71 @@
+"""
+Benchmark `batch_cost_per_token()` vs. calling `cost_per_token()` per row.
+
+Prices 1M synthetic rows over a handful of models (`BATCH_COST_BENCHMARK_ROWS` to override).
+The scalar path is timed on a sample and extrapolated.
+"""
+
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm import batch_cost_per_token, cost_per_token
+
+np = pytest.importorskip("numpy")
+
+NUM_ROWS = int(os.getenv("BATCH_COST_BENCHMARK_ROWS", 1_000_000))
+NUM_SCALAR_ROWS = 20_000
+
+MODELS = [
+    ("gpt-4o", "openai"),
+    ("gpt-4o-mini", "openai"),
+    ("claude-3-5-sonnet-20240620", "anthropic"),
+    ("gemini-1.5-pro", "gemini"),
+    ("deepseek-chat", "deepseek"),
+    ("groq/llama3-8b-8192", None),
+]
+
+
+def test_batch_cost_per_token_throughput():
+    litellm.model_cost = litellm.get_model_cost_map(url="")
+    random.seed(0)
+    rows = [random.choice(MODELS) for _ in range(NUM_ROWS)]
+    models = [model for model, _ in rows]
+    custom_llm_providers = [custom_llm_provider for _, custom_llm_provider in rows]
+    prompt_tokens = np.random.randint(0, 200_000, size=NUM_ROWS)
+    completion_tokens = np.random.randint(0, 4_000, size=NUM_ROWS)
+    cache_read_input_tokens = prompt_tokens // 2
+
+    start = time.perf_counter()
+    prompt_costs, completion_costs = batch_cost_per_token(
+        models=models,
+        custom_llm_providers=custom_llm_providers,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        cache_read_input_tokens=cache_read_input_tokens,
+    )
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for row_index in range(NUM_SCALAR_ROWS):
+        cost_per_token(
+            model=models[row_index],
+            custom_llm_provider=custom_llm_providers[row_index],
+            prompt_tokens=int(prompt_tokens[row_index]),
+            completion_tokens=int(completion_tokens[row_index]),
+            cache_read_input_tokens=int(cache_read_input_tokens[row_index]),
+        )
+    scalar_time = (time.perf_counter() - start) * NUM_ROWS / NUM_SCALAR_ROWS
+
+    print(
+        f"{NUM_ROWS} rows - batch_cost_per_token: {batch_time:.2f}s, cost_per_token (extrapolated): {scalar_time:.2f}s"
+    )
+    assert np.isfinite(prompt_costs).all()
+    assert np.isfinite(completion_costs).all()
+    assert batch_time < scalar_time
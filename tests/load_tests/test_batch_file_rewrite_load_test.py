@@ -0,0 +1,92 @@
+"""
+Benchmark peak memory of rewriting `body.model` in batch .jsonl files of growing size - reading + re-serializing the whole file vs. `stream_replace_model_in_jsonl()`.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.router_utils.batch_utils import stream_replace_model_in_jsonl
+
+FILE_SIZES_MB = [
+    int(size)
+    for size in os.getenv("BATCH_FILE_REWRITE_BENCHMARK_SIZES_MB", "4,16,64").split(",")
+]
+SPOOL_MAX_SIZE_BYTES = 1024 * 1024
+
+
+def _write_batch_file(file_path: str, size_mb: int):
+    line = (
+        json.dumps(
+            {
+                "custom_id": "request-1",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o",
+                    "messages": [{"role": "user", "content": "Hello world " * 50}],
+                    "max_tokens": 1000,
+                },
+            }
+        ).encode("utf-8")
+        + b"\n"
+    )
+    with open(file_path, "wb") as f:
+        for _ in range(size_mb * 1024 * 1024 // len(line)):
+            f.write(line)
+
+
+def _rewrite_in_memory(file_path: str, new_model_name: str) -> bytes:
+    """
+    what `replace_model_in_jsonl()` did before it streamed the file
+    """
+    with open(file_path, "rb") as f:
+        file_content_str = f.read().decode("utf-8")
+    modified_lines = []
+    for line in file_content_str.splitlines():
+        json_object = json.loads(line.strip())
+        json_object["body"]["model"] = new_model_name
+        modified_lines.append(json.dumps(json_object))
+    return "\n".join(modified_lines).encode("utf-8")
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def test_batch_file_rewrite_memory(tmp_path):
+    streaming_peaks = []
+    for size_mb in FILE_SIZES_MB:
+        file_path = str(tmp_path / f"batch_{size_mb}mb.jsonl")
+        _write_batch_file(file_path, size_mb)
+
+        def _rewrite_streaming():
+            with open(file_path, "rb") as f:
+                stream_replace_model_in_jsonl(
+                    f,
+                    new_model_name="azure/gpt-4o",
+                    max_size_in_memory=SPOOL_MAX_SIZE_BYTES,
+                ).close()
+
+        in_memory_peak, in_memory_time = _measure(
+            lambda: _rewrite_in_memory(file_path, "azure/gpt-4o")
+        )
+        streaming_peak, streaming_time = _measure(_rewrite_streaming)
+        streaming_peaks.append(streaming_peak)
+        print(
+            f"{size_mb}MB batch file - in memory: peak {in_memory_peak / 1024 / 1024:.1f}MB, {in_memory_time:.2f}s; streaming: peak {streaming_peak / 1024 / 1024:.1f}MB, {streaming_time:.2f}s"
+        )
+        assert streaming_peak < in_memory_peak
+
+    # peak memory doesn't grow with the file size
+    assert max(streaming_peaks) < 2 * SPOOL_MAX_SIZE_BYTES
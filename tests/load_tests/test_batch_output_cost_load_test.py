@@ -0,0 +1,138 @@
+"""
+Benchmark peak memory of computing the usage of a completed batch from output files of growing size - parsing the whole file into a list of dicts vs. streaming it with `_get_batch_output_file_cost_and_usage()`.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.batches.batch_utils import (
+    BatchOutputUsageAggregator,
+    _get_batch_output_file_cost_and_usage,
+)
+from litellm.batches.local_batches import (
+    LocalBatchExecutor,
+    LocalBatchesAPI,
+    LocalBatchStore,
+)
+from litellm.types.llms.openai import Batch
+
+FILE_SIZES_MB = [
+    int(size)
+    for size in os.getenv("BATCH_OUTPUT_COST_BENCHMARK_SIZES_MB", "4,16,64").split(",")
+]
+
+
+def _get_output_file_content(size_mb: int) -> bytes:
+    line = (
+        json.dumps(
+            {
+                "id": "batch_req_1",
+                "custom_id": "request-1",
+                "response": {
+                    "status_code": 200,
+                    "request_id": "req_1",
+                    "body": {
+                        "id": "chatcmpl-1",
+                        "object": "chat.completion",
+                        "created": 1734986202,
+                        "model": "gpt-4o-mini-2024-07-18",
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {
+                                    "role": "assistant",
+                                    "content": "Hello world " * 50,
+                                },
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": 20,
+                            "completion_tokens": 100,
+                            "total_tokens": 120,
+                        },
+                    },
+                },
+                "error": None,
+            }
+        ).encode("utf-8")
+        + b"\n"
+    )
+    return line * (size_mb * 1024 * 1024 // len(line))
+
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def test_batch_output_cost_memory(tmp_path, monkeypatch):
+    local_batches = LocalBatchesAPI(
+        executor=LocalBatchExecutor(store=LocalBatchStore(base_dir=str(tmp_path)))
+    )
+    monkeypatch.setattr("litellm.files.main.local_batches_instance", local_batches)
+
+    streaming_peaks = []
+    for size_mb in FILE_SIZES_MB:
+        file_content = _get_output_file_content(size_mb)
+        num_lines = file_content.count(b"\n")
+        file_obj = local_batches.store.create_file(
+            file=file_content, purpose="batch_output"
+        )
+        del file_content
+        batch = Batch(
+            id=f"batch_{size_mb}",
+            completion_window="24h",
+            created_at=1734986202,
+            endpoint="/v1/chat/completions",
+            input_file_id="file-input",
+            object="batch",
+            status="completed",
+            output_file_id=file_obj.id,
+        )
+
+        def _in_memory():
+            # what `_handle_completed_batch()` did before it streamed the output file
+            file_content_dictionary = [
+                json.loads(line)
+                for line in local_batches.store.get_file_content(file_obj.id)
+                .decode("utf-8")
+                .strip()
+                .split("\n")
+                if line
+            ]
+            aggregator = BatchOutputUsageAggregator(custom_llm_provider="local")
+            for item in file_content_dictionary:
+                aggregator.add_item(item)
+            return aggregator.usage
+
+        def _streaming():
+            return asyncio.run(
+                _get_batch_output_file_cost_and_usage(
+                    batch=batch, custom_llm_provider="local"
+                )
+            )
+
+        in_memory_peak, in_memory_time = _measure(_in_memory)
+        streaming_peak, streaming_time = _measure(_streaming)
+        streaming_peaks.append(streaming_peak)
+        _, usage = _streaming()
+        assert usage.total_tokens == 120 * num_lines
+        print(
+            f"{size_mb}MB batch output file - in memory: peak {in_memory_peak / 1024 / 1024:.1f}MB, {in_memory_time:.2f}s; streaming: peak {streaming_peak / 1024 / 1024:.1f}MB, {streaming_time:.2f}s"
+        )
+        assert streaming_peak < in_memory_peak
+
+    # peak memory doesn't grow with the file size
+    assert max(streaming_peaks) < 2 * min(streaming_peaks) + 1024 * 1024
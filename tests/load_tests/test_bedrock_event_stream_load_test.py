@@ -0,0 +1,120 @@
+"""
+Benchmark decoding bedrock streaming responses (`application/vnd.amazon.eventstream`) - botocore's EventStreamBuffer + EventStreamJSONParser + a str round trip per event (previous implementation) vs. `AWSEventStreamDecoder.iter_bytes()`.
+
+Streams are generated in the shape of recorded /converse-stream and /invoke-with-response-stream responses, and fed to the decoders in network-sized chunks.
+"""
+
+import base64
+import json
+import os
+import struct
+import sys
+import time
+from binascii import crc32
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.llms.bedrock.chat.invoke_handler import AWSEventStreamDecoder
+
+NUM_EVENTS = int(os.getenv("BEDROCK_EVENT_STREAM_BENCHMARK_EVENTS", 20000))
+NETWORK_CHUNK_SIZE = 1024
+
+
+def _encode_message(event_type: str, payload: dict) -> bytes:
+    encoded_headers = b""
+    for name, value in {
+        ":event-type": event_type,
+        ":content-type": "application/json",
+        ":message-type": "event",
+    }.items():
+        encoded_headers += (
+            struct.pack("!B", len(name))
+            + name.encode()
+            + struct.pack("!BH", 7, len(value))
+            + value.encode()
+        )
+    encoded_payload = json.dumps(payload).encode()
+    prelude = struct.pack(
+        "!II", 16 + len(encoded_headers) + len(encoded_payload), len(encoded_headers)
+    )
+    prelude += struct.pack("!I", crc32(prelude))
+    message = prelude + encoded_headers + encoded_payload
+    return message + struct.pack("!I", crc32(message))
+
+
+def _get_converse_stream() -> bytes:
+    return b"".join(
+        _encode_message(
+            "contentBlockDelta",
+            {"contentBlockIndex": 0, "delta": {"text": f" token{i}"}, "p": "abcdef"},
+        )
+        for i in range(NUM_EVENTS)
+    )
+
+
+def _get_invoke_stream() -> bytes:
+    return b"".join(
+        _encode_message(
+            "chunk",
+            {
+                "bytes": base64.b64encode(
+                    json.dumps({"outputText": f" token{i}", "index": 0}).encode()
+                ).decode(),
+                "p": "abcdefghijklmnopqrstuvwxyzABCDE",
+            },
+        )
+        for i in range(NUM_EVENTS)
+    )
+
+
+def _legacy_iter_bytes(decoder: AWSEventStreamDecoder, iterator):
+    from botocore.eventstream import EventStreamBuffer
+    from botocore.loaders import Loader
+    from botocore.model import ServiceModel
+    from botocore.parsers import EventStreamJSONParser
+
+    response_stream_shape = ServiceModel(
+        Loader().load_service_model("bedrock-runtime", "service-2")
+    ).shape_for("ResponseStream")
+    parser = EventStreamJSONParser()
+    event_stream_buffer = EventStreamBuffer()
+    for chunk in iterator:
+        event_stream_buffer.add_data(chunk)
+        for event in event_stream_buffer:
+            response_dict = event.to_response_dict()
+            parsed_response = parser.parse(response_dict, response_stream_shape)
+            if "chunk" in parsed_response:
+                message = parsed_response["chunk"]["bytes"].decode()
+            else:
+                message = response_dict["body"].decode()
+            yield decoder._chunk_parser(chunk_data=json.loads(message))
+
+
+def _measure(fn, stream: bytes):
+    chunks = [
+        stream[i : i + NETWORK_CHUNK_SIZE]
+        for i in range(0, len(stream), NETWORK_CHUNK_SIZE)
+    ]
+    start = time.perf_counter()
+    text = "".join(chunk["text"] for chunk in fn(iter(chunks)))
+    elapsed = time.perf_counter() - start
+    return NUM_EVENTS / elapsed, text
+
+
+def test_bedrock_event_stream_decoding_throughput():
+    for name, model, stream in [
+        ("converse", "anthropic.claude-3-sonnet-20240229-v1:0", _get_converse_stream()),
+        ("invoke", "amazon.titan-text-express-v1", _get_invoke_stream()),
+    ]:
+        decoder = AWSEventStreamDecoder(model=model)
+        legacy_eps, legacy_text = _measure(
+            lambda iterator: _legacy_iter_bytes(decoder, iterator), stream
+        )
+        new_eps, new_text = _measure(decoder.iter_bytes, stream)
+        print(
+            f"{name}: {NUM_EVENTS} events, {len(stream) / 1024 / 1024:.1f}MB - "
+            f"botocore parser: {legacy_eps:.0f} events/s; "
+            f"AWSEventStreamParser: {new_eps:.0f} events/s ({new_eps / legacy_eps:.1f}x)"
+        )
+        assert new_text == legacy_text
+        assert new_eps > legacy_eps
@@ -0,0 +1,133 @@
+"""
+Benchmark the callback delivery log - the datadog logger sending to a local stub intake server that goes down in the middle of the run, and responds slowly.
+
+- in-memory batches (default): batches flushed during the outage are lost, `flush_queue` waits on the slow destination
+- delivery log (`litellm.callback_delivery_log_dir`): batches are appended to disk, and delivered in the background once the destination is back
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import pytest
+
+import litellm
+from litellm.integrations.datadog.datadog import DataDogLogger
+
+NUM_EVENTS = int(os.getenv("CALLBACK_DELIVERY_LOG_BENCHMARK_EVENTS", 20000))
+BATCH_SIZE = int(os.getenv("CALLBACK_DELIVERY_LOG_BENCHMARK_BATCH_SIZE", 500))
+LATENCY_SECONDS = float(os.getenv("CALLBACK_DELIVERY_LOG_BENCHMARK_LATENCY", 0.05))
+OUTAGE_SECONDS = float(os.getenv("CALLBACK_DELIVERY_LOG_BENCHMARK_OUTAGE", 1))
+DRAIN_TIMEOUT_SECONDS = 60
+
+
+class StubIntakeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubIntakeHandler)
+        self.down = False
+        self.received_ids: set = set()
+        self.lock = threading.Lock()
+
+
+class StubIntakeHandler(BaseHTTPRequestHandler):
+    server: StubIntakeServer
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(LATENCY_SECONDS)
+        if self.server.down:
+            self.send_response(503)
+            self.end_headers()
+            return
+        events = json.loads(gzip.decompress(body))
+        with self.server.lock:
+            self.server.received_ids.update(event["id"] for event in events)
+        self.send_response(202)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+async def _produce(dd_logger: DataDogLogger, server: StubIntakeServer) -> float:
+    """
+    Logs NUM_EVENTS events, the destination goes down for OUTAGE_SECONDS after the 1st third of them. Returns the seconds spent in `flush_queue`.
+    """
+    flush_seconds = 0.0
+    outage_end = None
+    for i in range(NUM_EVENTS):
+        if i == NUM_EVENTS // 3:
+            server.down = True
+            outage_end = time.perf_counter() + OUTAGE_SECONDS
+        if outage_end is not None and time.perf_counter() >= outage_end:
+            server.down = False
+        dd_logger.log_queue.append({"id": i, "message": f"event {i}"})
+        if len(dd_logger.log_queue) >= dd_logger.batch_size:
+            start = time.perf_counter()
+            await dd_logger.flush_queue()
+            flush_seconds += time.perf_counter() - start
+    if outage_end is not None:
+        await asyncio.sleep(max(outage_end - time.perf_counter(), 0))
+    server.down = False
+    await dd_logger.flush_queue()
+    return flush_seconds
+
+
+@pytest.mark.asyncio
+async def test_callback_delivery_log_outage(monkeypatch):
+    server = StubIntakeServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("DD_API_KEY", "fake-key")
+    monkeypatch.setenv("DD_SITE", "fake.datadoghq.com")
+    monkeypatch.setenv("DD_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+
+    delivered = {}
+    flush_seconds = {}
+    for mode in ["in-memory", "delivery log"]:
+        server.received_ids = set()
+        monkeypatch.setattr(
+            litellm,
+            "callback_delivery_log_dir",
+            tempfile.mkdtemp() if mode == "delivery log" else None,
+        )
+        dd_logger = DataDogLogger()
+        dd_logger.batch_size = BATCH_SIZE
+        if dd_logger.delivery_log is not None:
+            dd_logger.delivery_log.batch_size = BATCH_SIZE
+            dd_logger.delivery_log.backoff_base_seconds = 0.1
+            dd_logger.delivery_log.backoff_max_seconds = 0.5
+
+        start = time.perf_counter()
+        flush_seconds[mode] = await _produce(dd_logger, server)
+        while (
+            dd_logger.delivery_log is not None
+            and dd_logger.delivery_log.num_delivered < NUM_EVENTS
+            and time.perf_counter() - start < DRAIN_TIMEOUT_SECONDS
+        ):
+            await asyncio.sleep(0.05)
+        total_seconds = time.perf_counter() - start
+        if dd_logger.delivery_log is not None:
+            dd_logger.delivery_log.close()
+
+        delivered[mode] = len(server.received_ids)
+        print(
+            f"{mode} - {NUM_EVENTS} events, {delivered[mode]} delivered in {total_seconds:.1f}s, "
+            f"{flush_seconds[mode] * 1000:.0f}ms in flush_queue"
+        )
+
+    server.shutdown()
+    # batches flushed during the outage are lost without the delivery log
+    assert delivered["in-memory"] < NUM_EVENTS * 0.8
+    assert delivered["delivery log"] == NUM_EVENTS
+    # producers append to disk - they never wait on the destination
+    assert flush_seconds["delivery log"] * 5 < flush_seconds["in-memory"]
@@ -0,0 +1,64 @@
+"""
+Benchmark per-call `hf_chat_template()` render cost - compiling the template on every call vs. the compiled template cache.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from jinja2.sandbox import ImmutableSandboxedEnvironment
+
+import litellm
+from litellm.litellm_core_utils.prompt_templates.factory import hf_chat_template
+
+NUM_CALLS = int(os.getenv("HF_CHAT_TEMPLATE_BENCHMARK_CALLS", 2000))
+MODEL = "mistralai/Mistral-7B-Instruct-v0.1"
+MESSAGES = [
+    {"role": "user", "content": "What is the weather in Copenhagen?"},
+    {"role": "assistant", "content": "It's sunny."},
+    {"role": "user", "content": "And tomorrow?"},
+]
+
+
+def _render_without_cache():
+    """
+    what `hf_chat_template()` did per call before templates were cached
+    """
+    tokenizer_config = litellm.known_tokenizer_config[MODEL]["tokenizer"]
+    env = ImmutableSandboxedEnvironment()
+    template = env.from_string(tokenizer_config["chat_template"])
+    try:
+        template.render(
+            messages=[{"role": "system", "content": "test"}],
+            eos_token="<eos>",
+            bos_token="<bos>",
+        )
+    except Exception:
+        pass
+    return template.render(
+        bos_token=tokenizer_config["bos_token"],
+        eos_token=tokenizer_config["eos_token"],
+        messages=MESSAGES,
+        add_generation_prompt=True,
+    )
+
+
+def test_hf_chat_template_render_cost():
+    assert hf_chat_template(model=MODEL, messages=MESSAGES) == _render_without_cache()
+
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        _render_without_cache()
+    uncached_time = (time.perf_counter() - start) / NUM_CALLS
+
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        hf_chat_template(model=MODEL, messages=MESSAGES)
+    cached_time = (time.perf_counter() - start) / NUM_CALLS
+
+    print(
+        f"hf_chat_template per call - compile every call: {uncached_time * 1e6:.1f}us, compiled template cache: {cached_time * 1e6:.1f}us"
+    )
+    assert cached_time < uncached_time
@@ -0,0 +1,55 @@
+"""
+Benchmark `import litellm` - provider configs + heavy subsystems (e.g. `litellm.Router`) are resolved lazily via `litellm.__getattr__`.
+
+Compares the cumulative `python -X importtime` of a bare `import litellm` with `import litellm` + resolving every lazy import (the cost of importing everything eagerly).
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+NUM_RUNS = int(os.getenv("IMPORT_TIME_BENCHMARK_RUNS", 3))
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+
+def _get_import_time_seconds(code: str) -> float:
+    """
+    Fastest of NUM_RUNS cumulative import times of the `litellm` package + everything `code` imports after it
+    """
+    import_times = []
+    for _ in range(NUM_RUNS):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+            env={**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"},
+            check=True,
+        )
+        cumulative_us = 0
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) != 3 or not parts[1].strip().isdigit():
+                continue
+            # top-level imports only (1 space of indent) - nested imports are part of their cumulative time
+            name = parts[2].rstrip()
+            if name.startswith("  ") or not name.startswith(" "):
+                continue
+            if name.strip() == "litellm" or name.strip().startswith("litellm."):
+                cumulative_us += int(parts[1])
+        import_times.append(cumulative_us / 1e6)
+    return min(import_times)
+
+
+def test_import_litellm_time():
+    lazy_seconds = _get_import_time_seconds("import litellm")
+    eager_seconds = _get_import_time_seconds(
+        "import litellm\nfor name in litellm._lazy_imports: getattr(litellm, name)"
+    )
+    print(
+        f"import litellm: {lazy_seconds:.2f}s, with all lazy imports resolved: {eager_seconds:.2f}s"
+    )
+    assert lazy_seconds < eager_seconds
@@ -0,0 +1,72 @@
+"""
+Benchmark the cost of debug logs on hot paths when debug logging is off - eagerly formatted f-strings vs. the lazy logging facade.
+
+The logged objects are the ones hot paths log per chunk / per request: a streamed chunk, and the messages of a request.
+"""
+
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm._logging import LazyLogger
+from litellm.types.utils import ModelResponseStream
+
+NUM_CALLS = int(os.getenv("LAZY_DEBUG_LOGGING_BENCHMARK_CALLS", 20000))
+NUM_MESSAGES = int(os.getenv("LAZY_DEBUG_LOGGING_BENCHMARK_MESSAGES", 50))
+
+
+def _per_call_us(func, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        func(*args)
+    return (time.perf_counter() - start) / NUM_CALLS * 1e6
+
+
+def test_lazy_debug_logging_disabled_cost(monkeypatch):
+    monkeypatch.setattr(litellm, "set_verbose", False)
+    logger = logging.getLogger("LiteLLM Lazy Logging Benchmark")
+    logger.setLevel(logging.INFO)
+    lazy_logger = LazyLogger(logger)
+
+    chunk = ModelResponseStream(
+        id="chatcmpl-123",
+        model="gpt-4o",
+        choices=[{"index": 0, "delta": {"content": "hello world"}}],
+    )
+    messages = [
+        {"role": "user", "content": f"message {i} " + "lorem ipsum " * 20}
+        for i in range(NUM_MESSAGES)
+    ]
+
+    def _eager_chunk(chunk):
+        logger.debug(f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}")
+
+    def _lazy_chunk(chunk):
+        lazy_logger.debug("PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk)
+
+    def _eager_messages(messages):
+        logger.debug(f"token_counter messages received: {messages}")
+
+    def _lazy_messages(messages):
+        lazy_logger.print_verbose("token_counter messages received: %s", messages)
+
+    def _no_log(_):
+        pass
+
+    no_log_us = _per_call_us(_no_log, chunk)
+    for name, eager, lazy, arg in [
+        ("streamed chunk", _eager_chunk, _lazy_chunk, chunk),
+        (f"{NUM_MESSAGES} messages", _eager_messages, _lazy_messages, messages),
+    ]:
+        eager_us = _per_call_us(eager, arg)
+        lazy_us = _per_call_us(lazy, arg)
+        print(
+            f"{name} - eager f-string: {eager_us:.2f}us/call, lazy: {lazy_us:.2f}us/call, no log: {no_log_us:.2f}us/call"
+        )
+        assert lazy_us * 10 < eager_us
+        # the disabled-debug cost is a level check (+ the `set_verbose` check) - no formatting
+        assert lazy_us - no_log_us < 2
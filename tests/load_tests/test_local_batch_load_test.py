@@ -0,0 +1,138 @@
+"""
+Benchmark local batch throughput (requests / second) against mock providers:
+
+- a router deployment on a mock custom provider with fixed latency (no rate limit)
+- a mock provider that returns 429s above a fixed concurrency - AIMD concurrency has to find the limit
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import pytest
+
+import litellm
+from litellm import Router
+from litellm.batches.local_batches import (
+    LocalBatchExecutor,
+    LocalBatchesAPI,
+    LocalBatchStore,
+)
+from litellm.llms.custom_llm import CustomLLM
+from litellm.utils import custom_llm_setup
+
+NUM_REQUESTS = int(os.getenv("LOCAL_BATCH_BENCHMARK_REQUESTS", 2000))
+MOCK_LATENCY_SECONDS = 0.05
+PROVIDER_CONCURRENCY_LIMIT = 20
+
+
+def _create_batch_input_file(local_batches: LocalBatchesAPI) -> str:
+    file_content = b"\n".join(
+        json.dumps(
+            {
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "my-model",
+                    "messages": [{"role": "user", "content": f"Hello {i}"}],
+                },
+            }
+        ).encode("utf-8")
+        for i in range(NUM_REQUESTS)
+    )
+    return local_batches.store.create_file(file=file_content, purpose="batch").id
+
+
+async def _run_batch(local_batches: LocalBatchesAPI, llm_router) -> float:
+    input_file_id = _create_batch_input_file(local_batches)
+    start = time.perf_counter()
+    batch = await local_batches.executor.acreate_batch(
+        create_batch_data={
+            "completion_window": "24h",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": input_file_id,
+        },
+        llm_router=llm_router,
+    )
+    batch = await local_batches.executor._tasks[batch.id]
+    elapsed = time.perf_counter() - start
+    assert batch.status == "completed"
+    assert batch.request_counts.completed == NUM_REQUESTS
+    return elapsed
+
+
+class MockProvider(CustomLLM):
+    async def acompletion(self, *args, **kwargs) -> litellm.ModelResponse:
+        await asyncio.sleep(MOCK_LATENCY_SECONDS)
+        return litellm.ModelResponse()
+
+
+@pytest.mark.asyncio
+async def test_local_batch_throughput_mock_router(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        litellm,
+        "custom_provider_map",
+        [{"provider": "mock_provider", "custom_handler": MockProvider()}],
+    )
+    custom_llm_setup()
+    local_batches = LocalBatchesAPI(
+        executor=LocalBatchExecutor(store=LocalBatchStore(base_dir=str(tmp_path)))
+    )
+    router = Router(
+        model_list=[
+            {
+                "model_name": "my-model",
+                "litellm_params": {"model": "mock_provider/my-model"},
+            }
+        ]
+    )
+    elapsed = await _run_batch(local_batches, router)
+    requests_per_second = NUM_REQUESTS / elapsed
+    print(
+        f"local batch - {NUM_REQUESTS} requests through the router in {elapsed:.2f}s ({requests_per_second:.0f} req/s, sequential would be {1 / MOCK_LATENCY_SECONDS:.0f} req/s)"
+    )
+    assert requests_per_second > 5 / MOCK_LATENCY_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_local_batch_throughput_rate_limited_provider(tmp_path):
+    class RateLimitedProvider:
+        """
+        Returns a 429 for any request above `PROVIDER_CONCURRENCY_LIMIT` concurrent requests
+        """
+
+        def __init__(self):
+            self.in_flight = 0
+            self.num_rate_limit_errors = 0
+
+        async def acompletion(self, model, messages, **kwargs):
+            if self.in_flight >= PROVIDER_CONCURRENCY_LIMIT:
+                self.num_rate_limit_errors += 1
+                raise litellm.RateLimitError(
+                    message="too many requests", llm_provider="mock", model=model
+                )
+            self.in_flight += 1
+            try:
+                await asyncio.sleep(MOCK_LATENCY_SECONDS)
+            finally:
+                self.in_flight -= 1
+            return litellm.ModelResponse()
+
+    provider = RateLimitedProvider()
+    local_batches = LocalBatchesAPI(
+        executor=LocalBatchExecutor(
+            store=LocalBatchStore(base_dir=str(tmp_path)), max_concurrency=100
+        )
+    )
+    elapsed = await _run_batch(local_batches, provider)
+    requests_per_second = NUM_REQUESTS / elapsed
+    print(
+        f"local batch - {NUM_REQUESTS} requests against a provider limited to {PROVIDER_CONCURRENCY_LIMIT} concurrent requests in {elapsed:.2f}s ({requests_per_second:.0f} req/s, max possible {PROVIDER_CONCURRENCY_LIMIT / MOCK_LATENCY_SECONDS:.0f} req/s), {provider.num_rate_limit_errors} rate limit errors"
+    )
+    # AIMD keeps the number of 429s small relative to the number of requests
+    assert provider.num_rate_limit_errors < NUM_REQUESTS * 0.2
@@ -0,0 +1,153 @@
+"""
+Benchmark the memory used to log an Anthropic pass-through stream - collecting all raw bytes, then parsing them at the end of the stream (previous implementation) vs. parsing the bytes as they arrive with `IncrementalLineDecoder` + `AnthropicPassThroughStreamingAccumulator`.
+
+Peak memory is measured with tracemalloc, for streams of increasing length.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
+from litellm.proxy.pass_through_endpoints.streaming_accumulator import (
+    AnthropicPassThroughStreamingAccumulator,
+    IncrementalLineDecoder,
+)
+from litellm.proxy.pass_through_endpoints.streaming_handler import (
+    PassThroughStreamingHandler,
+)
+
+STREAM_EVENTS = [
+    int(n)
+    for n in os.getenv("PASS_THROUGH_STREAMING_BENCHMARK_EVENTS", "1000,4000").split(
+        ","
+    )
+]
+NETWORK_CHUNK_SIZE = 1024
+MODEL = "claude-3-5-sonnet-20240620"
+
+
+def _get_stream(num_events: int) -> bytes:
+    events = [
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "model": MODEL,
+                "content": [],
+                "usage": {"input_tokens": 17, "output_tokens": 1},
+            },
+        },
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        },
+    ]
+    events += [
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": f" token{i}"},
+        }
+        for i in range(num_events)
+    ]
+    events += [
+        {"type": "content_block_stop", "index": 0},
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "end_turn"},
+            "usage": {"output_tokens": num_events},
+        },
+        {"type": "message_stop"},
+    ]
+    return "".join(
+        f"event: {event['type']}\ndata: {json.dumps(event)}\n\n" for event in events
+    ).encode()
+
+
+def _get_logging_obj() -> LiteLLMLoggingObj:
+    return LiteLLMLoggingObj(
+        model=MODEL,
+        messages=[],
+        stream=True,
+        call_type="pass_through_endpoint",
+        start_time=datetime.now(),
+        litellm_call_id="pass-through-streaming-benchmark",
+        function_id="pass-through-streaming-benchmark",
+    )
+
+
+def _legacy_logging(network_chunks):
+    raw_bytes = []
+    for chunk in network_chunks:
+        raw_bytes.append(chunk)
+    all_chunks = PassThroughStreamingHandler._convert_raw_bytes_to_str_lines(raw_bytes)
+    streaming_accumulator = AnthropicPassThroughStreamingAccumulator(
+        litellm_logging_obj=_get_logging_obj(), model=MODEL
+    )
+    all_openai_chunks = []
+    for line in all_chunks:
+        try:
+            generic_chunk = streaming_accumulator._convert_line_to_generic_chunk(line)
+            litellm_chunk = streaming_accumulator.custom_stream_wrapper.chunk_creator(
+                chunk=generic_chunk
+            )
+        except StopIteration:
+            break
+        if litellm_chunk is not None:
+            all_openai_chunks.append(litellm_chunk)
+    return litellm.stream_chunk_builder(chunks=all_openai_chunks)
+
+
+def _incremental_logging(network_chunks):
+    line_decoder = IncrementalLineDecoder()
+    streaming_accumulator = AnthropicPassThroughStreamingAccumulator(
+        litellm_logging_obj=_get_logging_obj(), model=MODEL
+    )
+    for chunk in network_chunks:
+        for line in line_decoder.feed(chunk):
+            streaming_accumulator.add_line(line)
+    for line in line_decoder.flush():
+        streaming_accumulator.add_line(line)
+    return streaming_accumulator.get_complete_streaming_response()
+
+
+def _measure(fn, stream: bytes):
+    network_chunks = (
+        stream[i : i + NETWORK_CHUNK_SIZE]
+        for i in range(0, len(stream), NETWORK_CHUNK_SIZE)
+    )
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = fn(network_chunks)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed, response
+
+
+def test_pass_through_streaming_logging_memory():
+    for num_events in STREAM_EVENTS:
+        stream = _get_stream(num_events)
+        legacy_peak, legacy_elapsed, legacy_response = _measure(_legacy_logging, stream)
+        new_peak, new_elapsed, new_response = _measure(_incremental_logging, stream)
+        print(
+            f"{num_events} events, {len(stream) / 1024:.0f}KB stream - "
+            f"collect + parse at the end: peak {legacy_peak / 1024:.0f}KB, {legacy_elapsed:.2f}s; "
+            f"incremental: peak {new_peak / 1024:.0f}KB, {new_elapsed:.2f}s"
+        )
+        assert (
+            new_response.choices[0].message.content
+            == legacy_response.choices[0].message.content
+        )
+        assert new_response.usage == legacy_response.usage
+        assert new_peak < legacy_peak
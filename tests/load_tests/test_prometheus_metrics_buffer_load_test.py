@@ -0,0 +1,79 @@
+"""
+Benchmark per-request cost of prometheus metric updates - direct `.labels(...).inc()` vs. buffered updates (`litellm.prometheus_async_metrics_aggregation`)
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from prometheus_client import CollectorRegistry, Counter, Histogram
+
+from litellm.integrations.prometheus_helpers.metrics_buffer import (
+    PrometheusMetricsBuffer,
+)
+
+NUM_REQUESTS = 100_000
+LABEL_NAMES = ["end_user", "hashed_api_key", "api_key_alias", "model", "team"]
+
+
+def _record_requests(counter, histogram) -> float:
+    start = time.perf_counter()
+    for i in range(NUM_REQUESTS):
+        labels = {
+            "end_user": f"user-{i % 50}",
+            "hashed_api_key": f"key-{i % 20}",
+            "api_key_alias": "alias",
+            "model": f"model-{i % 5}",
+            "team": "team",
+        }
+        counter.labels(**labels).inc(0.001)
+        histogram.labels(**labels).observe(0.25)
+    return time.perf_counter() - start
+
+
+def test_prometheus_metrics_buffer_request_path_latency():
+    registry = CollectorRegistry()
+    counter = Counter("direct_spend", "spend", LABEL_NAMES, registry=registry)
+    histogram = Histogram("direct_latency", "latency", LABEL_NAMES, registry=registry)
+    direct_time = _record_requests(counter, histogram)
+
+    buffered_registry = CollectorRegistry()
+    metrics_buffer = PrometheusMetricsBuffer()
+    buffered_counter = metrics_buffer.wrap(
+        Counter("buffered_spend", "spend", LABEL_NAMES, registry=buffered_registry)
+    )
+    buffered_histogram = metrics_buffer.wrap(
+        Histogram(
+            "buffered_latency", "latency", LABEL_NAMES, registry=buffered_registry
+        )
+    )
+    buffered_time = _record_requests(buffered_counter, buffered_histogram)
+
+    start = time.perf_counter()
+    assert metrics_buffer.flush() == 2 * NUM_REQUESTS
+    flush_time = time.perf_counter() - start
+
+    print(
+        f"{NUM_REQUESTS} requests - direct: {direct_time:.3f}s, buffered (request path): {buffered_time:.3f}s, background flush: {flush_time:.3f}s"
+    )
+    assert buffered_registry.get_sample_value(
+        "buffered_spend_total",
+        {
+            "end_user": "user-0",
+            "hashed_api_key": "key-0",
+            "api_key_alias": "alias",
+            "model": "model-0",
+            "team": "team",
+        },
+    ) == registry.get_sample_value(
+        "direct_spend_total",
+        {
+            "end_user": "user-0",
+            "hashed_api_key": "key-0",
+            "api_key_alias": "alias",
+            "model": "model-0",
+            "team": "team",
+        },
+    )
@@ -0,0 +1,91 @@
+"""
+Benchmark streamed tokens / CPU second of the proxy's /chat/completions streaming path - parsing + re-serializing every chunk (`async_data_generator`) vs. forwarding the upstream SSE bytes (`general_settings.raw_sse_passthrough`).
+
+The upstream is an in-process mock transport, so the CPU time measured is the proxy's (+ the same mock upstream cost for both).
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import httpx
+from openai import AsyncOpenAI
+
+import litellm
+from litellm.proxy import proxy_server
+from litellm.proxy._types import UserAPIKeyAuth
+
+NUM_TOKENS = int(os.getenv("RAW_SSE_PASSTHROUGH_BENCHMARK_TOKENS", 5000))
+
+
+def _get_sse_bytes() -> bytes:
+    sse_chunks = [
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [
+                {"index": 0, "delta": {"content": f" token{i}"}, "finish_reason": None}
+            ],
+        }
+        for i in range(NUM_TOKENS)
+    ]
+    sse_chunks.append(
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        }
+    )
+    return (
+        b"".join(f"data: {json.dumps(chunk)}\n\n".encode() for chunk in sse_chunks)
+        + b"data: [DONE]\n\n"
+    )
+
+
+async def _stream_tokens(sse_bytes: bytes, raw_sse_passthrough: bool) -> float:
+    client = AsyncOpenAI(
+        api_key="sk-1234",
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    200,
+                    headers={"content-type": "text/event-stream"},
+                    content=sse_bytes,
+                )
+            )
+        ),
+    )
+    proxy_server.general_settings = {"raw_sse_passthrough": raw_sse_passthrough}
+    start = time.process_time()
+    response = await litellm.acompletion(
+        model="openai/gpt-4o",
+        messages=[{"role": "user", "content": "Hi"}],
+        stream=True,
+        client=client,
+    )
+    generator = proxy_server.select_data_generator(
+        response=response, user_api_key_dict=UserAPIKeyAuth(), request_data={}
+    )
+    async for _ in generator:
+        pass
+    return time.process_time() - start
+
+
+def test_raw_sse_passthrough_tokens_per_cpu_second():
+    sse_bytes = _get_sse_bytes()
+    parsed_cpu_seconds = asyncio.run(_stream_tokens(sse_bytes, False))
+    raw_cpu_seconds = asyncio.run(_stream_tokens(sse_bytes, True))
+    print(
+        f"{NUM_TOKENS} streamed tokens - "
+        f"parsed chunks: {NUM_TOKENS / parsed_cpu_seconds:.0f} tokens/CPU second; "
+        f"raw SSE passthrough: {NUM_TOKENS / raw_cpu_seconds:.0f} tokens/CPU second"
+    )
+    assert raw_cpu_seconds < parsed_cpu_seconds
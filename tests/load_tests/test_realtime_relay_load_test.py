@@ -0,0 +1,109 @@
+"""
+Benchmark the per-event logging work of the realtime relay on a voice session - `json.loads` of every event + keeping every stored event, incl. audio (previous implementation) vs. `RealTimeStreaming.store_message()` (event type read from the prefix, usage folded from `response.done`, audio never stored).
+
+Events are generated in the shape of a recorded OpenAI realtime session: mostly `response.audio.delta` frames with ~8KB of base64 audio, `response.done` every 50 frames.
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.litellm_core_utils.realtime_streaming import RealTimeStreaming
+
+NUM_EVENTS = int(os.getenv("REALTIME_RELAY_BENCHMARK_EVENTS", 5000))
+AUDIO_FRAME_BYTES = 6000
+
+
+def _get_session_events():
+    audio = base64.b64encode(os.urandom(AUDIO_FRAME_BYTES)).decode()
+    events = []
+    for i in range(NUM_EVENTS):
+        if i % 50 == 49:
+            events.append(
+                json.dumps(
+                    {
+                        "type": "response.done",
+                        "event_id": f"event_{i}",
+                        "response": {
+                            "id": f"resp_{i}",
+                            "status": "completed",
+                            "output": [],
+                            "usage": {
+                                "total_tokens": 330,
+                                "input_tokens": 300,
+                                "output_tokens": 30,
+                                "input_token_details": {
+                                    "cached_tokens": 0,
+                                    "text_tokens": 100,
+                                    "audio_tokens": 200,
+                                },
+                                "output_token_details": {
+                                    "text_tokens": 10,
+                                    "audio_tokens": 20,
+                                },
+                            },
+                        },
+                    }
+                )
+            )
+        else:
+            events.append(
+                json.dumps(
+                    {
+                        "type": "response.audio.delta",
+                        "event_id": f"event_{i}",
+                        "response_id": "resp_1",
+                        "item_id": "item_1",
+                        "output_index": 0,
+                        "content_index": 0,
+                        "delta": audio,
+                    }
+                )
+            )
+    return events
+
+
+def _legacy_store_message(realtime_streaming: RealTimeStreaming, message: str):
+    message_obj = json.loads(message)
+    if (
+        realtime_streaming.logged_real_time_event_types == "*"
+        or message_obj["type"] in realtime_streaming.logged_real_time_event_types
+    ):
+        realtime_streaming.messages.append(message)
+
+
+def _measure(store_message, events):
+    realtime_streaming = RealTimeStreaming(websocket=None, backend_ws=None)
+    start = time.perf_counter()
+    for event in events:
+        store_message(realtime_streaming, event)
+    elapsed = time.perf_counter() - start
+    # every event is a new str received from the backend - stored events are kept until the session is logged
+    stored_bytes = sum(len(message) for message in realtime_streaming.messages)
+    return NUM_EVENTS / elapsed, stored_bytes, realtime_streaming
+
+
+def test_realtime_relay_logging_throughput():
+    events = _get_session_events()
+    for logged_event_types in [None, "*"]:
+        litellm.logged_real_time_event_types = logged_event_types
+        try:
+            legacy_eps, legacy_stored_bytes, _ = _measure(_legacy_store_message, events)
+            new_eps, new_stored_bytes, realtime_streaming = _measure(
+                RealTimeStreaming.store_message, events
+            )
+        finally:
+            litellm.logged_real_time_event_types = None
+        print(
+            f"logged_real_time_event_types={logged_event_types}, {NUM_EVENTS} events - "
+            f"json.loads per event: {legacy_eps:.0f} events/s, {legacy_stored_bytes / 1024:.0f}KB stored; "
+            f"store_message: {new_eps:.0f} events/s ({new_eps / legacy_eps:.1f}x), {new_stored_bytes / 1024:.0f}KB stored"
+        )
+        assert realtime_streaming.usage.num_responses == NUM_EVENTS // 50
+        assert new_eps > legacy_eps
+        assert new_stored_bytes <= legacy_stored_bytes
@@ -0,0 +1,143 @@
+"""
+Benchmark the shared-memory cache - auth lookups of virtual keys on a proxy with 8 workers, against a redis with a network round trip.
+
+- in-memory only (default before): every worker misses its own in-memory cache the 1st time it sees a key, and waits on redis
+- shared memory (`--num_workers > 1`): a key fetched from redis by 1 worker is read from shared memory by the other workers
+"""
+
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import pytest
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.shared_memory_cache import SharedMemoryCache
+from litellm.proxy._types import UserAPIKeyAuth
+
+NUM_WORKERS = int(os.getenv("SHARED_MEMORY_CACHE_BENCHMARK_WORKERS", 8))
+NUM_KEYS = int(os.getenv("SHARED_MEMORY_CACHE_BENCHMARK_KEYS", 2000))
+NUM_LOOKUPS = int(os.getenv("SHARED_MEMORY_CACHE_BENCHMARK_LOOKUPS", 3000))
+# time between requests of a worker - the rest of the request, workers don't saturate the cpu
+REQUEST_INTERVAL_SECONDS = float(
+    os.getenv("SHARED_MEMORY_CACHE_BENCHMARK_REQUEST_INTERVAL", 0.001)
+)
+REDIS_LATENCY_SECONDS = float(
+    os.getenv("SHARED_MEMORY_CACHE_BENCHMARK_REDIS_LATENCY", 0.0005)
+)
+
+
+class _RemoteRedisCache:
+    """
+    Redis holding every key object, 1 round trip per lookup
+    """
+
+    def __init__(self):
+        self.num_round_trips = 0
+
+    async def async_get_cache(self, key, parent_otel_span=None, **kwargs):
+        self.num_round_trips += 1
+        await asyncio.sleep(REDIS_LATENCY_SECONDS)
+        return UserAPIKeyAuth(token=key, key_alias=f"key {key}", spend=0.0)
+
+    async def async_set_cache(self, key, value, **kwargs):
+        pass
+
+
+async def _auth_lookups(
+    worker_id: int, shared_memory_cache_path: Optional[str]
+) -> tuple:
+    redis_cache = _RemoteRedisCache()
+    user_api_key_cache = DualCache(
+        in_memory_cache=InMemoryCache(max_size_in_memory=NUM_KEYS),
+        redis_cache=redis_cache,  # type: ignore
+        shared_memory_cache=(
+            SharedMemoryCache(
+                path=shared_memory_cache_path, namespace="user_api_key_cache"
+            )
+            if shared_memory_cache_path is not None
+            else None
+        ),
+    )
+    rng = random.Random(worker_id)
+    latencies = []
+    for _ in range(NUM_LOOKUPS):
+        hashed_token = f"hashed-token-{rng.randrange(NUM_KEYS)}"
+        start = time.perf_counter()
+        cached_key_obj = await user_api_key_cache.async_get_cache(key=hashed_token)
+        assert isinstance(cached_key_obj, UserAPIKeyAuth)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(REQUEST_INTERVAL_SECONDS)
+    return latencies, redis_cache.num_round_trips
+
+
+def _worker(
+    worker_id: int,
+    shared_memory_cache_path: Optional[str],
+    start_barrier,
+    results,
+) -> None:
+    start_barrier.wait()
+    results.put(asyncio.run(_auth_lookups(worker_id, shared_memory_cache_path)))
+
+
+def _run_workers(shared_memory_cache_path: Optional[str]) -> tuple:
+    ctx = multiprocessing.get_context("fork")
+    start_barrier = ctx.Barrier(NUM_WORKERS)
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=_worker,
+            args=(worker_id, shared_memory_cache_path, start_barrier, results),
+        )
+        for worker_id in range(NUM_WORKERS)
+    ]
+    for worker in workers:
+        worker.start()
+    latencies = []
+    num_round_trips = 0
+    for _ in workers:
+        worker_latencies, worker_round_trips = results.get(timeout=300)
+        latencies.extend(worker_latencies)
+        num_round_trips += worker_round_trips
+    for worker in workers:
+        worker.join()
+    return sorted(latencies), num_round_trips
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires fork + fcntl")
+def test_auth_lookup_latency_shared_memory_cache():
+    mean_us = {}
+    round_trips = {}
+    for mode in ["in-memory only", "shared memory"]:
+        shared_memory_cache_path = None
+        if mode == "shared memory":
+            fd, shared_memory_cache_path = tempfile.mkstemp(
+                prefix="litellm_shared_cache_benchmark_"
+            )
+            os.close(fd)
+        try:
+            latencies, round_trips[mode] = _run_workers(shared_memory_cache_path)
+        finally:
+            if shared_memory_cache_path is not None:
+                os.remove(shared_memory_cache_path)
+        mean_us[mode] = sum(latencies) / len(latencies) * 1e6
+        p50_us = latencies[len(latencies) // 2] * 1e6
+        p99_us = latencies[int(len(latencies) * 0.99)] * 1e6
+        print(
+            f"{mode} - {NUM_WORKERS} workers, {NUM_KEYS} keys, {NUM_WORKERS * NUM_LOOKUPS} lookups: "
+            f"mean {mean_us[mode]:.1f}us, p50 {p50_us:.1f}us, p99 {p99_us:.1f}us, "
+            f"{round_trips[mode]} redis round trips"
+        )
+
+    # a key is fetched from redis ~once per host, instead of once per worker
+    assert round_trips["shared memory"] * 3 < round_trips["in-memory only"]
+    assert mean_us["shared memory"] < mean_us["in-memory only"]
@@ -0,0 +1,201 @@
+"""
+Benchmark the spend accumulator of the proxy - spend of requests finishing while `update_spend` writes to the db, the cost of adding spend on the request path, and db writes per interval for several proxy pods with redis aggregation.
+
+Before the accumulator, spend was summed in plain dicts on `PrismaClient`, which were reset after the db write - spend added while the write was in flight was dropped.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import pytest
+
+from litellm.proxy.spend_tracking.spend_accumulator import SpendAccumulator
+
+NUM_REQUESTS = int(os.getenv("SPEND_ACCUMULATOR_BENCHMARK_REQUESTS", 20000))
+NUM_KEYS = int(os.getenv("SPEND_ACCUMULATOR_BENCHMARK_KEYS", 1000))
+NUM_FLUSHES = int(os.getenv("SPEND_ACCUMULATOR_BENCHMARK_FLUSHES", 20))
+NUM_PODS = int(os.getenv("SPEND_ACCUMULATOR_BENCHMARK_PODS", 5))
+RESPONSE_COST = 0.001
+
+
+async def _db_write(written: dict, transactions) -> None:
+    for entity_id, spend in transactions:
+        written[entity_id] = written.get(entity_id, 0) + spend
+    await asyncio.sleep(0.001)  # db round trip
+
+
+async def _run_requests(add_spend, done: asyncio.Event) -> None:
+    # requests spread over ~NUM_FLUSHES db writes
+    requests_per_ms = max(NUM_REQUESTS // NUM_FLUSHES, 1)
+    for i in range(NUM_REQUESTS):
+        add_spend(f"hashed-key-{i % NUM_KEYS}", RESPONSE_COST)
+        if i % requests_per_ms == 0:
+            await asyncio.sleep(0.001)
+    done.set()
+
+
+@pytest.mark.asyncio
+async def test_spend_added_during_flushes():
+    ## plain dict, reset after the db write
+    transactions: dict = {}
+    dict_written: dict = {}
+
+    def _dict_add(entity_id, spend):
+        transactions[entity_id] = spend + transactions.get(entity_id, 0)
+
+    async def _dict_flush(done: asyncio.Event):
+        nonlocal transactions
+        while not done.is_set():
+            await _db_write(dict_written, list(transactions.items()))
+            transactions = {}
+        await _db_write(dict_written, list(transactions.items()))
+
+    done = asyncio.Event()
+    await asyncio.gather(_run_requests(_dict_add, done), _dict_flush(done))
+
+    ## spend accumulator, swapped out before the db write
+    spend_accumulator = SpendAccumulator()
+    accumulator_written: dict = {}
+
+    def _accumulator_add(entity_id, spend):
+        spend_accumulator.add(entity_type="key", entity_id=entity_id, spend=spend)
+
+    async def _accumulator_flush(done: asyncio.Event):
+        while not done.is_set():
+            shard = spend_accumulator.swap("key")
+            await _db_write(accumulator_written, shard.items())
+        await _db_write(accumulator_written, spend_accumulator.swap("key").items())
+
+    done = asyncio.Event()
+    await asyncio.gather(
+        _run_requests(_accumulator_add, done), _accumulator_flush(done)
+    )
+
+    expected_spend = NUM_REQUESTS * RESPONSE_COST
+    dict_spend = sum(dict_written.values())
+    accumulator_spend = sum(accumulator_written.values())
+    print(
+        f"{NUM_REQUESTS} requests - spend written: plain dict {dict_spend:.3f}, accumulator {accumulator_spend:.3f}, expected {expected_spend:.3f}"
+    )
+    assert dict_spend < expected_spend * 0.99
+    assert accumulator_spend == pytest.approx(expected_spend)
+
+
+def test_spend_accumulator_add_cost():
+    entity_ids = [f"hashed-key-{i % NUM_KEYS}" for i in range(NUM_REQUESTS)]
+
+    transactions: dict = {}
+    start = time.perf_counter()
+    for entity_id in entity_ids:
+        transactions[entity_id] = RESPONSE_COST + transactions.get(entity_id, 0)
+    dict_us = (time.perf_counter() - start) / NUM_REQUESTS * 1e6
+
+    spend_accumulator = SpendAccumulator()
+    start = time.perf_counter()
+    for entity_id in entity_ids:
+        spend_accumulator.add(
+            entity_type="key", entity_id=entity_id, spend=RESPONSE_COST
+        )
+    accumulator_us = (time.perf_counter() - start) / NUM_REQUESTS * 1e6
+    print(
+        f"add spend - plain dict: {dict_us:.2f}us, accumulator: {accumulator_us:.2f}us"
+    )
+    assert spend_accumulator.get_shard("key").to_dict() == pytest.approx(transactions)
+    # on the request path - stays well under the cost of a request
+    assert accumulator_us < 5
+
+
+class _RedisClient:
+    def __init__(self):
+        self.hashes: dict = {}
+        self.locked = False
+        self.commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def set(self, name, value, nx=False, ex=None):
+        if nx and self.locked:
+            return None
+        self.locked = True
+        return True
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def hincrbyfloat(self, name, key, amount):
+        self.commands.append(("hincrbyfloat", name, key, amount))
+
+    def hgetall(self, name):
+        self.commands.append(("hgetall", name))
+
+    def delete(self, name):
+        self.commands.append(("delete", name))
+
+    async def execute(self):
+        results = []
+        for command in self.commands:
+            if command[0] == "hincrbyfloat":
+                redis_hash = self.hashes.setdefault(command[1], {})
+                redis_hash[command[2]] = redis_hash.get(command[2], 0) + command[3]
+            elif command[0] == "hgetall":
+                results.append(dict(self.hashes.get(command[1], {})))
+            elif command[0] == "delete":
+                self.hashes.pop(command[1], None)
+        self.commands = []
+        return results
+
+
+@pytest.mark.asyncio
+async def test_db_writes_per_interval_with_redis_aggregation():
+    redis_client = _RedisClient()
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    redis_cache.check_and_fix_namespace = lambda key: key
+
+    db_writes = {"per pod": 0, "redis aggregation": 0}
+    written_spend = {"per pod": 0.0, "redis aggregation": 0.0}
+    for mode in db_writes:
+        pods = [
+            SpendAccumulator(
+                redis_cache=redis_cache if mode == "redis aggregation" else None
+            )
+            for _ in range(NUM_PODS)
+        ]
+        # NUM_FLUSHES intervals with traffic on every pod, then 1 interval draining redis
+        for interval in range(NUM_FLUSHES + 1):
+            redis_client.locked = False  # flush lock expired
+            for spend_accumulator in pods:
+                if interval < NUM_FLUSHES:
+                    for i in range(NUM_KEYS):
+                        spend_accumulator.add(
+                            entity_type="key",
+                            entity_id=f"hashed-key-{i}",
+                            spend=RESPONSE_COST,
+                        )
+                holds_flush_lock = await spend_accumulator.acquire_flush_lock()
+                shard = await spend_accumulator.get_spend_to_write(
+                    entity_type="key", holds_flush_lock=holds_flush_lock
+                )
+                if len(shard) > 0:
+                    db_write = AsyncMock()
+                    await db_write(list(shard.items()))
+                    db_writes[mode] += 1
+                    written_spend[mode] += sum(spend for _, spend in shard.items())
+
+    print(
+        f"{NUM_PODS} pods, {NUM_KEYS} keys, {NUM_FLUSHES} intervals - db writes: {db_writes}"
+    )
+    expected_spend = NUM_PODS * NUM_KEYS * NUM_FLUSHES * RESPONSE_COST
+    assert written_spend["per pod"] == pytest.approx(expected_spend)
+    assert written_spend["redis aggregation"] == pytest.approx(expected_spend)
+    assert db_writes["per pod"] == NUM_PODS * NUM_FLUSHES
+    assert db_writes["redis aggregation"] == NUM_FLUSHES + 1
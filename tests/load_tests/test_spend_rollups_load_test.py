@@ -0,0 +1,130 @@
+"""
+Benchmark spend report queries - raw "LiteLLM_SpendLogs" aggregation vs. "LiteLLM_SpendRollups".
+
+Generates a synthetic spend log table (10M rows by default, `SPEND_ROLLUPS_BENCHMARK_ROWS` to override)
+with `generate_series`, backfills the rollups, and compares query latency.
+
+Requires a throwaway postgres db with the litellm schema applied (DATABASE_URL).
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.proxy.spend_tracking.spend_rollups import (
+    backfill_spend_rollups,
+    get_top_entities_by_spend,
+)
+
+NUM_ROWS = int(os.getenv("SPEND_ROLLUPS_BENCHMARK_ROWS", 10_000_000))
+NUM_DAYS = 30
+
+RAW_TOP_MODELS_QUERY = """
+SELECT model, SUM(spend) AS total_spend
+FROM "LiteLLM_SpendLogs"
+WHERE "startTime" >= $1::timestamp AND "startTime" < $2::timestamp AND model != ''
+GROUP BY model
+ORDER BY total_spend DESC
+LIMIT 10;
+"""
+
+SYNTHETIC_SPEND_LOGS_QUERY = """
+INSERT INTO "LiteLLM_SpendLogs" (
+    request_id, call_type, api_key, spend, total_tokens, prompt_tokens, completion_tokens,
+    "startTime", "endTime", model, "user", team_id, request_tags
+)
+SELECT
+    'benchmark-' || i,
+    'acompletion',
+    'key-' || (i % 500),
+    (i % 100) / 10000.0,
+    150,
+    100,
+    50,
+    $1::timestamp + ((i % ($2::int * 86400)) || ' seconds')::interval,
+    $1::timestamp + ((i % ($2::int * 86400)) || ' seconds')::interval,
+    'model-' || (i % 20),
+    'user-' || (i % 2000),
+    'team-' || (i % 50),
+    jsonb_build_array('tag-' || (i % 10))
+FROM generate_series(1, $3::int) AS i
+ON CONFLICT DO NOTHING;
+"""
+
+
+async def _timed(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+@pytest.mark.skipif(
+    os.getenv("DATABASE_URL") is None,
+    reason="needs a throwaway postgres db (DATABASE_URL)",
+)
+def test_spend_rollups_report_latency():
+    from prisma import Prisma
+
+    async def run():
+        db = Prisma(http={"timeout": 600000})
+        await db.connect()
+        prisma_client = SimpleNamespace(db=db)
+        start_date = datetime(2024, 1, 1)
+        end_date = start_date + timedelta(days=NUM_DAYS)
+        try:
+            insert_time = await _timed(
+                db.execute_raw(
+                    SYNTHETIC_SPEND_LOGS_QUERY,
+                    start_date.isoformat(),
+                    NUM_DAYS,
+                    NUM_ROWS,
+                )
+            )
+            print(f"inserted {NUM_ROWS} synthetic spend logs in {insert_time:.2f}s")
+
+            backfill_time = await _timed(
+                backfill_spend_rollups(
+                    prisma_client=prisma_client,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+            )
+            print(f"backfilled rollups in {backfill_time:.2f}s")
+
+            raw_time = await _timed(
+                db.query_raw(
+                    RAW_TOP_MODELS_QUERY, start_date.isoformat(), end_date.isoformat()
+                )
+            )
+            rollup_time = await _timed(
+                get_top_entities_by_spend(
+                    prisma_client=prisma_client,
+                    entity_type="model",
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=10,
+                )
+            )
+            print(
+                f"top models - raw spend logs: {raw_time * 1000:.1f}ms, rollups: {rollup_time * 1000:.1f}ms"
+            )
+            assert rollup_time < raw_time
+        finally:
+            await db.execute_raw(
+                """DELETE FROM "LiteLLM_SpendLogs" WHERE request_id LIKE 'benchmark-%';"""
+            )
+            await db.execute_raw(
+                """DELETE FROM "LiteLLM_SpendRollups" WHERE bucket_start >= $1::timestamp AND bucket_start < $2::timestamp;""",
+                start_date.isoformat(),
+                end_date.isoformat(),
+            )
+            await db.disconnect()
+
+    asyncio.run(run())
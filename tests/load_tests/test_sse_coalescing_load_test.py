@@ -0,0 +1,91 @@
+"""
+Benchmark proxy CPU per 1k streamed tokens - 1 ASGI message per SSE event vs. coalescing SSE events (`stream_coalescing_window_ms`).
+
+A uvicorn server streams events from a fast mock upstream (bursts of tokens, like Groq / Cerebras / vLLM). CPU time is measured on the server's event loop thread.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from litellm.proxy.common_utils.sse_coalescing import coalesce_sse_stream
+
+NUM_TOKENS = int(os.getenv("SSE_COALESCING_BENCHMARK_TOKENS", 20000))
+TOKENS_PER_BURST = 20
+WINDOW_MS = [0, 5, 20]
+
+
+async def _fast_upstream():
+    for i in range(NUM_TOKENS):
+        if i % TOKENS_PER_BURST == 0:
+            await asyncio.sleep(0.001)
+        chunk = {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "llama-3.1-8b",
+            "choices": [{"index": 0, "delta": {"content": f" tok{i}"}}],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+
+
+async def _stream(request: Request):
+    window_ms = float(request.query_params["window_ms"])
+    generator = _fast_upstream()
+    if window_ms > 0:
+        generator = coalesce_sse_stream(generator, window_ms=window_ms)
+    return StreamingResponse(generator, media_type="text/event-stream")
+
+
+async def _cpu(request: Request):
+    # runs on the server's event loop thread
+    return JSONResponse({"thread_time": time.thread_time()})
+
+
+def _start_server() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    app = Starlette(routes=[Route("/stream", _stream), Route("/cpu", _cpu)])
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def test_sse_coalescing_cpu_per_1k_tokens():
+    base_url = _start_server()
+    cpu_per_1k_tokens = {}
+    with httpx.Client(base_url=base_url, timeout=60) as client:
+        for window_ms in WINDOW_MS:
+            start_cpu = client.get("/cpu").json()["thread_time"]
+            num_messages = 0
+            received = 0
+            with client.stream("GET", "/stream", params={"window_ms": window_ms}) as r:
+                for text in r.iter_text():
+                    received += text.count("data: ")
+                    num_messages += 1
+            end_cpu = client.get("/cpu").json()["thread_time"]
+            assert received == NUM_TOKENS
+            cpu_per_1k_tokens[window_ms] = (end_cpu - start_cpu) / NUM_TOKENS * 1000
+            print(
+                f"window={window_ms}ms: {cpu_per_1k_tokens[window_ms] * 1000:.1f}ms proxy CPU / 1k tokens, "
+                f"{num_messages} reads for {NUM_TOKENS} events"
+            )
+    assert cpu_per_1k_tokens[5] < cpu_per_1k_tokens[0]
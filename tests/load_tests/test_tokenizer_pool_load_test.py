@@ -0,0 +1,100 @@
+"""
+Benchmark huggingface tokenizer loading - the first token count for a model, loaded on the request path vs. preloaded from `tokenizer_cache_dir`, loading several models with the same tokenizer, and `encode_batch`.
+
+The bundled anthropic tokenizer is saved to a temp cache dir as the llama-3 tokenizer - no huggingface hub access needed.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from tokenizers import Tokenizer
+
+import litellm
+from litellm.litellm_core_utils.tokenizer_registry import tokenizer_registry
+from litellm.utils import (
+    _select_tokenizer_helper,
+    claude_json_str,
+    load_tokenizers,
+    token_counter,
+)
+
+NUM_MODELS = int(os.getenv("TOKENIZER_POOL_BENCHMARK_MODELS", 4))
+NUM_TEXTS = int(os.getenv("TOKENIZER_POOL_BENCHMARK_TEXTS", 2000))
+MODELS = [f"llama-3-{i}b-instruct" for i in range(NUM_MODELS)]
+
+
+def _clear_tokenizers():
+    tokenizer_registry.clear()
+    _select_tokenizer_helper.cache_clear()
+
+
+def _load_per_model():
+    """
+    Before the registry - every model loaded its own copy of the tokenizer
+    """
+    return [Tokenizer.from_str(claude_json_str) for _ in MODELS]
+
+
+def test_tokenizer_pool(monkeypatch):
+    cache_dir = tempfile.mkdtemp()
+    Tokenizer.from_str(claude_json_str).save(
+        os.path.join(cache_dir, "Xenova--llama-3-tokenizer.json")
+    )
+    monkeypatch.setattr(litellm, "tokenizer_cache_dir", cache_dir)
+    monkeypatch.setattr(litellm, "disable_hf_tokenizer_download", True)
+
+    ## first request for a model - tokenizer loaded on the request path vs. preloaded
+    _clear_tokenizers()
+    start = time.perf_counter()
+    token_counter(model=MODELS[0], text="hello world")
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    _clear_tokenizers()
+    load_tokenizers(models=MODELS)
+    start = time.perf_counter()
+    token_counter(model=MODELS[0], text="hello world")
+    preloaded_ms = (time.perf_counter() - start) * 1000
+    print(
+        f"first token count - tokenizer loaded on the request path: {cold_ms:.1f}ms, preloaded: {preloaded_ms:.1f}ms"
+    )
+    assert preloaded_ms * 10 < cold_ms
+
+    ## several models with the same tokenizer - 1 tokenizer per model vs. 1 shared tokenizer
+    start = time.perf_counter()
+    per_model_tokenizers = _load_per_model()
+    per_model_load_s = time.perf_counter() - start
+    del per_model_tokenizers
+
+    _clear_tokenizers()
+    start = time.perf_counter()
+    load_tokenizers(models=MODELS)
+    shared_load_s = time.perf_counter() - start
+    tokenizers = {id(_select_tokenizer_helper(model)["tokenizer"]) for model in MODELS}
+    print(
+        f"{NUM_MODELS} models - 1 tokenizer per model: {per_model_load_s * 1000:.0f}ms, shared tokenizer: {shared_load_s * 1000:.0f}ms"
+    )
+    # 1 copy of the vocab + merges in memory, instead of 1 per model
+    assert len(tokenizers) == 1
+    assert shared_load_s * 2 < per_model_load_s
+
+    ## encode_batch vs. encode per text
+    texts = [
+        f"message {i} - " + "lorem ipsum dolor sit amet " * 20 for i in range(NUM_TEXTS)
+    ]
+    start = time.perf_counter()
+    encoded = [litellm.encode(model=MODELS[0], text=text) for text in texts]
+    loop_s = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_encoded = litellm.encode_batch(model=MODELS[0], texts=texts)
+    batch_s = time.perf_counter() - start
+    print(
+        f"{NUM_TEXTS} texts, {os.cpu_count()} cpus - encode per text: {loop_s * 1000:.0f}ms, encode_batch: {batch_s * 1000:.0f}ms"
+    )
+    assert [e.ids for e in batch_encoded] == [e.ids for e in encoded]
+    if (os.cpu_count() or 1) > 1:
+        assert batch_s < loop_s
+    _clear_tokenizers()
@@ -0,0 +1,63 @@
+"""
+Benchmark trimming long chat histories - re-counting the tokens of the whole candidate list for every added message (previous implementation) vs. `MessageTrimmer` (every message tokenized once + prefix sums).
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.litellm_core_utils.message_trimming import MessageTrimmer
+from litellm.utils import get_token_count
+
+MODEL = "gpt-4-0613"
+NUM_MESSAGES = [
+    int(num)
+    for num in os.getenv("TRIM_MESSAGES_BENCHMARK_MESSAGES", "100,400,800").split(",")
+]
+
+
+def _get_messages(num_messages: int) -> list:
+    return [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"message {i} "
+            + "the quick brown fox jumps over the lazy dog " * 20,
+        }
+        for i in range(num_messages)
+    ]
+
+
+def _legacy_trim(messages: list, max_tokens: int) -> list:
+    # most recent messages first, the whole candidate list is re-counted for every message
+    final_messages: list = []
+    for message in reversed(messages):
+        if get_token_count([message] + final_messages, model=MODEL) > max_tokens:
+            break
+        final_messages = [message] + final_messages
+    return final_messages
+
+
+def test_trim_messages_latency():
+    for num_messages in NUM_MESSAGES:
+        messages = _get_messages(num_messages)
+        max_tokens = get_token_count(messages, model=MODEL) // 2
+
+        start = time.perf_counter()
+        legacy_messages = _legacy_trim(messages=messages, max_tokens=max_tokens)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        trimmed_messages, _ = MessageTrimmer(model=MODEL).trim(
+            messages=messages, max_tokens=max_tokens
+        )
+        new_seconds = time.perf_counter() - start
+
+        print(
+            f"{num_messages} messages, trimmed to {max_tokens} tokens - "
+            f"re-counting: {legacy_seconds * 1000:.0f}ms ({len(legacy_messages)} kept); "
+            f"MessageTrimmer: {new_seconds * 1000:.0f}ms ({len(trimmed_messages)} kept)"
+        )
+        assert get_token_count(trimmed_messages, model=MODEL) <= max_tokens
+        assert new_seconds < legacy_seconds
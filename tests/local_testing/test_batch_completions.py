@@ -1,6 +1,7 @@
 #### What this tests ####
 #    This tests calling batch_completions by running 100 messages together
 
+import asyncio
 import sys, os
 import traceback
 import pytest
@@ -87,3 +88,96 @@ def test_batch_completion_models_all_responses():
 
 
 # test_batch_completion_models_all_responses()
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_partial_failures():
+    messages = [[{"role": "user", "content": f"hi {i}"}] for i in range(20)]
+    responses = await litellm.abatch_completion(
+        model="gpt-3.5-turbo",
+        messages=messages,
+        mock_response="Hello!",
+    )
+    assert len(responses) == 20
+    for response in responses:
+        assert response.choices[0].message.content == "Hello!"
+
+    responses = await litellm.abatch_completion(
+        model="gpt-3.5-turbo",
+        messages=messages[:2],
+        api_key="sk_xxx",  # deliberately set invalid key
+        api_base="http://localhost:1",
+        max_retries=0,
+    )
+    assert len(responses) == 2
+    for response in responses:
+        assert isinstance(response, Exception)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_abatch_completion_iter(monkeypatch, ordered):
+    """
+    requests that got rate limited are retried, results are yielded in order (or as they complete)
+    """
+    attempts = {}
+
+    async def _mock_acompletion(model, messages, **kwargs):
+        index = int(messages[0]["content"])
+        attempts[index] = attempts.get(index, 0) + 1
+        if index % 2 == 0 and attempts[index] == 1:
+            raise litellm.RateLimitError(
+                message="rate limited", llm_provider="openai", model=model
+            )
+        if index == 3:
+            raise litellm.BadRequestError(
+                message="bad request", llm_provider="openai", model=model
+            )
+        # later requests finish first
+        await asyncio.sleep(0.01 * (10 - index))
+        return litellm.ModelResponse(id=str(index))
+
+    monkeypatch.setattr(litellm, "acompletion", _mock_acompletion)
+    results = [
+        result
+        async for result in litellm.abatch_completion_iter(
+            model="gpt-3.5-turbo",
+            messages=[[{"role": "user", "content": str(i)}] for i in range(10)],
+            ordered=ordered,
+        )
+    ]
+    indices = [index for index, _ in results]
+    assert sorted(indices) == list(range(10))
+    if ordered:
+        assert indices == list(range(10))
+    else:
+        assert indices != list(range(10))
+    for index, result in results:
+        if index == 3:
+            assert isinstance(result, litellm.BadRequestError)
+        else:
+            assert result.id == str(index)
+    assert all(attempts[index] == 2 for index in range(0, 10, 2))
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_models(monkeypatch):
+    async def _mock_acompletion(model, messages, **kwargs):
+        if model == "failing-model":
+            raise litellm.APIConnectionError(
+                message="failed", llm_provider="openai", model=model
+            )
+        await asyncio.sleep(0.01 if model == "fast-model" else 1)
+        return litellm.ModelResponse(model=model)
+
+    monkeypatch.setattr(litellm, "acompletion", _mock_acompletion)
+    messages = [{"role": "user", "content": "Hey, how's it going"}]
+    response = await litellm.abatch_completion_models(
+        models=["failing-model", "slow-model", "fast-model"], messages=messages
+    )
+    assert response.model == "fast-model"
+
+    responses = await litellm.abatch_completion_models_all_responses(
+        models=["failing-model", "fast-model"], messages=messages
+    )
+    assert [response.model for response in responses] == ["fast-model"]
@@ -0,0 +1,264 @@
+"""
+Parity tests - `batch_cost_per_token()` vs. `cost_per_token()`
+"""
+
+import math
+import os
+import random
+import sys
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import pytest
+
+import litellm
+from litellm import batch_cost_per_token, cost_per_token
+from litellm.litellm_core_utils.llm_cost_calc.batch_cost_calculator import (
+    batch_cost_per_token_from_standard_logging_payloads,
+)
+from litellm.types.utils import (
+    CompletionTokensDetailsWrapper,
+    PromptTokensDetailsWrapper,
+    Usage,
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(autouse=True)
+def local_model_cost_map(monkeypatch):
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    monkeypatch.setattr(litellm, "model_cost", litellm.get_model_cost_map(url=""))
+
+
+def _get_chat_models():
+    return sorted(
+        model
+        for model, model_info in litellm.model_cost.items()
+        if model_info.get("mode") == "chat"
+        and model_info.get("litellm_provider") is not None
+    )
+
+
+def _scalar_cost(**kwargs):
+    try:
+        return cost_per_token(**kwargs)
+    except Exception:
+        return (math.nan, math.nan)
+
+
+def _assert_parity(batch_costs, scalar_costs):
+    prompt_costs, completion_costs = batch_costs
+    for row_index, (prompt_cost, completion_cost) in enumerate(scalar_costs):
+        for batch_cost, scalar_cost in (
+            (prompt_costs[row_index], prompt_cost),
+            (completion_costs[row_index], completion_cost),
+        ):
+            if math.isnan(scalar_cost):
+                assert math.isnan(batch_cost), row_index
+            else:
+                assert batch_cost == pytest.approx(
+                    scalar_cost, rel=1e-12, abs=1e-15
+                ), row_index
+
+
+@pytest.mark.parametrize("with_provider", [True, False])
+def test_batch_cost_per_token_parity_all_chat_models(with_provider):
+    """
+    Every chat model in the model cost map, with cached + cache creation tokens and > 128k token tiers
+    """
+    random.seed(42)
+    models = []
+    custom_llm_providers = []
+    rows = []
+    for model in _get_chat_models():
+        for _ in range(3):
+            prompt_tokens = random.choice([0, 10, 1000, 150000])
+            rows.append(
+                dict(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=random.choice([0, 20, 2000, 130000]),
+                    cache_read_input_tokens=random.randint(0, prompt_tokens),
+                    cache_creation_input_tokens=random.choice([0, 100]),
+                    response_time_ms=random.choice([0.0, 1500.0]),
+                )
+            )
+            models.append(model)
+            custom_llm_providers.append(
+                litellm.model_cost[model]["litellm_provider"] if with_provider else None
+            )
+
+    batch_costs = batch_cost_per_token(
+        models=models,
+        custom_llm_providers=custom_llm_providers,
+        prompt_tokens=[row["prompt_tokens"] for row in rows],
+        completion_tokens=[row["completion_tokens"] for row in rows],
+        cache_read_input_tokens=[row["cache_read_input_tokens"] for row in rows],
+        cache_creation_input_tokens=[
+            row["cache_creation_input_tokens"] for row in rows
+        ],
+        response_time_ms=[row["response_time_ms"] for row in rows],
+    )
+    scalar_costs = [
+        _scalar_cost(model=model, custom_llm_provider=custom_llm_provider, **row)
+        for model, custom_llm_provider, row in zip(models, custom_llm_providers, rows)
+    ]
+    _assert_parity(batch_costs, scalar_costs)
+    # most chat models are priced
+    assert np.isfinite(batch_costs[0]).sum() > len(models) * 0.5
+
+
+def test_batch_cost_per_token_parity_audio_tokens():
+    models = ["gpt-4o-audio-preview", "gpt-4o-audio-preview", "gpt-4o"]
+    prompt_audio_tokens = [100, 0, 50]
+    completion_audio_tokens = [200, 0, 0]
+    batch_costs = batch_cost_per_token(
+        models=models,
+        custom_llm_providers=["openai"] * 3,
+        prompt_tokens=[1000, 500, 300],
+        completion_tokens=[400, 100, 100],
+        cache_read_input_tokens=[0, 100, 0],
+        prompt_audio_tokens=prompt_audio_tokens,
+        completion_audio_tokens=completion_audio_tokens,
+    )
+    scalar_costs = [
+        cost_per_token(
+            model=models[0],
+            custom_llm_provider="openai",
+            usage_object=Usage(
+                prompt_tokens=1000,
+                completion_tokens=400,
+                prompt_tokens_details=PromptTokensDetailsWrapper(audio_tokens=100),
+                completion_tokens_details=CompletionTokensDetailsWrapper(
+                    audio_tokens=200
+                ),
+            ),
+        ),
+        cost_per_token(
+            model=models[1],
+            custom_llm_provider="openai",
+            prompt_tokens=500,
+            completion_tokens=100,
+            cache_read_input_tokens=100,
+        ),
+        cost_per_token(
+            model=models[2],
+            custom_llm_provider="openai",
+            usage_object=Usage(
+                prompt_tokens=300,
+                completion_tokens=100,
+                prompt_tokens_details=PromptTokensDetailsWrapper(audio_tokens=50),
+            ),
+        ),
+    ]
+    _assert_parity(batch_costs, scalar_costs)
+    assert batch_costs[0][0] > batch_costs[0][2]
+
+
+def test_batch_cost_per_token_unmapped_model():
+    prompt_costs, completion_costs = batch_cost_per_token(
+        models=["gpt-4o", "my-unmapped-model"],
+        custom_llm_providers=["openai", "openai"],
+        prompt_tokens=[10, 10],
+        completion_tokens=[10, 10],
+    )
+    assert prompt_costs[0] > 0
+    assert math.isnan(prompt_costs[1])
+    assert math.isnan(completion_costs[1])
+
+
+def test_batch_cost_per_token_column_length_mismatch():
+    with pytest.raises(ValueError):
+        batch_cost_per_token(
+            models=["gpt-4o", "gpt-4o"],
+            prompt_tokens=[10],
+            completion_tokens=[10, 10],
+        )
+
+
+def test_batch_cost_per_token_from_standard_logging_payloads():
+    payloads = [
+        {
+            "model": "claude-3-5-sonnet-20240620",
+            "custom_llm_provider": "anthropic",
+            "prompt_tokens": 2000,
+            "completion_tokens": 100,
+            "response_time": 1.2,
+            "response": {
+                "usage": {
+                    "prompt_tokens": 2000,
+                    "completion_tokens": 100,
+                    "prompt_tokens_details": {"cached_tokens": 1500},
+                    "cache_creation_input_tokens": 300,
+                }
+            },
+        },
+        {
+            "model": "gpt-4o",
+            "custom_llm_provider": "openai",
+            "prompt_tokens": 100,
+            "completion_tokens": 50,
+            "response_time": 0.5,
+            "response": None,
+        },
+    ]
+    (
+        prompt_costs,
+        completion_costs,
+    ) = batch_cost_per_token_from_standard_logging_payloads(
+        payloads  # type: ignore
+    )
+    expected = [
+        cost_per_token(
+            model="claude-3-5-sonnet-20240620",
+            custom_llm_provider="anthropic",
+            prompt_tokens=2000,
+            completion_tokens=100,
+            cache_read_input_tokens=1500,
+            cache_creation_input_tokens=300,
+        ),
+        cost_per_token(
+            model="gpt-4o",
+            custom_llm_provider="openai",
+            prompt_tokens=100,
+            completion_tokens=50,
+        ),
+    ]
+    _assert_parity((prompt_costs, completion_costs), expected)
+
+
+def test_batch_cost_per_token_without_numpy(monkeypatch):
+    """
+    NumPy is optional - without it, rows are priced with `cost_per_token()` and the results match
+    """
+    kwargs = dict(
+        models=[
+            "gpt-4o-audio-preview",
+            "claude-3-5-sonnet-20240620",
+            "gpt-4o",
+            "my-unmapped-model",
+        ],
+        custom_llm_providers=["openai", "anthropic", None, "openai"],
+        prompt_tokens=[1000, 2000, 300, 10],
+        completion_tokens=[400, 100, 100, 10],
+        cache_read_input_tokens=[0, 1500, 100, 0],
+        cache_creation_input_tokens=[0, 300, 0, 0],
+        prompt_audio_tokens=[100, 0, 0, 0],
+        completion_audio_tokens=[200, 0, 0, 0],
+    )
+    batch_costs = batch_cost_per_token(**kwargs)  # type: ignore
+
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    scalar_prompt_costs, scalar_completion_costs = batch_cost_per_token(**kwargs)  # type: ignore
+
+    assert isinstance(scalar_prompt_costs, list)
+    _assert_parity(batch_costs, zip(scalar_prompt_costs, scalar_completion_costs))
+
+    with pytest.raises(ValueError):
+        batch_cost_per_token(
+            models=["gpt-4o", "gpt-4o"],
+            prompt_tokens=[10],
+            completion_tokens=[10, 10],
+        )
@@ -348,3 +348,227 @@ async def test_health_check_bad_model():
         assert (
             end_time - start_time < 2
         ), "Health check took longer than health_check_timeout"
+
+
+def _get_health_check_model_list(num_deployments: int) -> list:
+    return [
+        {
+            "model_name": f"model-{i}",
+            "litellm_params": {"model": f"openai/model-{i}", "api_key": "sk-1234"},
+            "model_info": {"id": f"deployment-{i}"},
+        }
+        for i in range(num_deployments)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_perform_health_check_max_concurrency():
+    from litellm.proxy.health_check import _perform_health_check
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_health_check(litellm_params, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {}
+
+    with patch("litellm.ahealth_check", side_effect=mock_health_check):
+        healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
+            _get_health_check_model_list(10), max_concurrency=3
+        )
+
+    assert len(healthy_endpoints) == 10
+    assert len(unhealthy_endpoints) == 0
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_perform_health_check_not_limited_by_default():
+    """
+    the on-demand /health checks all deployments at once - only the background health checks are limited
+    """
+    from litellm.proxy.health_check import perform_health_check
+    from litellm.proxy.health_check_scheduler import HealthCheckScheduler
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_health_check(litellm_params, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {}
+
+    model_list = _get_health_check_model_list(20)
+    # deployments without an id are skipped
+    model_list.append(
+        {"model_name": "no-id", "litellm_params": {"model": "openai/no-id"}}
+    )
+    with patch("litellm.ahealth_check", side_effect=mock_health_check):
+        healthy_endpoints, _ = await perform_health_check(model_list)
+        assert len(healthy_endpoints) == 20
+        assert max_in_flight == 20
+
+        max_in_flight = 0
+        scheduler = HealthCheckScheduler(
+            model_list=model_list, interval=60, max_concurrency=3
+        )
+        assert len(scheduler.deployments) == 20
+        for state in scheduler.deployments.values():
+            state.next_check_time = 0
+        await scheduler.run_due_checks()
+        assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_health_check_scheduler_passive_health_checks():
+    """
+    Deployments that served requests since their last check get their health from those requests - only idle deployments are called
+    """
+    from litellm.proxy.health_check_scheduler import HealthCheckScheduler
+
+    scheduler = HealthCheckScheduler(
+        model_list=_get_health_check_model_list(3), interval=60
+    )
+    await scheduler.async_log_success_event(
+        kwargs={"litellm_params": {"model_info": {"id": "deployment-0"}}},
+        response_obj=None,
+        start_time=None,
+        end_time=None,
+    )
+    await scheduler.async_log_failure_event(
+        kwargs={
+            "litellm_params": {"model_info": {"id": "deployment-1"}},
+            "exception": litellm.InternalServerError(
+                message="overloaded", llm_provider="openai", model="model-1"
+            ),
+        },
+        response_obj=None,
+        start_time=None,
+        end_time=None,
+    )
+    for state in scheduler.deployments.values():
+        state.next_check_time = 0
+
+    mock_health_check = AsyncMock(return_value={})
+    with patch("litellm.ahealth_check", mock_health_check):
+        num_active_checks = await scheduler.run_due_checks()
+
+    assert num_active_checks == 1
+    assert mock_health_check.call_count == 1
+    assert mock_health_check.call_args.args[0]["model"] == "openai/model-2"
+
+    results = scheduler.get_health_check_results()
+    assert results["healthy_count"] == 2
+    assert results["unhealthy_count"] == 1
+    assert results["unhealthy_endpoints"][0]["model"] == "openai/model-1"
+    assert results["unhealthy_endpoints"][0]["health_check_source"] == "passive"
+
+
+@pytest.mark.asyncio
+async def test_health_check_scheduler_ignores_request_errors():
+    from litellm.proxy.health_check_scheduler import HealthCheckScheduler
+
+    scheduler = HealthCheckScheduler(
+        model_list=_get_health_check_model_list(1), interval=60
+    )
+    await scheduler.async_log_failure_event(
+        kwargs={
+            "litellm_params": {"model_info": {"id": "deployment-0"}},
+            "exception": litellm.BadRequestError(
+                message="bad request", llm_provider="openai", model="model-0"
+            ),
+        },
+        response_obj=None,
+        start_time=None,
+        end_time=None,
+    )
+    scheduler.deployments["deployment-0"].next_check_time = 0
+
+    with patch("litellm.ahealth_check", AsyncMock(return_value={})):
+        num_active_checks = await scheduler.run_due_checks()
+
+    assert num_active_checks == 1
+    assert scheduler.get_health_check_results()["healthy_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_health_check_scheduler_jitter():
+    import time
+
+    from litellm.proxy.health_check_scheduler import HealthCheckScheduler
+
+    model_list = _get_health_check_model_list(20)
+    model_list[0]["model_info"]["health_check_interval"] = 10
+    scheduler = HealthCheckScheduler(model_list=model_list, interval=100, jitter=0.2)
+
+    # first checks are spread over the first 20% of the interval
+    first_check_times = [
+        state.next_check_time - scheduler.started_at
+        for state in scheduler.deployments.values()
+    ]
+    assert all(0 <= t <= 100 * 0.2 for t in first_check_times)
+    assert len(set(first_check_times)) > 1
+
+    for state in scheduler.deployments.values():
+        state.next_check_time = 0
+    with patch("litellm.ahealth_check", AsyncMock(return_value={})):
+        assert await scheduler.run_due_checks() == 20
+    now = time.time()
+    for deployment_id, state in scheduler.deployments.items():
+        interval = 10 if deployment_id == "deployment-0" else 100
+        assert interval * 0.8 - 1 <= state.next_check_time - now <= interval * 1.2
+
+    # nothing is due until the next interval
+    with patch("litellm.ahealth_check", AsyncMock(return_value={})):
+        assert await scheduler.run_due_checks() == 0
+
+
+@pytest.mark.asyncio
+async def test_health_check_scheduler_shared_results():
+    """
+    Results another worker wrote to redis are used, instead of checking the deployment again
+    """
+    import time
+
+    from litellm.proxy.health_check_scheduler import HealthCheckScheduler
+
+    redis_cache = AsyncMock()
+    redis_cache.async_batch_get_cache.return_value = {
+        "litellm:health_check:deployment-0": {
+            "checked_at": time.time(),
+            "is_healthy": False,
+            "endpoint_data": {"model": "openai/model-0", "error": "down"},
+        },
+        "litellm:health_check:deployment-1": None,
+    }
+    scheduler = HealthCheckScheduler(
+        model_list=_get_health_check_model_list(2),
+        interval=60,
+        redis_cache=redis_cache,
+    )
+    for state in scheduler.deployments.values():
+        state.next_check_time = 0
+
+    mock_health_check = AsyncMock(return_value={})
+    with patch("litellm.ahealth_check", mock_health_check):
+        num_active_checks = await scheduler.run_due_checks()
+
+    assert num_active_checks == 1
+    assert mock_health_check.call_args.args[0]["model"] == "openai/model-1"
+    results = scheduler.get_health_check_results()
+    assert results["healthy_count"] == 1
+    assert results["unhealthy_endpoints"] == [
+        {"model": "openai/model-0", "error": "down"}
+    ]
+
+    # only the result this worker computed is shared
+    cache_list = redis_cache.async_set_cache_pipeline.call_args.kwargs["cache_list"]
+    assert [key for key, _ in cache_list] == ["litellm:health_check:deployment-1"]
+    assert cache_list[0][1]["is_healthy"] is True
@@ -735,3 +735,229 @@ async def test_tag_budgets_e2e_test_expect_to_fail():
             metadata={"tags": [TAG_NAME_2]},
         )
         print(response)
+
+
+@pytest.mark.asyncio
+async def test_filter_deployments_reads_local_spend_table():
+    """
+    Budget filtering should not do any cache / Redis reads per request - spend is read from the local spend table
+    """
+    from unittest.mock import AsyncMock
+
+    provider_budget = RouterBudgetLimiting(
+        dual_cache=DualCache(),
+        provider_budget_config={
+            "openai": BudgetConfig(time_period="1d", budget_limit=1),
+            "anthropic": BudgetConfig(time_period="1d", budget_limit=1),
+        },
+    )
+    provider_budget.dual_cache.async_batch_get_cache = AsyncMock()
+    provider_budget.dual_cache.async_get_cache = AsyncMock()
+
+    await provider_budget._increment_spend_in_current_window(
+        spend_key="provider_spend:openai:1d", response_cost=2.0, ttl=86400
+    )
+
+    deployments = [
+        {"model_name": "gpt-4o", "litellm_params": {"model": "openai/gpt-4o"}},
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "anthropic/claude-3-5-sonnet-20240620"},
+        },
+    ]
+    filtered_deployments = await provider_budget.async_filter_deployments(
+        model="gpt-4o", healthy_deployments=deployments, messages=[]
+    )
+
+    assert filtered_deployments == [deployments[1]]
+    provider_budget.dual_cache.async_batch_get_cache.assert_not_called()
+    provider_budget.dual_cache.async_get_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sync_pushes_one_increment_per_spend_key():
+    """
+    Increments are accumulated per key, pushed with a single pipeline and reconciled with the remote totals
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    redis_cache = MagicMock()
+    redis_cache.async_increment_pipeline = AsyncMock(return_value=[5.0])
+    redis_cache.async_batch_get_cache = AsyncMock(
+        return_value={"provider_spend:openai:1d": 7.0}
+    )
+    provider_budget = RouterBudgetLimiting(
+        dual_cache=DualCache(redis_cache=redis_cache),
+        provider_budget_config={
+            "openai": BudgetConfig(time_period="1d", budget_limit=100),
+        },
+    )
+    assert provider_budget.get_spend_staleness_seconds() is None
+
+    for _ in range(3):
+        await provider_budget._increment_spend_in_current_window(
+            spend_key="provider_spend:openai:1d", response_cost=1.0, ttl=86400
+        )
+    assert provider_budget.spend_table.get_spend("provider_spend:openai:1d") == 3.0
+
+    await provider_budget._sync_in_memory_spend_with_redis()
+
+    redis_cache.async_increment_pipeline.assert_called_once()
+    increment_list = redis_cache.async_increment_pipeline.call_args.kwargs[
+        "increment_list"
+    ]
+    assert len(increment_list) == 1
+    assert increment_list[0]["increment_value"] == 3.0
+    assert provider_budget.redis_increment_operation_queue == []
+
+    # remote total includes spend from other instances
+    assert provider_budget.spend_table.get_spend("provider_spend:openai:1d") == 7.0
+    assert provider_budget.get_spend_staleness_seconds() < 1
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_increments_if_redis_push_fails():
+    from unittest.mock import AsyncMock, MagicMock
+
+    redis_cache = MagicMock()
+    redis_cache.async_increment_pipeline = AsyncMock(
+        side_effect=Exception("redis down")
+    )
+    redis_cache.async_batch_get_cache = AsyncMock(return_value={})
+    provider_budget = RouterBudgetLimiting(
+        dual_cache=DualCache(redis_cache=redis_cache),
+        provider_budget_config={
+            "openai": BudgetConfig(time_period="1d", budget_limit=100),
+        },
+    )
+    await provider_budget._increment_spend_in_current_window(
+        spend_key="provider_spend:openai:1d", response_cost=1.5, ttl=86400
+    )
+
+    await provider_budget._push_in_memory_increments_to_redis()
+
+    assert len(provider_budget.redis_increment_operation_queue) == 1
+    assert provider_budget.redis_increment_operation_queue[0]["increment_value"] == 1.5
+    assert provider_budget.spend_table.get_spend("provider_spend:openai:1d") == 1.5
+
+
+def test_budget_spend_table_window_expiry():
+    from litellm.router_utils.budget_spend_table import BudgetSpendTable
+
+    spend_table = BudgetSpendTable()
+    spend_table.increment(key="tag_spend:prod:1d", increment_value=2.0, ttl=86400)
+    spend_table.set_window_spend(key="tag_spend:dev:1s", spend=3.0, ttl=-1)
+
+    assert spend_table.get_spend("tag_spend:prod:1d") == 2.0
+    # window ended - spend resets
+    assert spend_table.get_spend("tag_spend:dev:1s") == 0.0
+    assert spend_table.get_spend("tag_spend:unknown:1d") == 0.0
+
+    # key expired in redis (e.g. window reset by another instance) - only unpushed spend is kept
+    spend_table.set_remote_spend(key="tag_spend:prod:1d", remote_spend=None, ttl=86400)
+    assert spend_table.get_spend("tag_spend:prod:1d") == 2.0
+    spend_table.pop_pending_increments()
+    spend_table.set_remote_spend(key="tag_spend:prod:1d", remote_spend=None, ttl=86400)
+    assert spend_table.get_spend("tag_spend:prod:1d") == 0.0
+
+
+def test_budget_spend_table_evicts_ended_windows():
+    """
+    Entries of ended windows are evicted even if they are never read again
+    """
+    from litellm.router_utils import budget_spend_table
+    from litellm.router_utils.budget_spend_table import BudgetSpendTable
+
+    spend_table = BudgetSpendTable()
+    spend_table.set_window_spend(
+        key="virtual_key_spend:key-1:gpt-4o:1d", spend=1.0, ttl=-1
+    )
+    spend_table.set_window_spend(
+        key="virtual_key_spend:key-2:gpt-4o:1d", spend=1.0, ttl=60
+    )
+    assert len(spend_table._entries) == 2
+
+    spend_table._next_eviction_at = 0.0
+    spend_table.increment(
+        key="virtual_key_spend:key-3:gpt-4o:1d", increment_value=1.0, ttl=60
+    )
+    assert set(spend_table._entries) == {
+        "virtual_key_spend:key-2:gpt-4o:1d",
+        "virtual_key_spend:key-3:gpt-4o:1d",
+    }
+    assert spend_table._next_eviction_at > budget_spend_table.EVICTION_INTERVAL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_sync_uses_remaining_window_ttl_for_new_entries():
+    """
+    A window started on another instance ends when its key expires in Redis - not a full window after the sync
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    redis_cache = MagicMock()
+    redis_cache.async_increment_pipeline = AsyncMock()
+    redis_cache.async_batch_get_cache = AsyncMock(
+        return_value={"provider_spend:openai:1d": 5.0}
+    )
+    redis_cache.async_get_ttl = AsyncMock(return_value=120)
+    provider_budget = RouterBudgetLimiting(
+        dual_cache=DualCache(redis_cache=redis_cache),
+        provider_budget_config={
+            "openai": BudgetConfig(time_period="1d", budget_limit=100),
+        },
+    )
+
+    await provider_budget._sync_in_memory_spend_with_redis()
+
+    redis_cache.async_get_ttl.assert_called_once_with("provider_spend:openai:1d")
+    entry = provider_budget.spend_table._entries["provider_spend:openai:1d"]
+    assert entry.spend == 5.0
+    assert 0 < entry.expires_at - time.time() <= 120
+
+    # existing windows keep their end - no TTL lookup per sync
+    await provider_budget._sync_in_memory_spend_with_redis()
+    redis_cache.async_get_ttl.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_filter_deployments_loads_spend_from_redis_on_cold_start():
+    """
+    On a cold start the spend from Redis is loaded before the first budget check
+    """
+    from unittest.mock import AsyncMock, MagicMock
+
+    redis_cache = MagicMock()
+    redis_cache.async_increment_pipeline = AsyncMock()
+    redis_cache.async_batch_get_cache = AsyncMock(
+        return_value={"provider_spend:openai:1d": 5.0}
+    )
+    redis_cache.async_get_ttl = AsyncMock(return_value=3600)
+    provider_budget = RouterBudgetLimiting(
+        dual_cache=DualCache(redis_cache=redis_cache),
+        provider_budget_config={
+            "openai": BudgetConfig(time_period="1d", budget_limit=1),
+        },
+    )
+    assert provider_budget.get_spend_staleness_seconds() is None
+
+    deployments = [
+        {"model_name": "gpt-4o", "litellm_params": {"model": "openai/gpt-4o"}},
+    ]
+    with pytest.raises(ValueError) as exc_info:
+        await provider_budget.async_filter_deployments(
+            model="gpt-4o", healthy_deployments=deployments, messages=[]
+        )
+
+    assert (
+        "Exceeded budget for provider openai: 5.0 >= 1.0. spend_staleness_seconds="
+        in str(exc_info.value)
+    )
+    redis_cache.async_batch_get_cache.assert_called_once()
+
+    # later requests rely on the periodic sync
+    with pytest.raises(ValueError):
+        await provider_budget.async_filter_deployments(
+            model="gpt-4o", healthy_deployments=deployments, messages=[]
+        )
+    redis_cache.async_batch_get_cache.assert_called_once()
@@ -0,0 +1,278 @@
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import pytest
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.shared_memory_cache import (
+    SHARED_MEMORY_CACHE_PATH_ENV,
+    SharedMemoryCache,
+    _shared_memory_tables,
+    get_shared_memory_cache,
+    setup_shared_memory_cache_path,
+)
+from litellm.proxy._types import UserAPIKeyAuth
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="shared-memory cache requires fcntl"
+)
+
+
+@pytest.fixture
+def shared_memory_cache_path(tmp_path):
+    path = str(tmp_path / "shared_cache")
+    yield path
+    table = _shared_memory_tables.pop(path, None)
+    if table is not None:
+        table.close()
+
+
+def _set_in_worker(path: str):
+    cache = SharedMemoryCache(path=path, namespace="user_api_key_cache")
+    cache.set_cache(
+        "hashed-token", UserAPIKeyAuth(token="hashed-token", spend=1.5), ttl=60
+    )
+
+
+def _increment_in_worker(path: str, num_increments: int):
+    cache = SharedMemoryCache(path=path)
+    for _ in range(num_increments):
+        cache.increment_cache("rpm:key-1", 1)
+
+
+def _run_workers(target, args, num_workers: int):
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=target, args=args) for _ in range(num_workers)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+        assert worker.exitcode == 0
+
+
+def test_shared_memory_cache_value_set_by_other_worker(shared_memory_cache_path):
+    _run_workers(_set_in_worker, (shared_memory_cache_path,), num_workers=1)
+
+    cache = SharedMemoryCache(
+        path=shared_memory_cache_path, namespace="user_api_key_cache"
+    )
+    cached_key_obj = cache.get_cache("hashed-token")
+    assert isinstance(cached_key_obj, UserAPIKeyAuth)
+    assert cached_key_obj.spend == 1.5
+    assert 0 < asyncio.run(cache.async_get_ttl("hashed-token")) <= 60
+
+    cache.delete_cache("hashed-token")
+    assert cache.get_cache("hashed-token") is None
+
+
+def test_shared_memory_cache_increment_across_workers(shared_memory_cache_path):
+    _run_workers(_increment_in_worker, (shared_memory_cache_path, 250), num_workers=4)
+    cache = SharedMemoryCache(path=shared_memory_cache_path)
+    assert cache.get_cache("rpm:key-1") == 1000
+
+
+def test_shared_memory_cache_ttl(shared_memory_cache_path):
+    cache = SharedMemoryCache(path=shared_memory_cache_path)
+    cache.set_cache("cooldown", ["deployment-1"], ttl=0.1)
+    assert cache.get_cache("cooldown") == ["deployment-1"]
+    time.sleep(0.15)
+    assert cache.get_cache("cooldown") is None
+
+
+def test_shared_memory_cache_value_larger_than_slot(shared_memory_cache_path):
+    cache = SharedMemoryCache(path=shared_memory_cache_path, slot_size=256)
+    cache.set_cache("key", "small value")
+    assert cache.get_cache("key") == "small value"
+
+    # the old value is removed - it would be stale
+    cache.set_cache("key", "x" * 1000)
+    assert cache.get_cache("key") is None
+
+
+def test_shared_memory_cache_evicts_entry_expiring_first(shared_memory_cache_path):
+    cache = SharedMemoryCache(path=shared_memory_cache_path, num_slots=4)
+    for i in range(4):
+        cache.set_cache(f"key-{i}", i, ttl=100 + i)
+    cache.set_cache("key-4", 4, ttl=100)
+
+    assert cache.get_cache("key-0") is None
+    assert [cache.get_cache(f"key-{i}") for i in range(1, 5)] == [1, 2, 3, 4]
+
+
+def test_shared_memory_cache_namespaces(shared_memory_cache_path):
+    router_cache = SharedMemoryCache(path=shared_memory_cache_path, namespace="router")
+    auth_cache = SharedMemoryCache(
+        path=shared_memory_cache_path, namespace="user_api_key_cache"
+    )
+    router_cache.set_cache("key", "router value")
+    auth_cache.set_cache("key", "auth value")
+    assert router_cache.get_cache("key") == "router value"
+
+    router_cache.flush_cache()
+    assert router_cache.get_cache("key") is None
+    assert auth_cache.get_cache("key") == "auth value"
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_checks_shared_memory_cache_before_redis(
+    shared_memory_cache_path,
+):
+    redis_cache = MagicMock()
+    redis_cache.async_get_cache = AsyncMock(return_value={"spend": 2.0})
+    redis_cache.async_set_cache = AsyncMock()
+    redis_cache.async_delete_cache = AsyncMock()
+
+    # 2 workers, with their own in-memory cache
+    worker_1 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        redis_cache=redis_cache,
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+    worker_2 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        redis_cache=redis_cache,
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+
+    assert await worker_1.async_get_cache("user-1") == {"spend": 2.0}
+    assert redis_cache.async_get_cache.call_count == 1
+    # redis result is shared with worker 2
+    assert await worker_2.async_get_cache("user-1") == {"spend": 2.0}
+    assert redis_cache.async_get_cache.call_count == 1
+    assert worker_2.in_memory_cache.get_cache("user-1") == {"spend": 2.0}
+
+    # counters are summed across workers
+    await worker_1.async_increment_cache("rpm", 1, local_only=True)
+    assert await worker_2.async_increment_cache("rpm", 1, local_only=True) == 2
+
+    await worker_1.async_delete_cache("user-1")
+    redis_cache.async_get_cache.return_value = None
+    assert await worker_1.async_get_cache("user-1") is None
+
+
+def test_setup_shared_memory_cache_path(monkeypatch):
+    monkeypatch.delenv(SHARED_MEMORY_CACHE_PATH_ENV, raising=False)
+    assert setup_shared_memory_cache_path(num_workers=1) is None
+    assert get_shared_memory_cache(namespace="router") is None
+
+    path = setup_shared_memory_cache_path(num_workers=4)
+    try:
+        assert path is not None and os.path.exists(path)
+        assert os.environ[SHARED_MEMORY_CACHE_PATH_ENV] == path
+        shared_memory_cache = get_shared_memory_cache(namespace="router")
+        assert shared_memory_cache is not None
+
+        monkeypatch.setenv("LITELLM_DISABLE_SHARED_MEMORY_CACHE", "True")
+        assert get_shared_memory_cache(namespace="router") is None
+    finally:
+        os.environ.pop(SHARED_MEMORY_CACHE_PATH_ENV, None)
+        table = _shared_memory_tables.pop(path, None)
+        if table is not None:
+            table.close()
+        os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_keeps_remaining_ttl_of_shared_memory_value(
+    shared_memory_cache_path,
+):
+    worker_1 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+    worker_2 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+    worker_1.set_cache("cooldown", ["deployment-1"], ttl=5)
+
+    assert worker_2.get_cache("cooldown") == ["deployment-1"]
+    assert 0 < worker_2.in_memory_cache.ttl_dict["cooldown"] - time.time() <= 5
+
+    worker_1.set_cache("cooldown-2", ["deployment-2"], ttl=5)
+    assert await worker_2.async_batch_get_cache(["cooldown-2"]) == [["deployment-2"]]
+    assert 0 < worker_2.in_memory_cache.ttl_dict["cooldown-2"] - time.time() <= 5
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_local_only_process_objects_not_shared(
+    shared_memory_cache_path,
+):
+    worker_1 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+    worker_2 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+    semaphore = asyncio.Semaphore(10)
+    await worker_1.async_set_cache(
+        "model-1_max_parallel_requests_client", semaphore, local_only=True
+    )
+    assert (
+        await worker_1.async_get_cache("model-1_max_parallel_requests_client")
+        is semaphore
+    )
+    assert (
+        await worker_2.async_get_cache("model-1_max_parallel_requests_client") is None
+    )
+
+    # plain local_only values are still shared by the workers
+    await worker_1.async_set_cache("rpm:model-1", {"count": 1}, local_only=True)
+    assert await worker_2.async_get_cache("rpm:model-1") == {"count": 1}
+
+
+@pytest.mark.asyncio
+async def test_dual_cache_sees_updates_by_other_workers(
+    shared_memory_cache_path, monkeypatch
+):
+    from litellm.caching import dual_cache
+
+    monkeypatch.setattr(dual_cache, "SHARED_MEMORY_CACHE_IN_MEMORY_TTL_SECONDS", 0.1)
+    worker_1 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+    worker_2 = DualCache(
+        in_memory_cache=InMemoryCache(),
+        shared_memory_cache=SharedMemoryCache(path=shared_memory_cache_path),
+    )
+    await worker_1.async_increment_cache("rpm", 1, local_only=True, ttl=60)
+    assert await worker_2.async_get_cache("rpm") == 1
+    await worker_1.async_increment_cache("rpm", 1, local_only=True, ttl=60)
+    await asyncio.sleep(0.15)
+    assert await worker_2.async_get_cache("rpm") == 2
+
+    # sets are merged across workers
+    await worker_1.async_set_cache_sadd("ids", ["a"], local_only=True, ttl=60)
+    await worker_2.async_set_cache_sadd("ids", ["b"], local_only=True, ttl=60)
+    assert await worker_1.async_get_cache("ids") == {"a", "b"}
+
+    # process objects added with local_only stay in the worker
+    semaphore = asyncio.Semaphore(1)
+    await worker_1.async_set_cache_sadd("semaphores", [semaphore], local_only=True)
+    assert await worker_1.async_get_cache("semaphores") == {semaphore}
+    assert await worker_2.async_get_cache("semaphores") is None
+
+
+def test_is_plain_value():
+    from litellm.caching.dual_cache import _is_plain_value
+
+    assert _is_plain_value({"count": 1, "ids": ["a", ("b", None)], "ok": True})
+    assert not _is_plain_value({"lock": asyncio.Lock()})
+
+    deeply_nested: list = []
+    for _ in range(10000):
+        deeply_nested = [deeply_nested]
+    assert not _is_plain_value(deeply_nested)
+    assert not _is_plain_value(list(range(100000)))
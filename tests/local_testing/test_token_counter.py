@@ -387,9 +387,15 @@ def test_token_encode_disallowed_special():
 import unittest
 from unittest.mock import patch, MagicMock
 from litellm.utils import encoding, _select_tokenizer_helper, claude_json_str
+from litellm.litellm_core_utils.tokenizer_registry import tokenizer_registry
 
 
 class TestTokenizerSelection(unittest.TestCase):
+    def setUp(self):
+        # tokenizers are shared process-wide - make each test load them
+        tokenizer_registry.clear()
+        _select_tokenizer_helper.cache_clear()
+
     @patch("litellm.utils.Tokenizer.from_pretrained")
     def test_llama3_tokenizer_api_failure(self, mock_from_pretrained):
         # Setup mock to raise an error
@@ -470,3 +476,86 @@ class TestTokenizerSelection(unittest.TestCase):
         mock_return_huggingface_tokenizer.assert_not_called()
         assert result["type"] == "openai_tokenizer"
         assert result["tokenizer"] == encoding
+
+
+def _clear_tokenizers():
+    tokenizer_registry.clear()
+    _select_tokenizer_helper.cache_clear()
+
+
+def test_tokenizer_cache_dir_offline(tmp_path, monkeypatch):
+    """
+    Tokenizers in `tokenizer_cache_dir` load without the huggingface hub, and models using the same tokenizer share it
+    """
+    from tokenizers import Tokenizer
+
+    Tokenizer.from_str(claude_json_str).save(
+        str(tmp_path / "Xenova--llama-3-tokenizer.json")
+    )
+    monkeypatch.setattr(litellm, "tokenizer_cache_dir", str(tmp_path))
+    monkeypatch.setattr(litellm, "disable_hf_tokenizer_download", True)
+    _clear_tokenizers()
+    try:
+        with patch("litellm.utils.Tokenizer.from_pretrained") as mock_from_pretrained:
+            tokenizer_8b = _select_tokenizer_helper("llama-3-8b-instruct")
+            tokenizer_70b = _select_tokenizer_helper("llama-3-70b-instruct")
+            mock_from_pretrained.assert_not_called()
+        assert tokenizer_8b["type"] == "huggingface_tokenizer"
+        assert tokenizer_8b["tokenizer"] is tokenizer_70b["tokenizer"]
+
+        # not in the cache dir + download disabled -> openai tokenizer
+        assert _select_tokenizer_helper("llama-2-7b")["type"] == "openai_tokenizer"
+    finally:
+        _clear_tokenizers()
+
+
+def test_tokenizer_cache_dir_saves_downloaded_tokenizers(tmp_path, monkeypatch):
+    from tokenizers import Tokenizer
+
+    monkeypatch.setattr(litellm, "tokenizer_cache_dir", str(tmp_path))
+    _clear_tokenizers()
+    try:
+        with patch(
+            "litellm.utils.Tokenizer.from_pretrained",
+            return_value=Tokenizer.from_str(claude_json_str),
+        ) as mock_from_pretrained:
+            litellm.utils.load_tokenizers(models=["llama-3-8b-instruct", "gpt-4o"])
+            mock_from_pretrained.assert_called_once_with("Xenova/llama-3-tokenizer")
+        assert (tmp_path / "Xenova--llama-3-tokenizer.json").exists()
+    finally:
+        _clear_tokenizers()
+
+
+@pytest.mark.parametrize("model", ["gpt-4o", "claude-2"])
+def test_encode_batch(model):
+    texts = ["Hello, world! <|endoftext|>", "", "hey, how's it going?" * 10]
+    batch = litellm.encode_batch(model=model, texts=texts)
+    assert len(batch) == len(texts)
+    for text, encoded in zip(texts, batch):
+        expected = encode(model=model, text=text)
+        assert getattr(encoded, "ids", encoded) == getattr(expected, "ids", expected)
+
+
+def test_select_tokenizer_after_tokenizer_cache_dir_set(tmp_path, monkeypatch):
+    """
+    Tokenizers selected before `tokenizer_cache_dir` was set are not reused after it's set
+    """
+    from tokenizers import Tokenizer
+
+    from litellm.utils import _select_tokenizer
+
+    monkeypatch.setattr(litellm, "tokenizer_cache_dir", None)
+    monkeypatch.setattr(litellm, "disable_hf_tokenizer_download", True)
+    _clear_tokenizers()
+    try:
+        assert _select_tokenizer("llama-3-8b-instruct")["type"] == "openai_tokenizer"
+
+        Tokenizer.from_str(claude_json_str).save(
+            str(tmp_path / "Xenova--llama-3-tokenizer.json")
+        )
+        monkeypatch.setattr(litellm, "tokenizer_cache_dir", str(tmp_path))
+        assert (
+            _select_tokenizer("llama-3-8b-instruct")["type"] == "huggingface_tokenizer"
+        )
+    finally:
+        _clear_tokenizers()
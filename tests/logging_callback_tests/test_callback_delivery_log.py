@@ -0,0 +1,346 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import httpx
+import pytest
+
+import litellm
+from litellm.integrations.callback_delivery_log import (
+    DEAD_LETTER_FILE_NAME,
+    CallbackDeliveryLog,
+)
+from litellm.integrations.datadog.datadog import DataDogLogger
+
+
+class MockDestination:
+    def __init__(self, failures=None):
+        self.batches = []
+        self.failures = list(failures or [])
+
+    async def send_events(self, events):
+        if self.failures:
+            raise self.failures.pop(0)
+        self.batches.append(events)
+
+
+def _events(n, start=0):
+    return [{"id": str(i), "message": f"event {i}"} for i in range(start, start + n)]
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_delivers_in_batches_and_moves_cursor(tmp_path):
+    destination = MockDestination()
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=destination.send_events,
+        batch_size=4,
+        max_segment_bytes=200,
+    )
+    delivery_log.append(_events(5))
+    delivery_log.append(_events(5, start=5))
+
+    assert await delivery_log.deliver_pending() == 10
+    assert [len(batch) for batch in destination.batches] == [4, 4, 2]
+    assert [e["id"] for batch in destination.batches for e in batch] == [
+        str(i) for i in range(10)
+    ]
+    assert delivery_log.has_pending_events() is False
+    # delivered segments are deleted, nothing is delivered twice
+    assert len(delivery_log._list_segments()) <= 1
+    assert await delivery_log.deliver_pending() == 0
+    delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_replays_undelivered_events_after_restart(tmp_path):
+    destination = MockDestination()
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path), send_events=destination.send_events, batch_size=3
+    )
+    delivery_log.append(_events(3))
+    await delivery_log.deliver_pending()
+    delivery_log.append(_events(4, start=3))
+    delivery_log.close()  # restart before the 2nd batch is delivered
+
+    restarted_destination = MockDestination()
+    restarted_delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=restarted_destination.send_events,
+        batch_size=3,
+    )
+    assert restarted_delivery_log.directory == delivery_log.directory
+    assert await restarted_delivery_log.deliver_pending() == 4
+    assert [e["id"] for batch in restarted_destination.batches for e in batch] == [
+        "3",
+        "4",
+        "5",
+        "6",
+    ]
+    restarted_delivery_log.close()
+
+
+def test_delivery_log_slot_per_process(tmp_path):
+    delivery_logs = [
+        CallbackDeliveryLog(
+            directory=str(tmp_path), send_events=AsyncMock(), batch_size=10
+        )
+        for _ in range(2)
+    ]
+    assert delivery_logs[0].directory != delivery_logs[1].directory
+    for delivery_log in delivery_logs:
+        delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_retries_with_backoff(tmp_path):
+    destination = MockDestination(
+        failures=[httpx.ConnectError("down"), httpx.ConnectError("down")]
+    )
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=destination.send_events,
+        batch_size=10,
+        backoff_base_seconds=1,
+    )
+    delivery_log.append(_events(2))
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await delivery_log.deliver_pending()
+
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+    assert len(destination.batches) == 1
+    assert delivery_log.num_delivered == 2
+    assert delivery_log.num_dead_lettered == 0
+    delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_retries_retryable_errors_until_delivered(tmp_path):
+    too_many_requests = httpx.HTTPStatusError(
+        "too many requests",
+        request=httpx.Request("POST", "http://localhost"),
+        response=httpx.Response(status_code=429),
+    )
+    destination = MockDestination(
+        failures=[httpx.ReadTimeout("timeout")] * 10 + [too_many_requests] * 10
+    )
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=destination.send_events,
+        batch_size=10,
+        backoff_base_seconds=1,
+        backoff_max_seconds=60,
+    )
+    delivery_log.append(_events(2))
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        await delivery_log.deliver_pending()
+
+    # the backoff is capped
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(delays) == 20
+    assert delays[:7] == [1, 2, 4, 8, 16, 32, 60]
+    assert max(delays) == 60
+    assert [e["id"] for batch in destination.batches for e in batch] == ["0", "1"]
+    assert delivery_log.num_dead_lettered == 0
+    delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_dead_letters_and_requeues(tmp_path):
+    rejected = httpx.HTTPStatusError(
+        "bad request",
+        request=httpx.Request("POST", "http://localhost"),
+        response=httpx.Response(status_code=400),
+    )
+    destination = MockDestination(failures=[rejected, rejected])
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=destination.send_events,
+        batch_size=2,
+        backoff_base_seconds=0,
+    )
+    delivery_log.append(_events(6))
+
+    await delivery_log.deliver_pending()
+
+    # batches rejected with a 4xx are not retried
+    assert [e["id"] for batch in destination.batches for e in batch] == ["4", "5"]
+    assert delivery_log.num_dead_lettered == 4
+    with open(os.path.join(delivery_log.directory, DEAD_LETTER_FILE_NAME)) as f:
+        dead_letters = [json.loads(line) for line in f]
+    assert [d["event"]["id"] for d in dead_letters] == ["0", "1", "2", "3"]
+    assert dead_letters[0]["error"] == "bad request"
+
+    assert delivery_log.requeue_dead_letters() == 4
+    await delivery_log.deliver_pending()
+    assert [e["id"] for batch in destination.batches[1:] for e in batch] == [
+        "0",
+        "1",
+        "2",
+        "3",
+    ]
+    delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_requeues_dead_letters_on_startup(tmp_path):
+    rejected = httpx.HTTPStatusError(
+        "unauthorized",
+        request=httpx.Request("POST", "http://localhost"),
+        response=httpx.Response(status_code=401),
+    )
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=MockDestination(failures=[rejected]).send_events,
+        batch_size=10,
+    )
+    delivery_log.append(_events(3))
+    await delivery_log.deliver_pending()
+    assert delivery_log.num_dead_lettered == 3
+    delivery_log.close()
+
+    # restarted with the fixed destination config
+    destination = MockDestination()
+    restarted_delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path), send_events=destination.send_events, batch_size=10
+    )
+    assert await restarted_delivery_log.deliver_pending() == 3
+    assert [e["id"] for batch in destination.batches for e in batch] == [
+        "0",
+        "1",
+        "2",
+    ]
+    assert not os.path.exists(
+        os.path.join(restarted_delivery_log.directory, DEAD_LETTER_FILE_NAME)
+    )
+    restarted_delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_dead_letters_bounded_by_max_bytes(tmp_path):
+    rejected = httpx.HTTPStatusError(
+        "bad request",
+        request=httpx.Request("POST", "http://localhost"),
+        response=httpx.Response(status_code=400),
+    )
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=MockDestination(failures=[rejected] * 20).send_events,
+        batch_size=1,
+        max_bytes=500,
+    )
+    delivery_log.append(_events(20))
+    await delivery_log.deliver_pending()
+
+    assert delivery_log.num_dead_lettered == 20
+    dead_letter_path = os.path.join(delivery_log.directory, DEAD_LETTER_FILE_NAME)
+    assert os.path.getsize(dead_letter_path) <= 500
+    with open(dead_letter_path) as f:
+        dead_letters = [json.loads(line) for line in f]
+    # the most recent dead letters are kept
+    assert dead_letters[-1]["event"]["id"] == "19"
+    delivery_log.close()
+
+
+def test_delivery_log_drops_oldest_segments_past_max_bytes(tmp_path):
+    delivery_log = CallbackDeliveryLog(
+        directory=str(tmp_path),
+        send_events=AsyncMock(),
+        batch_size=10,
+        max_segment_bytes=100,
+        max_bytes=300,
+    )
+    for i in range(20):
+        delivery_log.append(_events(1, start=i))
+
+    segments = delivery_log._list_segments()
+    total_bytes = sum(
+        os.path.getsize(delivery_log._get_segment_path(s)) for s in segments
+    )
+    assert total_bytes <= 300 + 100
+    assert delivery_log._cursor[0] == segments[0]
+    delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_datadog_logger_flushes_to_delivery_log(tmp_path, monkeypatch):
+    monkeypatch.setenv("DD_API_KEY", "fake-key")
+    monkeypatch.setenv("DD_SITE", "fake.datadoghq.com")
+    monkeypatch.setattr(litellm, "callback_delivery_log_dir", str(tmp_path))
+
+    dd_logger = DataDogLogger()
+    assert dd_logger.delivery_log is not None
+    # a slow / down destination never blocks flush_queue
+    dd_logger.async_send_compressed_data = AsyncMock(
+        return_value=httpx.Response(
+            status_code=202, request=httpx.Request("POST", dd_logger.intake_url)
+        )
+    )
+    dd_logger.async_send_batch = AsyncMock()
+
+    dd_logger.log_queue = [{"message": "event 1"}, {"message": "event 2"}]
+    await dd_logger.flush_queue()
+    assert dd_logger.log_queue == []
+    dd_logger.async_send_batch.assert_not_called()
+
+    for _ in range(10):
+        await asyncio.sleep(0.05)
+        if dd_logger.async_send_compressed_data.call_count > 0:
+            break
+    dd_logger.async_send_compressed_data.assert_called_once_with(
+        [{"message": "event 1"}, {"message": "event 2"}]
+    )
+    assert dd_logger.delivery_log.num_delivered == 2
+    dd_logger.delivery_log.close()
+
+
+@pytest.mark.asyncio
+async def test_delivery_log_only_for_loggers_supporting_it(tmp_path, monkeypatch):
+    from litellm.integrations.custom_batch_logger import CustomBatchLogger
+    from litellm.integrations.datadog.datadog_llm_obs import DataDogLLMObsLogger
+
+    monkeypatch.setenv("DD_API_KEY", "fake-key")
+    monkeypatch.setenv("DD_SITE", "fake.datadoghq.com")
+    monkeypatch.setattr(litellm, "callback_delivery_log_dir", str(tmp_path))
+
+    assert CustomBatchLogger().delivery_log is None
+    assert DataDogLLMObsLogger().delivery_log is None
+
+
+@pytest.mark.asyncio
+async def test_opik_logger_retry_does_not_resend_accepted_traces(monkeypatch):
+    from litellm.integrations.opik.opik import OpikLogger
+
+    monkeypatch.setattr(litellm, "callback_delivery_log_dir", None)
+    opik_logger = OpikLogger()
+    events = [
+        {"id": "trace-1", "name": "trace"},
+        {"id": "span-1", "trace_id": "trace-1", "type": "llm"},
+    ]
+    request = httpx.Request("POST", opik_logger.span_url)
+    opik_logger.async_httpx_client.post = AsyncMock(
+        side_effect=[
+            httpx.Response(status_code=200, request=request),
+            httpx.Response(status_code=503, request=request),
+            httpx.Response(status_code=200, request=request),
+        ]
+    )
+
+    # the traces are accepted, the spans fail
+    with pytest.raises(httpx.HTTPStatusError):
+        await opik_logger.async_send_events(events)
+    # retried by the delivery log - only the spans are sent again
+    await opik_logger.async_send_events(events)
+
+    urls = [
+        call.kwargs["url"]
+        for call in opik_logger.async_httpx_client.post.call_args_list
+    ]
+    assert urls == [opik_logger.trace_url, opik_logger.span_url, opik_logger.span_url]
+    assert opik_logger._delivered_trace_ids == set()
@@ -1240,3 +1240,94 @@ async def test_initialize_api_key_budget_metrics(prometheus_logger):
         prometheus_logger.litellm_api_key_max_budget_metric.assert_has_calls(
             expected_max_budget_calls, any_order=True
         )
+
+
+def _get_sample_value(metric_name: str, labels: dict) -> float:
+    return REGISTRY.get_sample_value(metric_name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_prometheus_metrics_buffer(monkeypatch):
+    """
+    With prometheus_async_metrics_aggregation, metric updates are buffered and only applied on flush
+    """
+    collectors = list(REGISTRY._collector_to_names.keys())
+    for collector in collectors:
+        REGISTRY.unregister(collector)
+    monkeypatch.setattr("litellm.proxy.proxy_server.premium_user", True)
+    monkeypatch.setattr(litellm, "prometheus_async_metrics_aggregation", True)
+    prometheus_logger = PrometheusLogger()
+    assert prometheus_logger.metrics_buffer is not None
+
+    spend_labels = {
+        "end_user": "user1",
+        "hashed_api_key": "key1",
+        "api_key_alias": "alias1",
+        "model": "gpt-3.5-turbo",
+        "team": "team1",
+        "team_alias": "team_alias1",
+        "user": "user1",
+    }
+    for _ in range(3):
+        prometheus_logger.litellm_spend_metric.labels(*spend_labels.values()).inc(0.1)
+    prometheus_logger.litellm_provider_remaining_budget_metric.labels("openai").set(10)
+    prometheus_logger.litellm_provider_remaining_budget_metric.labels("openai").set(5)
+
+    assert _get_sample_value("litellm_spend_metric_total", spend_labels) == 0.0
+
+    assert prometheus_logger.metrics_buffer.flush() == 5
+    assert _get_sample_value(
+        "litellm_spend_metric_total", spend_labels
+    ) == pytest.approx(0.3)
+    assert (
+        _get_sample_value(
+            "litellm_provider_remaining_budget_metric", {"api_provider": "openai"}
+        )
+        == 5
+    )
+
+    # invalid labels still raise at the call site
+    with pytest.raises(ValueError):
+        prometheus_logger.litellm_spend_metric.labels("user1")
+
+
+def test_setup_prometheus_multiprocess_dir(monkeypatch):
+    from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+        is_prometheus_multiprocess_mode,
+        setup_prometheus_multiprocess_dir,
+    )
+
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    assert setup_prometheus_multiprocess_dir(num_workers=1) is None
+    assert is_prometheus_multiprocess_mode() is False
+
+    multiprocess_dir = setup_prometheus_multiprocess_dir(num_workers=4)
+    assert multiprocess_dir is not None and os.path.isdir(multiprocess_dir)
+    assert os.environ["PROMETHEUS_MULTIPROC_DIR"] == multiprocess_dir
+    assert is_prometheus_multiprocess_mode() is True
+    os.rmdir(multiprocess_dir)
+
+
+def test_setup_prometheus_multiprocess_dir_clears_stale_metrics(monkeypatch, tmp_path):
+    from litellm.integrations.prometheus_helpers.prometheus_multiprocess import (
+        mark_exited_prometheus_workers_dead,
+        setup_prometheus_multiprocess_dir,
+    )
+
+    # metric files of a previous run
+    (tmp_path / "counter_123.db").write_bytes(b"")
+    (tmp_path / "README").write_text("not a metric file")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+    assert setup_prometheus_multiprocess_dir(num_workers=4) == str(tmp_path)
+    assert sorted(os.listdir(tmp_path)) == ["README"]
+
+    # live gauges of an exited worker are removed, the ones of a running worker are kept
+    exited_pid = 2**22 + 1
+    (tmp_path / f"gauge_livesum_{exited_pid}.db").write_bytes(b"")
+    (tmp_path / f"gauge_livesum_{os.getpid()}.db").write_bytes(b"")
+    mark_exited_prometheus_workers_dead()
+    assert sorted(os.listdir(tmp_path)) == [
+        "README",
+        f"gauge_livesum_{os.getpid()}.db",
+    ]
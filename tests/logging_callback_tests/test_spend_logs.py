@@ -374,3 +374,40 @@ def test_spend_logs_payload_with_prompts_enabled(monkeypatch):
     payload_disabled: SpendLogsPayload = get_logging_payload(**input_args)
     assert payload_disabled["messages"] == "{}"
     assert payload_disabled["response"] == "{}"
+
+
+@pytest.mark.parametrize("call_type", ["_arealtime", "acompletion"])
+def test_spend_logs_payload_realtime_usage_from_standard_logging_payload(call_type):
+    """
+    Realtime sessions are logged as a list of events - the id + usage of the spend log come from the standard logging payload
+    """
+    kwargs: dict = {
+        "model": "gpt-4o-realtime-preview",
+        "litellm_params": {"metadata": {}},
+        "call_type": call_type,
+        "litellm_call_id": "05921cf7-33f9-421c-aad9-33310c1e2702",
+        "response_cost": 0.01,
+        "standard_logging_object": {
+            "id": "05921cf7-33f9-421c-aad9-33310c1e2702_1",
+            "prompt_tokens": 100,
+            "completion_tokens": 20,
+            "total_tokens": 120,
+            "metadata": {},
+        },
+    }
+
+    payload: SpendLogsPayload = get_logging_payload(
+        kwargs=kwargs,
+        response_obj={},
+        start_time=datetime.datetime.now(),
+        end_time=datetime.datetime.now(),
+    )
+
+    if call_type == "_arealtime":
+        assert payload["request_id"] == "05921cf7-33f9-421c-aad9-33310c1e2702_1"
+        assert payload["prompt_tokens"] == 100
+        assert payload["completion_tokens"] == 20
+        assert payload["total_tokens"] == 120
+    else:
+        assert payload["request_id"] == "05921cf7-33f9-421c-aad9-33310c1e2702"
+        assert payload["total_tokens"] == 0
@@ -117,3 +117,141 @@ def test_convert_raw_bytes_to_str_lines():
     raw_bytes = [b'data: {"content": "Hello"}\n\n', b'\ndata: {"content": "World"}\n']
     result = PassThroughStreamingHandler._convert_raw_bytes_to_str_lines(raw_bytes)
     assert result == ['data: {"content": "Hello"}', 'data: {"content": "World"}']
+
+
+def test_incremental_line_decoder():
+    """
+    Test that the IncrementalLineDecoder returns the same lines as _convert_raw_bytes_to_str_lines, however the bytes are split
+    """
+    from litellm.proxy.pass_through_endpoints.streaming_accumulator import (
+        IncrementalLineDecoder,
+    )
+
+    stream = 'event: content_block_delta\r\ndata: {"text": "héllo 👋"}\n\n\ndata: {"text": "World"}\ndata: [DONE]'.encode()
+    expected = PassThroughStreamingHandler._convert_raw_bytes_to_str_lines([stream])
+    for chunk_size in [1, 2, 3, 7, len(stream)]:
+        decoder = IncrementalLineDecoder()
+        lines = []
+        for i in range(0, len(stream), chunk_size):
+            lines.extend(decoder.feed(stream[i : i + chunk_size]))
+        lines.extend(decoder.flush())
+        assert lines == expected
+
+
+@pytest.mark.asyncio
+async def test_chunk_processor_parses_stream_incrementally():
+    """
+    Test that the chunk_processor parses the stream as it arrives, into the same complete response as the collected chunks
+    """
+    from litellm.proxy.pass_through_endpoints.llm_provider_handlers.anthropic_passthrough_logging_handler import (
+        AnthropicPassthroughLoggingHandler,
+    )
+
+    events = [
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_1",
+                "type": "message",
+                "role": "assistant",
+                "model": "claude-3-5-sonnet-20240620",
+                "content": [],
+                "usage": {"input_tokens": 17, "output_tokens": 1},
+            },
+        },
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        },
+    ]
+    events += [
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": f"token{i} "},
+        }
+        for i in range(50)
+    ]
+    events += [
+        {"type": "content_block_stop", "index": 0},
+        {
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {
+                "type": "tool_use",
+                "id": "toolu_1",
+                "name": "get_weather",
+                "input": {},
+            },
+        },
+        {
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "input_json_delta", "partial_json": '{"city": '},
+        },
+        {
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "input_json_delta", "partial_json": '"Paris"}'},
+        },
+        {"type": "content_block_stop", "index": 1},
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": "tool_use"},
+            "usage": {"output_tokens": 60},
+        },
+        {"type": "message_stop"},
+    ]
+    all_chunks = []
+    for event in events:
+        all_chunks += [f"event: {event['type']}", f"data: {json.dumps(event)}"]
+    stream = ("\n".join(all_chunks) + "\n\n").encode()
+
+    response = AsyncMock(spec=httpx.Response)
+
+    async def mock_aiter_bytes():
+        for i in range(0, len(stream), 100):
+            yield stream[i : i + 100]
+
+    response.aiter_bytes = mock_aiter_bytes
+    litellm_logging_obj = MagicMock()
+    model = "claude-3-5-sonnet-20240620"
+
+    with patch.object(
+        PassThroughStreamingHandler,
+        "_route_streaming_logging_to_handler",
+        new=AsyncMock(),
+    ) as mock_route:
+        received = b""
+        async for chunk in PassThroughStreamingHandler.chunk_processor(
+            response=response,
+            request_body={"model": model},
+            litellm_logging_obj=litellm_logging_obj,
+            endpoint_type=EndpointType.ANTHROPIC,
+            start_time=datetime.now(),
+            passthrough_success_handler_obj=MagicMock(),
+            url_route="/v1/messages",
+        ):
+            received += chunk
+        assert received == stream
+        streaming_accumulator = mock_route.call_args.kwargs["streaming_accumulator"]
+
+    complete_streaming_response = (
+        streaming_accumulator.get_complete_streaming_response()
+    )
+    expected_response = (
+        AnthropicPassthroughLoggingHandler._build_complete_streaming_response(
+            all_chunks=all_chunks,
+            litellm_logging_obj=litellm_logging_obj,
+            model=model,
+        )
+    )
+    message = complete_streaming_response.choices[0].message
+    assert message.content == "".join(f"token{i} " for i in range(50))
+    assert message.tool_calls[0].function.name == "get_weather"
+    assert message.tool_calls[0].function.arguments == '{"city": "Paris"}'
+    assert complete_streaming_response.choices[0].finish_reason == "tool_calls"
+    assert complete_streaming_response.usage.completion_tokens == 60
+    assert message == expected_response.choices[0].message
+    assert complete_streaming_response.usage == expected_response.usage
@@ -1502,13 +1502,17 @@ from unittest.mock import MagicMock, AsyncMock
 import asyncio
 from datetime import timedelta
 from litellm.proxy.utils import ProxyUpdateSpend
+from litellm.proxy.spend_tracking.spend_accumulator import SpendAccumulator
 
 
 @pytest.mark.asyncio
 async def test_end_user_transactions_reset():
     # Setup
     mock_client = MagicMock()
-    mock_client.end_user_list_transactons = {"1": 10.0}  # Bad log
+    mock_client.spend_accumulator = SpendAccumulator()
+    mock_client.spend_accumulator.add(
+        entity_type="end_user", entity_id="1", spend=10.0
+    )  # Bad log
     mock_client.db.tx = AsyncMock(side_effect=Exception("DB Error"))
 
     # Call function - should raise error
@@ -1519,7 +1523,7 @@ async def test_end_user_transactions_reset():
 
     # Verify cleanup happened
     assert (
-        mock_client.end_user_list_transactons == {}
+        len(mock_client.spend_accumulator.get_shard("end_user")) == 0
     ), "Transactions list should be empty after error"
 
 
@@ -1618,6 +1622,7 @@ def test_provider_specific_header():
         },
     }
 
+
 @pytest.mark.parametrize(
     "wildcard_model, expected_models",
     [
@@ -1642,7 +1647,8 @@ def test_get_known_models_from_wildcard(wildcard_model, expected_models):
             print(f"Missing expected model: {model}")
 
     assert all(model in wildcard_models for model in expected_models)
-    
+
+
 @pytest.mark.parametrize(
     "data, user_api_key_dict, expected_model",
     [
@@ -1692,3 +1698,262 @@ def test_update_model_if_team_alias_exists(data, user_api_key_dict, expected_mod
     # Check if model was updated correctly
     assert test_data.get("model") == expected_model
 
+
+def _get_openai_sse_bytes() -> bytes:
+    chunks = [
+        {"role": "assistant", "content": ""},
+        {"content": "Hello"},
+        {"content": " world"},
+    ]
+    sse_chunks = [
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+        }
+        for delta in chunks
+    ]
+    sse_chunks.append(
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        }
+    )
+    sse_chunks.append(
+        {
+            "id": "chatcmpl-123",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "gpt-4o",
+            "choices": [],
+            "usage": {"prompt_tokens": 9, "completion_tokens": 2, "total_tokens": 11},
+        }
+    )
+    return (
+        b"".join(f"data: {json.dumps(chunk)}\n\n".encode() for chunk in sse_chunks)
+        + b"data: [DONE]\n\n"
+    )
+
+
+def test_openai_stream_sniffer():
+    from litellm.proxy.common_utils.raw_sse_passthrough import OpenAIStreamSniffer
+
+    sse_bytes = _get_openai_sse_bytes()
+    sniffer = OpenAIStreamSniffer()
+    for i in range(0, len(sse_bytes), 13):
+        sniffer.feed(sse_bytes[i : i + 13])
+
+    response = sniffer.get_complete_streaming_response(
+        messages=[{"role": "user", "content": "Hi"}]
+    )
+    assert response.id == "chatcmpl-123"
+    assert response.choices[0].message.content == "Hello world"
+    assert response.choices[0].finish_reason == "stop"
+    assert response.usage.prompt_tokens == 9
+    assert response.usage.completion_tokens == 2
+
+
+async def _get_openai_stream(sse_bytes: bytes, model: str = "openai/gpt-4o", **kwargs):
+    import httpx
+    from openai import AsyncOpenAI
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=sse_bytes
+        )
+
+    client = AsyncOpenAI(
+        api_key="sk-1234",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    return await litellm.acompletion(
+        model=model,
+        messages=[{"role": "user", "content": "Hi"}],
+        stream=True,
+        client=client,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_raw_sse_passthrough_forwards_upstream_bytes(monkeypatch):
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy import proxy_server
+
+    class TestLogger(CustomLogger):
+        def __init__(self):
+            super().__init__()
+            self.response_obj = None
+
+        async def async_log_success_event(
+            self, kwargs, response_obj, start_time, end_time
+        ):
+            self.response_obj = response_obj
+
+    test_logger = TestLogger()
+    monkeypatch.setattr(litellm, "callbacks", [test_logger])
+    monkeypatch.setattr(proxy_server, "general_settings", {"raw_sse_passthrough": True})
+    sse_bytes = _get_openai_sse_bytes()
+    response = await _get_openai_stream(sse_bytes)
+
+    generator = proxy_server.select_data_generator(
+        response=response,
+        user_api_key_dict=UserAPIKeyAuth(),
+        request_data={},
+    )
+    received = b"".join([chunk async for chunk in generator])
+
+    assert received == sse_bytes
+    await asyncio.sleep(1)
+    assert test_logger.response_obj is not None
+    assert test_logger.response_obj.choices[0].message.content == "Hello world"
+    assert test_logger.response_obj.usage.total_tokens == 11
+
+
+@pytest.mark.asyncio
+async def test_raw_sse_passthrough_openai_compatible_provider(monkeypatch):
+    from litellm.proxy import proxy_server
+    from litellm.proxy.common_utils.raw_sse_passthrough import (
+        get_raw_sse_passthrough_response,
+    )
+
+    monkeypatch.setattr(litellm, "callbacks", [])
+    monkeypatch.setattr(proxy_server, "general_settings", {"raw_sse_passthrough": True})
+    sse_bytes = _get_openai_sse_bytes()
+    response = await _get_openai_stream(
+        sse_bytes,
+        model="hosted_vllm/my-model",
+        api_base="http://localhost:8000/v1",
+    )
+    assert (
+        response.logging_obj.model_call_details["custom_llm_provider"] == "hosted_vllm"
+    )
+    assert get_raw_sse_passthrough_response(response) is not None
+
+    generator = proxy_server.select_data_generator(
+        response=response,
+        user_api_key_dict=UserAPIKeyAuth(),
+        request_data={},
+    )
+    received = b"".join([chunk async for chunk in generator])
+    assert received == sse_bytes
+
+
+@pytest.mark.asyncio
+async def test_raw_sse_passthrough_falls_back_with_streaming_hooks(monkeypatch):
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.proxy import proxy_server
+
+    class TestStreamingHook(CustomLogger):
+        async def async_post_call_streaming_hook(self, user_api_key_dict, response):
+            pass
+
+    monkeypatch.setattr(litellm, "callbacks", [TestStreamingHook()])
+    monkeypatch.setattr(proxy_server, "general_settings", {"raw_sse_passthrough": True})
+    response = await _get_openai_stream(_get_openai_sse_bytes())
+
+    from litellm.proxy.common_utils.raw_sse_passthrough import (
+        get_raw_sse_passthrough_response,
+    )
+
+    assert get_raw_sse_passthrough_response(response) is None
+
+    generator = proxy_server.select_data_generator(
+        response=response,
+        user_api_key_dict=UserAPIKeyAuth(),
+        request_data={},
+    )
+    received = [chunk async for chunk in generator]
+    assert all(isinstance(chunk, str) for chunk in received)
+    assert received[-1] == "data: [DONE]\n\n"
+
+
+async def _collect_coalesced_stream(stream, **kwargs):
+    from litellm.proxy.common_utils.sse_coalescing import coalesce_sse_stream
+
+    return [chunk async for chunk in coalesce_sse_stream(stream, **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_sse_stream():
+    async def _stream():
+        for i in range(10):
+            yield f"data: {i}\n\n"
+        await asyncio.sleep(
+            0.2
+        )  # upstream pause - buffered events are flushed after the window
+        for i in range(10, 15):
+            yield f"data: {i}\n\n"
+
+    chunks = await _collect_coalesced_stream(_stream(), window_ms=50)
+
+    assert chunks[0] == "data: 0\n\n"  # first chunk is never delayed
+    assert chunks[1] == "".join(f"data: {i}\n\n" for i in range(1, 10))
+    assert chunks[2] == "".join(f"data: {i}\n\n" for i in range(10, 15))
+
+
+@pytest.mark.asyncio
+async def test_coalesce_sse_stream_max_bytes():
+    async def _stream():
+        for i in range(10):
+            yield b"data: 1234\n\n"
+
+    chunks = await _collect_coalesced_stream(_stream(), window_ms=1000, max_bytes=36)
+
+    assert b"".join(chunks) == b"data: 1234\n\n" * 10
+    assert [len(chunk) for chunk in chunks] == [12, 36, 36, 36]
+
+
+def test_get_stream_coalescing_window_ms():
+    from litellm.proxy.common_utils.sse_coalescing import (
+        get_stream_coalescing_window_ms,
+    )
+
+    general_settings = {
+        "stream_coalescing_window_ms": 10,
+        "stream_coalescing_route_window_ms": {"/v1/completions": 0},
+    }
+    chat_request = {
+        "proxy_server_request": {"url": "http://0.0.0.0:4000/v1/chat/completions"}
+    }
+    completions_request = {
+        "proxy_server_request": {"url": "http://0.0.0.0:4000/v1/completions"}
+    }
+
+    assert (
+        get_stream_coalescing_window_ms(
+            general_settings, UserAPIKeyAuth(), chat_request
+        )
+        == 10
+    )
+    assert (
+        get_stream_coalescing_window_ms(
+            general_settings, UserAPIKeyAuth(), completions_request
+        )
+        == 0
+    )
+    assert (
+        get_stream_coalescing_window_ms(
+            general_settings,
+            UserAPIKeyAuth(metadata={"stream_coalescing_window_ms": 20}),
+            completions_request,
+        )
+        == 20
+    )
+    # invalid key values fall back to the route / default window
+    for invalid_window_ms in ["fast", "nan", [10], {"ms": 10}]:
+        assert (
+            get_stream_coalescing_window_ms(
+                general_settings,
+                UserAPIKeyAuth(
+                    metadata={"stream_coalescing_window_ms": invalid_window_ms}
+                ),
+                chat_request,
+            )
+            == 10
+        )
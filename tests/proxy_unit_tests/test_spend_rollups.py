@@ -0,0 +1,195 @@
+import os
+import sys
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+from litellm.proxy.spend_tracking.spend_accumulator import SpendAccumulator
+from litellm.proxy.spend_tracking.spend_rollups import (
+    SPEND_ROLLUPS_ADVISORY_LOCK_ID,
+    _get_backfill_query,
+    aggregate_spend_logs_into_rollups,
+    backfill_spend_rollups,
+    update_spend_rollups,
+)
+from litellm.proxy.utils import update_spend
+
+
+def _spend_log(request_id: str, start_time, **kwargs) -> dict:
+    return {
+        "request_id": request_id,
+        "api_key": "hashed-key-1",
+        "spend": 0.5,
+        "prompt_tokens": 10,
+        "completion_tokens": 5,
+        "total_tokens": 15,
+        "startTime": start_time,
+        "model": "gpt-4o",
+        "user": "user-1",
+        "team_id": "team-1",
+        "request_tags": '["prod", "chat"]',
+        **kwargs,
+    }
+
+
+def _mock_prisma_client() -> MagicMock:
+    prisma_client = MagicMock()
+    # statements of a transaction are recorded on the db
+    prisma_client.db.tx.return_value.__aenter__.return_value = prisma_client.db
+    prisma_client.db.query_raw = AsyncMock(return_value=[{"locked": 1}])
+    return prisma_client
+
+
+def test_aggregate_spend_logs_into_rollups():
+    logs = [
+        _spend_log("1", datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc)),
+        _spend_log("2", datetime(2024, 5, 1, 10, 45, tzinfo=timezone.utc)),
+        _spend_log(
+            "3",
+            "2024-05-01T11:05:00+00:00",
+            team_id=None,
+            request_tags="[]",
+        ),
+    ]
+    rollups = aggregate_spend_logs_into_rollups(logs)
+
+    hour_10 = datetime(2024, 5, 1, 10)
+    day = datetime(2024, 5, 1)
+
+    key_hour = rollups[("hour", hour_10, "key", "hashed-key-1")]
+    assert key_hour.spend == 1.0
+    assert key_hour.total_tokens == 30
+    assert key_hour.api_requests == 2
+
+    key_day = rollups[("day", day, "key", "hashed-key-1")]
+    assert key_day.api_requests == 3
+    assert key_day.spend == 1.5
+
+    assert rollups[("day", day, "team", "team-1")].api_requests == 2
+    assert rollups[("day", day, "tag", "prod")].api_requests == 2
+    assert rollups[("day", day, "model", "gpt-4o")].prompt_tokens == 30
+    assert ("hour", datetime(2024, 5, 1, 11), "team", "") not in rollups
+
+
+def test_aggregate_spend_logs_skips_logs_without_start_time():
+    rollups = aggregate_spend_logs_into_rollups([{"id": "1", "spend": 10}])
+    assert rollups == {}
+
+
+@pytest.mark.asyncio
+async def test_update_spend_rollups_single_statement():
+    prisma_client = _mock_prisma_client()
+    prisma_client.db.execute_raw = AsyncMock(return_value=1)
+
+    logs = [
+        _spend_log("1", datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc)),
+        _spend_log("2", datetime(2024, 5, 1, 12, 15, tzinfo=timezone.utc)),
+    ]
+    rows_written = await update_spend_rollups(
+        prisma_client=prisma_client, spend_logs=logs
+    )
+
+    prisma_client.db.execute_raw.assert_called_once()
+    args = prisma_client.db.execute_raw.call_args.args
+    assert "ON CONFLICT" in args[0]
+    # token / request sums are BIGINT - int32 overflows on busy deployments
+    assert "::integer" not in args[0]
+    assert "u.total_tokens::bigint" in args[0]
+    # 9 column arrays, one entry per rollup row
+    assert len(args) == 10
+    assert all(len(column) == rows_written for column in args[1:])
+
+    # written under the shared rollup lock - the backfill holds it exclusively
+    lock_args = prisma_client.db.query_raw.call_args.args
+    assert "pg_advisory_xact_lock_shared" in lock_args[0]
+    assert lock_args[1] == SPEND_ROLLUPS_ADVISORY_LOCK_ID
+
+
+@pytest.mark.asyncio
+async def test_update_spend_writes_rollups_after_flushing_spend_logs():
+    prisma_client = _mock_prisma_client()
+    prisma_client.spend_log_transactions = [
+        _spend_log("1", datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc))
+    ]
+    prisma_client.spend_accumulator = SpendAccumulator()
+    prisma_client.jsonify_object = lambda obj: obj
+    prisma_client.db.litellm_spendlogs.create_many = AsyncMock()
+    prisma_client.db.execute_raw = AsyncMock(
+        side_effect=Exception("relation does not exist")
+    )
+    proxy_logging_obj = MagicMock()
+    proxy_logging_obj.failure_handler = AsyncMock()
+
+    await update_spend(prisma_client, None, proxy_logging_obj)
+
+    # rollup failures are non-blocking - spend logs are still flushed
+    prisma_client.db.litellm_spendlogs.create_many.assert_called_once()
+    prisma_client.db.execute_raw.assert_called_once()
+    assert prisma_client.spend_log_transactions == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_spend_rollups_runs_per_day():
+    prisma_client = _mock_prisma_client()
+    prisma_client.db.execute_raw = AsyncMock(return_value=2)
+
+    rows_written = await backfill_spend_rollups(
+        prisma_client=prisma_client,
+        start_date=datetime(2024, 5, 1, 12),
+        end_date=datetime(2024, 5, 3),
+    )
+
+    # 2 days x 2 granularities x 5 entity types
+    assert prisma_client.db.execute_raw.call_count == 20
+    assert rows_written == 40
+    first_call = prisma_client.db.execute_raw.call_args_list[0].args
+    assert first_call[1] == "2024-05-01T00:00:00"
+    assert first_call[2] == "2024-05-02T00:00:00"
+
+    # 1 transaction per day, holding the rollup lock exclusively
+    assert prisma_client.db.tx.call_count == 2
+    assert prisma_client.db.query_raw.call_count == 2
+    lock_query = prisma_client.db.query_raw.call_args.args[0]
+    assert "pg_advisory_xact_lock(" in lock_query
+    # backfilled rows replace the rollups of the chunk
+    assert "spend = EXCLUDED.spend" in first_call[0]
+
+
+def test_backfill_query_for_tags():
+    sql_query = _get_backfill_query(granularity="hour", entity_type="tag")
+    assert "jsonb_array_elements_text(s.request_tags)" in sql_query
+    assert "date_trunc('hour'" in sql_query
+
+
+@pytest.mark.asyncio
+async def test_rollup_id_same_for_update_and_backfill():
+    """
+    The incremental update and the backfill format the bucket start the same way in the row id
+    """
+    prisma_client = _mock_prisma_client()
+    prisma_client.db.execute_raw = AsyncMock(return_value=1)
+    await update_spend_rollups(
+        prisma_client=prisma_client,
+        spend_logs=[_spend_log("1", datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc))],
+    )
+    update_query = prisma_client.db.execute_raw.call_args.args[0]
+    backfill_query = _get_backfill_query(granularity="day", entity_type="model")
+
+    id_sql = "md5({} || to_char({}, 'YYYY-MM-DD\"T\"HH24:MI:SS') || {} || {})"
+    assert (
+        id_sql.format(
+            "u.granularity",
+            "u.bucket_start::timestamp",
+            "u.entity_type",
+            "u.entity_id",
+        )
+        in update_query
+    )
+    assert (
+        id_sql.format("'day'", "agg.bucket_start", "'model'", "agg.entity_id")
+        in backfill_query
+    )
@@ -16,18 +16,14 @@ from unittest.mock import MagicMock, patch, AsyncMock
 
 import httpx
 from litellm.proxy.utils import update_spend, DB_CONNECTION_ERROR_TYPES
+from litellm.proxy.spend_tracking.spend_accumulator import SpendAccumulator
 
 
 class MockPrismaClient:
     def __init__(self):
         self.db = MagicMock()
         self.spend_log_transactions = []
-        self.user_list_transactons = {}
-        self.end_user_list_transactons = {}
-        self.key_list_transactons = {}
-        self.team_list_transactons = {}
-        self.team_member_list_transactons = {}
-        self.org_list_transactons = {}
+        self.spend_accumulator = SpendAccumulator()
 
     def jsonify_object(self, obj):
         return obj
@@ -287,3 +283,190 @@ async def test_update_spend_logs_multiple_batches_with_failure():
 
     # Verify all logs were cleared from transactions
     assert len(prisma_client.spend_log_transactions) == 0
+
+
+class MockSpendTransaction:
+    """
+    `prisma_client.db.tx()` - records the spend updates of the batch, `on_enter` runs while the 1st write is in flight
+    """
+
+    def __init__(self, on_enter=None, error=None):
+        self.batcher = MagicMock()
+        self.on_enter = on_enter
+        self.error = error
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    async def __aenter__(self):
+        if self.on_enter is not None:
+            self.on_enter()
+            self.on_enter = None
+        if self.error is not None:
+            raise self.error
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def batch_(self):
+        batch = MagicMock()
+        batch.__aenter__ = AsyncMock(return_value=self.batcher)
+        batch.__aexit__ = AsyncMock(return_value=False)
+        return batch
+
+
+@pytest.mark.asyncio
+async def test_update_spend_keeps_spend_added_during_the_write():
+    prisma_client = MockPrismaClient()
+    spend_accumulator = prisma_client.spend_accumulator
+    spend_accumulator.add(entity_type="key", entity_id="hashed-key-1", spend=1.5)
+    spend_accumulator.add(entity_type="key", entity_id="hashed-key-1", spend=0.5)
+    spend_accumulator.add(entity_type="team", entity_id="team-1", spend=2.0)
+
+    # a request finishes while the key spend is being written
+    prisma_client.db.tx = MockSpendTransaction(
+        on_enter=lambda: spend_accumulator.add(
+            entity_type="key", entity_id="hashed-key-1", spend=3.0
+        )
+    )
+    await update_spend(prisma_client, None, MagicMock())
+
+    batcher = prisma_client.db.tx.batcher
+    batcher.litellm_verificationtoken.update_many.assert_any_call(
+        where={"token": "hashed-key-1"}, data={"spend": {"increment": 2.0}}
+    )
+    batcher.litellm_teamtable.update_many.assert_called_once_with(
+        where={"team_id": "team-1"}, data={"spend": {"increment": 2.0}}
+    )
+    # written by the next flush - not dropped by this one
+    assert spend_accumulator.get_shard("key").to_dict() == {"hashed-key-1": 3.0}
+
+
+@pytest.mark.asyncio
+async def test_update_spend_restores_spend_of_a_failed_write():
+    prisma_client = MockPrismaClient()
+    proxy_logging_obj = MagicMock()
+    proxy_logging_obj.failure_handler = AsyncMock()
+    spend_accumulator = prisma_client.spend_accumulator
+    spend_accumulator.add(entity_type="user", entity_id="user-1", spend=1.0)
+    prisma_client.db.tx = MockSpendTransaction(
+        error=ValueError("Unexpected database error")
+    )
+
+    with pytest.raises(ValueError):
+        await update_spend(prisma_client, None, proxy_logging_obj)
+
+    spend_accumulator.add(entity_type="user", entity_id="user-1", spend=2.0)
+    assert spend_accumulator.get_shard("user").to_dict() == {"user-1": 3.0}
+
+
+@pytest.mark.asyncio
+async def test_spend_accumulator_flushes_early_on_size():
+    spend_accumulator = SpendAccumulator(flush_size_threshold=3)
+    flush_callback = AsyncMock()
+    spend_accumulator.flush_callback = flush_callback
+
+    for i in range(2):
+        spend_accumulator.add(entity_type="key", entity_id=f"key-{i}", spend=1.0)
+    await asyncio.sleep(0)
+    flush_callback.assert_not_called()
+
+    for i in range(2, 6):
+        spend_accumulator.add(entity_type="key", entity_id=f"key-{i}", spend=1.0)
+    await asyncio.sleep(0)
+    # 1 early flush in flight at a time
+    flush_callback.assert_called_once()
+
+
+class MockRedisClient:
+    """
+    In-memory stand-in for the redis commands used by the spend accumulator
+    """
+
+    def __init__(self):
+        self.hashes = {}
+        self.keys = {}
+        self.commands = []
+        self.pipeline_transactions = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def set(self, name, value, nx=False, ex=None):
+        if nx and name in self.keys:
+            return None
+        self.keys[name] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        self.pipeline_transactions.append(transaction)
+        return self
+
+    def hincrbyfloat(self, name, key, amount):
+        self.commands.append(("hincrbyfloat", name, key, amount))
+
+    def hgetall(self, name):
+        self.commands.append(("hgetall", name))
+
+    def delete(self, name):
+        self.commands.append(("delete", name))
+
+    async def execute(self):
+        results = []
+        for command in self.commands:
+            if command[0] == "hincrbyfloat":
+                _, name, key, amount = command
+                redis_hash = self.hashes.setdefault(name, {})
+                redis_hash[key.encode()] = str(
+                    float(redis_hash.get(key.encode(), 0)) + amount
+                ).encode()
+                results.append(redis_hash[key.encode()])
+            elif command[0] == "hgetall":
+                results.append(dict(self.hashes.get(command[1], {})))
+            elif command[0] == "delete":
+                results.append(int(self.hashes.pop(command[1], None) is not None))
+        self.commands = []
+        return results
+
+
+@pytest.mark.asyncio
+async def test_update_spend_with_redis_aggregation_writes_once_for_all_pods():
+    redis_client = MockRedisClient()
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    redis_cache.check_and_fix_namespace = lambda key: key
+
+    pods = [MockPrismaClient() for _ in range(3)]
+    for i, pod in enumerate(pods):
+        pod.spend_accumulator.redis_cache = redis_cache
+        pod.db.tx = MockSpendTransaction()
+        pod.spend_accumulator.add(entity_type="key", entity_id="hashed-key", spend=1.0)
+        pod.spend_accumulator.add(
+            entity_type="key", entity_id=f"hashed-key-pod-{i}", spend=0.5
+        )
+
+    # the last pod to flush in the interval gets the flush lock
+    for pod in reversed(pods):
+        await update_spend(pod, None, MagicMock())
+
+    update_calls = [
+        pod.db.tx.batcher.litellm_verificationtoken.update_many.call_args_list
+        for pod in pods
+    ]
+    assert [len(calls) for calls in update_calls] == [0, 0, 2]
+    assert update_calls[2][0].kwargs == {
+        "where": {"token": "hashed-key"},
+        "data": {"spend": {"increment": 1.0}},
+    }
+    # a failed push is written to the db by the pod - no part of it may be in redis
+    assert all(redis_client.pipeline_transactions)
+    # spend of the pods flushing after the lock holder waits in redis for the next interval
+    assert redis_client.hashes["litellm:spend_accumulator:key"] == {
+        b"hashed-key": b"2.0",
+        b"hashed-key-pod-1": b"0.5",
+        b"hashed-key-pod-0": b"0.5",
+    }
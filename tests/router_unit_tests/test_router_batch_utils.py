@@ -17,8 +17,13 @@ import json
 from io import BytesIO
 from typing import Dict, List
 from litellm.router_utils.batch_utils import (
+    SpooledJsonlFile,
     replace_model_in_jsonl,
+    stream_replace_model_in_jsonl,
+    _get_jsonl_lines,
     _get_router_metadata_variable_name,
+    _iter_file_lines,
+    _replace_model_in_jsonl_line,
 )
 
 
@@ -76,6 +81,150 @@ def test_file_like_object(sample_file_like):
     assert result is not None
 
 
+def _read_jsonl(file) -> List[Dict]:
+    return [json.loads(line) for line in file.read().splitlines()]
+
+
+def test_replaces_model_on_every_line(sample_jsonl_bytes):
+    result = replace_model_in_jsonl(sample_jsonl_bytes, "claude-3")
+
+    assert result.name == "modified_file.jsonl"
+    lines = _read_jsonl(result)
+    assert len(lines) == 2
+    assert all(line["body"]["model"] == "claude-3" for line in lines)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        # fast path - body.model is the first key
+        {"custom_id": "1", "body": {"model": "gpt-4", "messages": []}},
+        # model is not the first key of body
+        {"body": {"messages": [], "model": "gpt-4"}},
+        # "model" also appears elsewhere in the line
+        {"body": {"model": "gpt-4", "metadata": {"model": "x"}}},
+        {"body": {"model": "gpt-4", "messages": [{"content": 'say "model"'}]}},
+        # escaped quote in the model name
+        {"body": {"model": 'gpt-"4"'}},
+        # no model in body
+        {"body": {"messages": []}},
+    ],
+)
+def test_stream_replace_model_matches_full_parse(line):
+    """
+    The fast path + full parse produce the same result as parsing every line
+    """
+    new_model = 'azure/"gpt-4o"'
+    result = stream_replace_model_in_jsonl(
+        json.dumps(line).encode("utf-8"), new_model_name=new_model
+    )
+    expected = json.loads(json.dumps(line))
+    expected["body"]["model"] = new_model
+    assert _read_jsonl(result) == [expected]
+
+
+def test_stream_replace_model_spools_to_disk(sample_jsonl_data):
+    jsonl_bytes = b"\n".join(
+        json.dumps(line).encode("utf-8") for line in sample_jsonl_data * 1000
+    )
+    result = stream_replace_model_in_jsonl(
+        BytesIO(jsonl_bytes), new_model_name="claude-3", max_size_in_memory=1024
+    )
+
+    assert result._rolled is True
+    assert result.name == "modified_file.jsonl"
+    lines = _read_jsonl(result)
+    assert len(lines) == 2000
+    assert all(line["body"]["model"] == "claude-3" for line in lines)
+
+
+@pytest.mark.parametrize("file_content", [b'{"body": {"model": "gpt-4"}\n{', 123])
+def test_invalid_file_content(file_content):
+    assert replace_model_in_jsonl(file_content, "claude-3") is None
+
+
+def test_replace_model_in_jsonl_line():
+    new_model_value = json.dumps("claude-3").encode("utf-8")
+
+    # fast path - the rest of the line is kept as-is
+    line = b'{"custom_id": "1", "body": {"model": "gpt-4", "messages": []}}'
+    assert (
+        _replace_model_in_jsonl_line(line, new_model_value)
+        == b'{"custom_id": "1", "body": {"model": "claude-3", "messages": []}}'
+    )
+
+    # "body" is not a top-level key - the line is re-serialized unchanged
+    line = b'{"request": {"body": {"model": "gpt-4"}}}'
+    assert json.loads(_replace_model_in_jsonl_line(line, new_model_value)) == {
+        "request": {"body": {"model": "gpt-4"}}
+    }
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        # matches the fast path pattern, but is not valid json
+        b'{"body": {"model": "gpt-4", "messages": [}',
+        b'{"body": {"model": "gpt-4"}} trailing',
+    ],
+)
+def test_replace_model_in_jsonl_line_invalid_line(line):
+    with pytest.raises(json.JSONDecodeError):
+        _replace_model_in_jsonl_line(line, b'"claude-3"')
+    assert replace_model_in_jsonl(line, "claude-3") is None
+
+
+def test_get_jsonl_lines(tmp_path, sample_jsonl_bytes):
+    expected_lines = sample_jsonl_bytes.splitlines()
+    file_path = tmp_path / "batch.jsonl"
+    file_path.write_bytes(sample_jsonl_bytes)
+
+    def _read_lines(file_content) -> List[bytes]:
+        return [
+            (line.encode("utf-8") if isinstance(line, str) else line).strip()
+            for line in _get_jsonl_lines(file_content)
+        ]
+
+    class _ReadOnlyFile:
+        """file-like object without `__iter__`"""
+
+        def __init__(self, content: bytes):
+            self._file = BytesIO(content)
+
+        def read(self, size: int = -1) -> bytes:
+            return self._file.read(size)
+
+        def readline(self) -> bytes:
+            return self._file.readline()
+
+    assert _read_lines(sample_jsonl_bytes) == expected_lines
+    assert _read_lines(sample_jsonl_bytes.decode("utf-8")) == expected_lines
+    assert _read_lines(("batch.jsonl", sample_jsonl_bytes)) == expected_lines
+    assert _read_lines(file_path) == expected_lines
+    assert _read_lines(BytesIO(sample_jsonl_bytes)) == expected_lines
+    assert _read_lines(_ReadOnlyFile(sample_jsonl_bytes)) == expected_lines
+    with pytest.raises(TypeError):
+        _get_jsonl_lines(123)
+
+
+def test_iter_file_lines(tmp_path, sample_jsonl_bytes):
+    file_path = tmp_path / "batch.jsonl"
+    file_path.write_bytes(sample_jsonl_bytes)
+
+    lines = list(_iter_file_lines(str(file_path)))
+    assert [line.strip() for line in lines] == sample_jsonl_bytes.splitlines()
+
+
+def test_spooled_jsonl_file_name():
+    spooled_file = SpooledJsonlFile(name="batch.jsonl", max_size=16)
+    spooled_file.write(b"x" * 32)
+
+    # the upload name is kept after rolling over to a temp file on disk
+    assert spooled_file._rolled is True
+    assert spooled_file.name == "batch.jsonl"
+    spooled_file.close()
+
+
 def test_router_metadata_variable_name():
     """Test that the variable name is correct"""
     assert _get_router_metadata_variable_name(function_name="completion") == "metadata"
@@ -1,4 +1,4 @@
-import sys, os, time
+import sys, os, time, json
 import traceback, asyncio
 import pytest
 
@@ -516,3 +516,270 @@ def test_mixed_success_failure(mock_failures, mock_successes, router):
     assert (
         should_cooldown is False
     ), "Should not cooldown when failure rate is below threshold"
+
+
+class FakePubSub:
+    """
+    In-process stand-in for a `redis.asyncio` PubSub - messages put on `queue` are delivered to the subscriber
+    """
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.channels = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+
+def _get_mock_redis_cache(pubsub: FakePubSub) -> MagicMock:
+    from litellm.caching.redis_cache import RedisCache
+
+    redis_cache = MagicMock(spec=RedisCache)
+    redis_cache.check_and_fix_namespace.side_effect = lambda key: key
+    redis_cache.init_async_pubsub.return_value = pubsub
+    # a successful read returns every key - None if not set
+    redis_cache.async_batch_get_cache = AsyncMock(
+        side_effect=lambda key_list, **kwargs: {key: None for key in key_list}
+    )
+    redis_cache.async_publish = AsyncMock()
+    return redis_cache
+
+
+@pytest.mark.asyncio
+async def test_cooldown_cache_local_cooldowns_without_redis():
+    """
+    Without redis, active cooldowns come from the local cooldowns - no cache reads
+    """
+    from litellm.caching.caching import DualCache
+    from litellm.router_utils.cooldown_cache import CooldownCache
+
+    cooldown_cache = CooldownCache(cache=DualCache(), default_cooldown_time=60)
+    cooldown_cache.add_deployment_to_cooldown(
+        model_id="deployment-1",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=60,
+    )
+    cooldown_cache.add_deployment_to_cooldown(
+        model_id="deployment-2",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=0.01,
+    )
+    await asyncio.sleep(0.02)
+
+    with patch.object(
+        cooldown_cache.cache, "async_batch_get_cache", new=AsyncMock()
+    ) as mock_batch_get_cache:
+        active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+            model_ids=["deployment-1", "deployment-2", "deployment-3"],
+            parent_otel_span=None,
+        )
+
+    mock_batch_get_cache.assert_not_called()
+    assert [model_id for model_id, _ in active_cooldowns] == ["deployment-1"]
+    assert active_cooldowns[0][1]["status_code"] == "429"
+    # expired cooldowns are dropped
+    assert "deployment-2" not in cooldown_cache.local_cooldowns
+
+
+@pytest.mark.asyncio
+async def test_cooldown_cache_cooldown_events():
+    """
+    With redis, cooldowns are published, and cooldowns from other instances arrive as events - once subscribed (and synced), routing reads no cache
+    """
+    from litellm.caching.caching import DualCache
+    from litellm.router_utils.cooldown_cache import (
+        COOLDOWN_EVENTS_CHANNEL,
+        CooldownCache,
+    )
+
+    pubsub = FakePubSub()
+    redis_cache = _get_mock_redis_cache(pubsub)
+    redis_cache.async_batch_get_cache.side_effect = None
+    redis_cache.async_batch_get_cache.return_value = {
+        "deployment:deployment-1:cooldown": {
+            "exception_received": "rate limited",
+            "status_code": "429",
+            "timestamp": time.time(),
+            "cooldown_time": 60,
+        },
+        "deployment:deployment-2:cooldown": None,
+        "deployment:deployment-3:cooldown": None,
+    }
+    cooldown_cache = CooldownCache(
+        cache=DualCache(redis_cache=redis_cache), default_cooldown_time=60
+    )
+    model_ids = ["deployment-1", "deployment-2", "deployment-3"]
+
+    # starts the subscription
+    await cooldown_cache.async_get_active_cooldowns(
+        model_ids=model_ids, parent_otel_span=None
+    )
+    await asyncio.sleep(0)
+    assert cooldown_cache.is_subscribed_to_cooldown_events is True
+    assert pubsub.channels == [COOLDOWN_EVENTS_CHANNEL]
+
+    # cooldowns set before the subscription are read from redis once
+    redis_cache.async_batch_get_cache.reset_mock()
+    active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+        model_ids=model_ids, parent_otel_span=None
+    )
+    assert [model_id for model_id, _ in active_cooldowns] == ["deployment-1"]
+    redis_cache.async_batch_get_cache.assert_called_once()
+
+    # a cooldown set by another instance
+    pubsub.queue.put_nowait(
+        {
+            "type": "message",
+            "data": json.dumps(
+                {
+                    "model_id": "deployment-2",
+                    "cooldown": {
+                        "exception_received": "internal server error",
+                        "status_code": "500",
+                        "timestamp": time.time(),
+                        "cooldown_time": 60,
+                    },
+                }
+            ),
+        }
+    )
+    await asyncio.sleep(0)
+
+    redis_cache.async_batch_get_cache.reset_mock()
+    with patch.object(
+        cooldown_cache.cache, "async_batch_get_cache", new=AsyncMock()
+    ) as mock_batch_get_cache:
+        active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+            model_ids=model_ids, parent_otel_span=None
+        )
+    mock_batch_get_cache.assert_not_called()
+    redis_cache.async_batch_get_cache.assert_not_called()
+    assert [model_id for model_id, _ in active_cooldowns] == [
+        "deployment-1",
+        "deployment-2",
+    ]
+
+    # a cooldown set by this instance is published
+    cooldown_cache.add_deployment_to_cooldown(
+        model_id="deployment-3",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=60,
+    )
+    await asyncio.sleep(0)
+    redis_cache.async_publish.assert_called_once()
+    channel, message = redis_cache.async_publish.call_args.args
+    assert channel == COOLDOWN_EVENTS_CHANNEL
+    assert message["model_id"] == "deployment-3"
+    assert message["cooldown"]["cooldown_time"] == 60
+
+    cooldown_cache.stop_cooldown_events_listener()
+    assert cooldown_cache.is_subscribed_to_cooldown_events is False
+
+
+@pytest.mark.asyncio
+async def test_cooldown_cache_syncs_each_model_id_from_redis_once():
+    """
+    Cooldowns set before the subscription are read from redis once per model id - a model group routed to later is still synced
+    """
+    from litellm.caching.caching import DualCache
+    from litellm.router_utils.cooldown_cache import CooldownCache
+
+    pubsub = FakePubSub()
+    redis_cache = _get_mock_redis_cache(pubsub)
+    cooldown_cache = CooldownCache(
+        cache=DualCache(redis_cache=redis_cache), default_cooldown_time=60
+    )
+
+    # starts the subscription + syncs deployment-1
+    await cooldown_cache.async_get_active_cooldowns(
+        model_ids=["deployment-1"], parent_otel_span=None
+    )
+    await asyncio.sleep(0)
+    await cooldown_cache.async_get_active_cooldowns(
+        model_ids=["deployment-1"], parent_otel_span=None
+    )
+
+    # another model group, cooled down by another instance before the subscription
+    redis_cache.async_batch_get_cache.reset_mock()
+    redis_cache.async_batch_get_cache.side_effect = None
+    redis_cache.async_batch_get_cache.return_value = {
+        "deployment:deployment-2:cooldown": {
+            "exception_received": "rate limited",
+            "status_code": "429",
+            "timestamp": time.time(),
+            "cooldown_time": 60,
+        }
+    }
+    active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+        model_ids=["deployment-1", "deployment-2"], parent_otel_span=None
+    )
+    assert [model_id for model_id, _ in active_cooldowns] == ["deployment-2"]
+    redis_cache.async_batch_get_cache.assert_called_once()
+    assert redis_cache.async_batch_get_cache.call_args.kwargs["key_list"] == [
+        "deployment:deployment-2:cooldown"
+    ]
+
+    # both synced - no more redis reads
+    redis_cache.async_batch_get_cache.reset_mock()
+    active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+        model_ids=["deployment-1", "deployment-2"], parent_otel_span=None
+    )
+    assert [model_id for model_id, _ in active_cooldowns] == ["deployment-2"]
+    redis_cache.async_batch_get_cache.assert_not_called()
+
+    cooldown_cache.stop_cooldown_events_listener()
+
+
+@pytest.mark.asyncio
+async def test_cooldown_cache_failed_redis_read_not_marked_synced():
+    """
+    A failed redis read (swallowed by the redis cache - keys missing from the results) is retried on the next call
+    """
+    from litellm.caching.caching import DualCache
+    from litellm.router_utils.cooldown_cache import CooldownCache
+
+    pubsub = FakePubSub()
+    redis_cache = _get_mock_redis_cache(pubsub)
+    redis_cache.async_batch_get_cache.side_effect = None
+    redis_cache.async_batch_get_cache.return_value = {}
+    cooldown_cache = CooldownCache(
+        cache=DualCache(redis_cache=redis_cache), default_cooldown_time=60
+    )
+
+    for _ in range(2):
+        await cooldown_cache.async_get_active_cooldowns(
+            model_ids=["deployment-1"], parent_otel_span=None
+        )
+        await asyncio.sleep(0)
+    assert "deployment-1" not in cooldown_cache._synced_cooldown_model_ids
+
+    redis_cache.async_batch_get_cache.reset_mock()
+    redis_cache.async_batch_get_cache.return_value = {
+        "deployment:deployment-1:cooldown": {
+            "exception_received": "rate limited",
+            "status_code": "429",
+            "timestamp": time.time(),
+            "cooldown_time": 60,
+        }
+    }
+    active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+        model_ids=["deployment-1"], parent_otel_span=None
+    )
+    assert [model_id for model_id, _ in active_cooldowns] == ["deployment-1"]
+    assert "deployment-1" in cooldown_cache._synced_cooldown_model_ids
+    redis_cache.async_batch_get_cache.assert_called_once()
+
+    cooldown_cache.stop_cooldown_events_listener()
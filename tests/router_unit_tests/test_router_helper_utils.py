@@ -1169,3 +1169,144 @@ def test_cached_get_model_group_info(model_list):
     # Verify the cache info shows hits
     cache_info = router._cached_get_model_group_info.cache_info()
     assert cache_info.hits > 0  # Should have at least one cache hit
+
+
+def _get_context_window_model_list() -> list:
+    return [
+        {
+            "model_name": "gpt-3.5-turbo",
+            "litellm_params": {"model": "gpt-3.5-turbo", "api_key": "sk-1234"},
+            "model_info": {"id": "small", "max_input_tokens": 10},
+        },
+        {
+            "model_name": "gpt-3.5-turbo",
+            "litellm_params": {"model": "gpt-3.5-turbo-16k", "api_key": "sk-1234"},
+            "model_info": {"id": "large"},
+        },
+    ]
+
+
+def test_pre_call_checks_no_copies_and_cached_model_info():
+    """
+    `_pre_call_checks` returns the router's deployment dicts (no deep copies), and resolves each deployment's model info once
+    """
+    router = Router(
+        model_list=_get_context_window_model_list(), enable_pre_call_checks=True
+    )
+    healthy_deployments = router.get_model_list(model_name="gpt-3.5-turbo")
+    messages = [{"role": "user", "content": "hello world " * 20}]
+
+    with patch.object(
+        router, "get_router_model_info", wraps=router.get_router_model_info
+    ) as mock_get_router_model_info:
+        for _ in range(3):
+            filtered_deployments = router._pre_call_checks(
+                model="gpt-3.5-turbo",
+                healthy_deployments=healthy_deployments,
+                messages=messages,
+            )
+            assert len(filtered_deployments) == 1
+            assert filtered_deployments[0] is healthy_deployments[1]
+
+    assert mock_get_router_model_info.call_count == 2
+
+    # deleting a deployment drops its cached info
+    router.delete_deployment(id="small")
+    assert "small" not in router.deployment_pre_call_info
+
+    with pytest.raises(litellm.ContextWindowExceededError):
+        router._pre_call_checks(
+            model="gpt-3.5-turbo",
+            healthy_deployments=healthy_deployments,
+            messages=messages,
+            input_tokens=1_000_000,
+        )
+
+
+@pytest.mark.asyncio
+async def test_pre_call_checks_input_tokens_counted_once():
+    """
+    The pre-call checks + the routing strategy share 1 token count per request
+    """
+    router = Router(
+        model_list=_get_context_window_model_list(),
+        enable_pre_call_checks=True,
+        routing_strategy="usage-based-routing-v2",
+    )
+    with patch.object(
+        litellm, "token_counter", return_value=5
+    ) as mock_token_counter, patch(
+        "litellm.router_strategy.lowest_tpm_rpm_v2.token_counter", return_value=5
+    ) as mock_strategy_token_counter:
+        deployment = await router.async_get_available_deployment(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": "hello"}],
+            request_kwargs={},
+        )
+
+    assert deployment["model_info"]["id"] in ["small", "large"]
+    assert mock_token_counter.call_count == 1
+    assert mock_strategy_token_counter.call_count == 0
+
+
+def test_get_deployment_pre_call_info(monkeypatch):
+    """
+    Cached per deployment, recomputed after the model cost map changed
+    """
+    import copy
+
+    monkeypatch.setattr(litellm, "model_cost", copy.deepcopy(litellm.model_cost))
+    router = Router(model_list=_get_context_window_model_list())
+    small, large = router.get_model_list(model_name="gpt-3.5-turbo")
+
+    small_info = router._get_deployment_pre_call_info(
+        deployment=small, model_group="gpt-3.5-turbo"
+    )
+    assert small_info.max_input_tokens == 10
+    assert small_info.model == "gpt-3.5-turbo"
+
+    large_info = router._get_deployment_pre_call_info(
+        deployment=large, model_group="gpt-3.5-turbo"
+    )
+    assert large_info.max_input_tokens is not None and large_info.max_input_tokens > 10
+    assert (
+        router._get_deployment_pre_call_info(
+            deployment=large, model_group="gpt-3.5-turbo"
+        )
+        is large_info
+    )
+
+    litellm.register_model({"gpt-3.5-turbo-16k": {"max_input_tokens": 50}})
+    updated_large_info = router._get_deployment_pre_call_info(
+        deployment=large, model_group="gpt-3.5-turbo"
+    )
+    assert updated_large_info is not large_info
+    assert updated_large_info.max_input_tokens == 50
+
+
+@pytest.mark.asyncio
+async def test_get_input_tokens_failure_not_recounted():
+    router = Router(
+        model_list=_get_context_window_model_list(), enable_pre_call_checks=True
+    )
+    messages = [{"role": "user", "content": "hello"}]
+    with patch.object(litellm, "token_counter", return_value=5):
+        assert router._get_input_tokens(messages=messages) == 5
+
+    with patch.object(
+        litellm, "token_counter", side_effect=Exception("tokenizer failed")
+    ) as mock_token_counter, patch.object(
+        litellm.router.verbose_router_logger, "error"
+    ) as mock_error:
+        assert router._get_input_tokens(messages=messages) is None
+        assert mock_error.call_count == 1
+
+        # the checks are skipped - the failed count is not retried by `_pre_call_checks`
+        mock_token_counter.reset_mock()
+        mock_error.reset_mock()
+        deployment = await router.async_get_available_deployment(
+            model="gpt-3.5-turbo", messages=messages, request_kwargs={}
+        )
+    assert deployment["model_info"]["id"] in ["small", "large"]
+    assert mock_token_counter.call_count == 1
+    assert mock_error.call_count == 1